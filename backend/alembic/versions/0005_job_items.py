@@ -0,0 +1,80 @@
+"""normalize per-document job results into finance.job_items
+
+Revision ID: 0005_job_items
+Revises: 0004_seed_admin
+Create Date: 2026-10-19 00:00:00.000000
+
+Per-document processing details used to live inside jobs.result as a
+single JSONB array ("details"). Listing jobs shipped every array and any
+update rewrote the whole TOASTed value.
+
+This migration moves those details into finance.job_items (one row per
+processed document) and strips the "details" key from jobs.result so
+that it only keeps the summary counts (total, processed, failed).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0005_job_items"
+down_revision: Union[str, None] = "0004_seed_admin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_items",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("document_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("action", sa.String(length=50), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["finance.jobs.id"], name="fk_job_items_job_id", ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        schema="finance",
+    )
+    op.create_index("ix_job_items_job_id_id", "job_items", ["job_id", "id"], schema="finance")
+
+    # ── Backfill from the legacy JSONB array, preserving the original order ──
+    op.execute("""
+        INSERT INTO finance.job_items (job_id, document_id, status, action, error)
+        SELECT j.id,
+               (d.detail->>'document_id')::int,
+               d.detail->>'status',
+               d.detail->>'action',
+               d.detail->>'error'
+        FROM finance.jobs j
+        CROSS JOIN LATERAL jsonb_array_elements(j.result->'details') WITH ORDINALITY AS d(detail, position)
+        WHERE jsonb_typeof(j.result->'details') = 'array'
+        ORDER BY j.created_at, j.id, d.position;
+    """)
+    op.execute("UPDATE finance.jobs SET result = result - 'details' WHERE result ? 'details'")
+
+
+def downgrade() -> None:
+    op.execute("""
+        UPDATE finance.jobs j
+        SET result = COALESCE(j.result, '{}'::jsonb) || jsonb_build_object('details', items.details)
+        FROM (
+            SELECT job_id,
+                   jsonb_agg(
+                       jsonb_strip_nulls(jsonb_build_object(
+                           'document_id', document_id,
+                           'status', status,
+                           'action', action,
+                           'error', error
+                       ))
+                       ORDER BY id
+                   ) AS details
+            FROM finance.job_items
+            GROUP BY job_id
+        ) AS items
+        WHERE items.job_id = j.id;
+    """)
+    op.drop_index("ix_job_items_job_id_id", table_name="job_items", schema="finance")
+    op.drop_table("job_items", schema="finance")
@@ -0,0 +1,53 @@
+"""add finance.outbox for transactional notification delivery
+
+Revision ID: 0006_outbox
+Revises: 0005_job_items
+Create Date: 2026-10-19 00:00:00.000000
+
+Job notifications used to be sent after the job status change committed,
+so a crash in between lost the event. Events are now written to
+finance.outbox in the same transaction as the status change and a relay
+(Celery task relay_outbox) drains pending rows with FOR UPDATE SKIP LOCKED.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0006_outbox"
+down_revision: Union[str, None] = "0005_job_items"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("channels", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("status", sa.String(length=20), server_default="pending", nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        schema="finance",
+    )
+    # The relay only ever scans pending rows; keep the index limited to them
+    op.create_index(
+        "ix_outbox_pending_next_attempt_at",
+        "outbox",
+        ["next_attempt_at", "id"],
+        schema="finance",
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_pending_next_attempt_at", table_name="outbox", schema="finance")
+    op.drop_table("outbox", schema="finance")
@@ -5,9 +5,12 @@ Provides dependency injection functions for FastAPI.
 
 from app.api.dependencies.database import get_database
 from app.api.dependencies.services import (
+    get_batch_get_documents_service,
+    get_bulk_update_status_service,
     get_create_document_service,
     get_get_document_service,
     get_get_job_status_service,
+    get_list_job_items_service,
     get_list_jobs_service,
     get_process_batch_service,
     get_search_documents_service,
@@ -16,10 +19,13 @@ from app.api.dependencies.services import (
 )
 
 __all__ = [
+    "get_batch_get_documents_service",
+    "get_bulk_update_status_service",
     "get_create_document_service",
     "get_database",
     "get_get_document_service",
     "get_get_job_status_service",
+    "get_list_job_items_service",
     "get_list_jobs_service",
     "get_process_batch_service",
     "get_search_documents_service",
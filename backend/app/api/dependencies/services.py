@@ -8,9 +8,12 @@ from sqlalchemy.orm import Session
 
 from app.api.dependencies.database import get_database
 from app.application.services import (
+    BatchGetDocuments,
+    BulkUpdateStatus,
     CreateDocument,
     GetDocument,
     GetJobStatus,
+    ListJobItems,
     ListJobs,
     ProcessBatch,
     SearchDocuments,
@@ -31,6 +34,13 @@ def get_get_document_service(db: Session = Depends(get_database)) -> GetDocument
     return GetDocument(db)
 
 
+def get_batch_get_documents_service(
+    db: Session = Depends(get_database),
+) -> BatchGetDocuments:
+    """Get BatchGetDocuments service instance."""
+    return BatchGetDocuments(db)
+
+
 def get_update_document_service(
     db: Session = Depends(get_database),
 ) -> UpdateDocument:
@@ -43,6 +53,11 @@ def get_update_status_service(db: Session = Depends(get_database)) -> UpdateStat
     return UpdateStatus(db)
 
 
+def get_bulk_update_status_service(db: Session = Depends(get_database)) -> BulkUpdateStatus:
+    """Get BulkUpdateStatus service instance."""
+    return BulkUpdateStatus(db)
+
+
 def get_search_documents_service(
     db: Session = Depends(get_database),
 ) -> SearchDocuments:
@@ -65,3 +80,8 @@ def get_get_job_status_service(
 def get_list_jobs_service(db: Session = Depends(get_database)) -> ListJobs:
     """Get ListJobs service instance."""
     return ListJobs(db)
+
+
+def get_list_job_items_service(db: Session = Depends(get_database)) -> ListJobItems:
+    """Get ListJobItems service instance."""
+    return ListJobItems(db)
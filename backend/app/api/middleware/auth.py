@@ -10,6 +10,7 @@ from typing import Optional
 from fastapi import Header, HTTPException, Request, status
 
 from app.core.config import settings
+from app.core.tracing import traced
 from app.infrastructure.cache.redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 _redis = RedisClient()
 
 
+@traced()
 async def verify_api_key(request: Request, x_api_key: Optional[str] = Header(None)) -> str:
     """Verify API Key from request header, with Redis cache and rate limiting.
 
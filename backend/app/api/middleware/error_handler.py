@@ -14,6 +14,7 @@ from app.domain.exceptions import (
     DocumentNotFoundException,
     DomainException,
     InvalidAmountException,
+    InvalidFieldSelectionException,
     InvalidStateTransitionException,
     JobNotFoundException,
 )
@@ -35,6 +36,7 @@ async def domain_exception_handler(request: Request, exc: DomainException) -> JS
         InvalidStateTransitionException: status.HTTP_400_BAD_REQUEST,
         InvalidAmountException: status.HTTP_400_BAD_REQUEST,
         DocumentNotEditableException: status.HTTP_400_BAD_REQUEST,
+        InvalidFieldSelectionException: status.HTTP_400_BAD_REQUEST,
         DomainException: status.HTTP_400_BAD_REQUEST,
     }
 
@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 
 from app.api.dependencies.database import get_database
 from app.core.config import settings
+from app.core.tracing import traced
 from app.domain.entities.user import User, UserRole, UserStatus
 from app.infrastructure.cache.redis_client import RedisClient
 from app.infrastructure.repositories.user_repository import UserRepository
@@ -25,6 +26,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token", auto_error=False)
 _redis = RedisClient()
 
 
+@traced()
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_database),
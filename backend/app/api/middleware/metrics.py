@@ -0,0 +1,52 @@
+"""Request metrics middleware.
+
+Records HTTP request latency per route template (``/api/v1/documents/{document_id}``,
+not the raw path) so label cardinality stays bounded. Implemented as a plain
+ASGI middleware to avoid the overhead of ``BaseHTTPMiddleware``.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import HTTP_REQUEST_DURATION
+
+# Label for requests that did not match an API route (404s, OpenAPI docs)
+OTHER_ROUTE = "other"
+
+
+class MetricsMiddleware:
+    """ASGI middleware that observes ``http_request_duration_seconds``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and record it under its route template."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=getattr(route, "path", OTHER_ROUTE),
+                status=str(status_code),
+            ).observe(time.perf_counter() - start)
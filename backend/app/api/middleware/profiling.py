@@ -0,0 +1,34 @@
+"""Request counting for the on-demand profiler.
+
+``POST /admin/profile?requests=N`` profiles until N requests have finished;
+this middleware reports finished requests while a profile is running and
+does nothing otherwise.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.profiling import is_profiling, request_completed
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that counts finished requests during a profile."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request and count it if a profile is running."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if is_profiling():
+                request_completed()
@@ -0,0 +1,69 @@
+"""SQL statement accounting middleware.
+
+Counts the statements each request runs and their total time (see
+``track_queries``), reports them in a ``Server-Timing`` header and the log,
+and checks them against the endpoint's statement budget so N+1 query
+patterns surface as warnings (or failures in strict mode, used by the tests).
+"""
+
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.infrastructure.database.instrumentation import (
+    QueryStats,
+    check_statement_budget,
+    current_query_stats,
+    start_query_tracking,
+    statement_budget,
+    stop_query_tracking,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that tracks SQL statements per request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Track the request's statements and add the Server-Timing header."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_query_tracking()
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                stats = current_query_stats() or QueryStats()
+                route = scope.get("route")
+                if route is not None:
+                    name = f"{scope['method']} {route.path}"
+                    check_statement_budget(name, stats, statement_budget(name, settings.DB_STATEMENT_BUDGET))
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration_ms:.2f};desc="{stats.statements} queries", '
+                    f"app;dur={(time.perf_counter() - start) * 1000:.2f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stats = stop_query_tracking(token)
+            logger.debug(
+                f"{scope['method']} {scope['path']}: {stats.statements} SQL statements in {stats.duration_ms:.1f} ms",
+                extra={"db_statements": stats.statements, "db_time_ms": stats.duration_ms},
+            )
@@ -0,0 +1,54 @@
+"""Request tracing middleware.
+
+Opens a server span per HTTP request, continuing the caller's trace when the
+request carries a W3C ``traceparent`` header. Dependencies, services,
+repositories and the Celery tasks published while handling the request
+become children of this span.
+"""
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import tracing
+
+
+class TracingMiddleware:
+    """ASGI middleware that wraps each request in a ``METHOD /route`` span."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request inside a server span."""
+        if scope["type"] != "http" or tracing.get_exporter() is None:
+            await self.app(scope, receive, send)
+            return
+
+        span, token = tracing.begin_span(
+            f"{scope['method']} {scope['path']}",
+            parent=tracing.extract(Headers(scope=scope)),
+            kind=tracing.KIND_SERVER,
+            attributes={"http.method": scope["method"], "http.target": scope["path"]},
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.status_code", message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as error:
+            span.record_error(error)
+            raise
+        finally:
+            route = scope.get("route")
+            if route is not None:
+                span.name = f"{scope['method']} {route.path}"
+                span.set_attribute("http.route", route.path)
+            tracing.finish_span(span, token)
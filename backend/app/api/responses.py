@@ -0,0 +1,69 @@
+"""Response classes for the API.
+
+Responses are rendered with orjson. Routes return their service's DTO
+wrapped in ``ORJSONResponse`` so FastAPI skips the ``response_model``
+round trip (re-validation plus ``jsonable_encoder``); the DTOs were already
+validated when the service built them. ``response_model`` is still declared
+on every route for the OpenAPI schema.
+"""
+
+from decimal import Decimal
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+# Matches Pydantic's JSON output: UTC datetimes end in "Z"
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: object) -> object:
+    """Serialize the types orjson does not handle natively.
+
+    Decimals are rendered as strings, like Pydantic does, so amounts keep
+    their exact value.
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Pydantic models are dumped as-is (no re-validation). Also used as the
+    application's default response class.
+    """
+
+    def __init__(
+        self,
+        content: Any,  # noqa: ANN401
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        exclude_unset: bool = False,
+    ) -> None:
+        """Initialize response.
+
+        Args:
+            content: DTO or JSON-compatible value to render
+            status_code: HTTP status code
+            headers: Optional response headers
+            media_type: Optional media type (default: application/json)
+            background: Optional background task
+            exclude_unset: Leave out model fields that were not explicitly set
+                (sparse fieldsets), like ``response_model_exclude_unset``
+        """
+        self.exclude_unset = exclude_unset
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Render content to JSON bytes."""
+        if isinstance(content, BaseModel):
+            content = content.model_dump(exclude_unset=self.exclude_unset)
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
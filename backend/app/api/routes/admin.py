@@ -4,13 +4,19 @@ User management endpoints, restricted to admin role.
   GET   /admin/users          → list all users (filterable by status)
   PATCH /admin/users/{id}     → approve user (assign role + activate)
   PATCH /admin/users/{id}/disable → disable user
+  GET   /admin/logs           → audit log
+  GET   /admin/slow-queries   → slowest recent SQL statements (with EXPLAIN plans when sampled)
+  POST  /admin/profile        → sample this API worker for N seconds or requests (collapsed stacks)
 """
 
-import uuid
+import asyncio
 import logging
+import time
+import uuid
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 
 from app.api.dependencies.database import get_database
@@ -19,9 +25,14 @@ from app.application.dtos.auth_dtos import (
     ApproveUserRequest,
     AuditLogListResponse,
     AuditLogResponse,
+    SlowQueryListResponse,
+    SlowQueryResponse,
     UserListResponse,
     UserResponse,
 )
+from app.core.config import settings
+from app.core.profiling import ProfilerBusy, SamplingProfiler, completed_requests
+from app.infrastructure.database.slow_queries import slow_query_log
 from app.infrastructure.repositories.audit_repository import AuditRepository
 from app.infrastructure.repositories.user_repository import UserRepository
 
@@ -150,3 +161,75 @@ async def list_audit_logs(
         ],
         total=total,
     )
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryListResponse,
+    summary="List recent slow SQL statements",
+    dependencies=[Depends(require_admin())],
+)
+async def list_slow_queries(
+    limit: int = Query(50, ge=1, le=200),
+) -> SlowQueryListResponse:
+    """Return the slowest statements recorded by this API process, slowest first. Admin only.
+
+    Parameters are reported by type only. ``plan`` holds the plan when the statement
+    was sampled (SLOW_QUERY_EXPLAIN_SAMPLE_RATE): EXPLAIN (ANALYZE, BUFFERS) for plain
+    SELECTs, plain EXPLAIN (statement not executed) for everything else.
+    """
+    entries = slow_query_log.entries()
+    return SlowQueryListResponse(
+        items=[SlowQueryResponse.model_validate(entry) for entry in entries[:limit]],
+        total=len(entries),
+        threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    )
+
+
+@router.post(
+    "/profile",
+    response_class=PlainTextResponse,
+    summary="Profile this API worker",
+    dependencies=[Depends(require_admin())],
+)
+async def profile_worker(
+    seconds: float = Query(10.0, gt=0, le=settings.PROFILING_MAX_SECONDS, description="Profile window"),
+    requests: Optional[int] = Query(
+        None, ge=1, le=10_000, description="Stop after this many requests finish (bounded by seconds)"
+    ),
+    interval_ms: float = Query(settings.PROFILING_INTERVAL_MS, ge=1, le=1000, description="Sampling interval"),
+) -> PlainTextResponse:
+    """Sample the Python stacks of the worker that receives this request. Admin only.
+
+    Profiles for ``seconds``, or until ``requests`` other requests have finished
+    (never longer than ``seconds``). Returns collapsed stacks
+    (``frame;frame;frame count``) for flamegraph.pl or speedscope. With several
+    uvicorn workers only the worker serving this call is profiled; one profile
+    runs at a time per worker (409 otherwise).
+    """
+    profiler = SamplingProfiler(interval=interval_ms / 1000)
+    try:
+        profiler.start()
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+    start_count = completed_requests()
+    deadline = time.monotonic() + seconds
+    try:
+        if requests is None:
+            await asyncio.sleep(seconds)
+        else:
+            while completed_requests() - start_count < requests and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+    finally:
+        profiler.stop()
+
+    logger.info(f"Admin profile: {profiler.samples} samples over {profiler.duration:.1f}s")
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={
+            "X-Profile-Samples": str(profiler.samples),
+            "X-Profile-Duration-Seconds": f"{profiler.duration:.3f}",
+            "X-Profile-Requests": str(completed_requests() - start_count),
+        },
+    )
@@ -5,12 +5,14 @@ Draft documents are evaluated and moved to pending/rejected.
 Rejected documents included in the batch are reset to draft.
 """
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.api.dependencies import get_process_batch_service
-from app.api.middleware.jwt_auth import require_loader
+from app.api.middleware.jwt_auth import get_current_user, require_loader
+from app.api.responses import ORJSONResponse
 from app.application.dtos.job_dtos import JobResponse, ProcessBatchRequest
 from app.application.services import ProcessBatch
+from app.domain.entities.user import User, UserRole
 
 router = APIRouter(
     tags=["batch"],
@@ -26,8 +28,10 @@ router = APIRouter(
 )
 async def process_batch(
     request: ProcessBatchRequest,
+    profile: bool = Query(False, description="Admin only: profile the worker run (collapsed stacks on the worker)"),
+    user: User = Depends(get_current_user),
     service: ProcessBatch = Depends(get_process_batch_service),
-) -> JobResponse:
+) -> ORJSONResponse:
     """Create a batch processing job for multiple documents.
 
     - **document_ids**: List of document IDs to process
@@ -39,5 +43,10 @@ async def process_batch(
 
     Returns a job ID. Processing is asynchronous via Celery.
     Use GET /jobs/{job_id} to poll the result.
+
+    With **profile=true** (admins only) the worker samples the run and writes
+    the collapsed stacks to PROFILING_OUTPUT_DIR.
     """
-    return service.execute(request)
+    if profile and user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can profile batch runs.")
+    return ORJSONResponse(service.execute(request, profile=profile), status_code=status.HTTP_202_ACCEPTED)
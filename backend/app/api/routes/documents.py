@@ -2,14 +2,18 @@
 
 Endpoints for document CRUD operations.
 Role-based access:
-  - GET (read): admin, loader, approver
+  - GET / POST batch-get (read): admin, loader, approver
   - POST / PUT (create/edit): admin, loader
-  - PATCH status → approved/rejected: admin, approver
+  - PATCH status (single or bulk) → approved/rejected: admin, approver
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Union
+
+from fastapi import APIRouter, Depends, Query, status
 
 from app.api.dependencies import (
+    get_batch_get_documents_service,
+    get_bulk_update_status_service,
     get_create_document_service,
     get_get_document_service,
     get_search_documents_service,
@@ -17,15 +21,25 @@ from app.api.dependencies import (
     get_update_status_service,
 )
 from app.api.middleware.jwt_auth import require_any_active_role, require_approver, require_loader
+from app.api.responses import ORJSONResponse
 from app.application.dtos.document_dtos import (
+    BatchGetDocumentsRequest,
+    BatchGetDocumentsResponse,
+    BulkUpdateStatusRequest,
+    BulkUpdateStatusResponse,
     CreateDocumentRequest,
     DocumentResponse,
     PaginatedDocumentsResponse,
     SearchDocumentsRequest,
+    SparseBatchGetDocumentsResponse,
+    SparseDocumentResponse,
+    SparsePaginatedDocumentsResponse,
     UpdateDocumentRequest,
     UpdateStatusRequest,
 )
 from app.application.services import (
+    BatchGetDocuments,
+    BulkUpdateStatus,
     CreateDocument,
     GetDocument,
     SearchDocuments,
@@ -38,6 +52,8 @@ _active_role_dep = require_any_active_role()
 _loader_dep = require_loader()
 _approver_dep = require_approver()
 
+_FIELDS_DESCRIPTION = "Comma-separated fields to return (id is always included), e.g. type,amount,metadata.client"
+
 router = APIRouter(prefix="/documents", tags=["documents"])
 
 
@@ -51,23 +67,44 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 async def create_document(
     request: CreateDocumentRequest,
     service: CreateDocument = Depends(get_create_document_service),
-) -> DocumentResponse:
+) -> ORJSONResponse:
     """Create a new financial document. Requires admin or loader role."""
-    return service.execute(request)
+    return ORJSONResponse(service.execute(request), status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/batch-get",
+    response_model=Union[BatchGetDocumentsResponse, SparseBatchGetDocumentsResponse],
+    response_model_exclude_unset=True,
+    summary="Get many documents by ID",
+    dependencies=[Depends(_active_role_dep)],
+)
+async def batch_get_documents(
+    request: BatchGetDocumentsRequest,
+    service: BatchGetDocuments = Depends(get_batch_get_documents_service),
+) -> ORJSONResponse:
+    """Fetch up to 200 documents in one query, in request order.
+
+    IDs that do not exist are listed in ``missing``. Accepts the same ``fields``
+    selection as GET /documents.
+    """
+    return ORJSONResponse(service.execute(request), exclude_unset=True)
 
 
 @router.get(
     "/{document_id}",
-    response_model=DocumentResponse,
+    response_model=Union[DocumentResponse, SparseDocumentResponse],
+    response_model_exclude_unset=True,
     summary="Get document by ID",
     dependencies=[Depends(_active_role_dep)],
 )
 async def get_document(
     document_id: int,
+    fields: str | None = Query(None, description=_FIELDS_DESCRIPTION),
     service: GetDocument = Depends(get_get_document_service),
-) -> DocumentResponse:
-    """Retrieve a document by its ID."""
-    return service.execute(document_id)
+) -> ORJSONResponse:
+    """Retrieve a document by its ID, optionally restricted to a sparse fieldset."""
+    return ORJSONResponse(service.execute(document_id, fields=fields), exclude_unset=True)
 
 
 @router.put(
@@ -80,9 +117,28 @@ async def update_document(
     document_id: int,
     request: UpdateDocumentRequest,
     service: UpdateDocument = Depends(get_update_document_service),
-) -> DocumentResponse:
+) -> ORJSONResponse:
     """Update document fields (only in DRAFT status). Requires admin or loader role."""
-    return service.execute(document_id, request)
+    return ORJSONResponse(service.execute(document_id, request))
+
+
+@router.patch(
+    "/status",
+    response_model=BulkUpdateStatusResponse,
+    summary="Update the status of many documents",
+)
+async def bulk_update_document_status(
+    request: BulkUpdateStatusRequest,
+    current_user: User = Depends(_approver_dep),
+    service: BulkUpdateStatus = Depends(get_bulk_update_status_service),
+) -> ORJSONResponse:
+    """Apply many status transitions in one transaction. Requires admin or approver role.
+
+    Each entry follows the same transition rules as PATCH /documents/{id}/status.
+    Entries that are not allowed (or whose document does not exist) are skipped
+    and reported; the rest are applied.
+    """
+    return ORJSONResponse(service.execute(request, user_email=current_user.email))
 
 
 @router.patch(
@@ -95,7 +151,7 @@ async def update_document_status(
     request: UpdateStatusRequest,
     current_user: User = Depends(_approver_dep),
     service: UpdateStatus = Depends(get_update_status_service),
-) -> DocumentResponse:
+) -> ORJSONResponse:
     """Change document status. Requires admin or approver role.
 
     Valid transitions:
@@ -103,12 +159,13 @@ async def update_document_status(
     - PENDING → APPROVED
     - PENDING → REJECTED
     """
-    return service.execute(document_id, request, user_email=current_user.email)
+    return ORJSONResponse(service.execute(document_id, request, user_email=current_user.email))
 
 
 @router.get(
     "",
-    response_model=PaginatedDocumentsResponse,
+    response_model=Union[PaginatedDocumentsResponse, SparsePaginatedDocumentsResponse],
+    response_model_exclude_unset=True,
     summary="Search documents with filters",
     dependencies=[Depends(_active_role_dep)],
 )
@@ -119,9 +176,10 @@ async def search_documents(
     amount_max: float | None = None,
     page: int = 1,
     page_size: int = 50,
+    fields: str | None = Query(None, description=_FIELDS_DESCRIPTION),
     service: SearchDocuments = Depends(get_search_documents_service),
-) -> PaginatedDocumentsResponse:
-    """Search documents with optional filters and pagination."""
+) -> ORJSONResponse:
+    """Search documents with optional filters, pagination and sparse fieldset."""
     request = SearchDocumentsRequest(
         type=type,
         status=status,
@@ -129,5 +187,6 @@ async def search_documents(
         amount_max=amount_max,
         page=page,
         page_size=page_size,
+        fields=fields,
     )
-    return service.execute(request)
+    return ORJSONResponse(service.execute(request), exclude_unset=True)
@@ -3,15 +3,22 @@
 Endpoints for listing and querying batch processing jobs.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 
-from app.api.dependencies import get_get_job_status_service, get_list_jobs_service
+from app.api.dependencies import get_get_job_status_service, get_list_job_items_service, get_list_jobs_service
 from app.api.middleware.jwt_auth import require_any_active_role
-from app.application.dtos.job_dtos import JobListResponse, JobResponse
-from app.application.services import GetJobStatus, ListJobs
+from app.api.responses import ORJSONResponse
+from app.application.dtos.job_dtos import (
+    JobItemListResponse,
+    JobListResponse,
+    JobListView,
+    JobResponse,
+    JobSummaryListResponse,
+)
+from app.application.services import GetJobStatus, ListJobItems, ListJobs
 
 router = APIRouter(
     prefix="/jobs",
@@ -22,22 +29,25 @@ router = APIRouter(
 
 @router.get(
     "",
-    response_model=JobListResponse,
+    response_model=Union[JobListResponse, JobSummaryListResponse],
     summary="List all jobs",
 )
 async def list_jobs(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     status: Optional[str] = Query(None, description="Filter by status (pending, processing, completed, failed)"),
+    view: JobListView = Query(JobListView.FULL, description="Projection: full or summary"),
     service: ListJobs = Depends(get_list_jobs_service),
-) -> JobListResponse:
+) -> ORJSONResponse:
     """List all batch processing jobs with optional filters.
 
     - **page**: Page number (default: 1)
     - **page_size**: Items per page (default: 10, max: 100)
     - **status**: Optional filter by job status
+    - **view**: `full` (default) or `summary` (status, timestamps and counts only;
+      full payload via GET /jobs/{job_id})
     """
-    return service.execute(page=page, page_size=page_size, status=status)
+    return ORJSONResponse(service.execute(page=page, page_size=page_size, status=status, view=view))
 
 
 @router.get(
@@ -48,11 +58,31 @@ async def list_jobs(
 async def get_job_status(
     job_id: UUID,
     service: GetJobStatus = Depends(get_get_job_status_service),
-) -> JobResponse:
+) -> ORJSONResponse:
     """Get the status of a batch processing job.
 
     - **job_id**: Job UUID to query
 
-    Returns job details including status, timestamps and results.
+    Returns job details including status, timestamps and result counts.
+    """
+    return ORJSONResponse(service.execute(job_id))
+
+
+@router.get(
+    "/{job_id}/items",
+    response_model=JobItemListResponse,
+    summary="List per-document job results",
+)
+async def list_job_items(
+    job_id: UUID,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    service: ListJobItems = Depends(get_list_job_items_service),
+) -> ORJSONResponse:
+    """List the result of every document processed by a job, in processing order.
+
+    - **job_id**: Job UUID to query
+    - **page**: Page number (default: 1)
+    - **page_size**: Items per page (default: 50, max: 100)
     """
-    return service.execute(job_id)
+    return ORJSONResponse(service.execute(job_id, page=page, page_size=page_size))
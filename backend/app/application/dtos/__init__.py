@@ -4,22 +4,45 @@ Contains data transfer objects for API requests and responses.
 """
 
 from app.application.dtos.document_dtos import (
+    BatchGetDocumentsRequest,
+    BatchGetDocumentsResponse,
     CreateDocumentRequest,
     DocumentResponse,
     PaginatedDocumentsResponse,
     SearchDocumentsRequest,
+    SparseBatchGetDocumentsResponse,
+    SparseDocumentResponse,
+    SparsePaginatedDocumentsResponse,
     UpdateDocumentRequest,
     UpdateStatusRequest,
 )
-from app.application.dtos.job_dtos import JobResponse, ProcessBatchRequest
+from app.application.dtos.job_dtos import (
+    JobItemListResponse,
+    JobItemResponse,
+    JobListView,
+    JobResponse,
+    JobSummaryListResponse,
+    JobSummaryResponse,
+    ProcessBatchRequest,
+)
 
 __all__ = [
+    "BatchGetDocumentsRequest",
+    "BatchGetDocumentsResponse",
     "CreateDocumentRequest",
     "DocumentResponse",
+    "JobItemListResponse",
+    "JobItemResponse",
+    "JobListView",
     "JobResponse",
+    "JobSummaryListResponse",
+    "JobSummaryResponse",
     "PaginatedDocumentsResponse",
     "ProcessBatchRequest",
     "SearchDocumentsRequest",
+    "SparseBatchGetDocumentsResponse",
+    "SparseDocumentResponse",
+    "SparsePaginatedDocumentsResponse",
     "UpdateDocumentRequest",
     "UpdateStatusRequest",
 ]
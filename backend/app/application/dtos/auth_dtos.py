@@ -1,7 +1,7 @@
 """DTOs for authentication and user management."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -45,3 +45,20 @@ class AuditLogResponse(BaseModel):
 class AuditLogListResponse(BaseModel):
     items: List[AuditLogResponse]
     total: int
+
+
+class SlowQueryResponse(BaseModel):
+    statement: str
+    parameters: Any
+    duration_ms: float
+    caller: str
+    captured_at: datetime
+    plan: Optional[str]
+
+    model_config = {"from_attributes": True}
+
+
+class SlowQueryListResponse(BaseModel):
+    items: List[SlowQueryResponse]
+    total: int
+    threshold_ms: float
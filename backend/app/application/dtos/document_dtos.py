@@ -3,18 +3,26 @@
 Request and response schemas for document operations.
 """
 
+from collections import Counter
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.domain.entities.document.status import DocumentStatus
+from app.domain.exceptions import InvalidFieldSelectionException
 
 MAX_METADATA_KEYS = 20
 MAX_AMOUNT = Decimal("999_999_999.99")
 
+MAX_BATCH_GET_IDS = 200
+MAX_BULK_STATUS_ENTRIES = 5000
+
+DOCUMENT_FIELDS = ("id", "type", "amount", "status", "created_at", "updated_at", "metadata", "created_by")
+METADATA_FIELD_PREFIX = "metadata."
+
 
 class DocumentType(str, Enum):
     """Valid document types."""
@@ -90,6 +98,48 @@ class UpdateStatusRequest(BaseModel):
         return v
 
 
+class BulkStatusEntry(UpdateStatusRequest):
+    """A single transition within a bulk status update."""
+
+    document_id: int = Field(..., description="Document ID")
+
+
+class BulkUpdateStatusRequest(BaseModel):
+    """Request schema for applying many status transitions in one transaction."""
+
+    entries: List[BulkStatusEntry] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_STATUS_ENTRIES,
+        description=f"Transitions to apply (max {MAX_BULK_STATUS_ENTRIES}, one per document)",
+    )
+
+    @model_validator(mode="after")
+    def validate_unique_documents(self) -> "BulkUpdateStatusRequest":
+        counts = Counter(entry.document_id for entry in self.entries)
+        duplicates = sorted(document_id for document_id, count in counts.items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate document_id in entries: {duplicates}")
+        return self
+
+
+class BulkStatusResult(BaseModel):
+    """Outcome of a single transition within a bulk status update."""
+
+    document_id: int = Field(..., description="Document ID")
+    outcome: Literal["updated", "not_found", "invalid_transition"] = Field(..., description="Transition outcome")
+    old_status: Optional[DocumentStatus] = Field(None, description="Status before the request (null if not found)")
+    new_status: DocumentStatus = Field(..., description="Requested status")
+
+
+class BulkUpdateStatusResponse(BaseModel):
+    """Response schema for a bulk status update, in request order."""
+
+    results: List[BulkStatusResult] = Field(..., description="Per-document outcomes, in request order")
+    updated: int = Field(..., description="Number of documents updated")
+    failed: int = Field(..., description="Number of entries not applied")
+
+
 class DocumentResponse(BaseModel):
     """Response schema for a document."""
 
@@ -108,6 +158,22 @@ class DocumentResponse(BaseModel):
         from_attributes = True
 
 
+class SparseDocumentResponse(BaseModel):
+    """Response schema for a document restricted to a ``fields=`` selection.
+
+    Only the selected fields are set; unset fields are left out of the response.
+    """
+
+    id: int = Field(..., description="Document ID")
+    type: Optional[DocumentType] = Field(None, description="Document type")
+    amount: Optional[Decimal] = Field(None, description="Document amount")
+    status: Optional[DocumentStatus] = Field(None, description="Document status")
+    created_at: Optional[datetime] = Field(None, description="Creation timestamp")
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Document metadata (or the selected keys)")
+    created_by: Optional[str] = Field(None, description="User who created the document")
+
+
 class SearchDocumentsRequest(BaseModel):
     """Request schema for searching documents."""
 
@@ -119,6 +185,7 @@ class SearchDocumentsRequest(BaseModel):
     created_to: Optional[datetime] = Field(None, description="Filter documents created until this date")
     page: int = Field(1, ge=1, description="Page number (starts at 1)")
     page_size: int = Field(50, ge=1, le=100, description="Number of items per page (max 100)")
+    fields: Optional[str] = Field(None, description="Comma-separated fields to return (e.g. id,type,metadata.client)")
 
 
 class PaginatedDocumentsResponse(BaseModel):
@@ -129,3 +196,72 @@ class PaginatedDocumentsResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
     total_pages: int = Field(..., description="Total number of pages")
+
+
+class SparsePaginatedDocumentsResponse(BaseModel):
+    """Response schema for paginated documents restricted to a ``fields=`` selection."""
+
+    items: List[SparseDocumentResponse] = Field(..., description="List of documents")
+    total: int = Field(..., description="Total number of documents matching filters")
+    page: int = Field(..., description="Current page number")
+    page_size: int = Field(..., description="Number of items per page")
+    total_pages: int = Field(..., description="Total number of pages")
+
+
+class BatchGetDocumentsRequest(BaseModel):
+    """Request schema for fetching many documents by ID in one call."""
+
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_GET_IDS, description=f"Document IDs (max {MAX_BATCH_GET_IDS})"
+    )
+    fields: Optional[str] = Field(None, description="Comma-separated fields to return (e.g. id,type,metadata.client)")
+
+
+class BatchGetDocumentsResponse(BaseModel):
+    """Response schema for a multi-get, in request order."""
+
+    items: List[DocumentResponse] = Field(..., description="Found documents, in request order")
+    missing: List[int] = Field(..., description="Requested IDs that do not exist")
+
+
+class SparseBatchGetDocumentsResponse(BaseModel):
+    """Response schema for a multi-get restricted to a ``fields=`` selection."""
+
+    items: List[SparseDocumentResponse] = Field(..., description="Found documents, in request order")
+    missing: List[int] = Field(..., description="Requested IDs that do not exist")
+
+
+def parse_document_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated sparse fieldset.
+
+    ``id`` is always included. ``metadata.<key>`` selects a single metadata key
+    and is dropped when the whole ``metadata`` is also requested.
+
+    Args:
+        fields: Raw ``fields=`` query value (e.g. "type,amount,metadata.client")
+
+    Returns:
+        Ordered, de-duplicated field names, or None when no selection was given
+
+    Raises:
+        InvalidFieldSelectionException: If a field is unknown or a metadata key is empty
+    """
+    if fields is None or not fields.strip():
+        return None
+
+    selected = ["id"]
+    for raw in fields.split(","):
+        field = raw.strip()
+        if not field:
+            continue
+        if field.startswith(METADATA_FIELD_PREFIX):
+            if not field[len(METADATA_FIELD_PREFIX) :]:
+                raise InvalidFieldSelectionException(field)
+        elif field not in DOCUMENT_FIELDS:
+            raise InvalidFieldSelectionException(field)
+        if field not in selected:
+            selected.append(field)
+
+    if "metadata" in selected:
+        selected = [f for f in selected if not f.startswith(METADATA_FIELD_PREFIX)]
+    return selected
@@ -4,6 +4,7 @@ Request and response schemas for job operations and webhook callbacks.
 """
 
 from datetime import datetime
+from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
@@ -23,7 +24,9 @@ class JobResponse(BaseModel):
     status: str = Field(..., description="Job status (pending, processing, completed, failed)")
     created_at: datetime = Field(..., description="Job creation timestamp")
     completed_at: Optional[datetime] = Field(None, description="Job completion timestamp")
-    result: Optional[Dict[str, Any]] = Field(None, description="Job result details (if completed)")
+    result: Optional[Dict[str, Any]] = Field(
+        None, description="Job result summary counts (if completed). Per-document details: GET /jobs/{job_id}/items"
+    )
     error_message: Optional[str] = Field(None, description="Error message (if failed)")
 
     class Config:
@@ -42,6 +45,66 @@ class JobListResponse(BaseModel):
     total_pages: int = Field(..., description="Total number of pages")
 
 
+class JobListView(str, Enum):
+    """Projection used by the job listing."""
+
+    FULL = "full"
+    SUMMARY = "summary"
+
+
+class JobSummaryResponse(BaseModel):
+    """Lightweight response schema for a job in listings (no document IDs nor result payload)."""
+
+    job_id: UUID = Field(..., description="Job unique identifier")
+    status: str = Field(..., description="Job status (pending, processing, completed, failed)")
+    created_at: datetime = Field(..., description="Job creation timestamp")
+    completed_at: Optional[datetime] = Field(None, description="Job completion timestamp")
+    error_message: Optional[str] = Field(None, description="Error message (if failed)")
+    document_count: int = Field(..., description="Number of documents in the batch")
+    processed: Optional[int] = Field(None, description="Successfully processed count (if completed)")
+    failed: Optional[int] = Field(None, description="Failed count (if completed)")
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class JobSummaryListResponse(BaseModel):
+    """Paginated response for the summary job listing."""
+
+    items: List[JobSummaryResponse] = Field(..., description="List of job summaries")
+    total: int = Field(..., description="Total number of jobs")
+    page: int = Field(..., description="Current page number")
+    page_size: int = Field(..., description="Number of items per page")
+    total_pages: int = Field(..., description="Total number of pages")
+
+
+class JobItemResponse(BaseModel):
+    """Response schema for the result of a single document within a job."""
+
+    document_id: int = Field(..., description="Document ID")
+    status: str = Field(..., description="Processing result (success, failed)")
+    action: Optional[str] = Field(None, description="Action taken (reset_to_draft, skipped)")
+    error: Optional[str] = Field(None, description="Error message if failed")
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
+
+class JobItemListResponse(BaseModel):
+    """Paginated response for the per-document results of a job."""
+
+    job_id: UUID = Field(..., description="Job unique identifier")
+    items: List[JobItemResponse] = Field(..., description="Per-document results")
+    total: int = Field(..., description="Total number of items in the job")
+    page: int = Field(..., description="Current page number")
+    page_size: int = Field(..., description="Number of items per page")
+    total_pages: int = Field(..., description="Total number of pages")
+
+
 class WebhookDocumentDetail(BaseModel):
     """Individual document result in webhook payload."""
 
@@ -3,9 +3,12 @@
 Contains business logic services for document and job operations.
 """
 
+from app.application.services.batch_get_documents import BatchGetDocuments
+from app.application.services.bulk_update_status import BulkUpdateStatus
 from app.application.services.create_document import CreateDocument
 from app.application.services.get_document import GetDocument
 from app.application.services.get_job_status import GetJobStatus
+from app.application.services.list_job_items import ListJobItems
 from app.application.services.list_jobs import ListJobs
 from app.application.services.process_batch import ProcessBatch
 from app.application.services.search_documents import SearchDocuments
@@ -13,9 +16,12 @@ from app.application.services.update_document import UpdateDocument
 from app.application.services.update_status import UpdateStatus
 
 __all__ = [
+    "BatchGetDocuments",
+    "BulkUpdateStatus",
     "CreateDocument",
     "GetDocument",
     "GetJobStatus",
+    "ListJobItems",
     "ListJobs",
     "ProcessBatch",
     "SearchDocuments",
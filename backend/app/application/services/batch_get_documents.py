@@ -0,0 +1,69 @@
+"""Batch get documents service.
+
+Handles retrieval of many documents by ID in a single query.
+"""
+
+from typing import Any, Dict, List, Union
+
+from sqlalchemy.orm import Session
+
+from app.application.dtos.document_dtos import (
+    BatchGetDocumentsRequest,
+    BatchGetDocumentsResponse,
+    SparseBatchGetDocumentsResponse,
+    SparseDocumentResponse,
+    parse_document_fields,
+)
+from app.core.tracing import traced
+from app.infrastructure.repositories.document_repository import DocumentRepository
+
+
+class BatchGetDocuments:
+    """Service for fetching many documents by ID."""
+
+    def __init__(self, db: Session) -> None:
+        """Initialize service with database session.
+
+        Args:
+            db: Database session
+        """
+        self.repository = DocumentRepository(db)
+
+    @traced()
+    def execute(
+        self, request: BatchGetDocumentsRequest
+    ) -> Union[BatchGetDocumentsResponse, SparseBatchGetDocumentsResponse]:
+        """Execute the multi-get.
+
+        Duplicate IDs are returned once, at their first position.
+
+        Args:
+            request: Document IDs and optional sparse fieldset
+
+        Returns:
+            Found documents in request order plus the IDs that do not exist
+
+        Raises:
+            InvalidFieldSelectionException: If ``request.fields`` contains an unknown field
+        """
+        selected = parse_document_fields(request.fields)
+        ids = list(dict.fromkeys(request.ids))
+
+        if selected is not None:
+            rows = self.repository.get_many_fields(ids, selected)
+            by_id: Dict[int, Any] = {row["id"]: row for row in rows}
+            return SparseBatchGetDocumentsResponse(
+                items=[SparseDocumentResponse.model_validate(by_id[i]) for i in ids if i in by_id],
+                missing=self._missing(ids, by_id),
+            )
+
+        by_id = {row.id: row for row in self.repository.get_many_rows(ids)}
+
+        return BatchGetDocumentsResponse.model_validate(
+            {"items": [by_id[i] for i in ids if i in by_id], "missing": self._missing(ids, by_id)},
+            from_attributes=True,
+        )
+
+    def _missing(self, ids: List[int], found: Dict[int, Any]) -> List[int]:
+        """Return the requested IDs that were not found, in request order."""
+        return [i for i in ids if i not in found]
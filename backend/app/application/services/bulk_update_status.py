@@ -0,0 +1,70 @@
+"""Bulk update document status service.
+
+Handles many status transitions in a single transaction with per-document outcomes.
+"""
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.application.dtos.document_dtos import (
+    BulkStatusResult,
+    BulkUpdateStatusRequest,
+    BulkUpdateStatusResponse,
+)
+from app.core.tracing import traced
+from app.infrastructure.repositories.document_repository import DocumentRepository
+
+
+class BulkUpdateStatus:
+    """Service for applying many document status transitions at once."""
+
+    def __init__(self, db: Session) -> None:
+        """Initialize service with database session.
+
+        Args:
+            db: Database session
+        """
+        self.document_repository = DocumentRepository(db)
+
+    @traced()
+    def execute(self, request: BulkUpdateStatusRequest, user_email: str) -> BulkUpdateStatusResponse:
+        """Execute the bulk transition.
+
+        Invalid entries do not abort the batch: every allowed transition is
+        applied and the rest are reported as not_found or invalid_transition.
+
+        Args:
+            request: Transitions to apply (one per document)
+            user_email: Email of the authenticated user performing the action
+
+        Returns:
+            Per-document outcomes in request order plus updated/failed counts
+        """
+        rows = self.document_repository.bulk_update_status(
+            [
+                {"document_id": entry.document_id, "new_status": entry.new_status.value, "comment": entry.comment}
+                for entry in request.entries
+            ],
+            user_email=user_email,
+        )
+
+        results = [
+            BulkStatusResult(
+                document_id=row.document_id,
+                outcome=self._outcome(row),
+                old_status=row.old_status,
+                new_status=row.new_status,
+            )
+            for row in rows
+        ]
+        updated = sum(1 for result in results if result.outcome == "updated")
+
+        return BulkUpdateStatusResponse(results=results, updated=updated, failed=len(results) - updated)
+
+    def _outcome(self, row: Row) -> str:
+        """Classify a repository row as updated, not_found or invalid_transition."""
+        if row.updated:
+            return "updated"
+        if row.old_status is None:
+            return "not_found"
+        return "invalid_transition"
@@ -6,6 +6,7 @@ Handles document creation with business rules validation.
 from sqlalchemy.orm import Session
 
 from app.application.dtos.document_dtos import CreateDocumentRequest, DocumentResponse
+from app.core.tracing import traced
 from app.domain.entities.document import Document
 from app.infrastructure.repositories.audit_repository import AuditRepository
 from app.infrastructure.repositories.document_repository import DocumentRepository
@@ -23,6 +24,7 @@ class CreateDocument:
         self.repository = DocumentRepository(db)
         self.audit_repository = AuditRepository(db)
 
+    @traced()
     def execute(self, request: CreateDocumentRequest) -> DocumentResponse:
         """Execute document creation.
 
@@ -3,9 +3,12 @@
 Handles document retrieval by ID.
 """
 
+from typing import Optional, Union
+
 from sqlalchemy.orm import Session
 
-from app.application.dtos.document_dtos import DocumentResponse
+from app.application.dtos.document_dtos import DocumentResponse, SparseDocumentResponse, parse_document_fields
+from app.core.tracing import traced
 from app.domain.exceptions import DocumentNotFoundException
 from app.infrastructure.repositories.document_repository import DocumentRepository
 
@@ -21,30 +24,33 @@ class GetDocument:
         """
         self.repository = DocumentRepository(db)
 
-    def execute(self, document_id: int) -> DocumentResponse:
+    @traced()
+    def execute(
+        self, document_id: int, fields: Optional[str] = None
+    ) -> Union[DocumentResponse, SparseDocumentResponse]:
         """Execute document retrieval.
 
         Args:
             document_id: Document ID to retrieve
+            fields: Optional comma-separated sparse fieldset (e.g. "type,amount,metadata.client")
 
         Returns:
-            Document response
+            Document response (sparse response with only the selected fields when ``fields`` is given)
 
         Raises:
             DocumentNotFoundException: If document doesn't exist
+            InvalidFieldSelectionException: If ``fields`` contains an unknown field
         """
-        document = self.repository.get_by_id(document_id)
+        selected = parse_document_fields(fields)
+        if selected is not None:
+            data = self.repository.get_fields(document_id, selected)
+            if data is None:
+                raise DocumentNotFoundException(document_id)
+            return SparseDocumentResponse.model_validate(data)
+
+        row = self.repository.get_row(document_id)
 
-        if not document:
+        if row is None:
             raise DocumentNotFoundException(document_id)
 
-        return DocumentResponse(
-            id=document.id,
-            type=document.type,
-            amount=document.amount,
-            status=document.status,
-            created_at=document.created_at,
-            updated_at=document.updated_at,
-            metadata=document.metadata,
-            created_by=document.created_by,
-        )
+        return DocumentResponse.model_validate(row)
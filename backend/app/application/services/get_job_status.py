@@ -8,6 +8,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.application.dtos.job_dtos import JobResponse
+from app.core.tracing import traced
 from app.domain.exceptions import JobNotFoundException
 from app.infrastructure.repositories.job_repository import JobRepository
 
@@ -23,6 +24,7 @@ class GetJobStatus:
         """
         self.repository = JobRepository(db)
 
+    @traced()
     def execute(self, job_id: UUID) -> JobResponse:
         """Execute job status retrieval.
 
@@ -0,0 +1,64 @@
+"""List job items service.
+
+Handles paginated retrieval of the per-document results of a job.
+"""
+
+import math
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.application.dtos.job_dtos import JobItemListResponse, JobItemResponse
+from app.core.tracing import traced
+from app.domain.exceptions import JobNotFoundException
+from app.infrastructure.repositories.job_repository import JobRepository
+
+
+class ListJobItems:
+    """Service for listing the per-document results of a job."""
+
+    def __init__(self, db: Session) -> None:
+        """Initialize service with database session.
+
+        Args:
+            db: Database session
+        """
+        self.repository = JobRepository(db)
+
+    @traced()
+    def execute(self, job_id: UUID, page: int = 1, page_size: int = 50) -> JobItemListResponse:
+        """Execute paginated job item listing.
+
+        Args:
+            job_id: Job UUID
+            page: Page number (1-based)
+            page_size: Number of items per page
+
+        Returns:
+            Paginated job item list response
+
+        Raises:
+            JobNotFoundException: If job doesn't exist
+        """
+        if not self.repository.exists(job_id):
+            raise JobNotFoundException(str(job_id))
+
+        skip = (page - 1) * page_size
+        items, total = self.repository.list_items(job_id, skip=skip, limit=page_size)
+
+        return JobItemListResponse(
+            job_id=job_id,
+            items=[
+                JobItemResponse(
+                    document_id=item.document_id,
+                    status=item.status,
+                    action=item.action,
+                    error=item.error,
+                )
+                for item in items
+            ],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=max(1, math.ceil(total / page_size)),
+        )
@@ -4,11 +4,18 @@ Handles paginated retrieval of all jobs.
 """
 
 import math
-from typing import Optional
+from typing import Optional, Union
 
 from sqlalchemy.orm import Session
 
-from app.application.dtos.job_dtos import JobListResponse, JobResponse
+from app.application.dtos.job_dtos import (
+    JobListResponse,
+    JobListView,
+    JobResponse,
+    JobSummaryListResponse,
+    JobSummaryResponse,
+)
+from app.core.tracing import traced
 from app.infrastructure.repositories.job_repository import JobRepository
 
 
@@ -23,23 +30,37 @@ class ListJobs:
         """
         self.repository = JobRepository(db)
 
+    @traced()
     def execute(
         self,
         page: int = 1,
         page_size: int = 10,
         status: Optional[str] = None,
-    ) -> JobListResponse:
+        view: JobListView = JobListView.FULL,
+    ) -> Union[JobListResponse, JobSummaryListResponse]:
         """Execute paginated job listing.
 
         Args:
             page: Page number (1-based)
             page_size: Number of items per page
             status: Optional status filter
+            view: ``full`` returns complete jobs, ``summary`` only status, timestamps and counts
 
         Returns:
-            Paginated job list response
+            Paginated job list response (summary list response when view is ``summary``)
         """
         skip = (page - 1) * page_size
+
+        if view == JobListView.SUMMARY:
+            rows, total = self.repository.list_summaries(status=status, skip=skip, limit=page_size)
+            return JobSummaryListResponse(
+                items=[JobSummaryResponse.model_validate(row) for row in rows],
+                total=total,
+                page=page,
+                page_size=page_size,
+                total_pages=max(1, math.ceil(total / page_size)),
+            )
+
         jobs, total = self.repository.list_all(status=status, skip=skip, limit=page_size)
 
         items = [
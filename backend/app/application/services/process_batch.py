@@ -6,8 +6,10 @@ Handles batch processing job creation and delegation to Celery.
 from sqlalchemy.orm import Session
 
 from app.application.dtos.job_dtos import JobResponse, ProcessBatchRequest
+from app.core.tracing import set_span_attributes, traced
 from app.domain.entities.job import Job
 from app.domain.exceptions import DocumentNotFoundException
+from app.infrastructure.notifications.tasks.celery_app import PROFILE_HEADER
 from app.infrastructure.notifications.tasks.document_tasks import process_documents_batch
 from app.infrastructure.repositories.document_repository import DocumentRepository
 from app.infrastructure.repositories.job_repository import JobRepository
@@ -25,11 +27,13 @@ class ProcessBatch:
         self.document_repository = DocumentRepository(db)
         self.job_repository = JobRepository(db)
 
-    def execute(self, request: ProcessBatchRequest) -> JobResponse:
+    @traced()
+    def execute(self, request: ProcessBatchRequest, profile: bool = False) -> JobResponse:
         """Execute batch processing job creation.
 
         Args:
             request: Batch processing request with document IDs
+            profile: Ask the worker to profile this run (see PROFILE_HEADER)
 
         Returns:
             Job response with pending status
@@ -37,16 +41,22 @@ class ProcessBatch:
         Raises:
             DocumentNotFoundException: If any document ID doesn't exist
         """
+        existing = self.document_repository.existing_ids(request.document_ids)
         for document_id in request.document_ids:
-            document = self.document_repository.get_by_id(document_id)
-            if not document:
+            if document_id not in existing:
                 raise DocumentNotFoundException(document_id)
 
         job = Job(document_ids=request.document_ids)
 
         created_job = self.job_repository.create(job)
+        set_span_attributes({"job.id": str(created_job.id), "job.document_count": len(created_job.document_ids)})
 
-        process_documents_batch.delay(str(created_job.id), created_job.document_ids)
+        if profile:
+            process_documents_batch.apply_async(
+                (str(created_job.id), created_job.document_ids), headers={PROFILE_HEADER: True}
+            )
+        else:
+            process_documents_batch.delay(str(created_job.id), created_job.document_ids)
 
         return JobResponse(
             job_id=created_job.id,
@@ -4,14 +4,18 @@ Handles document search with filters and pagination.
 """
 
 from math import ceil
+from typing import Union
 
 from sqlalchemy.orm import Session
 
 from app.application.dtos.document_dtos import (
-    DocumentResponse,
     PaginatedDocumentsResponse,
     SearchDocumentsRequest,
+    SparseDocumentResponse,
+    SparsePaginatedDocumentsResponse,
+    parse_document_fields,
 )
+from app.core.tracing import traced
 from app.infrastructure.repositories.document_repository import DocumentRepository
 
 
@@ -26,15 +30,22 @@ class SearchDocuments:
         """
         self.repository = DocumentRepository(db)
 
-    def execute(self, request: SearchDocumentsRequest) -> PaginatedDocumentsResponse:
+    @traced()
+    def execute(
+        self, request: SearchDocumentsRequest
+    ) -> Union[PaginatedDocumentsResponse, SparsePaginatedDocumentsResponse]:
         """Execute document search.
 
         Args:
-            request: Search request with filters and pagination
+            request: Search request with filters, pagination and optional sparse fieldset
 
         Returns:
-            Paginated documents response
+            Paginated documents response (sparse items when ``request.fields`` is given)
+
+        Raises:
+            InvalidFieldSelectionException: If ``request.fields`` contains an unknown field
         """
+        selected = parse_document_fields(request.fields)
         filter_mapping = {
             "type": request.type,
             "status": request.status,
@@ -46,27 +57,29 @@ class SearchDocuments:
         filters = {key: value for key, value in filter_mapping.items() if value is not None}
         skip = (request.page - 1) * request.page_size
 
-        documents, total = self.repository.search(filters=filters, skip=skip, limit=request.page_size)
-        total_pages = ceil(total / request.page_size) if total > 0 else 0
-
-        items = [
-            DocumentResponse(
-                id=doc.id,
-                type=doc.type,
-                amount=doc.amount,
-                status=doc.status,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at,
-                metadata=doc.metadata,
-                created_by=doc.created_by,
+        if selected is not None:
+            rows, total = self.repository.search_fields(
+                filters=filters, fields=selected, skip=skip, limit=request.page_size
             )
-            for doc in documents
-        ]
+            return SparsePaginatedDocumentsResponse(
+                items=[SparseDocumentResponse.model_validate(row) for row in rows],
+                total=total,
+                page=request.page,
+                page_size=request.page_size,
+                total_pages=ceil(total / request.page_size) if total > 0 else 0,
+            )
+
+        rows, total = self.repository.search_rows(filters=filters, skip=skip, limit=request.page_size)
+        total_pages = ceil(total / request.page_size) if total > 0 else 0
 
-        return PaginatedDocumentsResponse(
-            items=items,
-            total=total,
-            page=request.page,
-            page_size=request.page_size,
-            total_pages=total_pages,
+        # One validation pass over the whole page, reading the row attributes directly
+        return PaginatedDocumentsResponse.model_validate(
+            {
+                "items": rows,
+                "total": total,
+                "page": request.page,
+                "page_size": request.page_size,
+                "total_pages": total_pages,
+            },
+            from_attributes=True,
         )
@@ -6,6 +6,7 @@ Handles document field updates with business rules validation.
 from sqlalchemy.orm import Session
 
 from app.application.dtos.document_dtos import DocumentResponse, UpdateDocumentRequest
+from app.core.tracing import traced
 from app.domain.exceptions import DocumentNotFoundException
 from app.infrastructure.repositories.audit_repository import AuditRepository
 from app.infrastructure.repositories.document_repository import DocumentRepository
@@ -23,6 +24,7 @@ class UpdateDocument:
         self.repository = DocumentRepository(db)
         self.audit_repository = AuditRepository(db)
 
+    @traced()
     def execute(self, document_id: int, request: UpdateDocumentRequest) -> DocumentResponse:
         """Execute document update.
 
@@ -6,6 +6,7 @@ Handles document status transitions with state machine validation and audit logg
 from sqlalchemy.orm import Session
 
 from app.application.dtos.document_dtos import DocumentResponse, UpdateStatusRequest
+from app.core.tracing import traced
 from app.domain.entities.document.status import DocumentStatus
 from app.domain.exceptions import (
     DocumentNotFoundException,
@@ -28,6 +29,7 @@ class UpdateStatus:
         self.document_repository = DocumentRepository(db)
         self.audit_repository = AuditRepository(db)
 
+    @traced()
     def execute(self, document_id: int, request: UpdateStatusRequest, user_email: str) -> DocumentResponse:
         """Execute status update with validation and audit logging.
 
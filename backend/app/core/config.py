@@ -70,6 +70,10 @@ class Settings(BaseSettings):
         return keys
 
     WEBHOOK_URL: str = ""
+    # Optional per-channel keys for "http": "batch_size" (> 1 POSTs a JSON array of
+    # events) and "linger_seconds" (max wait for a batch to fill, default 2.0)
+    # "compression" ("gzip" or "zstd") with "compress_min_bytes" (default 1024), and
+    # "signing_secret" (adds an X-Duppla-Signature: sha256=<hmac> header over the sent bytes)
     NOTIFICATION_CHANNELS: List[Dict[str, Any]] = [
         {
             "type": "http",
@@ -80,6 +84,90 @@ class Settings(BaseSettings):
             },
         },
     ]
+    # Deadlines for NotificationDispatcher: per channel (one 10s HTTP attempt)
+    # and for the whole concurrent fan-out
+    NOTIFICATION_CHANNEL_TIMEOUT_SECONDS: float = 15.0
+    NOTIFICATION_DISPATCH_TIMEOUT_SECONDS: float = 20.0
+    # Shared HTTP connection pool for notification channels (one per worker process)
+    NOTIFICATION_HTTP_MAX_CONNECTIONS: int = 20
+    NOTIFICATION_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    NOTIFICATION_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    NOTIFICATION_HTTP2: bool = True
+    # Per-channel circuit breaker shared by all workers through Redis
+    NOTIFICATION_CIRCUIT_BREAKER_ENABLED: bool = True
+    NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    NOTIFICATION_CIRCUIT_WINDOW_SECONDS: int = 60
+    NOTIFICATION_CIRCUIT_OPEN_SECONDS: float = 30.0
+    NOTIFICATION_CIRCUIT_MAX_OPEN_SECONDS: float = 600.0
+    # Connect/read timeout of the breaker's Redis client; keep it well under the channel timeout
+    NOTIFICATION_CIRCUIT_REDIS_TIMEOUT_SECONDS: float = 1.0
+    # Outbox relay retries for failed channels (next attempt ~ backoff * 2^attempt, jittered)
+    NOTIFICATION_MAX_RETRIES: int = 3
+    NOTIFICATION_RETRY_BACKOFF_SECONDS: int = 2
+    # Outbox relay: events claimed per run (also caps channel batches) and Celery beat interval
+    OUTBOX_RELAY_BATCH_SIZE: int = 100
+    OUTBOX_RELAY_INTERVAL_SECONDS: float = 5.0
+
+    # Metrics: port where each Celery worker serves /metrics (0 disables). Multi-process
+    # aggregation (uvicorn workers, prefork children) is enabled by the PROMETHEUS_MULTIPROC_DIR env var
+    CELERY_METRICS_PORT: int = 0
+
+    # Connection pools: API processes use DB_POOL_SIZE + DB_MAX_OVERFLOW, Celery task processes
+    # DB_WORKER_POOL_SIZE + DB_WORKER_MAX_OVERFLOW. Checkouts wait DB_POOL_TIMEOUT_SECONDS on an
+    # exhausted pool; connections older than DB_POOL_RECYCLE_SECONDS (-1 never) are replaced. With
+    # DB_POOL_PRE_PING off, stale connections are only caught by recycle (saves a round trip per
+    # checkout). DB_POOL_USE_LIFO reuses the most recent connection so idle extras can time out.
+    # DB_PGBOUNCER=true (PgBouncer in transaction mode) disables client-side pooling entirely
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_WORKER_POOL_SIZE: int = 2
+    DB_WORKER_MAX_OVERFLOW: int = 2
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_USE_LIFO: bool = False
+    DB_PGBOUNCER: bool = False
+
+    # SQL statement budgets (N+1 detector). DB_STATEMENT_BUDGET applies to every HTTP request
+    # (0 disables); DB_STATEMENT_BUDGETS overrides it per "METHOD /route/template" or Celery task
+    # name (tasks have no budget unless listed). Over budget logs a warning, or raises when strict
+    DB_STATEMENT_BUDGET: int = 20
+    DB_STATEMENT_BUDGETS: Dict[str, int] = {}
+    DB_STATEMENT_BUDGET_STRICT: bool = False
+
+    # Slow-query log: statements slower than the threshold (0 disables) are logged and kept
+    # for GET /admin/slow-queries; a sample gets its plan captured: EXPLAIN (ANALYZE, BUFFERS) for plain
+    # SELECTs, plain EXPLAIN (no execution) for CTEs and statements that write or lock rows
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
+    SLOW_QUERY_LOG_SIZE: int = 100
+
+    # Tracing (see app.core.tracing): "none" (off), "memory" (in-process ring buffer)
+    # or "file" (JSON lines appended to TRACING_FILE_PATH by the API and the workers)
+    TRACING_EXPORTER: str = "none"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+
+    # On-demand profiling (POST /admin/profile and the "profile" Celery message header):
+    # sampling interval, longest allowed profile, and where Celery task profiles are written
+    PROFILING_INTERVAL_MS: float = 10.0
+    PROFILING_MAX_SECONDS: float = 60.0
+    PROFILING_OUTPUT_DIR: str = "/tmp/duppla-profiles"  # noqa: S108
+
+    # Readiness (GET /ready): reports are cached for READINESS_CACHE_SECONDS and each probe is
+    # abandoned after READINESS_PROBE_TIMEOUT_SECONDS. A critical check that is "down" answers 503
+    # so load balancers drain the instance; degraded checks (and non-critical failures) answer 200
+    # with "status": "degraded"
+    READINESS_CACHE_SECONDS: float = 1.0
+    READINESS_PROBE_TIMEOUT_SECONDS: float = 1.0
+    READINESS_CRITICAL_CHECKS: List[str] = ["database", "redis"]
+    READINESS_DB_LATENCY_DEGRADED_MS: float = 100.0
+    READINESS_DB_POOL_SATURATION: float = 0.9
+    READINESS_REDIS_LATENCY_DEGRADED_MS: float = 50.0
+    READINESS_QUEUES: List[str] = ["celery", "notifications"]
+    READINESS_QUEUE_DEPTH_DEGRADED: int = 1000
+    READINESS_WORKER_HEARTBEAT_MAX_AGE_SECONDS: float = 30.0
+    # Interval at which each Celery worker writes its heartbeat to Redis
+    WORKER_HEARTBEAT_INTERVAL_SECONDS: float = 10.0
 
     # CORS
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:5173"]
@@ -0,0 +1,114 @@
+"""Prometheus metrics shared by the API and the Celery workers.
+
+Every metric is defined here so the API process, each uvicorn worker and each
+Celery prefork child register the same names. When the
+``PROMETHEUS_MULTIPROC_DIR`` environment variable points to a writable
+directory (it must be set before the process starts and emptied on deploy),
+each process writes its samples there and ``render_metrics`` aggregates them
+with a ``MultiProcessCollector``; otherwise the in-process registry is used.
+"""
+
+import os
+from typing import Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Buckets sized for fast paths (sub-millisecond Redis/SQL up to multi-second requests)
+_FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+_JOB_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=_FAST_BUCKETS,
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the SQLAlchemy pool",
+    buckets=_FAST_BUCKETS,
+)
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the SQLAlchemy pool",
+    multiprocess_mode="livesum",
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time by statement type",
+    ["operation"],
+    buckets=_FAST_BUCKETS,
+)
+
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency from RedisClient",
+    ["command"],
+    buckets=_FAST_BUCKETS,
+)
+
+BATCH_JOB_DURATION = Histogram(
+    "batch_job_duration_seconds",
+    "Duration of process_documents_batch runs",
+    ["status"],
+    buckets=_JOB_BUCKETS,
+)
+BATCH_DOCUMENTS = Counter(
+    "batch_documents_total",
+    "Documents handled by process_documents_batch",
+    ["outcome"],
+)
+BATCH_DOCUMENTS_PER_SECOND = Gauge(
+    "batch_job_documents_per_second",
+    "Throughput of the most recently finished batch job",
+    multiprocess_mode="mostrecent",
+)
+
+NOTIFICATION_DELIVERIES = Counter(
+    "notification_deliveries_total",
+    "Notification channel deliveries by outcome",
+    ["channel", "outcome"],
+)
+
+
+def multiprocess_dir() -> Optional[str]:
+    """Return the multiprocess metrics directory, or None in single-process mode."""
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Return the registry to expose: aggregated across processes when enabled."""
+    if multiprocess_dir():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Render every metric in the Prometheus text format.
+
+    Returns:
+        Tuple of (body, content type)
+    """
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop the live gauges of an exited worker process (multiprocess mode only).
+
+    Args:
+        pid: Process ID of the exited worker
+    """
+    if multiprocess_dir():
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,163 @@
+"""On-demand sampling profiler.
+
+A background thread snapshots the Python stacks of the process's threads
+every ``interval`` seconds (``sys._current_frames``) and aggregates them in
+collapsed-stack format (``frame;frame;frame count``), which flamegraph.pl,
+speedscope and most flame graph viewers read directly.
+
+Overhead is bounded: nothing runs unless a profile is in progress, only one
+profile can run per process at a time, the interval has a 1 ms floor and
+stacks are truncated at ``max_depth`` frames. Threads parked in the standard
+library waiting for work (thread pool queues, selectors, locks) are skipped
+by default so idle time does not drown out the hot paths.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Dict, Optional, Set
+
+# Leaf frames in these stdlib modules mean the thread is idle (blocked waiting)
+_IDLE_MODULES = ("threading.py", "selectors.py", "queue.py", "socket.py", "ssl.py")
+_MIN_INTERVAL = 0.001
+
+_active_lock = threading.Lock()
+_completed_requests = 0
+
+
+class ProfilerBusy(RuntimeError):
+    """Another profile is already running in this process."""
+
+
+def _label(code: CodeType, cache: Dict[CodeType, str]) -> str:
+    label = cache.get(code)
+    if label is None:
+        label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        cache[code] = label
+    return label
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return frame.f_code.co_filename.endswith(_IDLE_MODULES)
+
+
+class SamplingProfiler:
+    """Statistical profiler for the threads of the current process."""
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        thread_ids: Optional[Set[int]] = None,
+        max_depth: int = 128,
+        include_idle: bool = False,
+        max_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize profiler.
+
+        Args:
+            interval: Seconds between samples (floored at 1 ms)
+            thread_ids: Only sample these threads (default: every thread but the sampler)
+            max_depth: Innermost frames kept per stack
+            include_idle: Also count threads blocked in threading/selectors/queue waits
+            max_seconds: Stop sampling, and free the process-wide slot, after this long
+                even if stop() has not been called yet (default: no limit)
+        """
+        self.interval = max(interval, _MIN_INTERVAL)
+        self.thread_ids = thread_ids
+        self.max_depth = max_depth
+        self.include_idle = include_idle
+        self.max_seconds = max_seconds
+        self.samples = 0
+        self.duration = 0.0
+        self.capped = False
+        self._stacks: Counter = Counter()
+        self._labels: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        """Start sampling in a daemon thread.
+
+        Returns:
+            The profiler, for chaining
+
+        Raises:
+            ProfilerBusy: If another profile is running in this process
+        """
+        if not _active_lock.acquire(blocking=False):
+            raise ProfilerBusy("A profile is already running in this process")
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        """Stop sampling and release the process-wide profiler slot.
+
+        Returns:
+            The profiler, for chaining
+        """
+        if self._thread is None:
+            return self
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        return self
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        deadline = None if self.max_seconds is None else self._started_at + self.max_seconds
+        try:
+            while not self._stop.wait(self.interval):
+                if deadline is not None and time.perf_counter() >= deadline:
+                    self.capped = True
+                    break
+                self._sample(own_id)
+        finally:
+            # Released here, not in stop(), so a capped profile frees the slot on its own
+            self.duration = time.perf_counter() - self._started_at
+            _active_lock.release()
+
+    def _sample(self, own_id: int) -> None:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                continue
+            if not self.include_idle and _is_idle(frame):
+                continue
+            stack = []
+            current: Optional[FrameType] = frame
+            while current is not None and len(stack) < self.max_depth:
+                stack.append(_label(current.f_code, self._labels))
+                current = current.f_back
+            self._stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        """Return the profile in collapsed-stack format, most frequent stacks first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+
+def is_profiling() -> bool:
+    """Return True while a profile is running in this process."""
+    return _active_lock.locked()
+
+
+def request_completed() -> None:
+    """Count a finished HTTP request (only called while profiling)."""
+    global _completed_requests
+    _completed_requests += 1
+
+
+def completed_requests() -> int:
+    """Return the number of requests counted while profiling."""
+    return _completed_requests
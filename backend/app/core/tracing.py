@@ -0,0 +1,411 @@
+"""Lightweight tracing.
+
+A minimal span API that follows the OpenTelemetry data model (trace and span
+IDs, parent span, kind, attributes, status) and propagates context with the
+W3C ``traceparent`` header, but has no dependencies and runs fully offline.
+Spans are exported according to ``TRACING_EXPORTER``:
+
+* ``none`` (default): spans are not created; ``start_span`` yields a no-op span
+* ``memory``: finished spans are kept in an in-process ring buffer
+* ``file``: finished spans are appended as JSON lines to ``TRACING_FILE_PATH``
+  (one file can be shared by the API and the workers)
+
+Exported spans use the OTLP/JSON field names, so they can be converted for an
+OpenTelemetry collector.
+"""
+
+import functools
+import inspect
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+import orjson
+
+from app.core.config import settings
+
+TRACEPARENT_HEADER = "traceparent"
+
+KIND_INTERNAL = "internal"
+KIND_SERVER = "server"
+KIND_PRODUCER = "producer"
+KIND_CONSUMER = "consumer"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class SpanContext:
+    """Identifiers needed to continue a trace (in-process or across processes)."""
+
+    __slots__ = ("span_id", "trace_id")
+
+    def __init__(self, trace_id: str, span_id: str) -> None:
+        """Initialize context.
+
+        Args:
+            trace_id: 32 hex character trace ID
+            span_id: 16 hex character span ID
+        """
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+    def to_traceparent(self) -> str:
+        """Return the W3C ``traceparent`` header value (always sampled)."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @classmethod
+    def from_traceparent(cls, value: Optional[str]) -> Optional["SpanContext"]:
+        """Parse a W3C ``traceparent`` header value.
+
+        Args:
+            value: Header value, may be None
+
+        Returns:
+            SpanContext, or None if the value is missing or malformed
+        """
+        parts = (value or "").strip().split("-")
+        if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+            return None
+        try:
+            int(parts[1], 16)
+            int(parts[2], 16)
+        except ValueError:
+            return None
+        return cls(parts[1], parts[2])
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = ("attributes", "context", "end_ns", "kind", "name", "parent_id", "start_ns", "status", "status_message")
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional[SpanContext] = None,
+        kind: str = KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        start_ns: Optional[int] = None,
+    ) -> None:
+        """Start a span.
+
+        Args:
+            name: Operation name (e.g. ``ProcessBatch.execute``)
+            parent: Parent span context; a new trace is started when None
+            kind: Span kind (internal, server, producer, consumer)
+            attributes: Initial attributes
+            start_ns: Start time in Unix nanoseconds (default: now)
+        """
+        trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.context = SpanContext(trace_id, secrets.token_hex(8))
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = "unset"
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute (strings, numbers, booleans or lists of them)."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed with the given exception."""
+        self.status = "error"
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        """Finish the span and hand it to the exporter.
+
+        Args:
+            end_ns: End time in Unix nanoseconds (default: now)
+        """
+        if self.end_ns is not None:
+            return
+        self.end_ns = end_ns if end_ns is not None else time.time_ns()
+        if self.status == "unset":
+            self.status = "ok"
+        exporter = get_exporter()
+        if exporter is not None:
+            exporter.export(self)
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds (0 while running)."""
+        return ((self.end_ns or self.start_ns) - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span in OTLP/JSON field names."""
+        return {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message},
+            "resource": {"service.name": settings.PROJECT_NAME, "process.pid": os.getpid()},
+        }
+
+
+class _NoopSpan:
+    """Span returned when tracing is disabled; every operation is a no-op."""
+
+    __slots__ = ()
+
+    context = None
+
+    def set_attribute(self, key: str, value: Any) -> None:  # noqa: ANN401
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+# ── Exporters ─────────────────────────────────────────────────────────────────
+
+
+class InMemoryExporter:
+    """Keeps the most recent finished spans in memory (tests, debugging)."""
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        """Initialize exporter.
+
+        Args:
+            max_spans: Ring buffer size; older spans are dropped
+        """
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        """Store a finished span."""
+        self._spans.append(span)
+
+    def spans(self) -> List[Span]:
+        """Return the stored spans, oldest first."""
+        return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop every stored span."""
+        self._spans.clear()
+
+
+class FileExporter:
+    """Appends finished spans as JSON lines to a file shared by all processes."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize exporter.
+
+        Args:
+            path: Output file, opened in append mode for every span
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Append one span as a single line (atomic with O_APPEND for small writes)."""
+        line = orjson.dumps(span.to_dict(), default=str, option=orjson.OPT_APPEND_NEWLINE)
+        with self._lock, open(self.path, "ab") as file:
+            file.write(line)
+
+
+_exporter: Any = None
+_exporter_configured = False
+
+
+def get_exporter() -> Any:  # noqa: ANN401
+    """Return the exporter configured by ``TRACING_EXPORTER``, or None when disabled."""
+    global _exporter, _exporter_configured
+    if not _exporter_configured:
+        if settings.TRACING_EXPORTER == "memory":
+            _exporter = InMemoryExporter()
+        elif settings.TRACING_EXPORTER == "file":
+            _exporter = FileExporter(settings.TRACING_FILE_PATH)
+        _exporter_configured = True
+    return _exporter
+
+
+def set_exporter(exporter: Any) -> None:  # noqa: ANN401
+    """Replace the exporter (None disables tracing).
+
+    Args:
+        exporter: Object with an ``export(span)`` method, or None
+    """
+    global _exporter, _exporter_configured
+    _exporter = exporter
+    _exporter_configured = True
+
+
+# ── Context ───────────────────────────────────────────────────────────────────
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """Return the active span in this context, if any."""
+    return _current_span.get()
+
+
+def set_span_attributes(attributes: Dict[str, Any]) -> None:
+    """Set attributes on the active span (no-op when there is none).
+
+    Args:
+        attributes: Attribute names and values (e.g. ``{"job.id": "..."}``)
+    """
+    span = _current_span.get()
+    if span is not None:
+        span.attributes.update(attributes)
+
+
+def inject(headers: Dict[str, Any]) -> None:
+    """Add the active span's ``traceparent`` to outgoing headers (no-op without one).
+
+    Args:
+        headers: Mutable header mapping (HTTP headers, Celery message headers)
+    """
+    span = _current_span.get()
+    if span is not None:
+        headers[TRACEPARENT_HEADER] = span.context.to_traceparent()
+
+
+def extract(headers: Optional[Mapping[str, Any]]) -> Optional[SpanContext]:
+    """Read the remote parent from incoming headers.
+
+    Args:
+        headers: Incoming header mapping
+
+    Returns:
+        Parent SpanContext, or None
+    """
+    if not headers:
+        return None
+    return SpanContext.from_traceparent(headers.get(TRACEPARENT_HEADER))
+
+
+def begin_span(
+    name: str,
+    parent: Optional[SpanContext] = None,
+    kind: str = KIND_INTERNAL,
+    attributes: Optional[Dict[str, Any]] = None,
+    start_ns: Optional[int] = None,
+) -> Tuple[Any, Any]:
+    """Start a span and make it current, for lifecycles split across callbacks.
+
+    Prefer ``start_span``; use this when start and end happen in different
+    functions (e.g. Celery prerun/postrun signals).
+
+    Args:
+        name: Operation name
+        parent: Explicit parent (default: the current span)
+        kind: Span kind
+        attributes: Initial attributes
+        start_ns: Start time in Unix nanoseconds (default: now)
+
+    Returns:
+        Tuple of (span, token for ``finish_span``); (NOOP_SPAN, None) when disabled
+    """
+    if get_exporter() is None:
+        return NOOP_SPAN, None
+    if parent is None:
+        active = _current_span.get()
+        parent = active.context if active is not None else None
+    span = Span(name, parent=parent, kind=kind, attributes=attributes, start_ns=start_ns)
+    return span, _current_span.set(span)
+
+
+def finish_span(span: Any, token: Any) -> None:  # noqa: ANN401
+    """End a span started with ``begin_span`` and restore the previous current span."""
+    span.end()
+    if token is not None:
+        _current_span.reset(token)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    parent: Optional[SpanContext] = None,
+    kind: str = KIND_INTERNAL,
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """Run the block inside a new span (child of the current span by default).
+
+    Exceptions mark the span as failed and are re-raised.
+
+    Args:
+        name: Operation name
+        parent: Explicit parent (default: the current span)
+        kind: Span kind
+        attributes: Initial attributes
+
+    Yields:
+        The span (NOOP_SPAN when tracing is disabled)
+    """
+    span, token = begin_span(name, parent=parent, kind=kind, attributes=attributes)
+    try:
+        yield span
+    except BaseException as error:
+        span.record_error(error)
+        raise
+    finally:
+        finish_span(span, token)
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorate a function or coroutine function to run inside a span.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                with start_span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with start_span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def traced_methods(cls: type) -> type:
+    """Class decorator that wraps every public method in a ``Class.method`` span.
+
+    Args:
+        cls: Class to instrument (e.g. a repository)
+
+    Returns:
+        The same class
+    """
+    for attr, value in list(vars(cls).items()):
+        if not attr.startswith("_") and inspect.isfunction(value):
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
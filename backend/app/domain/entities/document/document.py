@@ -37,6 +37,9 @@ class Document:
         created_by: User who created the document
     """
 
+    # No per-instance __dict__: batch jobs and bulk reads hold many documents at once
+    __slots__ = ("amount", "created_at", "created_by", "id", "metadata", "status", "type", "updated_at")
+
     def __init__(
         self,
         type: str,
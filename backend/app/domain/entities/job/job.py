@@ -25,6 +25,8 @@ class Job:
         result: Processing result details (JSON)
     """
 
+    __slots__ = ("completed_at", "created_at", "document_ids", "error_message", "id", "result", "status")
+
     def __init__(
         self,
         document_ids: List[int],
@@ -22,7 +22,7 @@ class UserStatus(str, Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity with role and approval status.
 
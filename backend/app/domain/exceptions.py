@@ -61,3 +61,12 @@ class DocumentNotEditableException(DomainException):
             f"Current state: {current_state}"
         )
         super().__init__(message)
+
+
+class InvalidFieldSelectionException(DomainException):
+    """Raised when a sparse fieldset requests an unknown field."""
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        message = f"Invalid field '{field}' in fields selection"
+        super().__init__(message)
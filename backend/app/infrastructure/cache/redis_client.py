@@ -5,10 +5,14 @@ usable for any identifier (API key, user ID, IP, etc.).
 """
 
 import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
 
 import redis
 
 from app.core.config import settings
+from app.core.metrics import REDIS_COMMAND_DURATION
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +20,16 @@ _PREFIX_KEY_VALID = "apikey:valid:"
 _PREFIX_RATE = "rl:"  # generic rate-limit prefix
 
 
+@contextmanager
+def _timed(command: str) -> Iterator[None]:
+    """Observe the latency of one Redis command in ``redis_command_duration_seconds``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REDIS_COMMAND_DURATION.labels(command=command).observe(time.perf_counter() - start)
+
+
 class RedisClient:
     """Redis client with API key caching and generic rate limiting."""
 
@@ -28,19 +42,22 @@ class RedisClient:
 
     def is_key_cached_valid(self, api_key: str) -> bool:
         """Return True if the key was previously validated and is still cached."""
-        return self._client.exists(f"{_PREFIX_KEY_VALID}{api_key}") == 1
+        with _timed("exists"):
+            return self._client.exists(f"{_PREFIX_KEY_VALID}{api_key}") == 1
 
     def cache_valid_key(self, api_key: str) -> None:
         """Store a validated API key in cache with TTL."""
-        self._client.setex(
-            name=f"{_PREFIX_KEY_VALID}{api_key}",
-            time=settings.API_KEY_CACHE_TTL,
-            value="1",
-        )
+        with _timed("setex"):
+            self._client.setex(
+                name=f"{_PREFIX_KEY_VALID}{api_key}",
+                time=settings.API_KEY_CACHE_TTL,
+                value="1",
+            )
 
     def invalidate_key(self, api_key: str) -> None:
         """Remove a key from the valid cache (e.g. on revocation)."""
-        self._client.delete(f"{_PREFIX_KEY_VALID}{api_key}")
+        with _timed("delete"):
+            self._client.delete(f"{_PREFIX_KEY_VALID}{api_key}")
 
     # -------------------------------------------------------------------------
     # Rate limiting
@@ -63,15 +80,18 @@ class RedisClient:
             - retry_after:   Seconds until the window resets (0 if allowed)
         """
         rate_key = f"{_PREFIX_RATE}{identifier}"
-        count = self._client.incr(rate_key)
+        with _timed("incr"):
+            count = self._client.incr(rate_key)
 
         if count == 1:
-            self._client.expire(rate_key, settings.RATE_LIMIT_WINDOW_SECONDS)
+            with _timed("expire"):
+                self._client.expire(rate_key, settings.RATE_LIMIT_WINDOW_SECONDS)
 
         allowed = count <= settings.RATE_LIMIT_REQUESTS
         retry_after = 0
         if not allowed:
-            ttl = self._client.ttl(rate_key)
+            with _timed("ttl"):
+                ttl = self._client.ttl(rate_key)
             retry_after = max(ttl, 1)
 
         return allowed, count, retry_after
@@ -7,16 +7,20 @@ from app.infrastructure.database.models import (
     AuditLogModel,
     Base,
     DocumentModel,
+    JobItemModel,
     JobModel,
 )
-from app.infrastructure.database.session import SessionLocal, engine, get_db
+from app.infrastructure.database.session import SessionLocal, WorkerSessionLocal, engine, get_db, worker_engine
 
 __all__ = [
     "AuditLogModel",
     "Base",
     "DocumentModel",
+    "JobItemModel",
     "JobModel",
     "SessionLocal",
+    "WorkerSessionLocal",
     "engine",
     "get_db",
+    "worker_engine",
 ]
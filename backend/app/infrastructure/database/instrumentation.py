@@ -0,0 +1,210 @@
+"""SQLAlchemy engine instrumentation.
+
+Hooks Prometheus metrics into an engine: per-statement timing through
+cursor execution events, checked-out connection count through pool
+checkout/checkin events, and pool checkout wait time through
+``InstrumentedQueuePool``.
+
+The same cursor events count statements and DB time per unit of work (an
+HTTP request or a Celery task) through ``track_queries``, which backs the
+``Server-Timing`` header and the per-endpoint statement budgets used to
+catch N+1 query patterns.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_CONNECTIONS_IN_USE, DB_STATEMENT_DURATION
+
+logger = logging.getLogger(__name__)
+
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "SET", "COPY"})
+_QUERY_START_KEY = "query_start_time"
+
+
+@dataclass
+class QueryStats:
+    """SQL statements issued during one unit of work."""
+
+    statements: int = 0
+    duration: float = 0.0
+
+    @property
+    def duration_ms(self) -> float:
+        """Total statement time in milliseconds."""
+        return self.duration * 1000
+
+
+class StatementBudgetExceeded(RuntimeError):
+    """A request or task ran more SQL statements than its budget (strict mode only)."""
+
+
+# Mutated in place, so sync routes running in the threadpool (which get a copy
+# of the context) still add to the request's stats
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_tracking() -> Token:
+    """Start counting statements in the current context.
+
+    Returns:
+        Token to pass to stop_query_tracking
+    """
+    return _query_stats.set(QueryStats())
+
+
+def stop_query_tracking(token: Token) -> QueryStats:
+    """Stop counting and restore the previous tracking state.
+
+    Args:
+        token: Token returned by start_query_tracking
+
+    Returns:
+        Statements counted since start_query_tracking
+    """
+    stats = _query_stats.get() or QueryStats()
+    _query_stats.reset(token)
+    return stats
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Return the stats being collected in the current context, if any."""
+    return _query_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed inside the block.
+
+    Yields:
+        QueryStats updated as statements run
+    """
+    token = start_query_tracking()
+    try:
+        yield _query_stats.get()
+    finally:
+        _query_stats.reset(token)
+
+
+def statement_budget(name: str, default: int = 0) -> int:
+    """Return the statement budget for an endpoint or task.
+
+    Args:
+        name: ``"METHOD /route/template"`` for requests, task name for Celery tasks
+        default: Budget when ``DB_STATEMENT_BUDGETS`` has no entry (0 = unlimited)
+
+    Returns:
+        Maximum number of statements, 0 for no limit
+    """
+    return settings.DB_STATEMENT_BUDGETS.get(name, default)
+
+
+def check_statement_budget(name: str, stats: QueryStats, budget: int) -> None:
+    """Warn, or raise in strict mode, when stats exceed the budget.
+
+    Args:
+        name: Endpoint or task name, for the message
+        stats: Statements counted for the unit of work
+        budget: Maximum number of statements (0 = unlimited)
+
+    Raises:
+        StatementBudgetExceeded: If over budget and DB_STATEMENT_BUDGET_STRICT is on
+    """
+    if not budget or stats.statements <= budget:
+        return
+
+    message = (
+        f"{name} ran {stats.statements} SQL statements (budget {budget}, {stats.duration_ms:.1f} ms); "
+        "look for queries issued inside a loop"
+    )
+    if settings.DB_STATEMENT_BUDGET_STRICT:
+        raise StatementBudgetExceeded(message)
+    logger.warning(
+        message,
+        extra={
+            "db_name": name,
+            "db_statements": stats.statements,
+            "db_time_ms": stats.duration_ms,
+            "db_budget": budget,
+        },
+    )
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection.
+
+    The wait includes opening a new connection when the pool has room, and
+    blocking on ``pool_timeout`` when it is exhausted.
+    """
+
+    def _do_get(self) -> Any:  # noqa: ANN401
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def statement_operation(statement: str) -> str:
+    """Return the statement type used as metric label (SELECT, UPDATE, ...).
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        Leading SQL keyword, or "OTHER" to keep label cardinality bounded
+    """
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:  # noqa: ANN401
+    # A single value, not a stack: cursor executions never nest on a connection, and the
+    # start of a statement that raised (no after_cursor_execute) is overwritten by the next
+    conn.info[_QUERY_START_KEY] = time.perf_counter()
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:  # noqa: ANN401
+    start = conn.info.pop(_QUERY_START_KEY, None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    DB_STATEMENT_DURATION.labels(operation=statement_operation(statement)).observe(elapsed)
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.duration += elapsed
+
+
+def _on_checkout(*args: Any) -> None:
+    DB_POOL_CONNECTIONS_IN_USE.inc()
+
+
+def _on_checkin(*args: Any) -> None:
+    DB_POOL_CONNECTIONS_IN_USE.dec()
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Register the metric event listeners on an engine.
+
+    Args:
+        engine: Engine to instrument
+
+    Returns:
+        The same engine, for chaining
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.pool, "checkout", _on_checkout)
+    event.listen(engine.pool, "checkin", _on_checkin)
+    return engine
@@ -7,6 +7,8 @@ from app.infrastructure.database.models.audit_log import AuditLogModel
 from app.infrastructure.database.models.base import Base
 from app.infrastructure.database.models.document import DocumentModel
 from app.infrastructure.database.models.job import JobModel
+from app.infrastructure.database.models.job_item import JobItemModel
+from app.infrastructure.database.models.outbox import OutboxModel
 from app.infrastructure.database.models.user import UserModel
 
-__all__ = ["AuditLogModel", "Base", "DocumentModel", "JobModel", "UserModel"]
+__all__ = ["AuditLogModel", "Base", "DocumentModel", "JobItemModel", "JobModel", "OutboxModel", "UserModel"]
@@ -0,0 +1,50 @@
+"""Job item SQLAlchemy model.
+
+Stores the per-document outcome of a batch processing job.
+"""
+
+from typing import Any, ClassVar, Dict
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+from app.infrastructure.database.models.base import Base
+
+
+class JobItemModel(Base):
+    """SQLAlchemy model for finance.job_items.
+
+    Attributes:
+        id: Primary key (also preserves the processing order within a job)
+        job_id: Parent job UUID
+        document_id: Processed document ID
+        status: Per-document result (success, failed)
+        action: Optional action taken (reset_to_draft, skipped)
+        error: Error code or message if the document failed
+    """
+
+    __tablename__ = "job_items"
+    __table_args__: ClassVar[tuple] = (
+        Index("ix_job_items_job_id_id", "job_id", "id"),
+        {"schema": "finance"},
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    job_id = Column(PGUUID(as_uuid=True), ForeignKey("finance.jobs.id", ondelete="CASCADE"), nullable=False)
+    document_id = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False)
+    action = Column(String(50), nullable=True)
+    error = Column(Text, nullable=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary.
+
+        Returns:
+            Dictionary representation of the job item
+        """
+        return {
+            "document_id": self.document_id,
+            "status": self.status,
+            "action": self.action,
+            "error": self.error,
+        }
@@ -0,0 +1,70 @@
+"""Outbox SQLAlchemy model.
+
+Stores events that must be delivered to notification channels.
+"""
+
+from typing import Any, ClassVar, Dict
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.models.base import Base
+
+
+class OutboxModel(Base):
+    """SQLAlchemy model for finance.outbox.
+
+    Attributes:
+        id: Primary key (also the delivery order and the event idempotency key)
+        event_type: Event name (e.g. job.completed)
+        payload: Event data sent to the notification channels
+        channels: Channel names still to deliver to (None = all configured)
+        status: Delivery status (pending, sent, failed)
+        attempts: Number of delivery attempts made
+        next_attempt_at: Earliest time the relay may pick the event up
+        created_at: Creation timestamp
+        processed_at: Timestamp when the event was sent or given up
+        last_error: Error of the last failed attempt
+    """
+
+    __tablename__ = "outbox"
+    __table_args__: ClassVar[tuple] = (
+        Index(
+            "ix_outbox_pending_next_attempt_at",
+            "next_attempt_at",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        {"schema": "finance"},
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    event_type = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    channels = Column(JSONB, nullable=True)
+    status = Column(String(20), nullable=False, default="pending", server_default="pending")
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime, nullable=False, server_default=func.now())
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    processed_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary.
+
+        Returns:
+            Dictionary representation of the outbox event
+        """
+        return {
+            "id": self.id,
+            "event_type": self.event_type,
+            "payload": self.payload,
+            "channels": self.channels,
+            "status": self.status,
+            "attempts": self.attempts,
+            "next_attempt_at": self.next_attempt_at,
+            "created_at": self.created_at,
+            "processed_at": self.processed_at,
+            "last_error": self.last_error,
+        }
@@ -1,22 +1,72 @@
 """Database session management.
 
 Handles SQLAlchemy engine and session lifecycle.
+
+The API and the Celery workers get separate engines (``engine`` /
+``worker_engine``) sized by DB_POOL_* and DB_WORKER_POOL_*: a prefork child
+runs one task at a time and needs far fewer connections than an API process
+serving concurrent requests. With DB_PGBOUNCER the engines keep no pool of
+their own (NullPool) and leave connection pooling to PgBouncer.
 """
 
-from sqlalchemy import create_engine
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.infrastructure.database.instrumentation import InstrumentedQueuePool, instrument_engine
+from app.infrastructure.database.slow_queries import enable_slow_query_log
+
+_SKIP_AUDIT_SQL = text("SET LOCAL app.skip_audit = 'application'")
+_SKIP_AUDIT_KEY = "skip_audit_transaction"
+
+
+def create_db_engine(pool_size: int, max_overflow: int) -> Engine:
+    """Create an engine with the DB_POOL_* (or PgBouncer) pool settings.
+
+    Pool and statement timings are exported as Prometheus metrics, and
+    statements over SLOW_QUERY_THRESHOLD_MS are recorded in the slow-query log.
+
+    Args:
+        pool_size: Connections kept open in the pool
+        max_overflow: Extra connections opened under burst load, closed when returned
+
+    Returns:
+        Instrumented engine
+    """
+    if settings.DB_PGBOUNCER:
+        # PgBouncer (transaction mode) owns the pool: every checkout is a fresh, cheap
+        # client connection, so a pre-ping would only add a round trip. psycopg2 never
+        # uses server-side prepared statements, so no driver option is needed
+        pool_options: Dict[str, Any] = {"poolclass": NullPool}
+    else:
+        pool_options = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+        }
+    return enable_slow_query_log(
+        instrument_engine(create_engine(settings.DATABASE_URL, echo=settings.SQL_ECHO, **pool_options))
+    )
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.SQL_ECHO,
-)
+
+# API engine
+engine = create_db_engine(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Celery task engine (see app.infrastructure.notifications.tasks)
+worker_engine = create_db_engine(settings.DB_WORKER_POOL_SIZE, settings.DB_WORKER_MAX_OVERFLOW)
+
+WorkerSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=worker_engine)
+
 
 def get_db() -> Session:
     """Dependency for getting database session.
@@ -36,3 +86,21 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+
+def skip_audit(db: Session) -> None:
+    """Disable the audit triggers for the rest of the session's current transaction.
+
+    Used before writes the application audits itself. The setting is
+    transaction-local (``SET LOCAL``), so it never leaks to other clients of
+    a server connection shared through PgBouncer, and it is sent only once
+    per transaction however many writes follow.
+
+    Args:
+        db: Session about to write
+    """
+    transaction = db.get_transaction()
+    if transaction is not None and db.info.get(_SKIP_AUDIT_KEY) is transaction:
+        return
+    db.execute(_SKIP_AUDIT_SQL)
+    db.info[_SKIP_AUDIT_KEY] = db.get_transaction()
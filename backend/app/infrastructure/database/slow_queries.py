@@ -0,0 +1,237 @@
+"""Slow-query log with sampled EXPLAIN capture.
+
+Statements slower than ``SLOW_QUERY_THRESHOLD_MS`` are logged with the shape
+of their bound parameters (types, never values) and the application code that
+issued them, and kept in an in-process ring buffer exposed at
+``GET /admin/slow-queries``. For a sample of slow statements
+(``SLOW_QUERY_EXPLAIN_SAMPLE_RATE``) the plan is captured on a separate
+connection, in a background thread and inside a rolled-back transaction, and
+stored with the entry. Only plain ``SELECT`` statements (no data-modifying
+keyword, no row lock) are re-run with ``EXPLAIN (ANALYZE, BUFFERS)``; every
+other statement gets a plain ``EXPLAIN``, which plans without executing.
+"""
+
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_START_KEY = "slow_query_start_time"
+_EXPLAIN_KEY = "slow_query_explain"
+_EXPLAINABLE = ("SELECT", "WITH", "VALUES", "INSERT", "UPDATE", "DELETE", "MERGE")
+# Statements that write or lock rows: EXPLAIN ANALYZE would execute them (taking locks and
+# firing triggers on the separate connection, where app.skip_audit is not set)
+_NOT_ANALYZABLE = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+(KEY\s+)?SHARE)\b")
+_MAX_STATEMENT_CHARS = 4000
+
+# Root of the ``app`` package, and the packages whose frames are never reported as callers
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SKIPPED_DIRS = tuple(os.path.join(_APP_DIR, *parts) + os.sep for parts in (("infrastructure", "database"), ("core",)))
+
+
+@dataclass
+class SlowQuery:
+    """A statement that exceeded the slow-query threshold."""
+
+    statement: str
+    parameters: Any
+    duration_ms: float
+    caller: str
+    captured_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    plan: Optional[str] = None
+
+
+class SlowQueryLog:
+    """Thread-safe ring buffer of the most recent slow queries."""
+
+    def __init__(self, max_entries: int = 100) -> None:
+        """Initialize log.
+
+        Args:
+            max_entries: Entries kept; older ones are dropped
+        """
+        self._entries: Deque[SlowQuery] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def add(self, entry: SlowQuery) -> None:
+        """Store an entry."""
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> List[SlowQuery]:
+        """Return the stored entries, slowest first."""
+        with self._lock:
+            return sorted(self._entries, key=lambda entry: entry.duration_ms, reverse=True)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_LOG_SIZE)
+
+_explain_executor: Optional[ThreadPoolExecutor] = None
+
+
+def parameter_shapes(parameters: Any, executemany: bool = False) -> Any:  # noqa: ANN401
+    """Describe bound parameters by type so no values (PII, secrets) are logged.
+
+    Args:
+        parameters: DBAPI parameters (dict or tuple; a list of them for executemany)
+        executemany: Whether ``parameters`` holds one parameter set per row
+
+    Returns:
+        Same structure with each value replaced by its type name
+        (sequences as ``list[N]``); executemany batches as ``{"rows": N, "row": shape}``
+    """
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": parameter_shapes(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: _shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_shape(value) for value in parameters]
+    return _shape(parameters)
+
+
+def _shape(value: Any) -> str:  # noqa: ANN401
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return f"list[{len(value)}]"
+    return type(value).__name__
+
+
+def caller_location() -> str:
+    """Return the innermost application frame outside the database layer.
+
+    Returns:
+        ``path:line in function`` relative to the ``app`` package's parent, or "unknown"
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APP_DIR + os.sep) and not filename.startswith(_SKIPPED_DIRS):
+            relative = os.path.relpath(filename, os.path.dirname(_APP_DIR)).replace(os.sep, "/")
+            return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def explain_sql(statement: str) -> str:
+    """Return the EXPLAIN statement used to capture the plan of ``statement``.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        ``EXPLAIN (ANALYZE, BUFFERS)`` for a plain SELECT; ``EXPLAIN`` (plans
+        without executing) for CTEs and any statement that writes or locks rows
+    """
+    upper = statement.upper()
+    if upper.lstrip().startswith("SELECT") and not _NOT_ANALYZABLE.search(upper):
+        return f"EXPLAIN (ANALYZE, BUFFERS) {statement}"
+    return f"EXPLAIN {statement}"
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:  # noqa: ANN401
+    # Single value, overwritten by the next statement if this one raises (see instrumentation)
+    conn.info[_START_KEY] = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,  # noqa: ANN401
+    cursor: Any,  # noqa: ANN401
+    statement: str,
+    parameters: Any,  # noqa: ANN401
+    context: Any,  # noqa: ANN401
+    executemany: bool,
+) -> None:
+    start = conn.info.pop(_START_KEY, None)
+    if start is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    threshold = settings.SLOW_QUERY_THRESHOLD_MS
+    if not threshold or duration_ms < threshold or conn.info.get(_EXPLAIN_KEY):
+        return
+
+    entry = SlowQuery(
+        statement=statement[:_MAX_STATEMENT_CHARS],
+        parameters=parameter_shapes(parameters, executemany),
+        duration_ms=round(duration_ms, 2),
+        caller=caller_location(),
+    )
+    slow_query_log.add(entry)
+    logger.warning(
+        f"Slow query ({entry.duration_ms:.1f} ms) from {entry.caller}: {' '.join(statement.split())[:300]}",
+        extra={"db_duration_ms": entry.duration_ms, "db_caller": entry.caller, "db_parameters": entry.parameters},
+    )
+
+    if (
+        not executemany
+        and conn.engine.dialect.name == "postgresql"
+        and statement.lstrip().upper().startswith(_EXPLAINABLE)
+        and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE  # noqa: S311
+    ):
+        _submit_explain(conn.engine, entry, statement, parameters)
+
+
+def _submit_explain(engine: Engine, entry: SlowQuery, statement: str, parameters: Any) -> None:  # noqa: ANN401
+    """Capture the plan in the background so the slow request is not delayed further."""
+    global _explain_executor
+    if _explain_executor is None:
+        _explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+    _explain_executor.submit(explain, engine, entry, statement, parameters)
+
+
+def explain(engine: Engine, entry: SlowQuery, statement: str, parameters: Any) -> None:  # noqa: ANN401
+    """Capture the plan of a slow statement (see ``explain_sql``) and attach it.
+
+    ANALYZE executes the statement, so it is only used for plain SELECTs, and
+    the capture always runs in its own transaction that is rolled back.
+
+    Args:
+        engine: Engine to take the separate connection from
+        entry: Slow-query entry to attach the plan to
+        statement: SQL as sent to the driver
+        parameters: Original DBAPI parameters
+    """
+    try:
+        with engine.connect() as conn:
+            conn.info[_EXPLAIN_KEY] = True
+            try:
+                result = conn.exec_driver_sql(explain_sql(statement), parameters)
+                entry.plan = "\n".join(row[0] for row in result)
+            finally:
+                conn.info.pop(_EXPLAIN_KEY, None)
+                conn.rollback()
+    except Exception as e:
+        logger.warning(f"EXPLAIN capture failed for slow query from {entry.caller}: {e}")
+
+
+def enable_slow_query_log(engine: Engine) -> Engine:
+    """Register the slow-query listeners on an engine.
+
+    Args:
+        engine: Engine to watch
+
+    Returns:
+        The same engine, for chaining
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
@@ -0,0 +1,383 @@
+"""Readiness probes for GET /ready and the Celery worker heartbeat.
+
+Checks:
+    database: API connection pool usage plus ``SELECT 1`` latency on a
+              dedicated connection (skipped while the pool is saturated)
+    redis:    ``PING`` latency
+    queues:   broker queue depth (LLEN of each Celery queue)
+    workers:  age of the newest worker heartbeat
+
+Each check reports "ok", "degraded" (slow or saturated) or "down". The probes
+run concurrently, each abandoned after a deadline, and the report is cached
+for a short time with a single probe run in flight, so the endpoint can be
+polled every second by every load balancer without adding load.
+"""
+
+import logging
+import math
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import redis
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Hash of worker hostname -> Unix time of its last heartbeat
+HEARTBEAT_KEY = "workers:heartbeat"
+
+STATUS_OK = "ok"
+STATUS_DEGRADED = "degraded"
+STATUS_DOWN = "down"
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one readiness check."""
+
+    status: str
+    latency_ms: float = 0.0
+    details: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def pool_stats(engine: Engine, max_overflow: int) -> Dict[str, Any]:
+    """Return the usage of the engine's connection pool.
+
+    Args:
+        engine: SQLAlchemy engine
+        max_overflow: Configured overflow of the pool (DB_MAX_OVERFLOW for the API engine)
+
+    Returns:
+        Size, checked-out, overflow and capacity for a QueuePool; only the
+        pool class for pools that keep no connections (e.g. NullPool)
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"class": type(pool).__name__}
+    capacity = pool.size() + max(max_overflow, 0)
+    return {
+        "class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+    }
+
+
+def create_probe_engine(url: str, timeout_seconds: float) -> Engine:
+    """Create the engine for the database check: one connection, kept apart from the API pool.
+
+    Args:
+        url: Database URL
+        timeout_seconds: Probe deadline, used for the checkout wait and the connect timeout
+
+    Returns:
+        Uninstrumented engine, so probe queries stay out of the metrics and the slow-query log
+    """
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=timeout_seconds,
+        connect_args={"connect_timeout": max(1, math.ceil(timeout_seconds))},
+    )
+
+
+class ReadinessProbe:
+    """Runs the readiness checks and caches the report."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        client: redis.Redis,
+        queues: List[str],
+        cache_seconds: float = 1.0,
+        timeout_seconds: float = 1.0,
+        critical_checks: Optional[List[str]] = None,
+        db_max_overflow: int = 10,
+        db_latency_degraded_ms: float = 100.0,
+        db_pool_saturation: float = 0.9,
+        redis_latency_degraded_ms: float = 50.0,
+        queue_depth_degraded: int = 1000,
+        heartbeat_max_age_seconds: float = 30.0,
+        probe_engine: Optional[Engine] = None,
+    ) -> None:
+        """Initialize the probe.
+
+        Args:
+            engine: Engine whose pool serves the API (its usage is reported)
+            client: Redis client for the cache and the Celery broker (decode_responses=True)
+            queues: Celery queues whose depth is reported
+            cache_seconds: How long a report is reused
+            timeout_seconds: Deadline of each check
+            critical_checks: Checks that make the instance unready when "down"
+            db_max_overflow: Configured pool overflow, used for the pool capacity
+            db_latency_degraded_ms: ``SELECT 1`` latency considered degraded
+            db_pool_saturation: Fraction of pool capacity in use considered degraded
+            redis_latency_degraded_ms: ``PING`` latency considered degraded
+            queue_depth_degraded: Messages waiting in one queue considered degraded
+            heartbeat_max_age_seconds: Age after which a worker counts as gone
+            probe_engine: Engine that runs ``SELECT 1`` (default: ``engine``)
+        """
+        self._engine = engine
+        self._probe_engine = probe_engine if probe_engine is not None else engine
+        self._redis = client
+        self._queues = queues
+        self._cache_seconds = cache_seconds
+        self._timeout_seconds = timeout_seconds
+        self._critical_checks = critical_checks if critical_checks is not None else ["database", "redis"]
+        self._db_max_overflow = db_max_overflow
+        self._db_latency_degraded_ms = db_latency_degraded_ms
+        self._db_pool_saturation = db_pool_saturation
+        self._redis_latency_degraded_ms = redis_latency_degraded_ms
+        self._queue_depth_degraded = queue_depth_degraded
+        self._heartbeat_max_age_seconds = heartbeat_max_age_seconds
+
+        self._checks: Dict[str, Callable[[], CheckResult]] = {
+            "database": self.check_database,
+            "redis": self.check_redis,
+            "queues": self.check_queues,
+            "workers": self.check_workers,
+        }
+        self._executor = ThreadPoolExecutor(max_workers=len(self._checks), thread_name_prefix="readiness")
+        self._running: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._report: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._last_status = "ready"
+
+    @classmethod
+    def from_config(cls) -> "ReadinessProbe":
+        """Build a probe for the API engine from the READINESS_* settings.
+
+        Returns:
+            ReadinessProbe with its own Redis client and database connection, both
+            with timeouts that match the probe deadline
+        """
+        from app.core.config import settings
+        from app.infrastructure.database.session import engine
+
+        timeout = settings.READINESS_PROBE_TIMEOUT_SECONDS
+        return cls(
+            engine,
+            redis.from_url(
+                settings.REDIS_URL, decode_responses=True, socket_timeout=timeout, socket_connect_timeout=timeout
+            ),
+            queues=settings.READINESS_QUEUES,
+            cache_seconds=settings.READINESS_CACHE_SECONDS,
+            timeout_seconds=timeout,
+            critical_checks=settings.READINESS_CRITICAL_CHECKS,
+            db_max_overflow=settings.DB_MAX_OVERFLOW,
+            db_latency_degraded_ms=settings.READINESS_DB_LATENCY_DEGRADED_MS,
+            db_pool_saturation=settings.READINESS_DB_POOL_SATURATION,
+            redis_latency_degraded_ms=settings.READINESS_REDIS_LATENCY_DEGRADED_MS,
+            queue_depth_degraded=settings.READINESS_QUEUE_DEPTH_DEGRADED,
+            heartbeat_max_age_seconds=settings.READINESS_WORKER_HEARTBEAT_MAX_AGE_SECONDS,
+            probe_engine=create_probe_engine(settings.DATABASE_URL, timeout),
+        )
+
+    # -------------------------------------------------------------------------
+    # Report
+    # -------------------------------------------------------------------------
+
+    def report(self) -> Dict[str, Any]:
+        """Return the readiness report, probing at most once per cache period.
+
+        Concurrent callers wait for the run in flight and share its result.
+
+        Returns:
+            ``{"status", "ready", "checked_at", "cached", "checks"}``; ``ready`` is
+            False only when a critical check is "down"; degraded checks keep it True
+            so a load burst that slows every instance does not drain all of them
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._report is not None and now < self._expires_at:
+                return {**self._report, "cached": True}
+            self._report = self._probe()
+            self._expires_at = time.monotonic() + self._cache_seconds
+            return {**self._report, "cached": False}
+
+    def _probe(self) -> Dict[str, Any]:
+        futures: Dict[str, Future] = {}
+        results: Dict[str, CheckResult] = {}
+        for name, check in self._checks.items():
+            previous = self._running.get(name)
+            if previous is not None and not previous.done():
+                results[name] = CheckResult(STATUS_DOWN, error="previous probe still running")
+                continue
+            futures[name] = self._running[name] = self._executor.submit(check)
+
+        wait(futures.values(), timeout=self._timeout_seconds)
+        for name, future in futures.items():
+            if not future.done():
+                results[name] = CheckResult(STATUS_DOWN, error=f"timed out after {self._timeout_seconds}s")
+            elif future.exception() is not None:
+                results[name] = CheckResult(STATUS_DOWN, error=str(future.exception()))
+            else:
+                results[name] = future.result()
+
+        ready = all(results[name].status != STATUS_DOWN for name in self._critical_checks if name in results)
+        if not ready:
+            status = "unavailable"
+        elif all(result.status == STATUS_OK for result in results.values()):
+            status = "ready"
+        else:
+            status = STATUS_DEGRADED
+        if status != self._last_status:
+            failing = {name: r.error or r.status for name, r in results.items() if r.status != STATUS_OK}
+            logger.log(logging.INFO if status == "ready" else logging.WARNING, f"Readiness {status}: {failing}")
+            self._last_status = status
+
+        return {
+            "status": status,
+            "ready": ready,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checks": {name: asdict(results[name]) for name in self._checks},
+        }
+
+    # -------------------------------------------------------------------------
+    # Checks
+    # -------------------------------------------------------------------------
+
+    def check_database(self) -> CheckResult:
+        """Report API pool usage and time ``SELECT 1`` on the probe engine.
+
+        A saturated pool is reported as degraded without querying: a burst that
+        exhausts the pool is not an outage, and the probe must not wait for it.
+        """
+        stats = pool_stats(self._engine, self._db_max_overflow)
+        if stats.get("capacity") and stats["checked_out"] / stats["capacity"] >= self._db_pool_saturation:
+            return CheckResult(STATUS_DEGRADED, details=stats, error="connection pool saturated")
+
+        start = time.perf_counter()
+        try:
+            with self._probe_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception as e:
+            return CheckResult(STATUS_DOWN, _elapsed_ms(start), stats, str(e))
+        latency = _elapsed_ms(start)
+        return CheckResult(STATUS_DEGRADED if latency > self._db_latency_degraded_ms else STATUS_OK, latency, stats)
+
+    def check_redis(self) -> CheckResult:
+        """Time a ``PING``."""
+        start = time.perf_counter()
+        try:
+            self._redis.ping()
+        except redis.RedisError as e:
+            return CheckResult(STATUS_DOWN, _elapsed_ms(start), error=str(e))
+        latency = _elapsed_ms(start)
+        return CheckResult(STATUS_DEGRADED if latency > self._redis_latency_degraded_ms else STATUS_OK, latency)
+
+    def check_queues(self) -> CheckResult:
+        """Read the number of messages waiting in each Celery queue."""
+        start = time.perf_counter()
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for queue in self._queues:
+                pipe.llen(queue)
+            depths = dict(zip(self._queues, pipe.execute()))
+        except redis.RedisError as e:
+            return CheckResult(STATUS_DOWN, _elapsed_ms(start), error=str(e))
+
+        backed_up = any(depth > self._queue_depth_degraded for depth in depths.values())
+        return CheckResult(STATUS_DEGRADED if backed_up else STATUS_OK, _elapsed_ms(start), {"depth": depths})
+
+    def check_workers(self) -> CheckResult:
+        """Report the age of the newest worker heartbeat.
+
+        Heartbeats older than ten times the allowed age are removed, so
+        workers that died without cleaning up stop being listed.
+        """
+        start = time.perf_counter()
+        try:
+            beats = {host: float(at) for host, at in self._redis.hgetall(HEARTBEAT_KEY).items()}
+            now = time.time()
+            expired = [host for host, at in beats.items() if now - at > self._heartbeat_max_age_seconds * 10]
+            if expired:
+                self._redis.hdel(HEARTBEAT_KEY, *expired)
+        except redis.RedisError as e:
+            return CheckResult(STATUS_DOWN, _elapsed_ms(start), error=str(e))
+
+        alive = sorted(host for host, at in beats.items() if now - at <= self._heartbeat_max_age_seconds)
+        details: Dict[str, Any] = {"alive": alive}
+        if not beats:
+            return CheckResult(STATUS_DOWN, _elapsed_ms(start), details, "no worker heartbeat")
+        details["newest_age_seconds"] = round(now - max(beats.values()), 1)
+        if not alive:
+            return CheckResult(STATUS_DOWN, _elapsed_ms(start), details, "no recent worker heartbeat")
+        return CheckResult(STATUS_OK, _elapsed_ms(start), details)
+
+
+_probe: Optional[ReadinessProbe] = None
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """Return the process-wide readiness probe.
+
+    Returns:
+        Shared ReadinessProbe built from settings
+    """
+    global _probe
+    if _probe is None:
+        _probe = ReadinessProbe.from_config()
+    return _probe
+
+
+class WorkerHeartbeat:
+    """Background thread that records a worker's liveness in Redis."""
+
+    def __init__(self, client: redis.Redis, hostname: Optional[str] = None, interval_seconds: float = 10.0) -> None:
+        """Initialize the heartbeat.
+
+        Args:
+            client: Redis client
+            hostname: Worker name stored in the heartbeat hash (default: the machine hostname)
+            interval_seconds: Time between beats
+        """
+        self._redis = client
+        self.hostname = hostname or socket.gethostname()
+        self._interval_seconds = interval_seconds
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def beat(self) -> None:
+        """Record the current time as this worker's last heartbeat."""
+        try:
+            self._redis.hset(HEARTBEAT_KEY, self.hostname, time.time())
+        except redis.RedisError as e:
+            logger.warning(f"Worker heartbeat failed: {e}")
+
+    def start(self) -> "WorkerHeartbeat":
+        """Beat now and then every interval in a daemon thread."""
+        self.beat()
+        self._thread = threading.Thread(target=self._run, name="worker-heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop beating and remove this worker from the heartbeat hash."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval_seconds)
+        try:
+            self._redis.hdel(HEARTBEAT_KEY, self.hostname)
+        except redis.RedisError as e:
+            logger.warning(f"Worker heartbeat cleanup failed: {e}")
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            self.beat()
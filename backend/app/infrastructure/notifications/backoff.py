@@ -0,0 +1,30 @@
+"""Retry backoff for notification delivery.
+
+Exponential backoff with jitter, so that many workers retrying the same
+endpoint do not hit it again at the same instant.
+"""
+
+import secrets
+from typing import Optional
+
+_rng = secrets.SystemRandom()
+
+
+def backoff_delay(base: float, attempt: int, cap: Optional[float] = None) -> float:
+    """Return a jittered exponential backoff delay.
+
+    Uses "equal jitter": half of the exponential delay is fixed and the other
+    half is random, so delays still grow with each attempt but are spread out.
+
+    Args:
+        base: Delay for the first attempt, in seconds
+        attempt: Zero-based attempt number
+        cap: Optional upper bound for the exponential delay
+
+    Returns:
+        Delay in seconds, between half and all of min(cap, base * 2^attempt)
+    """
+    delay = base * 2**attempt
+    if cap is not None:
+        delay = min(delay, cap)
+    return delay / 2 + _rng.uniform(0, delay / 2)
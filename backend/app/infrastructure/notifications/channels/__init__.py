@@ -1,7 +1,15 @@
 """Notification channels package."""
 
-from app.infrastructure.notifications.channels.base import NotificationChannel
-from app.infrastructure.notifications.channels.factory import build_channels
+from app.infrastructure.notifications.channels.base import NotificationChannel, NotificationDeliveryError
+from app.infrastructure.notifications.channels.batching import PayloadBatcher
+from app.infrastructure.notifications.channels.factory import build_channels, get_configured_channels
 from app.infrastructure.notifications.channels.http import HttpNotificationChannel
 
-__all__ = ["HttpNotificationChannel", "NotificationChannel", "build_channels"]
+__all__ = [
+    "HttpNotificationChannel",
+    "NotificationChannel",
+    "NotificationDeliveryError",
+    "PayloadBatcher",
+    "build_channels",
+    "get_configured_channels",
+]
@@ -7,6 +7,10 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict
 
 
+class NotificationDeliveryError(Exception):
+    """Raised by a channel when the payload could not be delivered."""
+
+
 class NotificationChannel(ABC):
     """Abstract base class for event notification channels.
 
@@ -20,4 +24,7 @@ class NotificationChannel(ABC):
 
         Args:
             payload: Event data to propagate
+
+        Raises:
+            NotificationDeliveryError: If the payload could not be delivered
         """
@@ -0,0 +1,88 @@
+"""Payload batching for notification channels.
+
+Coalesces payloads sent to one channel within the same event loop into a
+single delivery, flushed when ``max_size`` payloads are buffered or
+``linger_seconds`` after the first one, whichever comes first. Each send()
+only returns once its batch was delivered (or raises if it failed), so callers
+keep per-payload delivery guarantees.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_Flush = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class PayloadBatcher:
+    """Buffers payloads and delivers them in batches through ``flush``."""
+
+    def __init__(self, flush: _Flush, max_size: int, linger_seconds: float) -> None:
+        """Initialize the batcher.
+
+        Args:
+            flush: Coroutine function delivering a list of payloads (raises on failure)
+            max_size: Flush as soon as this many payloads are buffered
+            linger_seconds: Flush at most this long after the first buffered payload
+        """
+        self._flush = flush
+        self._max_size = max_size
+        self._linger_seconds = linger_seconds
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, payload: Dict[str, Any]) -> None:
+        """Buffer a payload and wait until its batch has been delivered.
+
+        Args:
+            payload: Event data to deliver
+
+        Raises:
+            Exception: Whatever ``flush`` raised for the batch containing the payload
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Buffers and timers belong to one loop; start fresh on a new one
+            self._loop, self._pending, self._timer = loop, [], None
+
+        future = loop.create_future()
+        self._pending.append((payload, future))
+
+        if len(self._pending) >= self._max_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._linger_seconds, self._flush_pending)
+
+        await future
+
+    def _flush_pending(self) -> None:
+        """Hand the buffered payloads to a background delivery task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._deliver(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _deliver(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Deliver one batch and resolve the futures of its payloads."""
+        try:
+            await self._flush([payload for payload, _ in batch])
+        except Exception as e:
+            logger.warning(f"Batch of {len(batch)} payload(s) failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
@@ -5,7 +5,7 @@ Registering a new channel type only requires adding it to CHANNEL_REGISTRY.
 """
 
 import logging
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Type
 
 from app.infrastructure.notifications.channels.base import NotificationChannel
 from app.infrastructure.notifications.channels.http import HttpNotificationChannel
@@ -44,3 +44,26 @@ def build_channels(config: List[Dict[str, Any]]) -> List[NotificationChannel]:
         channels.append(channel_class(**params))
 
     return channels
+
+
+_configured_channels: Optional[Dict[str, NotificationChannel]] = None
+
+
+def get_configured_channels() -> Dict[str, NotificationChannel]:
+    """Return the channels from settings.NOTIFICATION_CHANNELS, built once per process.
+
+    Reusing the instances lets per-channel state (e.g. batch buffers) be
+    shared by every dispatch in the worker process.
+
+    Returns:
+        Channels keyed by their configured name
+    """
+    global _configured_channels
+    if _configured_channels is None:
+        from app.core.config import settings
+
+        _configured_channels = {
+            getattr(channel, "_name", type(channel).__name__): channel
+            for channel in build_channels(settings.NOTIFICATION_CHANNELS)
+        }
+    return _configured_channels
@@ -1,13 +1,17 @@
 """HTTP notification channel.
 
 Sends event payloads via HTTP POST to any configured URL.
-Supports custom headers per channel (e.g. auth tokens, content type).
+Supports custom headers per channel (e.g. auth tokens, content type), an
+optional batching mode that POSTs several payloads as one JSON array, and
+optional body compression and HMAC signing.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from app.infrastructure.notifications.channels.base import NotificationChannel
+from app.infrastructure.notifications.channels.base import NotificationChannel, NotificationDeliveryError
+from app.infrastructure.notifications.channels.batching import PayloadBatcher
+from app.infrastructure.notifications.clients.body_encoder import BodyEncoder
 from app.infrastructure.notifications.clients.http_client import HttpClient
 
 logger = logging.getLogger(__name__)
@@ -18,28 +22,78 @@ class HttpNotificationChannel(NotificationChannel):
 
     Instantiated by the channel factory from a config entry of type 'http'.
     Receives name, url and optional headers from the NOTIFICATION_CHANNELS config list.
+    With ``batch_size`` > 1, payloads sent concurrently are coalesced and POSTed
+    as a JSON array of up to ``batch_size`` events, waiting at most ``linger_seconds``.
+    With ``compression`` set, bodies of at least ``compress_min_bytes`` are sent
+    gzip/zstd-encoded; with ``signing_secret`` set, every request carries an
+    HMAC-SHA256 signature of the bytes on the wire.
     """
 
-    def __init__(self, name: str, url: str, headers: Optional[Dict[str, str]] = None) -> None:
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_attempts: int = 1,
+        batch_size: int = 1,
+        linger_seconds: float = 2.0,
+        compression: Optional[str] = None,
+        compress_min_bytes: int = 1024,
+        signing_secret: Optional[str] = None,
+    ) -> None:
         """Initialize with config values injected by the factory.
 
         Args:
             name: Human-readable identifier for logging
             url: Target URL to POST the event payload to
             headers: Optional HTTP headers to include in every request
+            max_attempts: In-process POST attempts per send; retries across sends
+                are scheduled by the outbox relay
+            batch_size: Max payloads per POST; 1 disables batching
+            linger_seconds: Max wait for a batch to fill before it is sent
+            compression: Request body codec ("gzip", "zstd") or None
+            compress_min_bytes: Smallest body, in bytes, that gets compressed
+            signing_secret: Key for the HMAC-SHA256 signature header, or None
         """
         self._name = name
         self._url = url
         self._headers = headers or {}
-        self._client = HttpClient()
+        self._max_attempts = max_attempts
+        self._client = HttpClient(
+            encoder=BodyEncoder(
+                compression=compression,
+                compress_min_bytes=compress_min_bytes,
+                signing_secret=signing_secret,
+            )
+        )
+        self._batcher = PayloadBatcher(self._post, batch_size, linger_seconds) if batch_size > 1 else None
 
     async def send(self, payload: Dict[str, Any]) -> None:
-        """Send the payload via HTTP POST.
+        """Send the payload via HTTP POST (alone or as part of a batch).
 
         Args:
             payload: Event data to send
+
+        Raises:
+            NotificationDeliveryError: If the POST failed after all attempts
+        """
+        if self._batcher:
+            await self._batcher.submit(payload)
+        else:
+            await self._post(payload)
+
+    async def _post(self, body: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        """POST a single payload or a batch (JSON array).
+
+        Args:
+            body: Payload or list of payloads
+
+        Raises:
+            NotificationDeliveryError: If the POST failed after all attempts
         """
-        logger.info(f"Sending HTTP notification [{self._name}] → {self._url}")
-        success = await self._client.post(self._url, payload, headers=self._headers)
+        count = len(body) if isinstance(body, list) else 1
+        logger.info(f"Sending HTTP notification [{self._name}] ({count} event(s)) → {self._url}")
+        success = await self._client.post(self._url, body, headers=self._headers, max_retries=self._max_attempts)
         if not success:
-            logger.error(f"HTTP notification [{self._name}] failed after retries: {self._url}")
+            logger.error(f"HTTP notification [{self._name}] failed after {self._max_attempts} attempt(s): {self._url}")
+            raise NotificationDeliveryError(f"HTTP notification [{self._name}] failed: {self._url}")
@@ -0,0 +1,202 @@
+"""Per-channel circuit breaker shared across workers through Redis.
+
+States:
+    closed:    sends go through; failures are counted in a fixed window that
+               starts at the first failure
+    open:      after NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD failures within
+               NOTIFICATION_CIRCUIT_WINDOW_SECONDS, sends fast-fail. The open
+               period doubles with each consecutive trip (jittered, capped)
+    half_open: once the open period ends, a single worker probes the channel;
+               success closes the circuit, failure opens it again
+
+Redis errors fail open: a broken Redis never blocks delivery. The client built
+by from_config gives up after NOTIFICATION_CIRCUIT_REDIS_TIMEOUT_SECONDS, and the
+dispatcher calls the breaker off the event loop, so a slow Redis cannot stall
+the other channels.
+"""
+
+import logging
+import math
+from enum import Enum
+from typing import Optional
+
+import redis
+
+from app.infrastructure.notifications.backoff import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+_PREFIX = "cb:"
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Redis-backed circuit breaker keyed by channel name."""
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        failure_threshold: int = 5,
+        window_seconds: int = 60,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 600.0,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            client: Redis client (decode_responses=True)
+            failure_threshold: Failures within the window that open the circuit
+            window_seconds: Fixed window for counting failures, from the first failure
+            open_seconds: Base open period after the first trip
+            max_open_seconds: Upper bound for the open period
+        """
+        self._redis = client
+        self._failure_threshold = failure_threshold
+        self._window_seconds = window_seconds
+        self._open_seconds = open_seconds
+        self._max_open_seconds = max_open_seconds
+
+    @classmethod
+    def from_config(cls) -> "CircuitBreaker":
+        """Build a breaker from the NOTIFICATION_CIRCUIT_* settings.
+
+        Returns:
+            CircuitBreaker connected to settings.REDIS_URL
+        """
+        from app.core.config import settings
+
+        return cls(
+            redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_timeout=settings.NOTIFICATION_CIRCUIT_REDIS_TIMEOUT_SECONDS,
+                socket_connect_timeout=settings.NOTIFICATION_CIRCUIT_REDIS_TIMEOUT_SECONDS,
+            ),
+            failure_threshold=settings.NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD,
+            window_seconds=settings.NOTIFICATION_CIRCUIT_WINDOW_SECONDS,
+            open_seconds=settings.NOTIFICATION_CIRCUIT_OPEN_SECONDS,
+            max_open_seconds=settings.NOTIFICATION_CIRCUIT_MAX_OPEN_SECONDS,
+        )
+
+    @property
+    def open_seconds(self) -> float:
+        """Base open period, used to schedule retries of short-circuited sends."""
+        return self._open_seconds
+
+    def state(self, name: str) -> CircuitState:
+        """Return the current state of a channel's circuit.
+
+        Args:
+            name: Channel name
+
+        Returns:
+            CircuitState (CLOSED if Redis is unavailable)
+        """
+        try:
+            if self._redis.exists(self._key(name, "open")):
+                return CircuitState.OPEN
+            if self._redis.exists(self._key(name, "trips")):
+                return CircuitState.HALF_OPEN
+        except redis.RedisError as e:
+            logger.warning(f"Circuit breaker unavailable for [{name}]: {e}")
+        return CircuitState.CLOSED
+
+    def allow(self, name: str) -> bool:
+        """Decide whether a send to the channel may proceed.
+
+        In half-open state only the worker that takes the probe lock is allowed.
+
+        Args:
+            name: Channel name
+
+        Returns:
+            True if the send should be attempted
+        """
+        state = self.state(name)
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.OPEN:
+            return False
+        try:
+            probe_ttl = max(1, math.ceil(self._open_seconds))
+            return bool(self._redis.set(self._key(name, "probe"), "1", nx=True, ex=probe_ttl))
+        except redis.RedisError as e:
+            logger.warning(f"Circuit breaker unavailable for [{name}]: {e}")
+            return True
+
+    def record_success(self, name: str) -> None:
+        """Close the circuit and reset its failure count.
+
+        Args:
+            name: Channel name
+        """
+        try:
+            if self._redis.delete(self._key(name, "trips")):
+                logger.info(f"Circuit for [{name}] closed")
+            self._redis.delete(self._key(name, "failures"), self._key(name, "probe"))
+        except redis.RedisError as e:
+            logger.warning(f"Circuit breaker unavailable for [{name}]: {e}")
+
+    def record_failure(self, name: str) -> None:
+        """Count a failure and open the circuit when the threshold is reached.
+
+        A failed half-open probe re-opens the circuit immediately.
+
+        Args:
+            name: Channel name
+        """
+        try:
+            if self._redis.exists(self._key(name, "trips")):
+                self._trip(name)
+                return
+
+            # INCR and EXPIRE NX in one MULTI/EXEC: the counter can never outlive its window
+            failures_key = self._key(name, "failures")
+            with self._redis.pipeline() as pipe:
+                pipe.incr(failures_key)
+                pipe.expire(failures_key, self._window_seconds, nx=True)
+                count, _ = pipe.execute()
+            if count >= self._failure_threshold:
+                self._trip(name)
+        except redis.RedisError as e:
+            logger.warning(f"Circuit breaker unavailable for [{name}]: {e}")
+
+    def _trip(self, name: str) -> None:
+        """Open the circuit for an exponentially growing, jittered period."""
+        trips_key = self._key(name, "trips")
+        # Forget the trip history once the channel has been quiet for a while
+        with self._redis.pipeline() as pipe:
+            pipe.incr(trips_key)
+            pipe.expire(trips_key, math.ceil(self._max_open_seconds * 2))
+            trips, _ = pipe.execute()
+
+        open_for = max(1, math.ceil(backoff_delay(self._open_seconds, trips - 1, cap=self._max_open_seconds)))
+        self._redis.set(self._key(name, "open"), "1", ex=open_for)
+        self._redis.delete(self._key(name, "failures"), self._key(name, "probe"))
+        logger.warning(f"Circuit for [{name}] opened for {open_for}s (trip #{trips})")
+
+    @staticmethod
+    def _key(name: str, suffix: str) -> str:
+        return f"{_PREFIX}{name}:{suffix}"
+
+
+_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Return the process-wide circuit breaker.
+
+    Returns:
+        Shared CircuitBreaker built from settings
+    """
+    global _breaker
+    if _breaker is None:
+        _breaker = CircuitBreaker.from_config()
+    return _breaker
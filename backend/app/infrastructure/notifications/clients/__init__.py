@@ -3,6 +3,8 @@
 Contains low-level clients for sending event payloads (HTTP, SMS, etc).
 """
 
+from app.infrastructure.notifications.clients.body_encoder import BodyEncoder
 from app.infrastructure.notifications.clients.http_client import HttpClient
+from app.infrastructure.notifications.clients.http_pool import HttpClientPool, get_http_pool
 
-__all__ = ["HttpClient"]
+__all__ = ["BodyEncoder", "HttpClient", "HttpClientPool", "get_http_pool"]
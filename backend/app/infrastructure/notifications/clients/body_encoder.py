@@ -0,0 +1,92 @@
+"""Request body encoding for HTTP notifications.
+
+Serializes payloads with orjson, optionally compresses bodies above a size
+threshold (gzip or zstd) and signs the bytes actually sent with HMAC-SHA256
+so receivers can verify them before decompressing.
+"""
+
+import gzip
+import hashlib
+import hmac
+import importlib.util
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# zstd needs the optional "zstandard" package (httpx[zstd])
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+
+COMPRESSIONS = ("gzip", "zstd")
+SIGNATURE_HEADER = "X-Duppla-Signature"
+
+
+class BodyEncoder:
+    """Turns a JSON payload into the request body and its content headers.
+
+    Encoding happens once per send; retries reuse the same bytes.
+    """
+
+    def __init__(
+        self,
+        compression: Optional[str] = None,
+        compress_min_bytes: int = 1024,
+        signing_secret: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """Initialize encoder settings.
+
+        Args:
+            compression: "gzip", "zstd" or None to always send plain JSON
+            compress_min_bytes: Bodies smaller than this are sent uncompressed
+            signing_secret: HMAC-SHA256 key; None disables the signature header
+            compression_level: Codec level (default: gzip 6, zstd 3)
+
+        Raises:
+            ValueError: If compression is not a supported codec
+        """
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression '{compression}', expected one of {COMPRESSIONS}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstd compression requested but 'zstandard' is not installed, falling back to gzip")
+            compression = "gzip"
+
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+        self.compression_level = compression_level
+        self._signing_key = signing_secret.encode() if signing_secret else None
+
+    def encode(self, payload: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize, compress and sign a payload.
+
+        Args:
+            payload: JSON payload (object or array)
+
+        Returns:
+            Tuple of (body bytes, headers describing the body)
+        """
+        body = orjson.dumps(payload)
+        headers = {"Content-Type": "application/json"}
+
+        if self.compression and len(body) >= self.compress_min_bytes:
+            body = self._compress(body)
+            headers["Content-Encoding"] = self.compression
+
+        if self._signing_key:
+            digest = hmac.new(self._signing_key, body, hashlib.sha256).hexdigest()
+            headers[SIGNATURE_HEADER] = f"sha256={digest}"
+
+        return body, headers
+
+    def _compress(self, body: bytes) -> bytes:
+        """Compress the body with the configured codec."""
+        if self.compression == "zstd":
+            import zstandard
+
+            level = self.compression_level if self.compression_level is not None else 3
+            return zstandard.ZstdCompressor(level=level).compress(body)
+
+        level = self.compression_level if self.compression_level is not None else 6
+        return gzip.compress(body, compresslevel=level, mtime=0)
@@ -1,71 +1,87 @@
 """HTTP client for sending JSON notifications.
 
 Generic HTTP POST client with exponential backoff retry logic.
-Used by notification channels to deliver event payloads.
+Used by notification channels to deliver event payloads over the
+shared, keep-alive connection pool. Bodies are encoded once per send
+(orjson, optional compression and signature) and reused across retries.
 """
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
+from app.infrastructure.notifications.backoff import backoff_delay
+from app.infrastructure.notifications.clients.body_encoder import BodyEncoder
+from app.infrastructure.notifications.clients.http_pool import HttpClientPool, get_http_pool
+
 logger = logging.getLogger(__name__)
 
 
 class HttpClient:
     """Generic HTTP client for sending JSON payloads via POST.
 
-    Handles delivery with exponential backoff retry logic.
+    Handles delivery with jittered exponential backoff retry logic.
     """
 
-    def __init__(self, timeout: int = 10) -> None:
+    def __init__(
+        self,
+        timeout: int = 10,
+        pool: Optional[HttpClientPool] = None,
+        encoder: Optional[BodyEncoder] = None,
+    ) -> None:
         """Initialize client.
 
         Args:
             timeout: Request timeout in seconds
+            pool: Connection pool to send through (default: the process-wide pool)
+            encoder: Body encoder (default: uncompressed, unsigned JSON)
         """
         self.timeout = timeout
+        self._pool = pool or get_http_pool()
+        self._encoder = encoder or BodyEncoder()
 
     async def post(
         self,
         url: str,
-        payload: Dict[str, Any],
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]],
         headers: Optional[Dict[str, str]] = None,
         max_retries: int = 3,
     ) -> bool:
-        """Send a JSON payload via HTTP POST with exponential backoff retry.
+        """Send a JSON payload via HTTP POST with jittered exponential backoff retry.
 
         Args:
             url: Target URL
-            payload: JSON payload to send
+            payload: JSON payload (object or array) to send
             headers: Optional HTTP headers to include in the request
             max_retries: Maximum number of retry attempts
 
         Returns:
             True if successful, False after exhausting all retries
         """
-        retry_delays = [2, 4, 8]
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for attempt in range(max_retries):
-                try:
-                    response = await client.post(url, json=payload, headers=headers)
-                    response.raise_for_status()
-
-                    logger.info(
-                        f"HTTP POST succeeded → {url}",
-                        extra={"attempt": attempt + 1, "status_code": response.status_code},
-                    )
-                    return True
-
-                except httpx.HTTPError as e:
-                    logger.warning(
-                        f"HTTP POST failed (attempt {attempt + 1}/{max_retries}): {e}",
-                        extra={"url": url, "error": str(e)},
-                    )
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(retry_delays[attempt])
+        body, body_headers = self._encoder.encode(payload)
+        request_headers = {**(headers or {}), **body_headers}
+
+        client = self._pool.client()
+        for attempt in range(max_retries):
+            try:
+                response = await client.post(url, content=body, headers=request_headers, timeout=self.timeout)
+                response.raise_for_status()
+
+                logger.info(
+                    f"HTTP POST succeeded → {url}",
+                    extra={"attempt": attempt + 1, "status_code": response.status_code, "bytes": len(body)},
+                )
+                return True
+
+            except httpx.HTTPError as e:
+                logger.warning(
+                    f"HTTP POST failed (attempt {attempt + 1}/{max_retries}): {e}",
+                    extra={"url": url, "error": str(e)},
+                )
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(backoff_delay(2, attempt))
 
         logger.error(f"HTTP POST failed after {max_retries} attempts → {url}")
         return False
@@ -0,0 +1,98 @@
+"""Shared HTTP connection pool for notification delivery.
+
+One httpx.AsyncClient per worker process keeps TCP/TLS connections alive
+between notifications instead of handshaking on every POST. httpx binds
+connections to the event loop that opened them, so the pool is meant to be
+used from the worker's long-lived loop (see tasks.event_loop.run_async).
+"""
+
+import importlib.util
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional "h2" package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientPool:
+    """Lazily created, process-wide httpx.AsyncClient with connection limits.
+
+    The client is created on first use (after the worker process forks) and
+    recreated if it was closed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ) -> None:
+        """Initialize pool settings.
+
+        Args:
+            max_connections: Max concurrent connections across all hosts
+            max_keepalive_connections: Max idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Negotiate HTTP/2 when the server and the h2 package support it
+        """
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_config(cls) -> "HttpClientPool":
+        """Build a pool from the NOTIFICATION_HTTP_* settings.
+
+        Returns:
+            HttpClientPool with no open connections yet
+        """
+        from app.core.config import settings
+
+        return cls(
+            max_connections=settings.NOTIFICATION_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.NOTIFICATION_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.NOTIFICATION_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            http2=settings.NOTIFICATION_HTTP2,
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use.
+
+        Returns:
+            Open httpx.AsyncClient
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=self._limits, http2=self._http2)
+            logger.info(f"Opened notification HTTP pool (http2={self._http2}, limits={self._limits})")
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("Closed notification HTTP pool")
+        self._client = None
+
+
+_pool: Optional[HttpClientPool] = None
+
+
+def get_http_pool() -> HttpClientPool:
+    """Return the process-wide notification HTTP pool.
+
+    Returns:
+        Shared HttpClientPool built from settings
+    """
+    global _pool
+    if _pool is None:
+        _pool = HttpClientPool.from_config()
+    return _pool
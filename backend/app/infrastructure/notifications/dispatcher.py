@@ -1,31 +1,49 @@
 """Notification dispatcher.
 
-Broadcasts an event payload to all registered notification channels.
+Broadcasts an event payload to all registered notification channels concurrently.
 Use from_config() to build the dispatcher directly from settings.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from app.core.metrics import NOTIFICATION_DELIVERIES
+from app.core.tracing import start_span, traced
 from app.infrastructure.notifications.channels.base import NotificationChannel
+from app.infrastructure.notifications.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+_SUCCEEDED = "succeeded"
+_FAILED = "failed"
+_TIMED_OUT = "timed_out"
+_SHORT_CIRCUITED = "short_circuited"
+
 
 @dataclass
 class DispatchResult:
-    """Result of a dispatch operation across all channels."""
+    """Result of a dispatch operation across all channels.
+
+    ``timed_out`` is the subset of ``failed`` that hit the per-channel or overall deadline.
+    ``short_circuited`` is the subset of ``failed`` skipped because the channel's circuit is open.
+    """
 
     succeeded: List[str] = field(default_factory=list)
     failed: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    short_circuited: List[str] = field(default_factory=list)
 
     @property
     def all_succeeded(self) -> bool:
         return len(self.failed) == 0
 
     def __str__(self) -> str:
-        return f"succeeded={self.succeeded}, failed={self.failed}"
+        return (
+            f"succeeded={self.succeeded}, failed={self.failed}, "
+            f"timed_out={self.timed_out}, short_circuited={self.short_circuited}"
+        )
 
 
 class NotificationDispatcher:
@@ -33,57 +51,106 @@ class NotificationDispatcher:
 
     Channels are built from the NOTIFICATION_CHANNELS config list via from_config().
     The dispatcher is channel-agnostic — it only knows the shared NotificationChannel interface.
+    All channels run concurrently, so dispatch latency is that of the slowest channel
+    (bounded by the deadlines), not the sum of all of them.
 
     Usage:
         dispatcher = NotificationDispatcher.from_config()
         await dispatcher.dispatch(payload)
     """
 
-    def __init__(self, channels: List[NotificationChannel]) -> None:
+    def __init__(
+        self,
+        channels: List[NotificationChannel],
+        channel_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         """Initialize dispatcher with a list of channels.
 
         Args:
             channels: Instantiated notification channels to dispatch to
+            channel_timeout: Deadline in seconds for each channel (None = no limit)
+            total_timeout: Deadline in seconds for the whole dispatch (None = no limit)
+            breaker: Circuit breaker consulted before each send (None = always send)
         """
         self._channels = channels
+        self._channel_timeout = channel_timeout
+        self._total_timeout = total_timeout
+        self._breaker = breaker
 
     @classmethod
-    def from_config(cls) -> "NotificationDispatcher":
+    def from_config(cls, channel_names: Optional[List[str]] = None) -> "NotificationDispatcher":
         """Build a dispatcher from settings.NOTIFICATION_CHANNELS.
 
-        Reads the unified channel config list and instantiates each channel
-        via the factory based on its type.
+        Channels are built by the factory once per process and reused, so
+        batching channels can coalesce payloads across dispatches. Deadlines come from
+        NOTIFICATION_CHANNEL_TIMEOUT_SECONDS and NOTIFICATION_DISPATCH_TIMEOUT_SECONDS;
+        the shared circuit breaker is used when NOTIFICATION_CIRCUIT_BREAKER_ENABLED.
+
+        Args:
+            channel_names: Only build the channels with these names (None = all)
 
         Returns:
             NotificationDispatcher ready to dispatch events
         """
         from app.core.config import settings
-        from app.infrastructure.notifications.channels.factory import build_channels
+        from app.infrastructure.notifications.channels.factory import get_configured_channels
+        from app.infrastructure.notifications.circuit_breaker import get_circuit_breaker
+
+        channels = get_configured_channels()
+        if channel_names is not None:
+            channels = {name: channel for name, channel in channels.items() if name in channel_names}
 
-        return cls(build_channels(settings.NOTIFICATION_CHANNELS))
+        return cls(
+            list(channels.values()),
+            channel_timeout=settings.NOTIFICATION_CHANNEL_TIMEOUT_SECONDS,
+            total_timeout=settings.NOTIFICATION_DISPATCH_TIMEOUT_SECONDS,
+            breaker=get_circuit_breaker() if settings.NOTIFICATION_CIRCUIT_BREAKER_ENABLED else None,
+        )
 
+    @traced()
     async def dispatch(self, payload: Dict[str, Any]) -> DispatchResult:
-        """Send the payload to all registered channels.
+        """Send the payload to all registered channels concurrently.
 
-        Failures in one channel do not stop the others.
+        Failures or timeouts in one channel do not stop the others. Channels
+        still running when the overall deadline expires are cancelled and
+        reported as timed out. Channels whose circuit is open are not called
+        and are reported as short-circuited.
 
         Args:
             payload: Event data to propagate
 
         Returns:
-            DispatchResult with lists of succeeded and failed channel names
+            DispatchResult with succeeded, failed, timed out and short-circuited channel names (in channel order)
         """
         result = DispatchResult()
-
-        for channel in self._channels:
-            channel_name = getattr(channel, "_name", type(channel).__name__)
-            try:
-                await channel.send(payload)
-                result.succeeded.append(channel_name)
-                logger.info(f"Channel [{channel_name}] dispatched successfully")
-            except Exception:
-                result.failed.append(channel_name)
-                logger.exception(f"Channel [{channel_name}] failed to dispatch notification")
+        names = [getattr(channel, "_name", type(channel).__name__) for channel in self._channels]
+        tasks = [
+            asyncio.ensure_future(self._send(channel, name, payload)) for channel, name in zip(self._channels, names)
+        ]
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self._total_timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning(
+                    f"Dispatch deadline of {self._total_timeout}s reached, cancelled {len(pending)} channel(s)"
+                )
+
+        for name, task in zip(names, tasks):
+            outcome = _TIMED_OUT if task.cancelled() else task.result()
+            NOTIFICATION_DELIVERIES.labels(channel=name, outcome=outcome).inc()
+            if outcome == _SUCCEEDED:
+                result.succeeded.append(name)
+            else:
+                result.failed.append(name)
+                if outcome == _TIMED_OUT:
+                    result.timed_out.append(name)
+                elif outcome == _SHORT_CIRCUITED:
+                    result.short_circuited.append(name)
 
         if not result.all_succeeded:
             logger.warning(f"Dispatch completed with failures: {result}")
@@ -91,3 +158,58 @@ class NotificationDispatcher:
             logger.info(f"Dispatch completed: all channels succeeded {result.succeeded}")
 
         return result
+
+    async def _send(self, channel: NotificationChannel, name: str, payload: Dict[str, Any]) -> str:
+        """Send to a single channel inside a ``notify <channel>`` span.
+
+        Args:
+            channel: Channel to send through
+            name: Channel name for logging
+            payload: Event data to propagate
+
+        Returns:
+            Outcome: "succeeded", "failed", "timed_out" or "short_circuited"
+        """
+        with start_span(f"notify {name}", attributes={"notification.channel": name}) as span:
+            outcome = await self._send_within_deadline(channel, name, payload)
+            span.set_attribute("notification.outcome", outcome)
+            return outcome
+
+    async def _send_within_deadline(self, channel: NotificationChannel, name: str, payload: Dict[str, Any]) -> str:
+        """Send to a single channel within its deadline.
+
+        Args:
+            channel: Channel to send through
+            name: Channel name for logging
+            payload: Event data to propagate
+
+        Returns:
+            Outcome: "succeeded", "failed", "timed_out" or "short_circuited"
+        """
+        # The breaker's Redis calls are blocking: run them off the event loop so a slow
+        # Redis never stalls the other channels
+        if self._breaker and not await asyncio.to_thread(self._breaker.allow, name):
+            logger.warning(f"Channel [{name}] short-circuited: circuit is open")
+            return _SHORT_CIRCUITED
+
+        try:
+            await asyncio.wait_for(channel.send(payload), timeout=self._channel_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Channel [{name}] timed out after {self._channel_timeout}s")
+            await self._record(name, succeeded=False)
+            return _TIMED_OUT
+        except Exception:
+            logger.exception(f"Channel [{name}] failed to dispatch notification")
+            await self._record(name, succeeded=False)
+            return _FAILED
+
+        logger.info(f"Channel [{name}] dispatched successfully")
+        await self._record(name, succeeded=True)
+        return _SUCCEEDED
+
+    async def _record(self, name: str, succeeded: bool) -> None:
+        """Report a send outcome to the circuit breaker, if any, from a worker thread."""
+        if not self._breaker:
+            return
+        record = self._breaker.record_success if succeeded else self._breaker.record_failure
+        await asyncio.to_thread(record, name)
@@ -5,5 +5,6 @@ Contains Celery application setup and task definitions.
 
 from app.infrastructure.notifications.tasks.celery_app import celery_app
 from app.infrastructure.notifications.tasks.document_tasks import process_documents_batch
+from app.infrastructure.notifications.tasks.notification_tasks import relay_outbox
 
-__all__ = ["celery_app", "process_documents_batch"]
+__all__ = ["celery_app", "process_documents_batch", "relay_outbox"]
@@ -3,12 +3,35 @@
 Configures Celery for async task processing.
 """
 
+import logging
+import os
+import threading
+import time
+from contextvars import Token
+from typing import Any, Dict, Optional, Tuple
+
 from celery import Celery
-from celery.signals import after_setup_logger, after_setup_task_logger
+from celery.signals import (
+    after_setup_logger,
+    after_setup_task_logger,
+    after_task_publish,
+    before_task_publish,
+    task_failure,
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
 
 from app.core.config import settings
+from app.core import tracing
 from app.core.logging import setup_logging
 
+logger = logging.getLogger(__name__)
+
 # Create Celery app
 celery_app = Celery(
     "duppla",
@@ -29,6 +52,13 @@ celery_app.conf.update(
     worker_hijack_root_logger=False,
     task_routes={
         "app.infrastructure.celery_tasks.*": {"queue": "default"},
+        "relay_outbox": {"queue": "notifications"},
+    },
+    beat_schedule={
+        "relay-outbox": {
+            "task": "relay_outbox",
+            "schedule": settings.OUTBOX_RELAY_INTERVAL_SECONDS,
+        },
     },
 )
 
@@ -40,5 +70,233 @@ def configure_logging(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
     setup_logging(settings.LOG_LEVEL)
 
 
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_notification_pool(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Close pooled notification connections and the worker event loop on shutdown."""
+    from app.infrastructure.notifications.tasks.event_loop import close_event_loop
+
+    close_event_loop()
+
+
+@worker_init.connect
+def start_metrics_server(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Serve the worker's Prometheus metrics (aggregated over the prefork children when multiprocess is on)."""
+    if not settings.CELERY_METRICS_PORT:
+        return
+
+    from prometheus_client import start_http_server
+
+    from app.core.metrics import metrics_registry
+
+    start_http_server(settings.CELERY_METRICS_PORT, registry=metrics_registry())
+
+
+@worker_process_init.connect
+def reset_worker_engine(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Drop pooled connections a prefork child inherited from the parent process."""
+    from app.infrastructure.database.session import worker_engine
+
+    worker_engine.dispose(close=False)
+
+
+# Heartbeat of this worker (main process only), read by GET /ready
+_heartbeat: Optional[Any] = None
+
+
+@worker_ready.connect
+def start_worker_heartbeat(sender: object = None, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Start writing this worker's heartbeat to Redis every WORKER_HEARTBEAT_INTERVAL_SECONDS."""
+    global _heartbeat
+    import redis
+
+    from app.infrastructure.health import WorkerHeartbeat
+
+    _heartbeat = WorkerHeartbeat(
+        redis.from_url(settings.REDIS_URL, decode_responses=True),
+        hostname=getattr(sender, "hostname", None),
+        interval_seconds=settings.WORKER_HEARTBEAT_INTERVAL_SECONDS,
+    ).start()
+
+
+@worker_shutdown.connect
+def stop_worker_heartbeat(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Stop the heartbeat and remove this worker from the heartbeat hash."""
+    global _heartbeat
+    if _heartbeat is not None:
+        _heartbeat.stop()
+        _heartbeat = None
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Drop live gauges of an exiting prefork child from the multiprocess metrics."""
+    from app.core.metrics import mark_process_dead
+
+    mark_process_dead(kwargs.get("pid") or os.getpid())
+
+
+# Query tracking tokens of the tasks running in this process, by task id
+_query_tracking: Dict[str, Token] = {}
+
+
+@task_prerun.connect
+def start_task_query_tracking(task_id: str = "", *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Start counting the SQL statements of a task run."""
+    from app.infrastructure.database.instrumentation import start_query_tracking
+
+    _query_tracking[task_id] = start_query_tracking()
+
+
+@task_postrun.connect
+def finish_task_query_tracking(task_id: str = "", task: object = None, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Log a task run's SQL statement count and check it against the task's budget."""
+    from app.infrastructure.database.instrumentation import (
+        check_statement_budget,
+        statement_budget,
+        stop_query_tracking,
+    )
+
+    token = _query_tracking.pop(task_id, None)
+    if token is None:
+        return
+
+    name = getattr(task, "name", "unknown")
+    stats = stop_query_tracking(token)
+    logger.info(
+        f"Task {name} [{task_id}]: {stats.statements} SQL statements in {stats.duration_ms:.1f} ms",
+        extra={"task": name, "db_statements": stats.statements, "db_time_ms": stats.duration_ms},
+    )
+    check_statement_budget(name, stats, statement_budget(name))
+
+
+# Message header with the publish time, used to report the broker/queue wait as its own span
+PUBLISHED_AT_HEADER = "published_at_ns"
+
+# Open tracing spans of the messages being published / tasks running in this process, by task id
+_publish_spans: Dict[str, Tuple[Any, Any]] = {}
+_task_spans: Dict[str, Tuple[Any, Any]] = {}
+
+
+@before_task_publish.connect
+def start_publish_span(
+    sender: str = "",
+    headers: Optional[Dict[str, Any]] = None,
+    *args,  # noqa: ANN002
+    **kwargs,  # noqa: ANN003
+) -> None:
+    """Open a producer span and propagate the trace context in the message headers."""
+    if headers is None or tracing.get_exporter() is None:
+        return
+
+    task_id = headers.get("id", "")
+    _publish_spans[task_id] = tracing.begin_span(
+        f"publish {sender}", kind=tracing.KIND_PRODUCER, attributes={"task.id": task_id}
+    )
+    tracing.inject(headers)
+    headers[PUBLISHED_AT_HEADER] = time.time_ns()
+
+
+@after_task_publish.connect
+def finish_publish_span(headers: Optional[Dict[str, Any]] = None, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Close the producer span once the message is on the broker."""
+    entry = _publish_spans.pop((headers or {}).get("id", ""), None)
+    if entry is not None:
+        tracing.finish_span(*entry)
+
+
+@task_prerun.connect
+def start_task_span(task_id: str = "", task: object = None, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Open the task's consumer span as a child of the publisher's span.
+
+    The time between publish and start (broker plus worker queue wait) is
+    recorded as a separate ``queue <task>`` span.
+    """
+    if tracing.get_exporter() is None:
+        return
+
+    request = getattr(task, "request", None)
+    name = getattr(task, "name", "unknown")
+    parent = tracing.SpanContext.from_traceparent(getattr(request, tracing.TRACEPARENT_HEADER, None))
+    published_at = getattr(request, PUBLISHED_AT_HEADER, None)
+    if parent is not None and published_at:
+        tracing.Span(f"queue {name}", parent=parent, kind=tracing.KIND_CONSUMER, start_ns=int(published_at)).end()
+
+    _task_spans[task_id] = tracing.begin_span(
+        f"run {name}",
+        parent=parent,
+        kind=tracing.KIND_CONSUMER,
+        attributes={"task.id": task_id, "task.retries": getattr(request, "retries", 0)},
+    )
+
+
+@task_failure.connect
+def record_task_span_error(task_id: str = "", exception: Optional[BaseException] = None, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Mark the running task's span as failed."""
+    entry = _task_spans.get(task_id)
+    if entry is not None and exception is not None:
+        entry[0].record_error(exception)
+
+
+@task_postrun.connect
+def finish_task_span(task_id: str = "", state: str = "", *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Close the task's consumer span."""
+    entry = _task_spans.pop(task_id, None)
+    if entry is not None:
+        entry[0].set_attribute("task.state", state)
+        tracing.finish_span(*entry)
+
+
+# Message header that makes the worker profile a single task run
+# (e.g. process_documents_batch.apply_async(args, headers={PROFILE_HEADER: True}))
+PROFILE_HEADER = "profile"
+
+# Running task profilers in this process, by task id
+_task_profilers: Dict[str, Any] = {}
+
+
+@task_prerun.connect
+def start_task_profile(task_id: str = "", task: object = None, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Start sampling the task's thread when the message asks for a profile.
+
+    Sampling stops after PROFILING_MAX_SECONDS even if the task is still running,
+    so a long task does not hold the process-wide profiler slot for its whole run.
+    """
+    if not getattr(getattr(task, "request", None), PROFILE_HEADER, False):
+        return
+
+    from app.core.profiling import ProfilerBusy, SamplingProfiler
+
+    profiler = SamplingProfiler(
+        interval=settings.PROFILING_INTERVAL_MS / 1000,
+        thread_ids={threading.get_ident()},
+        include_idle=True,
+        max_seconds=settings.PROFILING_MAX_SECONDS,
+    )
+    try:
+        _task_profilers[task_id] = profiler.start()
+    except ProfilerBusy:
+        logger.warning(f"Profile requested for task {task_id} skipped: another profile is running")
+
+
+@task_postrun.connect
+def finish_task_profile(task_id: str = "", task: object = None, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """Stop the task's profiler and write its collapsed stacks to PROFILING_OUTPUT_DIR."""
+    profiler = _task_profilers.pop(task_id, None)
+    if profiler is None:
+        return
+
+    profiler.stop()
+    name = getattr(task, "name", "task")
+    os.makedirs(settings.PROFILING_OUTPUT_DIR, exist_ok=True)
+    path = os.path.join(settings.PROFILING_OUTPUT_DIR, f"{name}-{task_id}.folded")
+    with open(path, "w") as file:
+        file.write(profiler.collapsed())
+    capped = f" (capped at {profiler.max_seconds:g}s)" if profiler.capped else ""
+    logger.info(
+        f"Task {name} [{task_id}] profile: {profiler.samples} samples over {profiler.duration:.1f}s{capped} in {path}"
+    )
+
+
 # Auto-discover tasks
 celery_app.autodiscover_tasks(["app.infrastructure"])
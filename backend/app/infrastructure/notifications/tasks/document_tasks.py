@@ -5,7 +5,6 @@ STATUS_HANDLERS. Adding support for a new status only requires writing
 a new handler and adding one entry to the map — the task loop stays unchanged.
 """
 
-import asyncio
 import logging
 import secrets
 import time
@@ -19,9 +18,11 @@ if TYPE_CHECKING:
 
 from sqlalchemy.exc import DatabaseError
 
-from app.infrastructure.database.session import SessionLocal
-from app.infrastructure.notifications.dispatcher import NotificationDispatcher
+from app.core.metrics import BATCH_DOCUMENTS, BATCH_DOCUMENTS_PER_SECOND, BATCH_JOB_DURATION
+from app.core.tracing import set_span_attributes, start_span
+from app.infrastructure.database.session import WorkerSessionLocal
 from app.infrastructure.notifications.tasks.celery_app import celery_app
+from app.infrastructure.notifications.tasks.notification_tasks import relay_outbox
 
 logger = logging.getLogger(__name__)
 
@@ -133,14 +134,16 @@ def process_documents_batch(
         document_ids: List of document IDs to process
 
     Returns:
-        Processing result with counts and per-document details
+        Processing result counts (per-document details are stored in job_items)
     """
     from app.infrastructure.repositories.audit_repository import AuditRepository
     from app.infrastructure.repositories.document_repository import DocumentRepository
     from app.infrastructure.repositories.job_repository import JobRepository
 
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     job_uuid = UUID(job_id)
+    started_at = time.perf_counter()
+    set_span_attributes({"job.id": job_id, "job.document_count": len(document_ids)})
 
     try:
         job_repo = JobRepository(db)
@@ -163,38 +166,48 @@ def process_documents_batch(
         details: List[Dict[str, Any]] = []
 
         for document_id in document_ids:
-            try:
-                time.sleep(secrets.randbelow(9) + 1)
-
-                document = doc_repo.get_by_id(document_id)
-                if not document:
-                    logger.warning(f"Document {document_id} not found, skipping")
-                    details.append({"document_id": document_id, "status": "failed", "error": "not_found"})
-                    failed_count += 1
-                    continue
-
-                handler = handlers.get(document.status, _handle_unknown)
-                detail, succeeded = handler(document, doc_repo, audit_repo, job_id)
-
-                details.append(detail)
-                if succeeded:
-                    processed_count += 1
-                else:
+            with start_span("process document", attributes={"document.id": document_id}) as span:
+                try:
+                    time.sleep(secrets.randbelow(9) + 1)
+
+                    document = doc_repo.get_by_id(document_id)
+                    if not document:
+                        logger.warning(f"Document {document_id} not found, skipping")
+                        details.append({"document_id": document_id, "status": "failed", "error": "not_found"})
+                        failed_count += 1
+                        span.set_attribute("document.outcome", "not_found")
+                        continue
+
+                    handler = handlers.get(document.status, _handle_unknown)
+                    detail, succeeded = handler(document, doc_repo, audit_repo, job_id)
+
+                    details.append(detail)
+                    if succeeded:
+                        processed_count += 1
+                    else:
+                        failed_count += 1
+                    span.set_attribute("document.status", document.status)
+                    span.set_attribute("document.outcome", detail["status"])
+
+                except Exception as doc_error:
                     failed_count += 1
-
-            except Exception as doc_error:
-                failed_count += 1
-                details.append({"document_id": document_id, "status": "failed", "error": str(doc_error)})
-                logger.warning(f"Failed to process document {document_id}: {doc_error}")
+                    details.append({"document_id": document_id, "status": "failed", "error": str(doc_error)})
+                    logger.warning(f"Failed to process document {document_id}: {doc_error}")
+                    span.record_error(doc_error)
 
         result = {
             "total": len(document_ids),
             "processed": processed_count,
             "failed": failed_count,
-            "details": details,
         }
 
-        job_repo.update_status(job_uuid, "completed", result=result)
+        outbox_event = _completion_event(
+            job_id=job_id,
+            status="completed",
+            document_ids=document_ids,
+            result=result,
+        )
+        job_repo.update_status(job_uuid, "completed", result=result, items=details, outbox_event=outbox_event)
         audit_repo.log_state_change(
             table_name="jobs",
             record_id=job_id,
@@ -203,15 +216,24 @@ def process_documents_batch(
             user_id="celery-worker",
         )
         logger.info(f"Batch job {job_id} completed: {processed_count} processed, {failed_count} failed")
-        _notify_completion(job_id=job_id, status="completed", document_ids=document_ids, result=result)
+        _wake_outbox_relay(job_id)
+        _record_batch_metrics("completed", started_at, processed_count, failed_count)
 
         return result
 
     except Exception as error:
         error_message = str(error)
         logger.error(f"Critical failure in batch job {job_id}: {error_message}")
+        _record_batch_metrics("failed", started_at, 0, len(document_ids))
         try:
-            job_repo.update_status(job_uuid, "failed", error_message=error_message)
+            outbox_event = _completion_event(
+                job_id=job_id,
+                status="failed",
+                document_ids=document_ids,
+                result={"total": len(document_ids), "processed": 0, "failed": len(document_ids)},
+                error_message=error_message,
+            )
+            job_repo.update_status(job_uuid, "failed", error_message=error_message, outbox_event=outbox_event)
             audit_repo.log_state_change(
                 table_name="jobs",
                 record_id=job_id,
@@ -219,18 +241,7 @@ def process_documents_batch(
                 new_state="failed",
                 user_id="celery-worker",
             )
-            _notify_completion(
-                job_id=job_id,
-                status="failed",
-                document_ids=document_ids,
-                result={
-                    "total": len(document_ids),
-                    "processed": 0,
-                    "failed": len(document_ids),
-                    "details": [{"document_id": d, "status": "failed", "error": error_message} for d in document_ids],
-                },
-                error_message=error_message,
-            )
+            _wake_outbox_relay(job_id)
         except Exception as update_error:
             logger.error(f"Failed to update job status after critical failure: {update_error}")
         raise
@@ -239,14 +250,28 @@ def process_documents_batch(
         db.close()
 
 
-def _notify_completion(
+def _record_batch_metrics(status: str, started_at: float, processed: int, failed: int) -> None:
+    """Record the duration and throughput of a batch run in Prometheus metrics."""
+    elapsed = time.perf_counter() - started_at
+    BATCH_JOB_DURATION.labels(status=status).observe(elapsed)
+    BATCH_DOCUMENTS.labels(outcome="processed").inc(processed)
+    BATCH_DOCUMENTS.labels(outcome="failed").inc(failed)
+    if elapsed > 0:
+        BATCH_DOCUMENTS_PER_SECOND.set((processed + failed) / elapsed)
+
+
+def _completion_event(
     job_id: str,
     status: str,
     document_ids: List[int],
     result: Dict[str, Any],
     error_message: str | None = None,
-) -> None:
-    """Dispatch job completion notifications to all configured channels."""
+) -> Dict[str, Any]:
+    """Build the job completion payload stored in the outbox.
+
+    Only counts travel with the event: per-document results stay in job_items,
+    where receivers can page them through GET /jobs/{job_id}/items.
+    """
     payload: Dict[str, Any] = {
         "job_id": job_id,
         "status": status,
@@ -255,13 +280,16 @@ def _notify_completion(
     }
     if error_message:
         payload["error_message"] = error_message
+    return payload
+
 
+def _wake_outbox_relay(job_id: str) -> None:
+    """Trigger an outbox relay run so the notification goes out without waiting for beat.
+
+    Best effort: the event is already committed and the periodic relay
+    picks it up if the broker is unavailable.
+    """
     try:
-        dispatch_result = asyncio.run(NotificationDispatcher.from_config().dispatch(payload))
-        if not dispatch_result.all_succeeded:
-            logger.warning(
-                f"Job {job_id} — notification partial failure: "
-                f"ok={dispatch_result.succeeded}, failed={dispatch_result.failed}"
-            )
+        relay_outbox.delay()
     except Exception as e:
-        logger.error(f"Notification dispatch failed for job {job_id}: {e}")
+        logger.warning(f"Could not trigger outbox relay for job {job_id}: {e}")
@@ -0,0 +1,53 @@
+"""Long-lived event loop for async work inside Celery worker processes.
+
+asyncio.run() creates and closes a loop per call, which would orphan the
+pooled HTTP connections (they belong to the loop that opened them). Tasks
+call run_async() instead, which reuses one loop per worker process;
+close_event_loop() releases the pool and the loop on worker shutdown.
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Any, Coroutine, Optional, TypeVar
+
+from app.infrastructure.notifications.clients.http_pool import get_http_pool
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_runner: Optional[asyncio.Runner] = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on this process's long-lived event loop.
+
+    The coroutine runs in a copy of the caller's context (the runner would
+    otherwise reuse the context captured when it was created), so the active
+    tracing span and query tracking carry over.
+
+    Args:
+        coro: Coroutine to run to completion
+
+    Returns:
+        The coroutine result
+    """
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+    return _runner.run(coro, context=contextvars.copy_context())
+
+
+def close_event_loop() -> None:
+    """Close the shared HTTP pool and the event loop (idempotent)."""
+    global _runner
+    if _runner is None:
+        return
+    try:
+        _runner.run(get_http_pool().aclose())
+    except Exception as e:
+        logger.warning(f"Error closing notification HTTP pool: {e}")
+    finally:
+        _runner.close()
+        _runner = None
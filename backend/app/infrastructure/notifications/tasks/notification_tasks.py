@@ -0,0 +1,108 @@
+"""Celery tasks for notification delivery.
+
+Notification events are written to finance.outbox in the same transaction
+as the job status change. relay_outbox drains the outbox in batches on the
+dedicated "notifications" queue, so slow or failing third-party endpoints
+never hold a batch-processing worker slot. Delivery is at-least-once:
+every payload carries ``event_id`` (the outbox row id) for deduplication.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List
+
+from app.core.config import settings
+from app.infrastructure.database.models import OutboxModel
+from app.infrastructure.database.session import WorkerSessionLocal
+from app.infrastructure.notifications.backoff import backoff_delay
+from app.infrastructure.notifications.dispatcher import DispatchResult, NotificationDispatcher
+from app.infrastructure.notifications.tasks.celery_app import celery_app
+from app.infrastructure.notifications.tasks.event_loop import run_async
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATIONS_QUEUE = "notifications"
+
+
+async def _deliver(events: List[OutboxModel]) -> List[DispatchResult]:
+    """Dispatch every claimed event concurrently.
+
+    Each event only targets the channels that have not received it yet.
+
+    Args:
+        events: Claimed outbox rows
+
+    Returns:
+        One DispatchResult per event, in the same order
+    """
+    return await asyncio.gather(
+        *(
+            NotificationDispatcher.from_config(event.channels).dispatch({**event.payload, "event_id": event.id})
+            for event in events
+        )
+    )
+
+
+@celery_app.task(name="relay_outbox")
+def relay_outbox() -> Dict[str, int]:
+    """Deliver one batch of pending outbox events.
+
+    Claims up to OUTBOX_RELAY_BATCH_SIZE due events with FOR UPDATE SKIP LOCKED,
+    dispatches them, and marks each one sent or schedules a retry for its failed
+    channels (jittered NOTIFICATION_RETRY_BACKOFF_SECONDS * 2^attempt). After
+    NOTIFICATION_MAX_RETRIES retries the event is marked failed. Events whose
+    failed channels were all short-circuited (open circuit) are deferred without
+    spending an attempt. Row locks are released by the final commit.
+
+    Runs periodically through Celery beat and is also triggered right after
+    a job finishes.
+
+    Returns:
+        Number of events sent, rescheduled, deferred and given up
+    """
+    from app.infrastructure.repositories.outbox_repository import OutboxRepository
+
+    db = WorkerSessionLocal()
+    counts = {"sent": 0, "retried": 0, "deferred": 0, "failed": 0}
+
+    try:
+        outbox_repo = OutboxRepository(db)
+        events = outbox_repo.claim_pending(settings.OUTBOX_RELAY_BATCH_SIZE)
+        if not events:
+            db.rollback()
+            return counts
+
+        results = run_async(_deliver(events))
+
+        for event, result in zip(events, results):
+            if result.all_succeeded:
+                outbox_repo.mark_sent(event)
+                counts["sent"] += 1
+                continue
+
+            error = f"failed channels: {result.failed}"
+            if set(result.failed) <= set(result.short_circuited):
+                retry_in = backoff_delay(settings.NOTIFICATION_CIRCUIT_OPEN_SECONDS, 0)
+                outbox_repo.mark_failed(event, result.failed, error, retry_in=retry_in, count_attempt=False)
+                counts["deferred"] += 1
+                logger.info(f"Outbox event {event.id} deferred {retry_in:.0f}s: open circuit for {result.failed}")
+            elif event.attempts >= settings.NOTIFICATION_MAX_RETRIES:
+                outbox_repo.mark_failed(event, result.failed, error)
+                counts["failed"] += 1
+                logger.error(f"Outbox event {event.id} gave up after {event.attempts} attempts: {error}")
+            else:
+                retry_in = backoff_delay(settings.NOTIFICATION_RETRY_BACKOFF_SECONDS, event.attempts)
+                outbox_repo.mark_failed(event, result.failed, error, retry_in=retry_in)
+                counts["retried"] += 1
+                logger.warning(f"Outbox event {event.id} — {error}, retrying in {retry_in:.0f}s")
+
+        db.commit()
+        logger.info(f"Outbox relay batch done: {counts}")
+        return counts
+
+    except Exception:
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
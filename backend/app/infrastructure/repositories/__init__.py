@@ -6,5 +6,6 @@ Contains repository implementations for data access.
 from app.infrastructure.repositories.audit_repository import AuditRepository
 from app.infrastructure.repositories.document_repository import DocumentRepository
 from app.infrastructure.repositories.job_repository import JobRepository
+from app.infrastructure.repositories.outbox_repository import OutboxRepository
 
-__all__ = ["AuditRepository", "DocumentRepository", "JobRepository"]
+__all__ = ["AuditRepository", "DocumentRepository", "JobRepository", "OutboxRepository"]
@@ -5,13 +5,16 @@ Uses (table_name, record_id) to avoid coupling to a specific table.
 """
 
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced_methods
 from app.infrastructure.database.models import AuditLogModel
 
 
+@traced_methods
 class AuditRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
@@ -49,6 +52,34 @@ class AuditRepository:
         self.db.add(entry)
         self.db.commit()
 
+    def log_many(self, entries: List[Dict[str, Any]], commit: bool = True) -> None:
+        """Append many audit entries with a single multi-row INSERT.
+
+        Args:
+            entries: Dicts with table_name, record_id, action and optional
+                     old_value, new_value and user_id
+            commit:  Commit right away; pass False to keep the rows in the
+                     caller's transaction
+        """
+        if not entries:
+            return
+        timestamp = datetime.utcnow()
+        rows = [
+            {
+                "table_name": entry["table_name"],
+                "record_id": str(entry["record_id"]),
+                "action": entry["action"],
+                "old_value": entry.get("old_value"),
+                "new_value": entry.get("new_value"),
+                "timestamp": timestamp,
+                "user_id": entry.get("user_id"),
+            }
+            for entry in entries
+        ]
+        self.db.execute(insert(AuditLogModel), rows)
+        if commit:
+            self.db.commit()
+
     # ── Convenience shorthands ────────────────────────────────────────────────
 
     def log_created(self, table_name: str, record_id: str, summary: str, user_id: Optional[str] = None) -> None:
@@ -3,18 +3,96 @@
 Handles document persistence and retrieval operations.
 """
 
+import json
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import Integer, any_, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.domain.entities.document import Document
+from app.core.tracing import traced_methods
+from app.domain.entities.document import Document, DocumentStatus
 from app.domain.exceptions import DocumentNotFoundException
+from app.domain.state_machine import StateMachine
 from app.infrastructure.database.models import DocumentModel
-
-_SKIP_AUDIT_SQL = text("SET LOCAL app.skip_audit = 'application'")
+from app.infrastructure.database.session import skip_audit
+from app.infrastructure.repositories.audit_repository import AuditRepository
+
+# Allowed transitions as (from_status, to_status) rows, joined in SQL by bulk_update_status
+_TRANSITIONS_JSON = json.dumps(
+    [
+        {"from_status": from_status, "to_status": to_status}
+        for from_status, to_statuses in StateMachine.TRANSITIONS.items()
+        for to_status in to_statuses
+    ]
+)
+
+# One statement for the whole batch: lock the target rows, apply only the
+# entries whose (current, new) status pair is an allowed transition, merge the
+# rejection comment into metadata, and report every entry in request order.
+_BULK_STATUS_SQL = text("""
+    WITH entries AS (
+        SELECT e.idx, e.document_id, e.new_status, e.comment
+        FROM jsonb_to_recordset(CAST(:entries AS jsonb))
+             AS e(idx int, document_id int, new_status text, comment text)
+    ),
+    transitions AS (
+        SELECT t.from_status, t.to_status
+        FROM jsonb_to_recordset(CAST(:transitions AS jsonb)) AS t(from_status text, to_status text)
+    ),
+    locked AS (
+        SELECT d.id, d.status
+        FROM finance.documents d
+        JOIN entries e ON e.document_id = d.id
+        FOR UPDATE OF d
+    ),
+    updated AS (
+        UPDATE finance.documents d
+        SET status = e.new_status,
+            metadata = CASE
+                WHEN e.new_status = :rejected AND e.comment IS NOT NULL
+                THEN d.metadata || jsonb_build_object(
+                    'rejection_comment', e.comment, 'rejected_by', CAST(:user_email AS text)
+                )
+                ELSE d.metadata
+            END,
+            updated_at = now()
+        FROM entries e
+        JOIN locked l ON l.id = e.document_id
+        JOIN transitions t ON t.from_status = l.status AND t.to_status = e.new_status
+        WHERE d.id = e.document_id
+        RETURNING d.id
+    )
+    SELECT e.document_id, e.new_status, l.status AS old_status, u.id IS NOT NULL AS updated
+    FROM entries e
+    LEFT JOIN locked l ON l.id = e.document_id
+    LEFT JOIN updated u ON u.id = e.document_id
+    ORDER BY e.idx
+""")
+
+_METADATA_FIELD_PREFIX = "metadata."
+_FIELD_COLUMNS = {
+    "id": DocumentModel.id,
+    "type": DocumentModel.type,
+    "amount": DocumentModel.amount,
+    "status": DocumentModel.status,
+    "created_at": DocumentModel.created_at,
+    "updated_at": DocumentModel.updated_at,
+    "metadata": DocumentModel.extra_data,
+    "created_by": DocumentModel.created_by,
+}
+
+# Every field labeled with its response name: rows map straight into response DTOs
+_DOCUMENT_COLUMNS = [column.label(field) for field, column in _FIELD_COLUMNS.items()]
+
+
+def _id_in(document_ids: List[int]) -> ColumnElement[bool]:
+    """Build ``id = ANY(:document_ids)`` with the IDs bound as a single integer array parameter."""
+    return DocumentModel.id == any_(bindparam("document_ids", list(document_ids), type_=ARRAY(Integer)))
 
 
 class FilterOperator(str, Enum):
@@ -25,6 +103,7 @@ class FilterOperator(str, Enum):
     LESS_THAN_OR_EQUAL = "lte"
 
 
+@traced_methods
 class DocumentRepository:
     """Repository for Document entity persistence."""
 
@@ -35,6 +114,7 @@ class DocumentRepository:
             db: SQLAlchemy database session
         """
         self.db = db
+        self._audit = AuditRepository(db)
 
     def create(self, document: Document) -> Document:
         """Create a new document in database.
@@ -45,7 +125,7 @@ class DocumentRepository:
         Returns:
             Document entity with assigned ID
         """
-        self.db.execute(_SKIP_AUDIT_SQL)
+        skip_audit(self.db)
         db_document = DocumentModel(
             type=document.type,
             amount=document.amount,
@@ -78,6 +158,69 @@ class DocumentRepository:
 
         return self._to_entity(db_document)
 
+    def get_many(self, document_ids: List[int]) -> List[Document]:
+        """Get many documents with a single ``WHERE id = ANY(:ids)`` query.
+
+        Args:
+            document_ids: Document IDs
+
+        Returns:
+            Found document entities, in no particular order
+        """
+        db_documents = self.db.query(DocumentModel).filter(_id_in(document_ids)).all()
+
+        return [self._to_entity(doc) for doc in db_documents]
+
+    def existing_ids(self, document_ids: List[int]) -> Set[int]:
+        """Return which of the given document IDs exist, in a single query.
+
+        Args:
+            document_ids: Document IDs
+
+        Returns:
+            IDs present in the table
+        """
+        return {row.id for row in self.db.query(DocumentModel.id).filter(_id_in(document_ids)).all()}
+
+    def get_row(self, document_id: int) -> Optional[Row]:
+        """Get a document as a plain row for read-only use.
+
+        Skips the ORM object and the domain entity; columns are labeled with
+        the response field names (``metadata`` included).
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            Row if found, None otherwise
+        """
+        return self.db.query(*_DOCUMENT_COLUMNS).filter(DocumentModel.id == document_id).first()
+
+    def get_many_rows(self, document_ids: List[int]) -> List[Row]:
+        """Get many documents as plain rows (see get_row) in a single query.
+
+        Args:
+            document_ids: Document IDs
+
+        Returns:
+            Found rows, in no particular order
+        """
+        return self.db.query(*_DOCUMENT_COLUMNS).filter(_id_in(document_ids)).all()
+
+    def get_many_fields(self, document_ids: List[int], fields: List[str]) -> List[Dict[str, Any]]:
+        """Get only the selected fields of many documents in a single query.
+
+        Args:
+            document_ids: Document IDs
+            fields: Field names to select (must include ``id``)
+
+        Returns:
+            Dictionaries with the selected fields, in no particular order
+        """
+        rows = self.db.query(*self._select_columns(fields)).filter(_id_in(document_ids)).all()
+
+        return [self._row_to_dict(row, fields) for row in rows]
+
     def update(self, document_id: int, data: Dict[str, Any]) -> Document:
         """Update document fields.
 
@@ -96,7 +239,7 @@ class DocumentRepository:
         if not db_document:
             raise DocumentNotFoundException(document_id)
 
-        self.db.execute(_SKIP_AUDIT_SQL)
+        skip_audit(self.db)
         field_name_map = {"metadata": "extra_data"}
         for key, value in data.items():
             orm_key = field_name_map.get(key, key)
@@ -123,6 +266,79 @@ class DocumentRepository:
         """
         return self.update(document_id, {"status": new_status})
 
+    def get_fields(self, document_id: int, fields: List[str]) -> Optional[Dict[str, Any]]:
+        """Get only the selected fields of a document.
+
+        Args:
+            document_id: Document ID
+            fields: Field names to select (``metadata.<key>`` selects a single metadata key)
+
+        Returns:
+            Dictionary with the selected fields if found, None otherwise
+        """
+        row = self.db.query(*self._select_columns(fields)).filter(DocumentModel.id == document_id).first()
+
+        if row is None:
+            return None
+
+        return self._row_to_dict(row, fields)
+
+    def bulk_update_status(self, entries: List[Dict[str, Any]], user_email: str) -> List[Row]:
+        """Apply many status transitions in one transaction.
+
+        Transitions are validated against StateMachine.TRANSITIONS inside the
+        UPDATE itself; entries that are not allowed are left untouched. One
+        state_change audit row is written per updated document, in the same
+        transaction.
+
+        Args:
+            entries: Dicts with document_id, new_status and optional comment (unique document_id)
+            user_email: Email of the user performing the transitions
+
+        Returns:
+            One row per entry, in input order, with document_id, new_status,
+            old_status (None if the document does not exist) and updated
+        """
+        payload = [
+            {
+                "idx": idx,
+                "document_id": entry["document_id"],
+                "new_status": entry["new_status"],
+                "comment": entry.get("comment"),
+            }
+            for idx, entry in enumerate(entries)
+        ]
+
+        skip_audit(self.db)
+        rows = self.db.execute(
+            _BULK_STATUS_SQL,
+            {
+                "entries": json.dumps(payload),
+                "transitions": _TRANSITIONS_JSON,
+                "rejected": DocumentStatus.REJECTED.value,
+                "user_email": user_email,
+            },
+        ).all()
+
+        self._audit.log_many(
+            [
+                {
+                    "table_name": "documents",
+                    "record_id": row.document_id,
+                    "action": "state_change",
+                    "old_value": row.old_status,
+                    "new_value": row.new_status,
+                    "user_id": user_email,
+                }
+                for row in rows
+                if row.updated
+            ],
+            commit=False,
+        )
+        self.db.commit()
+
+        return rows
+
     def search(self, filters: Dict[str, Any], skip: int = 0, limit: int = 50) -> Tuple[List[Document], int]:
         """Search documents with filters and pagination.
 
@@ -134,8 +350,66 @@ class DocumentRepository:
         Returns:
             Tuple of (list of documents, total count)
         """
-        query = self.db.query(DocumentModel)
+        query = self._apply_filters(self.db.query(DocumentModel), filters)
+
+        total = query.count()
+        documents = query.order_by(DocumentModel.created_at.desc()).offset(skip).limit(limit).all()
+
+        return [self._to_entity(doc) for doc in documents], total
+
+    def search_rows(self, filters: Dict[str, Any], skip: int = 0, limit: int = 50) -> Tuple[List[Row], int]:
+        """Search documents returning plain rows (see get_row).
+
+        Args:
+            filters: Search filters (type, status, amount_min, amount_max, etc.)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of rows, total count)
+        """
+        query = self._apply_filters(self.db.query(*_DOCUMENT_COLUMNS), filters)
+
+        total = query.count()
+        rows = query.order_by(DocumentModel.created_at.desc()).offset(skip).limit(limit).all()
+
+        return rows, total
+
+    def search_fields(
+        self,
+        filters: Dict[str, Any],
+        fields: List[str],
+        skip: int = 0,
+        limit: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Search documents selecting only the requested columns.
+
+        Args:
+            filters: Search filters (type, status, amount_min, amount_max, etc.)
+            fields: Field names to select (``metadata.<key>`` selects a single metadata key)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of dictionaries with the selected fields, total count)
+        """
+        query = self._apply_filters(self.db.query(*self._select_columns(fields)), filters)
+
+        total = query.count()
+        rows = query.order_by(DocumentModel.created_at.desc()).offset(skip).limit(limit).all()
+
+        return [self._row_to_dict(row, fields) for row in rows], total
+
+    def _apply_filters(self, query: Query, filters: Dict[str, Any]) -> Query:
+        """Apply search filters to a documents query.
+
+        Args:
+            query: Query over the documents table
+            filters: Search filters (type, status, amount_min, amount_max, etc.)
 
+        Returns:
+            Filtered query
+        """
         filter_mappings = [
             ("type", DocumentModel.type, FilterOperator.EQUAL),
             ("status", DocumentModel.status, FilterOperator.EQUAL),
@@ -164,10 +438,47 @@ class DocumentRepository:
             if value is not None:
                 query = query.filter(_operator_fn[operator](column, value))
 
-        total = query.count()
-        documents = query.order_by(DocumentModel.created_at.desc()).offset(skip).limit(limit).all()
+        return query
 
-        return [self._to_entity(doc) for doc in documents], total
+    def _select_columns(self, fields: List[str]) -> List[Any]:
+        """Map field names to the columns (or metadata ``->`` expressions) to select.
+
+        Args:
+            fields: Field names to select
+
+        Returns:
+            Column expressions in the same order as ``fields``
+        """
+        return [
+            DocumentModel.extra_data[field[len(_METADATA_FIELD_PREFIX) :]]
+            if field.startswith(_METADATA_FIELD_PREFIX)
+            else _FIELD_COLUMNS[field]
+            for field in fields
+        ]
+
+    def _row_to_dict(self, row: Row, fields: List[str]) -> Dict[str, Any]:
+        """Convert a projected row to a dictionary keyed by field name.
+
+        Selected metadata keys are nested under ``metadata``; missing keys are omitted.
+
+        Args:
+            row: Row returned by a query built with _select_columns
+            fields: Field names in select order
+
+        Returns:
+            Dictionary with the selected fields
+        """
+        data: Dict[str, Any] = {}
+        for field, value in zip(fields, row):
+            if field.startswith(_METADATA_FIELD_PREFIX):
+                metadata = data.setdefault("metadata", {})
+                if value is not None:
+                    metadata[field[len(_METADATA_FIELD_PREFIX) :]] = value
+            elif field == "metadata":
+                data["metadata"] = value or {}
+            else:
+                data[field] = value
+        return data
 
     def _to_entity(self, db_document: DocumentModel) -> Document:
         """Convert database model to domain entity.
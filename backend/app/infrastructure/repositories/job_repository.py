@@ -3,19 +3,22 @@
 Handles job persistence and retrieval operations.
 """
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import Integer, func, insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced_methods
 from app.domain.entities.job import Job
 from app.domain.exceptions import JobNotFoundException
-from app.infrastructure.database.models import JobModel
-
-_SKIP_AUDIT_SQL = text("SET LOCAL app.skip_audit = 'application'")
+from app.infrastructure.database.models import JobItemModel, JobModel
+from app.infrastructure.database.session import skip_audit
+from app.infrastructure.repositories.outbox_repository import OutboxRepository
 
 
+@traced_methods
 class JobRepository:
     """Repository for Job entity persistence."""
 
@@ -26,6 +29,7 @@ class JobRepository:
             db: SQLAlchemy database session
         """
         self.db = db
+        self._outbox = OutboxRepository(db)
 
     def create(self, job: Job) -> Job:
         """Create a new job in database.
@@ -45,7 +49,7 @@ class JobRepository:
             error_message=job.error_message,
             result=job.result,
         )
-        self.db.execute(_SKIP_AUDIT_SQL)
+        skip_audit(self.db)
         self.db.add(db_job)
         self.db.commit()
         self.db.refresh(db_job)
@@ -94,13 +98,85 @@ class JobRepository:
 
         return [self._to_entity(j) for j in db_jobs], total
 
+    def list_summaries(
+        self,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 10,
+    ) -> Tuple[List[Row], int]:
+        """List job summaries without loading document_ids or result.
+
+        The document count and the processed/failed totals are computed in SQL
+        from the array length and the JSONB keys, so only scalars leave the database.
+
+        Args:
+            status: Optional status filter
+            skip: Number of records to skip
+            limit: Max records to return
+
+        Returns:
+            Tuple of (list of rows with job_id, status, created_at, completed_at,
+            error_message, document_count, processed, failed; total count)
+        """
+        query = self.db.query(
+            JobModel.id.label("job_id"),
+            JobModel.status,
+            JobModel.created_at,
+            JobModel.completed_at,
+            JobModel.error_message,
+            func.cardinality(JobModel.document_ids).label("document_count"),
+            JobModel.result["processed"].astext.cast(Integer).label("processed"),
+            JobModel.result["failed"].astext.cast(Integer).label("failed"),
+        )
+
+        if status:
+            query = query.filter(JobModel.status == status)
+
+        total = query.count()
+        rows = query.order_by(JobModel.created_at.desc()).offset(skip).limit(limit).all()
+
+        return rows, total
+
+    def exists(self, job_id: UUID) -> bool:
+        """Check whether a job exists without loading its columns.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            True if the job exists, False otherwise
+        """
+        return self.db.query(self.db.query(JobModel.id).filter(JobModel.id == job_id).exists()).scalar()
+
+    def list_items(self, job_id: UUID, skip: int = 0, limit: int = 50) -> Tuple[List[JobItemModel], int]:
+        """List the per-document results of a job in processing order.
+
+        Args:
+            job_id: Job UUID
+            skip: Number of records to skip
+            limit: Max records to return
+
+        Returns:
+            Tuple of (list of job items, total count)
+        """
+        query = self.db.query(JobItemModel).filter(JobItemModel.job_id == job_id)
+
+        total = query.count()
+        items = query.order_by(JobItemModel.id).offset(skip).limit(limit).all()
+
+        return items, total
+
     def update_status(self, job_id: UUID, status: str, **kwargs: Any) -> Job:
         """Update job status and related fields.
 
         Args:
             job_id: Job UUID
             status: New status value
-            **kwargs: Additional fields to update (completed_at, error_message, result)
+            **kwargs: Additional fields to update (completed_at, error_message, result).
+                ``items`` may carry the per-document details; they are bulk
+                inserted into job_items in the same transaction.
+                ``outbox_event`` may carry a notification payload; it is written
+                to finance.outbox in the same transaction as the status change.
 
         Returns:
             Updated job entity
@@ -113,7 +189,7 @@ class JobRepository:
         if not db_job:
             raise JobNotFoundException(str(job_id))
 
-        self.db.execute(_SKIP_AUDIT_SQL)
+        skip_audit(self.db)
         db_job.status = status
 
         # Update optional fields
@@ -123,12 +199,35 @@ class JobRepository:
             db_job.error_message = kwargs["error_message"]
         if "result" in kwargs:
             db_job.result = kwargs["result"]
+        if kwargs.get("items"):
+            self._insert_items(job_id, kwargs["items"])
+        if kwargs.get("outbox_event"):
+            self._outbox.add(f"job.{status}", kwargs["outbox_event"], commit=False)
 
         self.db.commit()
         self.db.refresh(db_job)
 
         return self._to_entity(db_job)
 
+    def _insert_items(self, job_id: UUID, items: List[Dict[str, Any]]) -> None:
+        """Bulk insert per-document details with a single multi-row INSERT.
+
+        Args:
+            job_id: Parent job UUID
+            items: Detail dicts with document_id, status and optional action/error
+        """
+        rows = [
+            {
+                "job_id": job_id,
+                "document_id": item["document_id"],
+                "status": item["status"],
+                "action": item.get("action"),
+                "error": item.get("error"),
+            }
+            for item in items
+        ]
+        self.db.execute(insert(JobItemModel), rows)
+
     def _to_entity(self, db_job: JobModel) -> Job:
         """Convert database model to domain entity.
 
@@ -0,0 +1,111 @@
+"""Outbox repository.
+
+Transactional outbox for notification events: events are written in the
+same transaction as the state change that produced them and drained by the
+relay with FOR UPDATE SKIP LOCKED, so several relays never claim the same row.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.tracing import traced_methods
+from app.infrastructure.database.models import OutboxModel
+
+STATUS_PENDING = "pending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+
+@traced_methods
+class OutboxRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    # ── Write ─────────────────────────────────────────────────────────────────
+
+    def add(self, event_type: str, payload: Dict[str, Any], commit: bool = True) -> OutboxModel:
+        """Append a pending event.
+
+        Args:
+            event_type: Event name (e.g. 'job.completed')
+            payload:    Event data to deliver
+            commit:     Commit right away; pass False to keep the row in the
+                        caller's transaction (the usual case)
+
+        Returns:
+            The pending outbox row
+        """
+        event = OutboxModel(event_type=event_type, payload=payload, status=STATUS_PENDING, attempts=0)
+        self.db.add(event)
+        if commit:
+            self.db.commit()
+        return event
+
+    def mark_sent(self, event: OutboxModel) -> None:
+        """Mark a claimed event as delivered.
+
+        The caller commits, which also releases the row lock taken by claim_pending().
+
+        Args:
+            event: Row returned by claim_pending()
+        """
+        event.status = STATUS_SENT
+        event.attempts += 1
+        event.channels = None
+        event.last_error = None
+        event.processed_at = func.now()
+
+    def mark_failed(
+        self,
+        event: OutboxModel,
+        channels: List[str],
+        error: str,
+        retry_in: Optional[float] = None,
+        count_attempt: bool = True,
+    ) -> None:
+        """Record a failed delivery attempt for a claimed event.
+
+        Args:
+            event:    Row returned by claim_pending()
+            channels: Channel names that still have to receive the event
+            error:    Description of the failure
+            retry_in: Seconds until the next attempt; None gives up (status 'failed')
+            count_attempt: Whether this try counts towards the retry limit (False when
+                           no channel was actually called, e.g. every circuit was open)
+        """
+        if count_attempt:
+            event.attempts += 1
+        event.channels = channels
+        event.last_error = error
+        if retry_in is None:
+            event.status = STATUS_FAILED
+            event.processed_at = func.now()
+        else:
+            # Database clock, like the claim_pending() filter
+            event.next_attempt_at = func.now() + timedelta(seconds=retry_in)
+
+    # ── Read ──────────────────────────────────────────────────────────────────
+
+    def claim_pending(self, limit: int) -> List[OutboxModel]:
+        """Lock and return the oldest events that are due for delivery.
+
+        Rows already locked by another relay are skipped, so concurrent relays
+        drain disjoint batches. Locks are held until the caller commits.
+
+        Args:
+            limit: Max events to claim
+
+        Returns:
+            Claimed outbox rows in creation order
+        """
+        return (
+            self.db.query(OutboxModel)
+            .filter(OutboxModel.status == STATUS_PENDING, OutboxModel.next_attempt_at <= func.now())
+            .order_by(OutboxModel.next_attempt_at, OutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
@@ -9,11 +9,13 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced_methods
 from app.domain.entities.user import User, UserRole, UserStatus
 from app.infrastructure.database.models.user import UserModel
 from app.infrastructure.repositories.audit_repository import AuditRepository
 
 
+@traced_methods
 class UserRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
@@ -3,15 +3,22 @@
 Main application configuration with routes and middleware.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.middleware import domain_exception_handler, validation_exception_handler
+from app.api.middleware.metrics import MetricsMiddleware
+from app.api.middleware.profiling import ProfilingMiddleware
+from app.api.middleware.query_stats import QueryStatsMiddleware
+from app.api.middleware.tracing import TracingMiddleware
+from app.api.responses import ORJSONResponse
 from app.api.routes import admin_router, auth_router, batch_router, documents_router, jobs_router
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.metrics import render_metrics
 from app.domain.exceptions import DomainException
+from app.infrastructure.health import get_readiness_probe
 
 setup_logging(settings.LOG_LEVEL)
 
@@ -22,6 +29,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
@@ -32,6 +40,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(ProfilingMiddleware)
 
 # Exception handlers
 app.add_exception_handler(DomainException, domain_exception_handler)
@@ -59,3 +71,22 @@ async def root() -> dict[str, str]:
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/ready", tags=["health"])
+def readiness_check() -> ORJSONResponse:
+    """Readiness with dependency probes (database, Redis, queue depth, worker heartbeat).
+
+    Probe results are cached for READINESS_CACHE_SECONDS, so load balancers
+    can poll every second. Answers 503 only when a critical check is "down";
+    degraded checks are reported in the body with a 200.
+    """
+    report = get_readiness_probe().report()
+    return ORJSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics (aggregated across worker processes when multiprocess mode is on)."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
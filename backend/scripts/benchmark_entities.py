@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark — memory and construction time of the domain entities.
+
+Builds N instances of Document, Job and User (as the batch worker and the
+write paths do) and reports construction time and traced memory per instance:
+    docker compose exec backend python scripts/benchmark_entities.py
+    docker compose exec backend python scripts/benchmark_entities.py --count 100000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, List
+
+sys.path.insert(0, "/app")
+
+from app.domain.entities.document import Document
+from app.domain.entities.job import Job
+from app.domain.entities.user import User, UserRole, UserStatus
+
+NOW = datetime(2026, 1, 1)
+AMOUNT = Decimal("1500.00")
+METADATA = {"client": "ACME", "email": "billing@acme.test"}
+
+
+def make_document(i: int) -> Document:
+    return Document(
+        type="invoice", amount=AMOUNT, metadata=METADATA, id=i, created_at=NOW, updated_at=NOW, created_by="loader"
+    )
+
+
+def make_job(i: int) -> Job:
+    return Job(document_ids=[i], id=uuid.UUID(int=i), created_at=NOW)
+
+
+def make_user(i: int) -> User:
+    return User(
+        id=uuid.UUID(int=i),
+        google_id=str(i),
+        email="user@test.com",
+        name="User",
+        picture=None,
+        role=UserRole.LOADER,
+        status=UserStatus.ACTIVE,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def measure(factory: Callable[[int], Any], count: int) -> tuple:
+    """Return (construction ms, traced bytes per instance).
+
+    Field values are shared between instances, so the memory figure is the
+    instance itself (object header, attribute storage) plus per-instance
+    values such as document_ids lists and UUIDs.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    instances: List[Any] = [factory(i) for i in range(count)]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    del instances
+
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+
+    return elapsed_ms, size / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark domain entity memory and construction time")
+    parser.add_argument("--count", type=int, default=100_000, help="Instances per entity (default: 100000)")
+    args = parser.parse_args()
+
+    print(f"{args.count} instances per entity\n")
+    print(f"{'entity':<10}{'build ms':>10}{'bytes/instance':>16}{'has __dict__':>14}")
+    for name, factory in (("Document", make_document), ("Job", make_job), ("User", make_user)):
+        elapsed_ms, per_instance = measure(factory, args.count)
+        has_dict = hasattr(factory(1), "__dict__")
+        print(f"{name:<10}{elapsed_ms:>10.1f}{per_instance:>16.0f}{has_dict!s:>14}")
+
+
+if __name__ == "__main__":
+    main()
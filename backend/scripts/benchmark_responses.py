@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark — JSON rendering of the search and job list responses.
+
+Compares FastAPI's default path (return the DTO, ``response_model``
+re-validation + ``jsonable_encoder`` + ``JSONResponse``) with the API's
+``ORJSONResponse`` (DTO dumped once, rendered with orjson) through the full
+ASGI stack, using in-memory DTOs so no database is needed:
+    docker compose exec backend python scripts/benchmark_responses.py
+    docker compose exec backend python scripts/benchmark_responses.py --items 100 --requests 500
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+from faker import Faker
+
+sys.path.insert(0, "/app")
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.api.responses import ORJSONResponse
+from app.application.dtos.document_dtos import DocumentResponse, PaginatedDocumentsResponse
+from app.application.dtos.job_dtos import JobListResponse, JobResponse
+
+fake = Faker("es_CO")
+
+
+def build_documents(count: int) -> PaginatedDocumentsResponse:
+    """Build a page of documents with realistic JSONB metadata."""
+    now = datetime.now(timezone.utc)
+    items = [
+        DocumentResponse(
+            id=i,
+            type="invoice",
+            amount=Decimal(f"{fake.random_int(1_000, 50_000_000)}.{fake.random_int(0, 99):02d}"),
+            status="pending",
+            created_at=now - timedelta(days=i),
+            updated_at=now,
+            metadata={
+                "client": fake.company(),
+                "email": fake.company_email(),
+                "reference": f"INV-2026-{i:04d}",
+                "city": fake.city(),
+                "notes": fake.sentence(nb_words=6),
+                "tax": "19%",
+                "currency": "COP",
+            },
+            created_by=fake.email(),
+        )
+        for i in range(1, count + 1)
+    ]
+    return PaginatedDocumentsResponse(items=items, total=count * 10, page=1, page_size=count, total_pages=10)
+
+
+def build_jobs(count: int) -> JobListResponse:
+    """Build a page of completed jobs with summary results."""
+    now = datetime.now(timezone.utc)
+    items = [
+        JobResponse(
+            job_id=uuid.uuid4(),
+            status="completed",
+            created_at=now - timedelta(minutes=i),
+            completed_at=now,
+            result={"total": 50, "processed": 48, "failed": 2},
+        )
+        for i in range(count)
+    ]
+    return JobListResponse(items=items, total=count * 10, page=1, page_size=count, total_pages=10)
+
+
+def build_app(documents: PaginatedDocumentsResponse, jobs: JobListResponse) -> FastAPI:
+    """Mount each endpoint twice: default FastAPI rendering and ORJSONResponse."""
+    app = FastAPI()
+
+    @app.get("/default/documents", response_model=PaginatedDocumentsResponse, response_class=JSONResponse)
+    async def default_documents() -> PaginatedDocumentsResponse:
+        return documents
+
+    @app.get("/orjson/documents", response_model=PaginatedDocumentsResponse)
+    async def orjson_documents() -> ORJSONResponse:
+        return ORJSONResponse(documents)
+
+    @app.get("/default/jobs", response_model=JobListResponse, response_class=JSONResponse)
+    async def default_jobs() -> JobListResponse:
+        return jobs
+
+    @app.get("/orjson/jobs", response_model=JobListResponse)
+    async def orjson_jobs() -> ORJSONResponse:
+        return ORJSONResponse(jobs)
+
+    return app
+
+
+def measure(call: Callable[[], Any], requests: int) -> Tuple[float, float]:
+    """Return (median, p95) latency in milliseconds."""
+    for _ in range(min(50, requests)):
+        call()
+    samples: List[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark API JSON response rendering")
+    parser.add_argument("--items", type=int, default=100, help="Items per page (default: 100)")
+    parser.add_argument("--requests", type=int, default=300, help="Requests per endpoint (default: 300)")
+    args = parser.parse_args()
+
+    client = TestClient(build_app(build_documents(args.items), build_jobs(args.items)))
+    results: Dict[str, Dict[str, Tuple[float, float]]] = {}
+    for endpoint in ("documents", "jobs"):
+        if client.get(f"/default/{endpoint}").json() != client.get(f"/orjson/{endpoint}").json():
+            raise SystemExit(f"{endpoint}: response bodies differ")
+        results[endpoint] = {
+            mode: measure(lambda url=f"/{mode}/{endpoint}": client.get(url), args.requests)
+            for mode in ("default", "orjson")
+        }
+
+    print(f"{args.items} items/page, {args.requests} requests per endpoint\n")
+    print(f"{'endpoint':<12}{'renderer':<10}{'median ms':>11}{'p95 ms':>9}{'speedup':>10}")
+    for endpoint, modes in results.items():
+        baseline = modes["default"][0]
+        for mode, (median, p95) in modes.items():
+            print(f"{endpoint:<12}{mode:<10}{median:>11.2f}{p95:>9.2f}{baseline / median:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from datetime import datetime, timedelta, timezone
 sys.path.insert(0, "/app")
 
 from jose import jwt
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.infrastructure.database.session import SessionLocal
@@ -36,32 +37,37 @@ def list_users() -> None:
         db.close()
 
 
+def find_user(db: Session, email: str | None = None, role: str | None = None) -> UserModel | None:
+    """Return the user with this email, else the first active user with this role (default: admin)."""
+    if email:
+        return db.query(UserModel).filter(UserModel.email == email).first()
+    return db.query(UserModel).filter(UserModel.role == (role or "admin"), UserModel.status == "active").first()
+
+
+def issue_token(user: UserModel, hours: int) -> str:
+    """Sign a JWT for the user, valid for the given hours."""
+    payload = {
+        "sub": str(user.id),
+        "email": user.email,
+        "name": user.name,
+        "role": user.role,
+        "status": user.status,
+        "exp": datetime.now(timezone.utc) + timedelta(hours=hours),
+    }
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
 def generate_token(email: str | None, hours: int) -> None:
     db = SessionLocal()
     try:
-        if email:
-            user = db.query(UserModel).filter(UserModel.email == email).first()
-        else:
-            user = (
-                db.query(UserModel)
-                .filter(UserModel.role == "admin", UserModel.status == "active")
-                .first()
-            )
+        user = find_user(db, email)
 
         if not user:
             print(f"Error: no se encontró usuario{f' con email {email!r}' if email else ' admin activo'}.\n")
             print("Usa --list para ver los usuarios disponibles.")
             sys.exit(1)
 
-        payload = {
-            "sub": str(user.id),
-            "email": user.email,
-            "name": user.name,
-            "role": user.role,
-            "status": user.status,
-            "exp": datetime.now(timezone.utc) + timedelta(hours=hours),
-        }
-        token = jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        token = issue_token(user, hours)
 
         print(f"Usuario:  {user.name} <{user.email}>")
         print(f"Rol:      {user.role}")
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Load test — replays realistic traffic and reports latency percentiles.
+
+Virtual users log in with tokens issued like scripts/generate_token.py (one
+per role: loader, approver, admin) and run a weighted mix of searches,
+document reads, creates, approvals and batch submissions with random think
+times. Submitted jobs are polled until they finish; with --webhook-url
+pointing at scripts/mock_webhook.py the notification arrival of each job is
+collected too. Reports p50/p95/p99 per endpoint, job completion times and
+notification delivery times. Everything runs locally (docker-compose stack
+plus the mock receiver, see docker-compose.loadtest.yml):
+    docker compose -f docker-compose.yml -f docker-compose.loadtest.yml up -d
+    docker compose exec backend python scripts/loadtest.py --scenario mixed --users 20 --duration 120 \\
+        --webhook-url http://mock-webhook:9000
+    docker compose exec backend python scripts/loadtest.py --list
+    docker compose exec backend python scripts/loadtest.py --scenario-file scenario.json --output report.json
+
+A scenario file holds one scenario as JSON with the fields of Scenario, e.g.
+{"description": "...", "weights": {"search": 80, "create": 20}, "users": 50}.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter, defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+sys.path.insert(0, "/app")
+
+API = "/api/v1"
+ROLES = ("admin", "loader", "approver")
+DOCUMENT_TYPES = ["invoice", "receipt", "voucher", "credit_note", "debit_note"]
+DOCUMENT_STATUSES = ["draft", "pending", "approved", "rejected"]
+TERMINAL_JOB_STATUSES = {"completed", "failed"}
+
+
+@dataclass
+class Scenario:
+    """Traffic mix and shape of a load test."""
+
+    description: str
+    weights: Dict[str, int]
+    users: int = 10
+    duration_seconds: float = 60.0
+    ramp_up_seconds: float = 10.0
+    think_time_seconds: float = 1.0
+    batch_size: int = 3
+    webhook: Dict[str, float] = field(default_factory=dict)
+
+
+# The worker spends 1-9 s per document, so batches are kept small
+SCENARIOS = {
+    "browse": Scenario(
+        "Read-heavy traffic: searches and document reads",
+        {"search": 70, "get_document": 30},
+        users=20,
+        think_time_seconds=0.5,
+    ),
+    "mixed": Scenario(
+        "Typical day: searches, creates, approvals and batch submissions",
+        {"search": 50, "get_document": 15, "create": 20, "approve": 10, "submit_batch": 5},
+    ),
+    "ingest": Scenario(
+        "Bulk loading: creates and batch submissions",
+        {"create": 60, "submit_batch": 30, "search": 10},
+        batch_size=5,
+    ),
+    "degraded_webhooks": Scenario(
+        "Typical day with slow, unreliable notification receivers",
+        {"search": 50, "get_document": 15, "create": 20, "approve": 10, "submit_batch": 5},
+        webhook={"latency_ms": 2000, "jitter_ms": 500, "failure_rate": 0.2},
+    ),
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summary(values: List[float]) -> Dict[str, float]:
+    """Count and p50/p95/p99/max of durations in seconds, reported in milliseconds."""
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 1),
+        "p95_ms": round(percentile(values, 95) * 1000, 1),
+        "p99_ms": round(percentile(values, 99) * 1000, 1),
+        "max_ms": round(max(values, default=0.0) * 1000, 1),
+    }
+
+
+def issue_tokens(hours: int) -> Dict[str, str]:
+    """Issue one token per role from the users in the database (admin fills in missing roles)."""
+    from generate_token import find_user, issue_token
+
+    from app.infrastructure.database.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        tokens = {role: issue_token(user, hours) for role in ROLES if (user := find_user(db, role=role))}
+    finally:
+        db.close()
+    if "admin" not in tokens:
+        raise SystemExit("No active admin user; run the migrations or pass --token")
+    return {role: tokens.get(role, tokens["admin"]) for role in ROLES}
+
+
+class LoadTest:
+    """Runs one scenario and collects the measurements."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        scenario: Scenario,
+        tokens: Dict[str, str],
+        webhook_url: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.client = client
+        self.scenario = scenario
+        self.tokens = tokens
+        self.webhook_url = webhook_url.rstrip("/") if webhook_url else None
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.drafts: Deque[int] = deque(maxlen=10_000)
+        self.pending: Deque[int] = deque(maxlen=10_000)
+        self.known_ids: Deque[int] = deque(maxlen=10_000)
+        self.jobs: Dict[str, Tuple[float, float]] = {}
+        self.completions: Dict[str, Tuple[str, float]] = {}
+        self.elapsed = 0.0
+        # Traffic mix and think times only; a seed makes the request sequence reproducible
+        self.random = random.Random(seed)  # noqa: S311
+
+    # ── HTTP ──────────────────────────────────────────────────────────────────
+
+    async def request(
+        self, endpoint: str, method: str, url: str, role: str = "admin", **kwargs: Any
+    ) -> Optional[httpx.Response]:
+        """Send a request and record its latency and status under ``endpoint``."""
+        headers = {"Authorization": f"Bearer {self.tokens[role]}"}
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError as e:
+            self.latencies[endpoint].append(time.perf_counter() - started)
+            self.statuses[endpoint][type(e).__name__] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        self.statuses[endpoint][str(response.status_code)] += 1
+        return response
+
+    # ── Actions ───────────────────────────────────────────────────────────────
+
+    async def search(self, status: Optional[str] = None) -> None:
+        params: Dict[str, Any] = {"page": self.random.randint(1, 5), "page_size": 50}
+        status = status or self.random.choice([None, *DOCUMENT_STATUSES])
+        if status:
+            params["status"] = status
+        if self.random.random() < 0.3:
+            params["type"] = self.random.choice(DOCUMENT_TYPES)
+        response = await self.request("GET /documents", "GET", f"{API}/documents", params=params)
+        if response is not None and response.status_code == 200:
+            for item in response.json()["items"]:
+                self.known_ids.append(item["id"])
+                if item["status"] == "pending":
+                    self.pending.append(item["id"])
+
+    async def get_document(self) -> None:
+        if not self.known_ids:
+            await self.search()
+            return
+        document_id = self.random.choice(self.known_ids)
+        await self.request("GET /documents/{id}", "GET", f"{API}/documents/{document_id}")
+
+    async def create(self) -> None:
+        client = self.random.randint(1, 5_000)
+        metadata = {"client": f"Load Client {client}", "reference": f"LT-{self.random.getrandbits(32):08x}"}
+        if self.random.random() < 0.95:
+            metadata["email"] = f"billing{client}@loadtest.local"
+        amount = (
+            self.random.uniform(10_001_000, 20_000_000)
+            if self.random.random() < 0.1
+            else self.random.uniform(1_000, 9_000_000)
+        )
+        body = {"type": self.random.choice(DOCUMENT_TYPES), "amount": f"{amount:.2f}", "metadata": metadata}
+        response = await self.request("POST /documents", "POST", f"{API}/documents", role="loader", json=body)
+        if response is not None and response.status_code == 201:
+            document_id = response.json()["id"]
+            self.drafts.append(document_id)
+            self.known_ids.append(document_id)
+
+    async def approve(self) -> None:
+        if not self.pending:
+            await self.search(status="pending")
+            return
+        document_id = self.pending.popleft()
+        body = (
+            {"new_status": "approved"}
+            if self.random.random() < 0.9
+            else {"new_status": "rejected", "comment": "load test"}
+        )
+        await self.request(
+            "PATCH /documents/{id}/status", "PATCH", f"{API}/documents/{document_id}/status", role="approver", json=body
+        )
+
+    async def submit_batch(self) -> None:
+        if len(self.drafts) < self.scenario.batch_size:
+            await self.create()
+            return
+        document_ids = [self.drafts.popleft() for _ in range(self.scenario.batch_size)]
+        submitted = (time.monotonic(), time.time())
+        response = await self.request(
+            "POST /documents/batch/process",
+            "POST",
+            f"{API}/documents/batch/process",
+            role="loader",
+            json={"document_ids": document_ids},
+        )
+        if response is not None and response.status_code == 202:
+            self.jobs[response.json()["job_id"]] = submitted
+
+    # ── Run ───────────────────────────────────────────────────────────────────
+
+    async def user(self, index: int, deadline: float) -> None:
+        """One virtual user: weighted actions separated by exponential think times."""
+        await asyncio.sleep(self.scenario.ramp_up_seconds * index / max(self.scenario.users, 1))
+        actions = list(self.scenario.weights)
+        weights = [self.scenario.weights[action] for action in actions]
+        while time.monotonic() < deadline:
+            await getattr(self, self.random.choices(actions, weights)[0])()
+            if self.scenario.think_time_seconds > 0:
+                await asyncio.sleep(self.random.expovariate(1 / self.scenario.think_time_seconds))
+
+    async def track_jobs(self, stop: asyncio.Event, interval: float = 1.0) -> None:
+        """Poll submitted jobs until they reach a terminal status."""
+        while not stop.is_set():
+            for job_id, (submitted, _) in list(self.jobs.items()):
+                if job_id in self.completions:
+                    continue
+                response = await self.request("GET /jobs/{id}", "GET", f"{API}/jobs/{job_id}")
+                if response is not None and response.status_code == 200:
+                    status = response.json()["status"]
+                    if status in TERMINAL_JOB_STATUSES:
+                        self.completions[job_id] = (status, time.monotonic() - submitted)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+
+    async def webhook(self, path: str, body: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Call the mock receiver's control API."""
+        method = "GET" if body is None else "POST"
+        response = await self.client.request(method, f"{self.webhook_url}/{path}", json=body)
+        response.raise_for_status()
+        return response.json()
+
+    async def run(self, drain_seconds: float) -> None:
+        """Run the scenario, then wait up to ``drain_seconds`` for outstanding jobs."""
+        if self.webhook_url:
+            await self.webhook("reset", {})
+            if self.scenario.webhook:
+                await self.webhook("config", self.scenario.webhook)
+
+        started = time.monotonic()
+        deadline = started + self.scenario.duration_seconds
+        stop = asyncio.Event()
+        tracker = asyncio.create_task(self.track_jobs(stop))
+        await asyncio.gather(*(self.user(index, deadline) for index in range(self.scenario.users)))
+        self.elapsed = time.monotonic() - started
+
+        drain_deadline = time.monotonic() + drain_seconds
+        while len(self.completions) < len(self.jobs) and time.monotonic() < drain_deadline:
+            await asyncio.sleep(1)
+        stop.set()
+        await tracker
+
+    async def report(self) -> Dict[str, Any]:
+        """Build the report: per-endpoint latency, job completion and notification delivery."""
+        endpoints = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            statuses = self.statuses[endpoint]
+            errors = sum(count for status, count in statuses.items() if not status.startswith(("2", "3")))
+            endpoints[endpoint] = {
+                **summary(values),
+                "rps": round(len(values) / self.elapsed, 2) if self.elapsed else 0.0,
+                "errors": errors,
+                "statuses": dict(statuses),
+            }
+
+        completion_times = [seconds for _, seconds in self.completions.values()]
+        jobs = {
+            "submitted": len(self.jobs),
+            "completed": sum(status == "completed" for status, _ in self.completions.values()),
+            "failed": sum(status == "failed" for status, _ in self.completions.values()),
+            "unfinished": len(self.jobs) - len(self.completions),
+            "completion": summary(completion_times),
+        }
+
+        report: Dict[str, Any] = {
+            "scenario": asdict(self.scenario),
+            "duration_seconds": round(self.elapsed, 1),
+            "endpoints": endpoints,
+            "jobs": jobs,
+        }
+        if self.webhook_url:
+            stats = await self.webhook("stats")
+            delivery = [
+                stats["jobs"][job_id] - submitted_wall
+                for job_id, (_, submitted_wall) in self.jobs.items()
+                if job_id in stats["jobs"]
+            ]
+            report["notifications"] = {
+                "requests": stats["requests"],
+                "failed_requests": stats["failed"],
+                "events": stats["events"],
+                "jobs_notified": len(delivery),
+                "delivery": summary(delivery),
+            }
+        return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print the report as tables."""
+    print(f"\n{report['scenario']['description']} — {report['duration_seconds']}s\n")
+    header = (
+        f"{'endpoint':<32}{'count':>8}{'rps':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for endpoint, row in report["endpoints"].items():
+        print(
+            f"{endpoint:<32}{row['count']:>8}{row['rps']:>8.1f}{row['errors']:>8}"
+            f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}"
+        )
+
+    jobs = report["jobs"]
+    completion = jobs["completion"]
+    print(
+        f"\nJobs: {jobs['submitted']} submitted, {jobs['completed']} completed, {jobs['failed']} failed, "
+        f"{jobs['unfinished']} unfinished"
+    )
+    print(
+        f"Job completion (submit → terminal status): p50 {completion['p50_ms'] / 1000:.1f}s, "
+        f"p95 {completion['p95_ms'] / 1000:.1f}s, p99 {completion['p99_ms'] / 1000:.1f}s"
+    )
+
+    notifications = report.get("notifications")
+    if notifications:
+        delivery = notifications["delivery"]
+        print(
+            f"Notifications: {notifications['jobs_notified']} jobs notified, {notifications['requests']} webhook "
+            f"requests ({notifications['failed_requests']} failed by the mock)"
+        )
+        print(
+            f"Notification delivery (submit → webhook): p50 {delivery['p50_ms'] / 1000:.1f}s, "
+            f"p95 {delivery['p95_ms'] / 1000:.1f}s, p99 {delivery['p99_ms'] / 1000:.1f}s"
+        )
+
+
+def load_scenario(args: argparse.Namespace) -> Scenario:
+    """Pick the named or file scenario and apply command-line overrides."""
+    if args.scenario_file:
+        with open(args.scenario_file) as file:
+            scenario = Scenario(**json.load(file))
+    else:
+        scenario = Scenario(**asdict(SCENARIOS[args.scenario]))
+    for option in ("users", "duration_seconds", "ramp_up_seconds", "think_time_seconds", "batch_size"):
+        value = getattr(args, option)
+        if value is not None:
+            setattr(scenario, option, value)
+    unknown = set(scenario.weights) - {"search", "get_document", "create", "approve", "submit_batch"}
+    if unknown:
+        raise SystemExit(f"Unknown actions in scenario: {sorted(unknown)}")
+    return scenario
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    scenario = load_scenario(args)
+    tokens = dict.fromkeys(ROLES, args.token) if args.token else issue_tokens(hours=2)
+    limits = httpx.Limits(max_connections=max(scenario.users, 10), max_keepalive_connections=max(scenario.users, 10))
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        load_test = LoadTest(client, scenario, tokens, webhook_url=args.webhook_url, seed=args.seed)
+        await load_test.run(drain_seconds=args.drain_seconds)
+        report = await load_test.report()
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"\nReport written to {args.output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay realistic traffic and report latency percentiles")
+    parser.add_argument("--scenario", default="mixed", choices=sorted(SCENARIOS), help="Built-in scenario")
+    parser.add_argument("--scenario-file", help="JSON scenario (overrides --scenario)")
+    parser.add_argument("--list", action="store_true", help="List the built-in scenarios")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="API base URL")
+    parser.add_argument("--token", help="JWT used for every role (default: issued from the database per role)")
+    parser.add_argument("--webhook-url", help="Mock webhook receiver base URL (e.g. http://mock-webhook:9000)")
+    parser.add_argument("--users", type=int, help="Virtual users")
+    parser.add_argument("--duration", dest="duration_seconds", type=float, help="Seconds of traffic")
+    parser.add_argument("--ramp-up", dest="ramp_up_seconds", type=float, help="Seconds to start every user")
+    parser.add_argument("--think-time", dest="think_time_seconds", type=float, help="Mean pause between actions")
+    parser.add_argument("--batch-size", type=int, help="Documents per batch submission")
+    parser.add_argument("--drain-seconds", type=float, default=120.0, help="Max wait for jobs after the traffic")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, help="Random seed for a reproducible traffic mix")
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:<20} {scenario.description} — weights {scenario.weights}")
+        return
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
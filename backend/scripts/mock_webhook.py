@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Mock webhook receiver — local stand-in for the NOTIFICATION_CHANNELS targets.
+
+Accepts the notification POSTs (single events or batched JSON arrays, gzip or
+zstd bodies) after a configurable latency, fails a configurable fraction of
+them with 503 and records when each job's event arrived, so the load test can
+measure end-to-end job completion including notification delivery:
+    docker compose -f docker-compose.yml -f docker-compose.loadtest.yml up -d
+    python scripts/mock_webhook.py --port 9000 --latency-ms 150 --jitter-ms 50 --failure-rate 0.05
+
+Endpoints:
+    POST /<any path>   receive events
+    GET  /stats        counters, settings and receipt time (Unix seconds) per job_id
+    POST /config       change latency_ms, jitter_ms and failure_rate at runtime (JSON body)
+    POST /reset        clear counters and receipts
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import time
+from typing import Any, Dict, List, Union
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for channels with "compression": "zstd"
+    zstandard = None
+
+
+class Receiver:
+    """Receiver state: behaviour settings, counters and job receipts."""
+
+    def __init__(self, latency_ms: float, jitter_ms: float, failure_rate: float) -> None:
+        self.config: Dict[str, float] = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "failure_rate": failure_rate}
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.failed = 0
+        self.events = 0
+        self.jobs: Dict[str, float] = {}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "config": self.config,
+            "requests": self.requests,
+            "failed": self.failed,
+            "events": self.events,
+            "jobs": self.jobs,
+        }
+
+
+def decode_body(body: bytes, encoding: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    """Decompress (gzip/zstd) and parse a notification body."""
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd body received but the zstandard package is not installed")
+        body = zstandard.ZstdDecompressor().decompress(body)
+    return json.loads(body)
+
+
+def build_app(receiver: Receiver) -> Starlette:
+    async def receive(request: Request) -> Response:
+        receiver.requests += 1
+        config = receiver.config
+        delay = max(0.0, random.gauss(config["latency_ms"], config["jitter_ms"])) / 1000
+        await asyncio.sleep(delay)
+
+        if random.random() < config["failure_rate"]:  # noqa: S311
+            receiver.failed += 1
+            return JSONResponse({"error": "simulated failure"}, status_code=503)
+
+        try:
+            payload = decode_body(await request.body(), request.headers.get("content-encoding", ""))
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+
+        received_at = time.time()
+        for event in payload if isinstance(payload, list) else [payload]:
+            receiver.events += 1
+            if isinstance(event, dict) and event.get("job_id"):
+                receiver.jobs.setdefault(str(event["job_id"]), received_at)
+        return JSONResponse({"received": True})
+
+    async def stats(request: Request) -> Response:
+        return JSONResponse(receiver.stats())
+
+    async def configure(request: Request) -> Response:
+        changes = await request.json()
+        unknown = set(changes) - set(receiver.config)
+        if unknown:
+            return JSONResponse({"error": f"unknown settings: {sorted(unknown)}"}, status_code=400)
+        receiver.config.update({key: float(value) for key, value in changes.items()})
+        return JSONResponse(receiver.config)
+
+    async def reset(request: Request) -> Response:
+        receiver.reset()
+        return JSONResponse({"reset": True})
+
+    return Starlette(
+        routes=[
+            Route("/stats", stats, methods=["GET"]),
+            Route("/config", configure, methods=["POST"]),
+            Route("/reset", reset, methods=["POST"]),
+            Route("/{path:path}", receive, methods=["POST"]),
+        ]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock webhook receiver for load tests")
+    parser.add_argument("--host", default="0.0.0.0", help="Bind address (default: 0.0.0.0)")  # noqa: S104
+    parser.add_argument("--port", type=int, default=9000, help="Port (default: 9000)")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="Mean response latency (default: 100)")
+    parser.add_argument("--jitter-ms", type=float, default=25.0, help="Latency standard deviation (default: 25)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction answered with 503 (default: 0)")
+    args = parser.parse_args()
+
+    receiver = Receiver(args.latency_ms, args.jitter_ms, args.failure_rate)
+    uvicorn.run(build_app(receiver), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
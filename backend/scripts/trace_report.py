@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Trace report — where the time of a batch job went.
+
+Reads the spans written with TRACING_EXPORTER=file and prints, for one job
+(or the most recent one), the span tree from the API request through the
+Celery queue wait, the per-document handlers and the notifications, plus the
+time attributed to each stage:
+    docker compose exec backend python scripts/trace_report.py
+    docker compose exec backend python scripts/trace_report.py --job-id <uuid> --file traces.jsonl
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """Read every span from a JSON lines file."""
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def find_trace_id(spans: List[Dict[str, Any]], job_id: Optional[str]) -> Optional[str]:
+    """Return the trace of the given job, or of the most recent job."""
+    job_spans = [span for span in spans if span["attributes"].get("job.id")]
+    if job_id:
+        job_spans = [span for span in job_spans if span["attributes"]["job.id"] == job_id]
+    if not job_spans:
+        return None
+    return max(job_spans, key=lambda span: span["startTimeUnixNano"])["traceId"]
+
+
+def stage(name: str) -> str:
+    """Group span names into stages: all API requests, and repository calls per repository."""
+    if name.startswith(("GET ", "POST ", "PUT ", "PATCH ", "DELETE ")):
+        return "api request"
+    return name.split(".")[0] if "Repository." in name else name
+
+
+def print_tree(children: Dict[str, List[Dict[str, Any]]], span: Dict[str, Any], trace_start: int, depth: int) -> None:
+    """Print a span and its children, ordered by start time."""
+    start_ms = (span["startTimeUnixNano"] - trace_start) / 1e6
+    duration_ms = (span["endTimeUnixNano"] - span["startTimeUnixNano"]) / 1e6
+    status = "" if span["status"]["code"] == "ok" else f"  [{span['status']['code']}]"
+    print(f"{start_ms:>10.1f}{duration_ms:>10.1f}  {'  ' * depth}{span['name']}{status}")
+    for child in sorted(children[span["spanId"]], key=lambda s: s["startTimeUnixNano"]):
+        print_tree(children, child, trace_start, depth + 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Attribute a batch job's latency to its stages")
+    parser.add_argument("--file", default="traces.jsonl", help="Span file (default: traces.jsonl)")
+    parser.add_argument("--job-id", help="Job UUID (default: most recent job in the file)")
+    args = parser.parse_args()
+
+    spans = load_spans(args.file)
+    trace_id = find_trace_id(spans, args.job_id)
+    if trace_id is None:
+        raise SystemExit("No job spans found; run with TRACING_EXPORTER=file and submit a batch")
+
+    trace = [span for span in spans if span["traceId"] == trace_id]
+    span_ids = {span["spanId"] for span in trace}
+    children: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    roots = []
+    for span in trace:
+        if span["parentSpanId"] in span_ids:
+            children[span["parentSpanId"]].append(span)
+        else:
+            roots.append(span)
+
+    trace_start = min(span["startTimeUnixNano"] for span in trace)
+    trace_end = max(span["endTimeUnixNano"] for span in trace)
+    print(f"trace {trace_id}: {len(trace)} spans, {(trace_end - trace_start) / 1e6:.1f} ms end to end\n")
+    print(f"{'start ms':>10}{'dur ms':>10}  span")
+    for root in sorted(roots, key=lambda s: s["startTimeUnixNano"]):
+        print_tree(children, root, trace_start, 0)
+
+    # Self time per stage: span duration minus the time covered by its children
+    totals: Dict[str, float] = defaultdict(float)
+    for span in trace:
+        duration = span["endTimeUnixNano"] - span["startTimeUnixNano"]
+        child_time = sum(c["endTimeUnixNano"] - c["startTimeUnixNano"] for c in children[span["spanId"]])
+        totals[stage(span["name"])] += max(duration - child_time, 0) / 1e6
+
+    print(f"\n{'stage':<40}{'self ms':>12}")
+    for name, total in sorted(totals.items(), key=lambda item: item[1], reverse=True):
+        print(f"{name:<40}{total:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Benchmark suite fixtures.
+
+The benchmarks run against a dedicated local PostgreSQL database
+(``duppla_bench`` on the test server by default) that is created, migrated
+and seeded on first use and reused while its row counts match the requested
+size. They are not collected by a plain ``pytest`` run; enable them with::
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks --no-cov
+    RUN_BENCHMARKS=1 BENCHMARK_DOCUMENTS=1000000 pytest tests/benchmarks --no-cov -k search
+
+Environment:
+    BENCHMARK_DATABASE_URL: Benchmark database (default: DATABASE_URL with database duppla_bench)
+    BENCHMARK_DOCUMENTS: Seeded documents, 100000 to 1000000 (default 100000)
+    BENCHMARK_ROUNDS: Timed rounds per benchmark (default 10)
+    BENCHMARK_HISTORY: JSON lines history file (default tests/benchmarks/results/history.jsonl)
+    BENCHMARK_BASELINE: Baseline file (default tests/benchmarks/baseline.json)
+    BENCHMARK_THRESHOLD: Allowed median slowdown over the baseline (default 0.2 = 20%)
+    BENCHMARK_UPDATE_BASELINE: "1" stores this run's medians as the new baseline
+
+Every test runs in a transaction that is rolled back, so the seeded data is
+the same for each benchmark and each run.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+
+from .harness import (
+    BENCHMARKS_DIR,
+    BenchmarkResult,
+    append_history,
+    load_baseline,
+    measure,
+    regression,
+    summarize,
+    write_baseline,
+)
+from .seed import Dataset, row_counts, seed
+
+if os.environ.get("RUN_BENCHMARKS") != "1":
+    collect_ignore_glob = ["test_*.py"]
+
+BACKEND_DIR = BENCHMARKS_DIR.parent.parent
+
+BENCHMARK_DATABASE_URL = os.environ.get("BENCHMARK_DATABASE_URL") or make_url(settings.DATABASE_URL).set(
+    database="duppla_bench"
+).render_as_string(hide_password=False)
+BENCHMARK_DOCUMENTS = int(os.environ.get("BENCHMARK_DOCUMENTS", "100000"))
+BENCHMARK_ROUNDS = int(os.environ.get("BENCHMARK_ROUNDS", "10"))
+BENCHMARK_HISTORY = Path(os.environ.get("BENCHMARK_HISTORY", BENCHMARKS_DIR / "results" / "history.jsonl"))
+BENCHMARK_BASELINE = Path(os.environ.get("BENCHMARK_BASELINE", BENCHMARKS_DIR / "baseline.json"))
+BENCHMARK_THRESHOLD = float(os.environ.get("BENCHMARK_THRESHOLD", "0.2"))
+
+
+def _create_database(url: str) -> None:
+    """Create the benchmark database if it does not exist; skip the suite if the server is down."""
+    target = make_url(url)
+    server = create_engine(target.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with server.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": target.database}
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{target.database}"'))
+    except Exception as e:
+        pytest.skip(f"PostgreSQL not reachable — skipping benchmarks ({e})")
+    finally:
+        server.dispose()
+
+
+@pytest.fixture(scope="session")
+def dataset() -> Dataset:
+    """Sizes of the seeded tables."""
+    return Dataset.for_documents(BENCHMARK_DOCUMENTS)
+
+
+@pytest.fixture(scope="session")
+def bench_engine(dataset: Dataset) -> Engine:
+    """Migrated and seeded benchmark database (seeding is skipped when the counts already match)."""
+    _create_database(BENCHMARK_DATABASE_URL)
+
+    result = subprocess.run(
+        ["alembic", "upgrade", "head"],  # noqa: S607
+        cwd=str(BACKEND_DIR),
+        capture_output=True,
+        text=True,
+        env={**os.environ, "DATABASE_URL": BENCHMARK_DATABASE_URL},
+    )
+    if result.returncode != 0:
+        pytest.fail(f"Alembic migration failed:\n{result.stderr}")
+
+    eng = create_engine(BENCHMARK_DATABASE_URL, pool_pre_ping=True)
+    with eng.connect() as conn:
+        if row_counts(conn) != dataset:
+            seed(conn, dataset)
+            conn.commit()
+    with eng.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+    yield eng
+
+    eng.dispose()
+
+
+@pytest.fixture()
+def bench_connection(bench_engine: Engine) -> Connection:
+    """Connection inside a transaction that is rolled back after the test."""
+    connection = bench_engine.connect()
+    transaction = connection.begin()
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture()
+def session_factory(bench_connection: Connection) -> Callable[[], Session]:
+    """Session factory whose sessions share the test's rolled-back transaction.
+
+    ``commit()`` in services and tasks releases a SAVEPOINT, so writes are
+    visible to later sessions of the same test but never persisted.
+    """
+    return sessionmaker(bind=bench_connection, autoflush=False, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture()
+def db(session_factory: Callable[[], Session]) -> Session:
+    """Session on the rolled-back benchmark transaction."""
+    session = session_factory()
+    yield session
+    session.close()
+
+
+class BenchmarkRun:
+    """Results of the current pytest session, written to the history file at the end."""
+
+    def __init__(self) -> None:
+        """Initialize run."""
+        self.results: List[BenchmarkResult] = []
+        self.baseline = load_baseline(BENCHMARK_BASELINE)
+
+
+@pytest.fixture(scope="session")
+def benchmark_run(bench_engine: Engine, dataset: Dataset) -> BenchmarkRun:
+    """Collect every result and append the run to the history (and baseline, if asked) at the end."""
+    run = BenchmarkRun()
+
+    yield run
+
+    if not run.results:
+        return
+    with bench_engine.connect() as conn:
+        server_version = conn.execute(text("SHOW server_version")).scalar()
+    append_history(
+        BENCHMARK_HISTORY,
+        run.results,
+        {"postgres": server_version, "dataset": dataset.__dict__, "rounds": BENCHMARK_ROUNDS},
+    )
+    if os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1":
+        write_baseline(BENCHMARK_BASELINE, run.results, run.baseline)
+
+
+@pytest.fixture()
+def benchmark(benchmark_run: BenchmarkRun, request: pytest.FixtureRequest) -> Callable[..., BenchmarkResult]:
+    """Time a callable, record the result and fail the test on a baseline regression.
+
+    Usage::
+
+        result = benchmark(lambda: repo.search({"status": "draft"}))
+        result = benchmark(run_batch, rounds=3, after=reset, extra=lambda r: {"docs_per_second": ...})
+
+    The result is named after the test node ID (module, class, test and parameters).
+    """
+
+    def run(
+        func: Callable[[], Any],
+        rounds: Optional[int] = None,
+        warmup: int = 1,
+        after: Optional[Callable[[], Any]] = None,
+        extra: Optional[Callable[[BenchmarkResult], Dict[str, float]]] = None,
+    ) -> BenchmarkResult:
+        timings = measure(func, rounds or BENCHMARK_ROUNDS, warmup=warmup, after=after)
+        result = summarize(request.node.nodeid.split("benchmarks/", 1)[-1], timings)
+        if extra is not None:
+            result.extra = extra(result)
+        benchmark_run.results.append(result)
+
+        failure = regression(result, benchmark_run.baseline, BENCHMARK_THRESHOLD)
+        if failure:
+            pytest.fail(failure)
+        return result
+
+    return run
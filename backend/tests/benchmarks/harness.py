@@ -0,0 +1,149 @@
+"""Timing, history and baseline comparison for the benchmark suite.
+
+Every benchmark run appends one JSON line to the history file (commit, date,
+dataset size, per-benchmark statistics), so results can be compared across
+commits. A baseline file holds the reference median of each benchmark; a run
+whose median exceeds it by more than the regression threshold fails.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+
+@dataclass
+class BenchmarkResult:
+    """Statistics of one benchmark, in milliseconds."""
+
+    name: str
+    rounds: int
+    min_ms: float
+    median_ms: float
+    p95_ms: float
+    mean_ms: float
+    extra: Dict[str, float] = field(default_factory=dict)
+
+
+def measure(
+    func: Callable[[], Any],
+    rounds: int,
+    warmup: int = 1,
+    after: Optional[Callable[[], Any]] = None,
+) -> List[float]:
+    """Call ``func`` ``warmup`` times untimed, then ``rounds`` times timed.
+
+    Args:
+        func: Code under test
+        rounds: Timed calls
+        warmup: Untimed calls first (caches, connection, query plans)
+        after: Untimed cleanup after every call (e.g. undo the writes of ``func``)
+
+    Returns:
+        Wall-clock duration of each timed call, in seconds
+    """
+    timings = []
+    for index in range(warmup + rounds):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        if index >= warmup:
+            timings.append(elapsed)
+        if after is not None:
+            after()
+    return timings
+
+
+def summarize(name: str, timings: List[float], extra: Optional[Dict[str, float]] = None) -> BenchmarkResult:
+    """Reduce raw timings (seconds) to a BenchmarkResult."""
+    ordered = sorted(timings)
+    p95_index = min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))
+    return BenchmarkResult(
+        name=name,
+        rounds=len(ordered),
+        min_ms=round(ordered[0] * 1000, 3),
+        median_ms=round(statistics.median(ordered) * 1000, 3),
+        p95_ms=round(ordered[p95_index] * 1000, 3),
+        mean_ms=round(statistics.fmean(ordered) * 1000, 3),
+        extra=extra or {},
+    )
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the baseline file (``{name: {"median_ms": ..., "threshold": ...}}``), empty if missing."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def write_baseline(path: Path, results: List[BenchmarkResult], previous: Dict[str, Dict[str, Any]]) -> None:
+    """Store the medians of ``results`` as the new baseline, keeping per-benchmark thresholds."""
+    baseline = dict(previous)
+    for result in results:
+        entry = {"median_ms": result.median_ms}
+        if "threshold" in previous.get(result.name, {}):
+            entry["threshold"] = previous[result.name]["threshold"]
+        baseline[result.name] = entry
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def regression(result: BenchmarkResult, baseline: Dict[str, Dict[str, Any]], threshold: float) -> Optional[str]:
+    """Compare a result with its baseline.
+
+    Args:
+        result: Measured result
+        baseline: Loaded baseline file
+        threshold: Allowed slowdown as a fraction (0.2 = 20%), unless the entry sets its own
+
+    Returns:
+        Failure message if the median regressed past the threshold, else None
+    """
+    entry = baseline.get(result.name)
+    if not entry:
+        return None
+    allowed = entry["median_ms"] * (1 + entry.get("threshold", threshold))
+    if result.median_ms <= allowed:
+        return None
+    change = (result.median_ms / entry["median_ms"] - 1) * 100
+    return (
+        f"{result.name}: median {result.median_ms:.2f} ms is {change:.0f}% slower than the baseline "
+        f"{entry['median_ms']:.2f} ms (allowed {allowed:.2f} ms)"
+    )
+
+
+def git_commit() -> str:
+    """Return the current commit hash, or "unknown" outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def append_history(path: Path, results: List[BenchmarkResult], environment: Dict[str, Any]) -> None:
+    """Append one run (environment plus every result) as a JSON line."""
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        **environment,
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as file:
+        file.write(json.dumps(run, sort_keys=True) + "\n")
@@ -0,0 +1,157 @@
+"""Deterministic dataset for the benchmark suite.
+
+Rows are generated from a fixed random seed, so every run (and every machine)
+benchmarks the same data distribution: document types and statuses in
+production-like proportions, amounts on both sides of the auto-processing
+limit, two years of creation dates, jobs of 50 documents and two audit rows
+per document.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Connection
+
+from app.infrastructure.database.models.audit_log import AuditLogModel
+from app.infrastructure.database.models.document import DocumentModel
+from app.infrastructure.database.models.job import JobModel
+
+SEED = 20260101
+CHUNK_SIZE = 10_000
+DOCUMENTS_PER_JOB = 50
+AUDIT_ROWS_PER_DOCUMENT = 2
+
+DOCUMENT_TYPES = ["invoice", "receipt", "voucher", "credit_note", "debit_note"]
+DOCUMENT_STATUSES = ["draft", "pending", "approved", "rejected"]
+STATUS_WEIGHTS = [40, 30, 20, 10]
+JOB_STATUSES = ["completed", "completed", "completed", "failed", "pending"]
+EPOCH = datetime(2026, 1, 1)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Row counts of the seeded tables (document IDs are 1..documents)."""
+
+    documents: int
+    jobs: int
+    audit_logs: int
+
+    @classmethod
+    def for_documents(cls, documents: int) -> "Dataset":
+        """Dataset sized from the number of documents."""
+        return cls(
+            documents=documents,
+            jobs=max(documents // DOCUMENTS_PER_JOB, 1),
+            audit_logs=documents * AUDIT_ROWS_PER_DOCUMENT,
+        )
+
+
+def _chunks(rows: Iterator[Dict[str, Any]], size: int = CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _created_at(rng: random.Random) -> datetime:
+    return EPOCH - timedelta(seconds=rng.randrange(730 * 24 * 3600))
+
+
+def document_rows(count: int, rng: random.Random) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` document rows."""
+    for i in range(1, count + 1):
+        doc_type = rng.choice(DOCUMENT_TYPES)
+        created_at = _created_at(rng)
+        client = rng.randrange(5_000)
+        yield {
+            "type": doc_type,
+            "amount": Decimal(rng.randrange(100_000, 2_000_000_000)) / 100,
+            "status": rng.choices(DOCUMENT_STATUSES, STATUS_WEIGHTS)[0],
+            "created_at": created_at,
+            "updated_at": created_at,
+            "metadata": {
+                "client": f"Client {client}",
+                "email": f"billing{client}@example.test",
+                "reference": f"{doc_type[:3].upper()}-{i:07d}",
+            },
+            "created_by": f"loader{rng.randrange(50)}@example.test",
+        }
+
+
+def job_rows(count: int, documents: int, rng: random.Random) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` job rows over documents 1..documents."""
+    for _ in range(count):
+        status = rng.choice(JOB_STATUSES)
+        created_at = _created_at(rng)
+        size = min(DOCUMENTS_PER_JOB, documents)
+        finished = status != "pending"
+        yield {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "document_ids": rng.sample(range(1, documents + 1), size),
+            "status": status,
+            "created_at": created_at,
+            "completed_at": created_at + timedelta(seconds=rng.randrange(5, 300)) if finished else None,
+            "error_message": "database unavailable" if status == "failed" else None,
+            "result": {"total": size, "processed": size, "failed": 0} if status == "completed" else None,
+        }
+
+
+def audit_rows(count: int, documents: int, rng: random.Random) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` audit_logs rows (creations and state changes of documents)."""
+    for i in range(count):
+        document_id = i % documents + 1
+        if i < documents:
+            action, old_value, new_value = "created", None, "seeded"
+        else:
+            action = "state_change"
+            old_value, new_value = rng.sample(DOCUMENT_STATUSES, 2)
+        yield {
+            "table_name": "documents",
+            "record_id": str(document_id),
+            "action": action,
+            "old_value": old_value,
+            "new_value": new_value,
+            "timestamp": _created_at(rng),
+            "user_id": f"loader{rng.randrange(50)}@example.test",
+        }
+
+
+def row_counts(conn: Connection) -> Dataset:
+    """Return the current row counts of the seeded tables."""
+    return Dataset(
+        documents=conn.execute(text("SELECT count(*) FROM finance.documents")).scalar_one(),
+        jobs=conn.execute(text("SELECT count(*) FROM finance.jobs")).scalar_one(),
+        audit_logs=conn.execute(text("SELECT count(*) FROM finance.audit_logs")).scalar_one(),
+    )
+
+
+def seed(conn: Connection, dataset: Dataset) -> None:
+    """Replace the benchmark tables' contents with ``dataset`` and refresh planner statistics.
+
+    Args:
+        conn: Connection to the benchmark database (committed by the caller)
+        dataset: Row counts to generate
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    conn.execute(text("SET LOCAL app.skip_audit = 'application'"))
+    conn.execute(
+        text(
+            "TRUNCATE finance.job_items, finance.jobs, finance.documents, finance.audit_logs, finance.outbox "
+            "RESTART IDENTITY CASCADE"
+        )
+    )
+    for chunk in _chunks(document_rows(dataset.documents, rng)):
+        conn.execute(insert(DocumentModel.__table__), chunk)
+    for chunk in _chunks(job_rows(dataset.jobs, dataset.documents, rng)):
+        conn.execute(insert(JobModel.__table__), chunk)
+    for chunk in _chunks(audit_rows(dataset.audit_logs, dataset.documents, rng)):
+        conn.execute(insert(AuditLogModel.__table__), chunk)
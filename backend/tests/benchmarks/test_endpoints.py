@@ -0,0 +1,71 @@
+"""End-to-end endpoint latency through the full ASGI stack (middlewares, auth, serialization)."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.api.dependencies.database import get_database
+from app.api.middleware.jwt_auth import get_current_user
+from app.domain.entities.user import User, UserRole, UserStatus
+from app.main import app
+
+GET_ENDPOINTS = {
+    "search_first_page": "/api/v1/documents?page=1&page_size=50",
+    "search_filtered_deep_page": "/api/v1/documents?type=invoice&status=draft&page=100&page_size=50",
+    "search_sparse_fields": "/api/v1/documents?page=1&page_size=100&fields=id,status,amount",
+    "list_jobs": "/api/v1/jobs?page=1&page_size=50",
+    "list_jobs_summary": "/api/v1/jobs?page=1&page_size=100&view=summary",
+    "list_audit_logs": "/api/v1/admin/logs?limit=100",
+}
+
+
+@pytest.fixture()
+def call(session_factory):
+    """Send a request through the ASGI app with the benchmark database and an admin user."""
+    now = datetime.utcnow()
+    admin = User(
+        id=uuid4(), google_id="bench", email="bench@example.test", name="Bench",
+        picture=None, role=UserRole.ADMIN, status=UserStatus.ACTIVE,
+        created_at=now, updated_at=now,
+    )
+
+    def database():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_database] = database
+    app.dependency_overrides[get_current_user] = lambda: admin
+    loop = asyncio.new_event_loop()
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    def send(method, url, expected_status=200, **kwargs):
+        response = loop.run_until_complete(client.request(method, url, **kwargs))
+        assert response.status_code == expected_status, response.text
+        return response
+
+    yield send
+
+    loop.run_until_complete(client.aclose())
+    loop.close()
+    app.dependency_overrides.clear()
+
+
+class TestEndpointLatency:
+    """Latency of the main read endpoints and batch submission."""
+
+    @pytest.mark.parametrize("url", GET_ENDPOINTS.values(), ids=GET_ENDPOINTS.keys())
+    def test_get(self, call, benchmark, url):
+        benchmark(lambda: call("GET", url))
+
+    def test_submit_batch(self, call, benchmark):
+        body = {"document_ids": list(range(1, 1_001))}
+
+        with patch("app.application.services.process_batch.process_documents_batch"):
+            benchmark(lambda: call("POST", "/api/v1/documents/batch/process", expected_status=202, json=body))
@@ -0,0 +1,57 @@
+"""Benchmarks for the repository queries behind search and the audit log."""
+
+from datetime import timedelta
+
+import pytest
+
+from app.infrastructure.repositories.audit_repository import AuditRepository
+from app.infrastructure.repositories.document_repository import DocumentRepository
+
+from .seed import EPOCH
+
+SEARCH_FILTERS = {
+    "none": {},
+    "status": {"status": "draft"},
+    "type_status": {"type": "invoice", "status": "pending"},
+    "amount_range": {"amount_min": 1_000_000, "amount_max": 5_000_000},
+    "created_last_90_days": {"created_from": EPOCH - timedelta(days=90), "created_to": EPOCH},
+    "all": {
+        "type": "receipt",
+        "status": "approved",
+        "amount_min": 10_000,
+        "amount_max": 10_000_000,
+        "created_from": EPOCH - timedelta(days=365),
+    },
+}
+PAGE_DEPTHS = [0, 1_000, 10_000]
+
+
+class TestDocumentRepositorySearch:
+    """DocumentRepository.search: count plus one page, across filters and page depths."""
+
+    @pytest.mark.parametrize("skip", PAGE_DEPTHS, ids=lambda skip: f"skip{skip}")
+    @pytest.mark.parametrize("filters", SEARCH_FILTERS.values(), ids=SEARCH_FILTERS.keys())
+    def test_search(self, db, benchmark, filters, skip):
+        repo = DocumentRepository(db)
+
+        benchmark(lambda: repo.search(filters, skip=skip, limit=50))
+
+    @pytest.mark.parametrize("filters", SEARCH_FILTERS.values(), ids=SEARCH_FILTERS.keys())
+    def test_search_fields(self, db, benchmark, filters):
+        repo = DocumentRepository(db)
+
+        benchmark(lambda: repo.search_fields(filters, ["id", "status", "amount", "metadata.client"], limit=50))
+
+
+class TestAuditRepositoryListRecent:
+    """AuditRepository.list_recent across filters and page depths."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [{}, {"action": "state_change"}, {"table_name": "documents"}, {"skip": 10_000}],
+        ids=["latest", "action", "table_name", "skip10000"],
+    )
+    def test_list_recent(self, db, benchmark, filters):
+        repo = AuditRepository(db)
+
+        benchmark(lambda: repo.list_recent(limit=50, **filters))
@@ -0,0 +1,64 @@
+"""Benchmarks for application services and the batch worker."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from app.application.dtos.job_dtos import ProcessBatchRequest
+from app.application.services.process_batch import ProcessBatch
+from app.domain.entities.job import Job
+from app.infrastructure.notifications.tasks import document_tasks
+from app.infrastructure.repositories.job_repository import JobRepository
+
+WORKER_BATCH_SIZE = 1_000
+
+
+class TestProcessBatchExecute:
+    """ProcessBatch.execute: id validation plus job creation (Celery dispatch mocked)."""
+
+    @pytest.mark.parametrize("count", [1_000, 10_000], ids=lambda count: f"{count}ids")
+    def test_execute(self, db, benchmark, dataset, count):
+        if dataset.documents < count:
+            pytest.skip(f"needs {count} documents")
+        request = ProcessBatchRequest(document_ids=list(range(1, count + 1)))
+        service = ProcessBatch(db=db)
+
+        with patch("app.application.services.process_batch.process_documents_batch"):
+            benchmark(lambda: service.execute(request))
+
+
+class TestProcessDocumentsBatch:
+    """process_documents_batch throughput on draft documents (simulated work removed)."""
+
+    def test_throughput(self, db, bench_connection, session_factory, benchmark):
+        document_ids = list(
+            db.execute(
+                text("SELECT id FROM finance.documents WHERE status = 'draft' ORDER BY id LIMIT :n"),
+                {"n": WORKER_BATCH_SIZE},
+            ).scalars()
+        )
+        job = JobRepository(db).create(Job(document_ids=document_ids))
+        savepoints = []
+
+        def run_batch():
+            savepoints.append(bench_connection.begin_nested())
+            result = document_tasks.process_documents_batch(str(job.id), document_ids)
+            assert result["processed"] == len(document_ids)
+
+        def undo_batch():
+            savepoints.pop().rollback()
+
+        # The per-document sleep stands in for external work; the benchmark measures the code path
+        with (
+            patch.object(document_tasks, "WorkerSessionLocal", session_factory),
+            patch.object(document_tasks, "_wake_outbox_relay"),
+            patch.object(time, "sleep"),
+        ):
+            benchmark(
+                run_batch,
+                rounds=5,
+                after=undo_batch,
+                extra=lambda result: {"docs_per_second": round(len(document_ids) / (result.median_ms / 1000), 1)},
+            )
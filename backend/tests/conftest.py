@@ -9,6 +9,8 @@ import os
 os.environ.setdefault("TESTING", "true")
 os.environ.setdefault("POSTGRES_HOST", "localhost")
 os.environ.setdefault("REDIS_HOST", "localhost")
+# Statement budgets fail the test instead of logging a warning (N+1 regressions break CI)
+os.environ.setdefault("DB_STATEMENT_BUDGET_STRICT", "true")
 os.environ.setdefault(
     "DATABASE_URL",
     f"postgresql://{os.environ.get('POSTGRES_USER', 'postgres')}:{os.environ.get('POSTGRES_PASSWORD', 'postgres')}"  # pragma: allowlist secret
@@ -13,6 +13,7 @@ from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.infrastructure.database.instrumentation import instrument_engine, track_queries
 
 BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -42,7 +43,7 @@ def integration_engine():
     if not _db_is_reachable(_DB_URL):
         pytest.skip("PostgreSQL not reachable — skipping integration tests")
 
-    eng = create_engine(_DB_URL, echo=False)
+    eng = instrument_engine(create_engine(_DB_URL, echo=False))
 
     result = subprocess.run(
         ["alembic", "upgrade", "head"],
@@ -84,3 +85,18 @@ def db(integration_engine):
     session.close()
     transaction.rollback()
     connection.close()
+
+
+@pytest.fixture()
+def count_queries(db):
+    """Context manager counting the SQL statements run inside it.
+
+    Usage::
+
+        with count_queries() as stats:
+            service.execute(...)
+        assert stats.statements == 2
+
+    Pins the query count of a code path so an N+1 regression fails the suite.
+    """
+    return track_queries
@@ -0,0 +1,51 @@
+"""Integration tests for BatchGetDocuments service (POST batch-get)."""
+
+from app.application.dtos.document_dtos import BatchGetDocumentsRequest
+from app.application.services.batch_get_documents import BatchGetDocuments
+
+from .conftest import create_draft, fake
+
+
+class TestBatchGetDocuments:
+    """Verify BatchGetDocuments fetches many rows with one query."""
+
+    def test_batch_get_preserves_order_and_reports_missing(self, db):
+        """
+        When: Fetching existing and non-existing IDs in a custom order
+        Then: Found documents follow the request order and the rest are missing
+        """
+        first = create_draft(db)
+        second = create_draft(db)
+        not_found_id = fake.random_int(min=900_000, max=999_999)
+
+        result = BatchGetDocuments(db=db).execute(
+            BatchGetDocumentsRequest(ids=[second.id, not_found_id, first.id])
+        )
+
+        assert [item.id for item in result.items] == [second.id, first.id]
+        assert result.items[0].amount == second.amount
+        assert result.missing == [not_found_id]
+
+    def test_batch_get_sparse_fields(self, db):
+        """
+        When: Fetching with fields=type
+        Then: Items should only carry id and type
+        """
+        created = create_draft(db)
+
+        result = BatchGetDocuments(db=db).execute(BatchGetDocumentsRequest(ids=[created.id], fields="type"))
+
+        assert result.items[0].model_dump(exclude_unset=True) == {"id": created.id, "type": created.type}
+
+    def test_batch_get_single_query(self, db, count_queries):
+        """
+        When: Fetching 5 documents by ID
+        Then: Should run exactly one statement
+        """
+        ids = [create_draft(db).id for _ in range(5)]
+
+        with count_queries() as stats:
+            result = BatchGetDocuments(db=db).execute(BatchGetDocumentsRequest(ids=ids))
+
+        assert len(result.items) == 5
+        assert stats.statements == 1
@@ -60,3 +60,37 @@ class TestSearchDocuments:
         assert len(result.items) == 2
         assert result.total >= 5
         assert result.page == 1
+
+    def test_search_sparse_fields(self, db):
+        """
+        When: Searching with fields=amount,metadata.client
+        Then: Items should only carry id, amount and the selected metadata key
+        """
+        client = fake.company()
+        created = create_draft(db, metadata={"client": client, "notes": fake.paragraph()})
+
+        result = SearchDocuments(db=db).execute(
+            SearchDocumentsRequest(fields="amount,metadata.client", page_size=100)
+        )
+
+        item = next(i for i in result.items if i.id == created.id)
+        assert item.model_dump(exclude_unset=True) == {
+            "id": created.id,
+            "amount": created.amount,
+            "metadata": {"client": client},
+        }
+
+    def test_search_query_count_independent_of_page_size(self, db, count_queries):
+        """
+        When: Searching with page sizes 1 and 5
+        Then: Both should run the same statements (count + page)
+        """
+        for _ in range(5):
+            create_draft(db, type="receipt")
+
+        with count_queries() as small_stats:
+            SearchDocuments(db=db).execute(SearchDocumentsRequest(type="receipt", page=1, page_size=1))
+        with count_queries() as large_stats:
+            SearchDocuments(db=db).execute(SearchDocumentsRequest(type="receipt", page=1, page_size=5))
+
+        assert small_stats.statements == large_stats.statements == 2
@@ -2,7 +2,8 @@
 
 import pytest
 
-from app.application.dtos.document_dtos import UpdateStatusRequest
+from app.application.dtos.document_dtos import BulkUpdateStatusRequest, UpdateStatusRequest
+from app.application.services.bulk_update_status import BulkUpdateStatus
 from app.application.services.update_status import UpdateStatus
 from app.domain.entities.document.status import DocumentStatus
 from app.domain.exceptions import InvalidStateTransitionException
@@ -169,3 +170,52 @@ class TestUpdateStatusAudit:
         assert audit is not None
         assert audit.old_value == "draft"
         assert audit.new_value == "pending"
+
+
+class TestBulkUpdateStatus:
+    """Verify the set-based bulk transition against the real schema."""
+
+    def test_bulk_applies_valid_and_reports_invalid(self, db):
+        """
+        When: A bulk request mixes valid, invalid and unknown documents
+        Then: Only valid transitions are applied, audited once each, and reported in order
+        """
+        approver_email = fake.email()
+        draft = create_draft(db)
+        pending = create_draft(db)
+        to_reject = create_draft(db)
+        UpdateStatus(db=db).execute(pending.id, UpdateStatusRequest(new_status=DocumentStatus.PENDING), fake.email())
+        UpdateStatus(db=db).execute(to_reject.id, UpdateStatusRequest(new_status=DocumentStatus.PENDING), fake.email())
+        not_found_id = fake.random_int(min=900_000, max=999_999)
+        comment = fake.sentence()
+
+        result = BulkUpdateStatus(db=db).execute(
+            BulkUpdateStatusRequest(
+                entries=[
+                    {"document_id": pending.id, "new_status": "approved"},
+                    {"document_id": draft.id, "new_status": "approved"},
+                    {"document_id": not_found_id, "new_status": "approved"},
+                    {"document_id": to_reject.id, "new_status": "rejected", "comment": comment},
+                ]
+            ),
+            user_email=approver_email,
+        )
+
+        assert [r.outcome for r in result.results] == ["updated", "invalid_transition", "not_found", "updated"]
+        assert result.results[1].old_status == "draft"
+        assert (result.updated, result.failed) == (2, 2)
+
+        db.expire_all()
+        assert db.query(DocumentModel).filter_by(id=pending.id).one().status == "approved"
+        assert db.query(DocumentModel).filter_by(id=draft.id).one().status == "draft"
+        rejected = db.query(DocumentModel).filter_by(id=to_reject.id).one()
+        assert rejected.status == "rejected"
+        assert rejected.extra_data["rejection_comment"] == comment
+        assert rejected.extra_data["rejected_by"] == approver_email
+
+        audit_rows = (
+            db.query(AuditLogModel)
+            .filter(AuditLogModel.user_id == approver_email, AuditLogModel.action == "state_change")
+            .all()
+        )
+        assert sorted(row.record_id for row in audit_rows) == sorted([str(pending.id), str(to_reject.id)])
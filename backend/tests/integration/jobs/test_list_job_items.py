@@ -0,0 +1,83 @@
+"""Integration tests for ListJobItems service (GET /jobs/{id}/items)."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.dtos.job_dtos import ProcessBatchRequest
+from app.application.services.get_job_status import GetJobStatus
+from app.application.services.list_job_items import ListJobItems
+from app.application.services.process_batch import ProcessBatch
+from app.domain.exceptions import JobNotFoundException
+from app.infrastructure.repositories.job_repository import JobRepository
+
+from .conftest import create_documents
+
+
+def _complete_job(db, job_id, doc_ids):
+    details = [{"document_id": d, "status": "success"} for d in doc_ids]
+    details[-1] = {"document_id": doc_ids[-1], "status": "failed", "error": "not_found"}
+    JobRepository(db).update_status(
+        job_id,
+        "completed",
+        completed_at=datetime.now(timezone.utc),
+        result={"total": len(doc_ids), "processed": len(doc_ids) - 1, "failed": 1},
+        items=details,
+    )
+
+
+class TestListJobItems:
+    """Verify per-document job results are stored in job_items and paginated."""
+
+    def test_items_are_returned_in_processing_order(self, db, mock_celery):
+        """
+        When: A completed job stored its details as job items
+        Then: ListJobItems should return them in processing order
+        """
+        doc_ids = create_documents(db, count=3)
+        created = ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=doc_ids))
+        _complete_job(db, created.job_id, doc_ids)
+
+        result = ListJobItems(db=db).execute(created.job_id)
+
+        assert result.total == 3
+        assert [item.document_id for item in result.items] == doc_ids
+        assert result.items[-1].status == "failed"
+        assert result.items[-1].error == "not_found"
+
+    def test_job_result_keeps_only_summary_counts(self, db, mock_celery):
+        """
+        When: A job completes with items
+        Then: The job result should hold only the counts
+        """
+        doc_ids = create_documents(db, count=2)
+        created = ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=doc_ids))
+        _complete_job(db, created.job_id, doc_ids)
+
+        job = GetJobStatus(db=db).execute(created.job_id)
+
+        assert job.result == {"total": 2, "processed": 1, "failed": 1}
+
+    def test_items_pagination(self, db, mock_celery):
+        """
+        When: A job has more items than page_size
+        Then: Should return the requested page only
+        """
+        doc_ids = create_documents(db, count=5)
+        created = ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=doc_ids))
+        _complete_job(db, created.job_id, doc_ids)
+
+        page2 = ListJobItems(db=db).execute(created.job_id, page=2, page_size=2)
+
+        assert [item.document_id for item in page2.items] == doc_ids[2:4]
+        assert page2.total == 5
+        assert page2.total_pages == 3
+
+    def test_items_not_found(self, db):
+        """
+        When: The job doesn't exist
+        Then: Should raise JobNotFoundException
+        """
+        with pytest.raises(JobNotFoundException):
+            ListJobItems(db=db).execute(uuid4())
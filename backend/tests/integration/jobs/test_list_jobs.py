@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 
-from app.application.dtos.job_dtos import ProcessBatchRequest
+from app.application.dtos.job_dtos import JobListView, ProcessBatchRequest
 from app.application.services.list_jobs import ListJobs
 from app.application.services.process_batch import ProcessBatch
 from app.infrastructure.repositories.job_repository import JobRepository
@@ -80,3 +80,29 @@ class TestListJobs:
         assert page1.page == 1
         assert page1.page_size == 2
         assert page1.total_pages >= 3
+
+    def test_list_summary_view_computes_counts(self, db, mock_celery):
+        """
+        When: Listing with view=summary
+        Then: document_count, processed and failed should be computed in SQL
+        """
+        doc_ids = create_documents(db, count=3)
+        created = ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=doc_ids))
+        JobRepository(db).update_status(
+            created.job_id,
+            "completed",
+            completed_at=datetime.now(timezone.utc),
+            result={"total": 3, "processed": 2, "failed": 1},
+        )
+        ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=create_documents(db, count=2)))
+
+        result = ListJobs(db=db).execute(view=JobListView.SUMMARY)
+        by_id = {item.job_id: item for item in result.items}
+
+        completed = by_id[created.job_id]
+        assert completed.document_count == 3
+        assert completed.processed == 2
+        assert completed.failed == 1
+        pending = next(item for item in result.items if item.status == "pending")
+        assert pending.document_count == 2
+        assert pending.processed is None
@@ -0,0 +1,75 @@
+"""Integration tests for the notification outbox (finance.outbox)."""
+
+from datetime import datetime, timezone
+
+from app.application.dtos.job_dtos import ProcessBatchRequest
+from app.application.services.process_batch import ProcessBatch
+from app.infrastructure.repositories.job_repository import JobRepository
+from app.infrastructure.repositories.outbox_repository import OutboxRepository
+
+from .conftest import create_documents
+
+
+def _complete_job_with_event(db, mock_celery):
+    doc_ids = create_documents(db, count=2)
+    created = ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=doc_ids))
+    payload = {"job_id": str(created.job_id), "status": "completed", "document_ids": doc_ids}
+    JobRepository(db).update_status(
+        created.job_id,
+        "completed",
+        completed_at=datetime.now(timezone.utc),
+        result={"total": 2, "processed": 2, "failed": 0},
+        outbox_event=payload,
+    )
+    return payload
+
+
+def _claim(db, job_id):
+    return [e for e in OutboxRepository(db).claim_pending(100) if e.payload["job_id"] == job_id]
+
+
+class TestOutbox:
+    """Verify outbox events are written with the job status and drained by the relay."""
+
+    def test_status_change_writes_pending_event(self, db, mock_celery):
+        """
+        When: A job status change carries an outbox event
+        Then: A pending event is stored in the same transaction
+        """
+        payload = _complete_job_with_event(db, mock_celery)
+
+        events = _claim(db, payload["job_id"])
+
+        assert len(events) == 1
+        assert events[0].event_type == "job.completed"
+        assert events[0].payload == payload
+        assert events[0].attempts == 0
+
+    def test_sent_event_is_not_claimed_again(self, db, mock_celery):
+        """
+        When: A claimed event is marked sent
+        Then: It is no longer returned by claim_pending
+        """
+        payload = _complete_job_with_event(db, mock_celery)
+        repo = OutboxRepository(db)
+        repo.mark_sent(_claim(db, payload["job_id"])[0])
+        db.commit()
+
+        assert _claim(db, payload["job_id"]) == []
+
+    def test_rescheduled_event_waits_for_backoff(self, db, mock_celery):
+        """
+        When: A claimed event fails with a retry delay
+        Then: It is not claimed before the delay and keeps only the failed channels
+        """
+        payload = _complete_job_with_event(db, mock_celery)
+        repo = OutboxRepository(db)
+        event = _claim(db, payload["job_id"])[0]
+        repo.mark_failed(event, ["external_monitoring"], "boom", retry_in=60)
+        db.commit()
+        db.refresh(event)
+
+        assert _claim(db, payload["job_id"]) == []
+        assert event.status == "pending"
+        assert event.attempts == 1
+        assert event.channels == ["external_monitoring"]
@@ -71,3 +71,18 @@ class TestProcessBatch:
             ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=doc_ids))
 
         assert db.query(JobModel).count() == initial_count
+
+    def test_document_validation_query_count_is_constant(self, db, mock_celery, count_queries):
+        """
+        When: Creating jobs for 2 and for 10 documents
+        Then: Both should run the same number of statements (no query per document)
+        """
+        small = create_documents(db, count=2)
+        large = create_documents(db, count=10)
+
+        with count_queries() as small_stats:
+            ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=small))
+        with count_queries() as large_stats:
+            ProcessBatch(db=db).execute(ProcessBatchRequest(document_ids=large))
+
+        assert large_stats.statements == small_stats.statements
@@ -5,6 +5,8 @@ from unittest.mock import MagicMock
 from tests.common import BaseTestCase
 
 from app.api.dependencies.services import (
+    get_batch_get_documents_service,
+    get_bulk_update_status_service,
     get_create_document_service,
     get_get_document_service,
     get_get_job_status_service,
@@ -15,6 +17,8 @@ from app.api.dependencies.services import (
     get_update_status_service,
 )
 from app.application.services import (
+    BatchGetDocuments,
+    BulkUpdateStatus,
     CreateDocument,
     GetDocument,
     GetJobStatus,
@@ -33,6 +37,14 @@ class TestServiceFactories(BaseTestCase):
         super().setUp()
         self.mock_db = self.make_mock_db_session()
 
+    def test_get_batch_get_documents_service_success(self) -> None:
+        svc = get_batch_get_documents_service(db=self.mock_db)
+        self.assertIsInstance(svc, BatchGetDocuments)
+
+    def test_get_bulk_update_status_service_success(self) -> None:
+        svc = get_bulk_update_status_service(db=self.mock_db)
+        self.assertIsInstance(svc, BulkUpdateStatus)
+
     def test_get_create_document_service_success(self) -> None:
         svc = get_create_document_service(db=self.mock_db)
         self.assertIsInstance(svc, CreateDocument)
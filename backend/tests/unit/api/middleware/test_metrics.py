@@ -0,0 +1,53 @@
+"""Tests for app.api.middleware.metrics.MetricsMiddleware."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from tests.common import BaseTestCase
+
+from app.api.middleware.metrics import OTHER_ROUTE, MetricsMiddleware
+
+
+def _count(method: str, route: str, status: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": method, "route": route, "status": status}
+    )
+    return value or 0.0
+
+
+class TestMetricsMiddleware(BaseTestCase):
+    """Tests for request latency recording."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int) -> dict:
+            return {"id": item_id}
+
+        @app.get("/boom")
+        async def boom() -> dict:
+            raise RuntimeError("boom")
+
+        self.client = TestClient(app, raise_server_exceptions=False)
+
+    def test_call_success_labels_route_template(self) -> None:
+        before = _count("GET", "/items/{item_id}", "200")
+
+        self.client.get("/items/1")
+        self.client.get("/items/2")
+
+        self.assertEqual(_count("GET", "/items/{item_id}", "200") - before, 2)
+
+    def test_call_success_unmatched_route(self) -> None:
+        before = _count("GET", OTHER_ROUTE, "404")
+        self.client.get(f"/{self.fake.word()}/{self.fake.word()}")
+        self.assertEqual(_count("GET", OTHER_ROUTE, "404") - before, 1)
+
+    def test_call_error_records_500(self) -> None:
+        before = _count("GET", "/boom", "500")
+        self.client.get("/boom")
+        self.assertEqual(_count("GET", "/boom", "500") - before, 1)
@@ -0,0 +1,38 @@
+"""Tests for app.api.middleware.profiling.ProfilingMiddleware."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tests.common import BaseTestCase
+
+from app.api.middleware.profiling import ProfilingMiddleware
+from app.core.profiling import SamplingProfiler, completed_requests
+
+
+class TestProfilingMiddleware(BaseTestCase):
+    """Tests for request counting."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        app = FastAPI()
+        app.add_middleware(ProfilingMiddleware)
+
+        @app.get("/ping")
+        def ping() -> dict:
+            return {"ok": True}
+
+        self.client = TestClient(app)
+
+    def test_call_success_counts_requests_while_profiling(self) -> None:
+        before = completed_requests()
+        with SamplingProfiler(interval=0.05):
+            self.client.get("/ping")
+            self.client.get("/ping")
+
+        self.assertEqual(completed_requests() - before, 2)
+
+    def test_call_success_ignored_when_not_profiling(self) -> None:
+        before = completed_requests()
+        self.client.get("/ping")
+
+        self.assertEqual(completed_requests(), before)
@@ -0,0 +1,62 @@
+"""Tests for app.api.middleware.query_stats.QueryStatsMiddleware."""
+
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from tests.common import BaseTestCase
+
+from app.api.middleware.query_stats import QueryStatsMiddleware
+from app.infrastructure.database.instrumentation import StatementBudgetExceeded, instrument_engine
+
+
+class TestQueryStatsMiddleware(BaseTestCase):
+    """Tests for per-request statement tracking."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = instrument_engine(
+            create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        )
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware)
+
+        @app.get("/items/{count}")
+        def list_items(count: int) -> dict:
+            with self.engine.connect() as conn:
+                for i in range(count):
+                    conn.execute(text(f"SELECT {i}"))
+            return {"count": count}
+
+        self.client = TestClient(app)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        super().tearDown()
+
+    def test_call_success_server_timing_header(self) -> None:
+        resp = self.client.get("/items/3")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn('desc="3 queries"', resp.headers["server-timing"])
+        self.assertIn("app;dur=", resp.headers["server-timing"])
+
+    def test_call_success_route_override_budget(self) -> None:
+        with patch("app.infrastructure.database.instrumentation.settings") as mock_settings:
+            mock_settings.DB_STATEMENT_BUDGETS = {"GET /items/{count}": 50}
+            resp = self.client.get("/items/30")
+
+        self.assertEqual(resp.status_code, 200)
+
+    def test_call_error_budget_exceeded_strict(self) -> None:
+        with patch("app.api.middleware.query_stats.settings") as mock_settings, patch(
+            "app.infrastructure.database.instrumentation.settings"
+        ) as mock_instrumentation_settings:
+            mock_settings.DB_STATEMENT_BUDGET = 2
+            mock_instrumentation_settings.DB_STATEMENT_BUDGETS = {}
+            mock_instrumentation_settings.DB_STATEMENT_BUDGET_STRICT = True
+            with self.assertRaises(StatementBudgetExceeded):
+                self.client.get("/items/3")
@@ -0,0 +1,63 @@
+"""Tests for app.api.middleware.tracing.TracingMiddleware."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tests.common import BaseTestCase
+
+from app.api.middleware.tracing import TracingMiddleware
+from app.core import tracing
+
+
+class TestTracingMiddleware(BaseTestCase):
+    """Tests for request spans."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exporter = tracing.InMemoryExporter()
+        tracing.set_exporter(self.exporter)
+
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware)
+
+        @tracing.traced("dependency work")
+        def work() -> None:
+            pass
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: int) -> dict:
+            work()
+            return {"id": item_id}
+
+        self.client = TestClient(app)
+
+    def tearDown(self) -> None:
+        tracing.set_exporter(None)
+        super().tearDown()
+
+    def test_call_success_server_span_named_by_route(self) -> None:
+        self.client.get("/items/7")
+
+        child, server = self.exporter.spans()
+        self.assertEqual(server.name, "GET /items/{item_id}")
+        self.assertEqual(server.kind, tracing.KIND_SERVER)
+        self.assertEqual(server.attributes["http.status_code"], 200)
+        self.assertEqual(child.name, "dependency work")
+        self.assertEqual(child.parent_id, server.context.span_id)
+
+    def test_call_success_continues_incoming_trace(self) -> None:
+        remote = tracing.SpanContext("e" * 32, "f" * 16)
+
+        self.client.get("/items/1", headers={"traceparent": remote.to_traceparent()})
+
+        server = self.exporter.spans()[-1]
+        self.assertEqual(server.context.trace_id, "e" * 32)
+        self.assertEqual(server.parent_id, "f" * 16)
+
+    def test_call_success_disabled(self) -> None:
+        tracing.set_exporter(None)
+
+        resp = self.client.get("/items/1")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.exporter.spans(), [])
@@ -165,3 +165,61 @@ class TestListAuditLogsRoute(BaseTestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json()["total"], 1)
         app.dependency_overrides.clear()
+
+
+class TestListSlowQueriesRoute(BaseTestCase):
+    def test_list_slow_queries_success_slowest_first(self) -> None:
+        from app.infrastructure.database.slow_queries import SlowQuery, slow_query_log
+
+        app, _ = _setup_app()
+        slow_query_log.clear()
+        slow_query_log.add(SlowQuery("SELECT 1", {"id": "int"}, 250.0, "app/x.py:1 in f"))
+        slow_query_log.add(SlowQuery("SELECT 2", [], 900.0, "app/y.py:2 in g", plan="Seq Scan"))
+
+        client = TestClient(app)
+        resp = client.get("/api/v1/admin/slow-queries?limit=1")
+        slow_query_log.clear()
+        app.dependency_overrides.clear()
+
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(data["total"], 2)
+        self.assertEqual(len(data["items"]), 1)
+        self.assertEqual(data["items"][0]["statement"], "SELECT 2")
+        self.assertEqual(data["items"][0]["plan"], "Seq Scan")
+
+
+class TestProfileWorkerRoute(BaseTestCase):
+    def test_profile_worker_success_returns_collapsed_stacks(self) -> None:
+        app, _ = _setup_app()
+
+        client = TestClient(app)
+        resp = client.post("/api/v1/admin/profile?seconds=0.05&interval_ms=1")
+        app.dependency_overrides.clear()
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/plain"))
+        self.assertGreater(int(resp.headers["X-Profile-Samples"]), 0)
+        self.assertEqual(resp.headers["X-Profile-Requests"], "0")
+
+    def test_profile_worker_success_stops_at_deadline_in_requests_mode(self) -> None:
+        app, _ = _setup_app()
+
+        client = TestClient(app)
+        resp = client.post("/api/v1/admin/profile?seconds=0.1&requests=5")
+        app.dependency_overrides.clear()
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertLess(float(resp.headers["X-Profile-Duration-Seconds"]), 1.0)
+
+    def test_profile_worker_error_busy(self) -> None:
+        from app.core.profiling import SamplingProfiler
+
+        app, _ = _setup_app()
+
+        client = TestClient(app)
+        with SamplingProfiler(interval=0.05):
+            resp = client.post("/api/v1/admin/profile?seconds=0.05")
+        app.dependency_overrides.clear()
+
+        self.assertEqual(resp.status_code, 409)
@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 
 from tests.common import BaseTestCase
 
+from app.application.dtos.job_dtos import JobResponse
 from app.domain.entities.user import User, UserRole, UserStatus
 
 
@@ -25,7 +26,7 @@ class TestProcessBatchRoute(BaseTestCase):
             created_at=now, updated_at=now,
         )
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = JobResponse(
             job_id=uuid4(), status="pending", created_at=self.test_timestamp,
             completed_at=None, result=None, error_message=None,
         )
@@ -40,3 +41,29 @@ class TestProcessBatchRoute(BaseTestCase):
         resp = client.post("/api/v1/documents/batch/process", json={"document_ids": [1, 2, 3]})
         self.assertEqual(resp.status_code, 202)
         app.dependency_overrides.clear()
+
+    def test_process_batch_error_profile_requires_admin(self) -> None:
+        from app.api.dependencies.database import get_database
+        from app.api.dependencies.services import get_process_batch_service
+        from app.api.middleware.jwt_auth import get_current_user, require_loader
+        from app.main import app
+
+        now = datetime.utcnow()
+        user = User(
+            id=uuid4(), google_id="g", email="u@t.com", name="T",
+            picture=None, role=UserRole.LOADER, status=UserStatus.ACTIVE,
+            created_at=now, updated_at=now,
+        )
+        mock_svc = MagicMock()
+
+        app.dependency_overrides[get_database] = lambda: MagicMock()
+        app.dependency_overrides[get_current_user] = lambda: user
+        dep_fn = require_loader()
+        app.dependency_overrides[dep_fn] = lambda: user
+        app.dependency_overrides[get_process_batch_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.post("/api/v1/documents/batch/process?profile=true", json={"document_ids": [1]})
+        self.assertEqual(resp.status_code, 403)
+        mock_svc.execute.assert_not_called()
+        app.dependency_overrides.clear()
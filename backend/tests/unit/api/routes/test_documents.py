@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 
 from tests.common import BaseTestCase
 
+from app.application.dtos.document_dtos import DocumentResponse, PaginatedDocumentsResponse
 from app.domain.entities.user import User, UserRole, UserStatus
 
 
@@ -42,7 +43,7 @@ class TestCreateDocumentRoute(BaseTestCase):
         from app.api.dependencies.services import get_create_document_service
 
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = DocumentResponse(
             id=1, type="invoice", amount=Decimal("100.00"), status="draft",
             created_at=self.test_timestamp, updated_at=self.test_timestamp,
             metadata={}, created_by="user",
@@ -61,7 +62,7 @@ class TestGetDocumentRoute(BaseTestCase):
         from app.api.dependencies.services import get_get_document_service
 
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = DocumentResponse(
             id=1, type="invoice", amount=Decimal("100.00"), status="draft",
             created_at=self.test_timestamp, updated_at=self.test_timestamp,
             metadata={}, created_by="user",
@@ -74,13 +75,72 @@ class TestGetDocumentRoute(BaseTestCase):
         app.dependency_overrides.clear()
 
 
+    def test_get_document_success_sparse_fields(self) -> None:
+        app, _ = _make_app()
+        from app.api.dependencies.services import get_get_document_service
+        from app.application.dtos.document_dtos import SparseDocumentResponse
+
+        mock_svc = MagicMock()
+        mock_svc.execute.return_value = SparseDocumentResponse(id=1, type="invoice", metadata={"client": "ACME"})
+        app.dependency_overrides[get_get_document_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.get("/api/v1/documents/1", params={"fields": "type,metadata.client"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {"id": 1, "type": "invoice", "metadata": {"client": "ACME"}})
+        mock_svc.execute.assert_called_once_with(1, fields="type,metadata.client")
+        app.dependency_overrides.clear()
+
+    def test_get_document_error_invalid_fields(self) -> None:
+        app, _ = _make_app()
+        from app.api.dependencies.services import get_get_document_service
+        from app.domain.exceptions import InvalidFieldSelectionException
+
+        mock_svc = MagicMock()
+        mock_svc.execute.side_effect = InvalidFieldSelectionException("secret")
+        app.dependency_overrides[get_get_document_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.get("/api/v1/documents/1", params={"fields": "secret"})
+        self.assertEqual(resp.status_code, 400)
+        app.dependency_overrides.clear()
+
+
+class TestBatchGetDocumentsRoute(BaseTestCase):
+    def test_batch_get_documents_success(self) -> None:
+        app, _ = _make_app()
+        from app.api.dependencies.services import get_batch_get_documents_service
+        from app.application.dtos.document_dtos import SparseBatchGetDocumentsResponse, SparseDocumentResponse
+
+        mock_svc = MagicMock()
+        mock_svc.execute.return_value = SparseBatchGetDocumentsResponse(
+            items=[SparseDocumentResponse(id=2, status="draft")], missing=[3],
+        )
+        app.dependency_overrides[get_batch_get_documents_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.post("/api/v1/documents/batch-get", json={"ids": [2, 3], "fields": "status"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json(), {"items": [{"id": 2, "status": "draft"}], "missing": [3]})
+        app.dependency_overrides.clear()
+
+    def test_batch_get_documents_error_too_many_ids(self) -> None:
+        app, _ = _make_app()
+        from app.application.dtos.document_dtos import MAX_BATCH_GET_IDS
+
+        client = TestClient(app)
+        resp = client.post("/api/v1/documents/batch-get", json={"ids": list(range(1, MAX_BATCH_GET_IDS + 2))})
+        self.assertEqual(resp.status_code, 422)
+        app.dependency_overrides.clear()
+
+
 class TestUpdateDocumentRoute(BaseTestCase):
     def test_update_document_success(self) -> None:
         app, _ = _make_app()
         from app.api.dependencies.services import get_update_document_service
 
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = DocumentResponse(
             id=1, type="receipt", amount=Decimal("200.00"), status="draft",
             created_at=self.test_timestamp, updated_at=self.test_timestamp,
             metadata={}, created_by="user",
@@ -99,7 +159,7 @@ class TestUpdateStatusRoute(BaseTestCase):
         from app.api.dependencies.services import get_update_status_service
 
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = DocumentResponse(
             id=1, type="invoice", amount=Decimal("100.00"), status="pending",
             created_at=self.test_timestamp, updated_at=self.test_timestamp,
             metadata={}, created_by="user",
@@ -112,13 +172,49 @@ class TestUpdateStatusRoute(BaseTestCase):
         app.dependency_overrides.clear()
 
 
+class TestBulkUpdateStatusRoute(BaseTestCase):
+    def test_bulk_update_status_success(self) -> None:
+        app, _ = _make_app()
+        from app.api.dependencies.services import get_bulk_update_status_service
+        from app.application.dtos.document_dtos import BulkStatusResult, BulkUpdateStatusResponse
+
+        mock_svc = MagicMock()
+        mock_svc.execute.return_value = BulkUpdateStatusResponse(
+            results=[BulkStatusResult(document_id=1, outcome="updated", old_status="pending", new_status="approved")],
+            updated=1,
+            failed=0,
+        )
+        app.dependency_overrides[get_bulk_update_status_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.patch(
+            "/api/v1/documents/status",
+            json={"entries": [{"document_id": 1, "new_status": "approved"}]},
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["results"][0]["outcome"], "updated")
+        self.assertEqual(mock_svc.execute.call_args.kwargs["user_email"], "user@test.com")
+        app.dependency_overrides.clear()
+
+    def test_bulk_update_status_error_duplicate_documents(self) -> None:
+        app, _ = _make_app()
+
+        client = TestClient(app)
+        resp = client.patch(
+            "/api/v1/documents/status",
+            json={"entries": [{"document_id": 1, "new_status": "approved"}, {"document_id": 1, "new_status": "rejected"}]},
+        )
+        self.assertEqual(resp.status_code, 422)
+        app.dependency_overrides.clear()
+
+
 class TestSearchDocumentsRoute(BaseTestCase):
     def test_search_documents_success(self) -> None:
         app, _ = _make_app()
         from app.api.dependencies.services import get_search_documents_service
 
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = PaginatedDocumentsResponse(
             items=[], total=0, page=1, page_size=50, total_pages=0,
         )
         app.dependency_overrides[get_search_documents_service] = lambda: mock_svc
@@ -127,3 +223,21 @@ class TestSearchDocumentsRoute(BaseTestCase):
         resp = client.get("/api/v1/documents")
         self.assertEqual(resp.status_code, 200)
         app.dependency_overrides.clear()
+
+    def test_search_documents_success_sparse_fields(self) -> None:
+        app, _ = _make_app()
+        from app.api.dependencies.services import get_search_documents_service
+        from app.application.dtos.document_dtos import SparseDocumentResponse, SparsePaginatedDocumentsResponse
+
+        mock_svc = MagicMock()
+        mock_svc.execute.return_value = SparsePaginatedDocumentsResponse(
+            items=[SparseDocumentResponse(id=1, status="draft")], total=1, page=1, page_size=50, total_pages=1,
+        )
+        app.dependency_overrides[get_search_documents_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.get("/api/v1/documents", params={"fields": "status"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["items"], [{"id": 1, "status": "draft"}])
+        self.assertEqual(mock_svc.execute.call_args.args[0].fields, "status")
+        app.dependency_overrides.clear()
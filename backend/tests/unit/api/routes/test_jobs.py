@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 
 from tests.common import BaseTestCase
 
+from app.application.dtos.job_dtos import JobListResponse, JobResponse
 from app.domain.entities.user import User, UserRole, UserStatus
 
 
@@ -29,7 +30,7 @@ class TestListJobsRoute(BaseTestCase):
 
         user = _make_user()
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = JobListResponse(
             items=[], total=0, page=1, page_size=10, total_pages=0,
         )
 
@@ -45,6 +46,35 @@ class TestListJobsRoute(BaseTestCase):
         app.dependency_overrides.clear()
 
 
+    def test_list_jobs_success_summary_view(self) -> None:
+        from app.api.dependencies.database import get_database
+        from app.api.dependencies.services import get_list_jobs_service
+        from app.api.middleware.jwt_auth import get_current_user, require_any_active_role
+        from app.application.dtos.job_dtos import JobListView, JobSummaryListResponse
+        from app.main import app
+
+        user = _make_user()
+        mock_svc = MagicMock()
+        mock_svc.execute.return_value = JobSummaryListResponse(
+            items=[], total=0, page=1, page_size=10, total_pages=1,
+        )
+
+        app.dependency_overrides[get_database] = lambda: MagicMock()
+        app.dependency_overrides[get_current_user] = lambda: user
+        dep_fn = require_any_active_role()
+        app.dependency_overrides[dep_fn] = lambda: user
+        app.dependency_overrides[get_list_jobs_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.get("/api/v1/jobs", params={"view": "summary"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(mock_svc.execute.call_args.kwargs["view"], JobListView.SUMMARY)
+
+        resp = client.get("/api/v1/jobs", params={"view": "bogus"})
+        self.assertEqual(resp.status_code, 422)
+        app.dependency_overrides.clear()
+
+
 class TestGetJobStatusRoute(BaseTestCase):
     def test_get_job_status_success(self) -> None:
         from app.api.dependencies.database import get_database
@@ -55,7 +85,7 @@ class TestGetJobStatusRoute(BaseTestCase):
         user = _make_user()
         job_id = uuid4()
         mock_svc = MagicMock()
-        mock_svc.execute.return_value = MagicMock(
+        mock_svc.execute.return_value = JobResponse(
             job_id=job_id, status="completed", created_at=self.test_timestamp,
             completed_at=self.test_timestamp, result={"processed": 1}, error_message=None,
         )
@@ -70,3 +100,34 @@ class TestGetJobStatusRoute(BaseTestCase):
         resp = client.get(f"/api/v1/jobs/{job_id}")
         self.assertEqual(resp.status_code, 200)
         app.dependency_overrides.clear()
+
+
+class TestListJobItemsRoute(BaseTestCase):
+    def test_list_job_items_success(self) -> None:
+        from app.api.dependencies.database import get_database
+        from app.api.dependencies.services import get_list_job_items_service
+        from app.api.middleware.jwt_auth import get_current_user, require_any_active_role
+        from app.application.dtos.job_dtos import JobItemListResponse, JobItemResponse
+        from app.main import app
+
+        user = _make_user()
+        job_id = uuid4()
+        mock_svc = MagicMock()
+        mock_svc.execute.return_value = JobItemListResponse(
+            job_id=job_id,
+            items=[JobItemResponse(document_id=1, status="success")],
+            total=1, page=2, page_size=25, total_pages=1,
+        )
+
+        app.dependency_overrides[get_database] = lambda: MagicMock()
+        app.dependency_overrides[get_current_user] = lambda: user
+        dep_fn = require_any_active_role()
+        app.dependency_overrides[dep_fn] = lambda: user
+        app.dependency_overrides[get_list_job_items_service] = lambda: mock_svc
+
+        client = TestClient(app)
+        resp = client.get(f"/api/v1/jobs/{job_id}/items", params={"page": 2, "page_size": 25})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["items"][0]["document_id"], 1)
+        mock_svc.execute.assert_called_once_with(job_id, page=2, page_size=25)
+        app.dependency_overrides.clear()
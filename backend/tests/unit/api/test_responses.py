@@ -0,0 +1,67 @@
+"""Tests for app.api.responses.ORJSONResponse."""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from tests.common import BaseTestCase
+
+from app.api.responses import ORJSONResponse
+from app.application.dtos.document_dtos import (
+    DocumentResponse,
+    PaginatedDocumentsResponse,
+    SparseDocumentResponse,
+)
+from app.application.dtos.job_dtos import JobResponse
+
+
+class TestORJSONResponse(BaseTestCase):
+    """Tests for ORJSONResponse rendering."""
+
+    def _document(self) -> DocumentResponse:
+        return DocumentResponse(
+            id=self.fake.random_int(),
+            type="invoice",
+            amount=Decimal("1234.50"),
+            status="pending",
+            created_at=datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            updated_at=datetime(2026, 1, 2, 3, 4, 5),
+            metadata={"client": self.fake.company(), "tags": ["a", "b"], "nested": {"ratio": 1.5}},
+            created_by=self.fake.email(),
+        )
+
+    def test_render_success_matches_pydantic_json(self) -> None:
+        model = PaginatedDocumentsResponse(
+            items=[self._document() for _ in range(3)], total=3, page=1, page_size=50, total_pages=1
+        )
+
+        response = ORJSONResponse(model)
+
+        self.assertEqual(json.loads(response.body), json.loads(model.model_dump_json()))
+        self.assertEqual(response.media_type, "application/json")
+
+    def test_render_success_decimal_datetime_uuid(self) -> None:
+        job_id = uuid4()
+        model = JobResponse(job_id=job_id, status="pending", created_at=datetime(2026, 1, 2, tzinfo=timezone.utc))
+
+        body = json.loads(ORJSONResponse(model).body)
+        amount = json.loads(ORJSONResponse({"amount": Decimal("10.10")}).body)
+
+        self.assertEqual(body["job_id"], str(job_id))
+        self.assertEqual(body["created_at"], "2026-01-02T00:00:00Z")
+        self.assertEqual(amount, {"amount": "10.10"})
+
+    def test_render_success_exclude_unset(self) -> None:
+        model = SparseDocumentResponse(id=1, amount=Decimal("5.00"))
+
+        self.assertEqual(json.loads(ORJSONResponse(model, exclude_unset=True).body), {"id": 1, "amount": "5.00"})
+        self.assertIn("type", json.loads(ORJSONResponse(model).body))
+
+    def test_render_success_status_code(self) -> None:
+        response = ORJSONResponse({"ok": True}, status_code=201)
+        self.assertEqual(response.status_code, 201)
+
+    def test_render_error_unsupported_type(self) -> None:
+        with self.assertRaises(TypeError):
+            ORJSONResponse({"value": object()})
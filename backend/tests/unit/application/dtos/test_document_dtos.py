@@ -7,13 +7,16 @@ from pydantic import ValidationError
 from tests.common import BaseTestCase
 
 from app.application.dtos.document_dtos import (
+    BulkUpdateStatusRequest,
     CreateDocumentRequest,
     MAX_AMOUNT,
     MAX_METADATA_KEYS,
     UpdateDocumentRequest,
     UpdateStatusRequest,
+    parse_document_fields,
 )
 from app.domain.entities.document.status import DocumentStatus
+from app.domain.exceptions import InvalidFieldSelectionException
 
 
 class TestCreateDocumentRequestAmountExceedsMax(BaseTestCase):
@@ -80,3 +83,55 @@ class TestUpdateStatusRequestDraftBlocked(BaseTestCase):
         for target in [DocumentStatus.PENDING, DocumentStatus.APPROVED, DocumentStatus.REJECTED]:
             req = UpdateStatusRequest(new_status=target)
             self.assertEqual(req.new_status, target)
+
+
+class TestParseDocumentFields(BaseTestCase):
+    """Tests for parse_document_fields()."""
+
+    def test_parse_fields_none_returns_none(self) -> None:
+        self.assertIsNone(parse_document_fields(None))
+        self.assertIsNone(parse_document_fields("  "))
+
+    def test_parse_fields_always_includes_id_and_dedupes(self) -> None:
+        self.assertEqual(parse_document_fields("type, amount,type"), ["id", "type", "amount"])
+
+    def test_parse_fields_metadata_keys(self) -> None:
+        self.assertEqual(parse_document_fields("metadata.client,status"), ["id", "metadata.client", "status"])
+
+    def test_parse_fields_full_metadata_wins_over_keys(self) -> None:
+        self.assertEqual(parse_document_fields("metadata.client,metadata"), ["id", "metadata"])
+
+    def test_parse_fields_unknown_field_raises(self) -> None:
+        with self.assertRaises(InvalidFieldSelectionException):
+            parse_document_fields("type,password")
+
+    def test_parse_fields_empty_metadata_key_raises(self) -> None:
+        with self.assertRaises(InvalidFieldSelectionException):
+            parse_document_fields("metadata.")
+
+
+class TestBulkUpdateStatusRequest(BaseTestCase):
+    """Tests for BulkUpdateStatusRequest validation."""
+
+    def test_bulk_request_duplicate_documents_raises(self) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            BulkUpdateStatusRequest(
+                entries=[
+                    {"document_id": 1, "new_status": "approved"},
+                    {"document_id": 1, "new_status": "rejected"},
+                ]
+            )
+        self.assertIn("Duplicate document_id", str(ctx.exception))
+
+    def test_bulk_request_draft_target_raises(self) -> None:
+        with self.assertRaises(ValidationError):
+            BulkUpdateStatusRequest(entries=[{"document_id": 1, "new_status": "draft"}])
+
+    def test_bulk_request_valid(self) -> None:
+        request = BulkUpdateStatusRequest(
+            entries=[
+                {"document_id": 1, "new_status": "approved"},
+                {"document_id": 2, "new_status": "rejected", "comment": "missing RUT"},
+            ]
+        )
+        self.assertEqual(request.entries[1].comment, "missing RUT")
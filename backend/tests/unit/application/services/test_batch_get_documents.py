@@ -0,0 +1,119 @@
+"""Tests for app.application.services.batch_get_documents.BatchGetDocuments."""
+
+from unittest.mock import MagicMock, patch
+
+from tests.common import BaseTestCase
+from app.application.dtos.document_dtos import (
+    BatchGetDocumentsRequest,
+    BatchGetDocumentsResponse,
+    SparseBatchGetDocumentsResponse,
+)
+from app.application.services.batch_get_documents import BatchGetDocuments
+from app.domain.exceptions import InvalidFieldSelectionException
+
+
+class BatchGetDocumentsTestCase(BaseTestCase):
+    """Global base class for ALL BatchGetDocuments tests."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.patcher_repo = patch(
+            "app.application.services.batch_get_documents.DocumentRepository"
+        )
+        cls.MockDocumentRepository = cls.patcher_repo.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        cls.patcher_repo.stop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_db = self.make_mock_db_session()
+        self.mock_repo_instance = MagicMock()
+        self.MockDocumentRepository.return_value = self.mock_repo_instance
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.MockDocumentRepository.reset_mock()
+
+    def get_instance(self) -> BatchGetDocuments:
+        return BatchGetDocuments(db=self.mock_db)
+
+
+class TestUnderScoreUnderScoreInit(BatchGetDocumentsTestCase):
+    """Tests for __init__()."""
+
+    def test_init_success_creates_repository(self) -> None:
+        """
+        When: BatchGetDocuments is initialized
+        Then: Should create DocumentRepository
+        """
+        self.get_instance()
+        self.MockDocumentRepository.assert_called_once_with(self.mock_db)
+
+
+class TestExecute(BatchGetDocumentsTestCase):
+    """Tests for execute()."""
+
+    def test_execute_success_preserves_request_order(self) -> None:
+        """
+        When: Repository returns documents in a different order
+        Then: Items should follow the request order
+        """
+        docs = [self.make_document(id=i) for i in (1, 2, 3)]
+        self.mock_repo_instance.get_many_rows.return_value = list(reversed(docs))
+
+        result = self.get_instance().execute(BatchGetDocumentsRequest(ids=[2, 3, 1]))
+
+        self.assertIsInstance(result, BatchGetDocumentsResponse)
+        self.assertEqual([item.id for item in result.items], [2, 3, 1])
+        self.assertEqual(result.missing, [])
+
+    def test_execute_success_reports_missing(self) -> None:
+        """
+        When: Some requested IDs do not exist
+        Then: Should list them in missing, in request order
+        """
+        self.mock_repo_instance.get_many_rows.return_value = [self.make_document(id=5)]
+
+        result = self.get_instance().execute(BatchGetDocumentsRequest(ids=[9, 5, 7]))
+
+        self.assertEqual([item.id for item in result.items], [5])
+        self.assertEqual(result.missing, [9, 7])
+
+    def test_execute_success_dedupes_ids(self) -> None:
+        """
+        When: An ID is requested twice
+        Then: Should query it once and return it once
+        """
+        self.mock_repo_instance.get_many_rows.return_value = [self.make_document(id=4)]
+
+        result = self.get_instance().execute(BatchGetDocumentsRequest(ids=[4, 4]))
+
+        self.mock_repo_instance.get_many_rows.assert_called_once_with([4])
+        self.assertEqual(len(result.items), 1)
+
+    def test_execute_success_sparse_fields(self) -> None:
+        """
+        When: fields is given
+        Then: Should use the projected query and return sparse items
+        """
+        self.mock_repo_instance.get_many_fields.return_value = [{"id": 8, "status": "draft"}]
+
+        result = self.get_instance().execute(BatchGetDocumentsRequest(ids=[8, 9], fields="status"))
+
+        self.mock_repo_instance.get_many_rows.assert_not_called()
+        self.mock_repo_instance.get_many_fields.assert_called_once_with([8, 9], ["id", "status"])
+        self.assertIsInstance(result, SparseBatchGetDocumentsResponse)
+        self.assertEqual(result.items[0].model_dump(exclude_unset=True)["id"], 8)
+        self.assertEqual(result.missing, [9])
+
+    def test_execute_error_invalid_fields(self) -> None:
+        """
+        When: fields contains an unknown field
+        Then: Should raise InvalidFieldSelectionException
+        """
+        with self.assertRaises(InvalidFieldSelectionException):
+            self.get_instance().execute(BatchGetDocumentsRequest(ids=[1], fields="nope"))
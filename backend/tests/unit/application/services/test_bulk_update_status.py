@@ -0,0 +1,93 @@
+"""Tests for app.application.services.bulk_update_status.BulkUpdateStatus."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from tests.common import BaseTestCase
+from app.application.dtos.document_dtos import BulkUpdateStatusRequest
+from app.application.services.bulk_update_status import BulkUpdateStatus
+
+
+class BulkUpdateStatusTestCase(BaseTestCase):
+    """Global base class for ALL BulkUpdateStatus tests."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.patcher_doc_repo = patch(
+            "app.application.services.bulk_update_status.DocumentRepository"
+        )
+        cls.MockDocumentRepository = cls.patcher_doc_repo.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        cls.patcher_doc_repo.stop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_db = self.make_mock_db_session()
+        self.mock_doc_repo = MagicMock()
+        self.MockDocumentRepository.return_value = self.mock_doc_repo
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.MockDocumentRepository.reset_mock()
+
+    def get_instance(self) -> BulkUpdateStatus:
+        return BulkUpdateStatus(db=self.mock_db)
+
+
+class TestUnderScoreUnderScoreInit(BulkUpdateStatusTestCase):
+    """Tests for __init__()."""
+
+    def test_init_success_creates_repository(self) -> None:
+        """
+        When: BulkUpdateStatus is initialized
+        Then: Should create DocumentRepository
+        """
+        self.get_instance()
+        self.MockDocumentRepository.assert_called_once_with(self.mock_db)
+
+
+class TestExecute(BulkUpdateStatusTestCase):
+    """Tests for execute()."""
+
+    def test_execute_success_reports_outcomes(self) -> None:
+        """
+        When: Repository reports updated, invalid and missing entries
+        Then: Should map each row to its outcome, in order, with counts
+        """
+        self.mock_doc_repo.bulk_update_status.return_value = [
+            SimpleNamespace(document_id=1, new_status="approved", old_status="pending", updated=True),
+            SimpleNamespace(document_id=2, new_status="approved", old_status="approved", updated=False),
+            SimpleNamespace(document_id=3, new_status="rejected", old_status=None, updated=False),
+        ]
+        request = BulkUpdateStatusRequest(
+            entries=[
+                {"document_id": 1, "new_status": "approved"},
+                {"document_id": 2, "new_status": "approved"},
+                {"document_id": 3, "new_status": "rejected", "comment": "dup"},
+            ]
+        )
+        user_email = self.fake.email()
+
+        result = self.get_instance().execute(request, user_email=user_email)
+
+        self.assertEqual([r.outcome for r in result.results], ["updated", "invalid_transition", "not_found"])
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(result.failed, 2)
+        entries = self.mock_doc_repo.bulk_update_status.call_args.args[0]
+        self.assertEqual(entries[2], {"document_id": 3, "new_status": "rejected", "comment": "dup"})
+        self.assertEqual(self.mock_doc_repo.bulk_update_status.call_args.kwargs["user_email"], user_email)
+
+    def test_execute_error_repository_raises(self) -> None:
+        """
+        When: Repository raises exception
+        Then: Should propagate
+        """
+        self.mock_doc_repo.bulk_update_status.side_effect = RuntimeError("DB error")
+        request = BulkUpdateStatusRequest(entries=[{"document_id": 1, "new_status": "pending"}])
+
+        with self.assertRaises(RuntimeError):
+            self.get_instance().execute(request, user_email=self.fake.email())
@@ -9,7 +9,7 @@ from tests.common import BaseTestCase
 from app.application.services.get_document import GetDocument
 from app.domain.entities.document.document import Document
 from app.domain.entities.document.status import DocumentStatus
-from app.domain.exceptions import DocumentNotFoundException
+from app.domain.exceptions import DocumentNotFoundException, InvalidFieldSelectionException
 
 
 class GetDocumentTestCase(BaseTestCase):
@@ -80,7 +80,7 @@ class TestExecute(GetDocumentTestCase):
         """
         doc_id = self.fake.random_int(min=1, max=99_999)
         doc = self.make_document(id=doc_id)
-        self.mock_repo_instance.get_by_id.return_value = doc
+        self.mock_repo_instance.get_row.return_value = doc
 
         service = self.get_instance()
         result = service.execute(doc_id)
@@ -97,7 +97,7 @@ class TestExecute(GetDocumentTestCase):
         doc_id = self.fake.random_int(min=1, max=99_999)
         created_by = self.fake.bothify("user-####")
         doc = self.make_document(id=doc_id, type="receipt", created_by=created_by)
-        self.mock_repo_instance.get_by_id.return_value = doc
+        self.mock_repo_instance.get_row.return_value = doc
 
         service = self.get_instance()
         result = service.execute(doc_id)
@@ -113,16 +113,16 @@ class TestExecute(GetDocumentTestCase):
     def test_execute_success_calls_repository(self) -> None:
         """
         When: execute() is called
-        Then: Should call repository.get_by_id with correct ID
+        Then: Should call repository.get_row with correct ID
         """
         doc_id = self.fake.random_int(min=1, max=99_999)
         doc = self.make_document(id=doc_id)
-        self.mock_repo_instance.get_by_id.return_value = doc
+        self.mock_repo_instance.get_row.return_value = doc
 
         service = self.get_instance()
         service.execute(doc_id)
 
-        self.mock_repo_instance.get_by_id.assert_called_once_with(doc_id)
+        self.mock_repo_instance.get_row.assert_called_once_with(doc_id)
 
     def test_execute_error_document_not_found(self) -> None:
         """
@@ -130,7 +130,7 @@ class TestExecute(GetDocumentTestCase):
         Then: Should raise DocumentNotFoundException
         """
         not_found_id = self.fake.random_int(min=100_000, max=999_999)
-        self.mock_repo_instance.get_by_id.return_value = None
+        self.mock_repo_instance.get_row.return_value = None
 
         service = self.get_instance()
 
@@ -145,7 +145,7 @@ class TestExecute(GetDocumentTestCase):
         Then: Should propagate the exception
         """
         doc_id = self.fake.random_int(min=1, max=99_999)
-        self.mock_repo_instance.get_by_id.side_effect = Exception(self.fake.sentence())
+        self.mock_repo_instance.get_row.side_effect = Exception(self.fake.sentence())
 
         service = self.get_instance()
 
@@ -160,9 +160,47 @@ class TestExecute(GetDocumentTestCase):
         doc_id = self.fake.random_int(min=1, max=99_999)
         metadata = {"client": self.fake.company(), "email": self.fake.company_email()}
         doc = self.make_document(id=doc_id, metadata=metadata)
-        self.mock_repo_instance.get_by_id.return_value = doc
+        self.mock_repo_instance.get_row.return_value = doc
 
         service = self.get_instance()
         result = service.execute(doc_id)
 
         self.assertEqual(result.metadata, metadata)
+
+    def test_execute_success_sparse_fields(self) -> None:
+        """
+        When: fields is given
+        Then: Should read only the selected fields and leave the rest unset
+        """
+        doc_id = self.fake.random_int(min=1, max=99_999)
+        self.mock_repo_instance.get_fields.return_value = {"id": doc_id, "amount": Decimal("12.50")}
+
+        service = self.get_instance()
+        result = service.execute(doc_id, fields="amount")
+
+        self.mock_repo_instance.get_fields.assert_called_once_with(doc_id, ["id", "amount"])
+        self.mock_repo_instance.get_row.assert_not_called()
+        self.assertEqual(result.model_dump(exclude_unset=True), {"id": doc_id, "amount": Decimal("12.50")})
+
+    def test_execute_error_sparse_fields_not_found(self) -> None:
+        """
+        When: fields is given and the document doesn't exist
+        Then: Should raise DocumentNotFoundException
+        """
+        self.mock_repo_instance.get_fields.return_value = None
+
+        service = self.get_instance()
+
+        with self.assertRaises(DocumentNotFoundException):
+            service.execute(1, fields="status")
+
+    def test_execute_error_invalid_fields(self) -> None:
+        """
+        When: fields contains an unknown field
+        Then: Should raise InvalidFieldSelectionException without querying
+        """
+        service = self.get_instance()
+
+        with self.assertRaises(InvalidFieldSelectionException):
+            service.execute(1, fields="secret")
+        self.mock_repo_instance.get_fields.assert_not_called()
@@ -0,0 +1,107 @@
+"""Tests for app.application.services.list_job_items.ListJobItems."""
+
+from unittest.mock import MagicMock, patch
+
+from tests.common import BaseTestCase
+from app.application.services.list_job_items import ListJobItems
+from app.domain.exceptions import JobNotFoundException
+
+
+class ListJobItemsTestCase(BaseTestCase):
+    """Global base class for ALL ListJobItems tests."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.patcher_repo = patch(
+            "app.application.services.list_job_items.JobRepository"
+        )
+        cls.MockJobRepository = cls.patcher_repo.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        cls.patcher_repo.stop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_db = self.make_mock_db_session()
+        self.mock_repo_instance = MagicMock()
+        self.mock_repo_instance.exists.return_value = True
+        self.MockJobRepository.return_value = self.mock_repo_instance
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.MockJobRepository.reset_mock()
+
+    def get_instance(self) -> ListJobItems:
+        return ListJobItems(db=self.mock_db)
+
+    def make_item(self, **overrides) -> MagicMock:
+        item = MagicMock()
+        item.document_id = overrides.get("document_id", self.fake.random_int(min=1, max=999))
+        item.status = overrides.get("status", "success")
+        item.action = overrides.get("action", None)
+        item.error = overrides.get("error", None)
+        return item
+
+
+class TestUnderScoreUnderScoreInit(ListJobItemsTestCase):
+    """Tests for __init__()."""
+
+    def test_init_success_creates_repository(self) -> None:
+        """
+        When: ListJobItems is initialized
+        Then: Should create JobRepository
+        """
+        self.get_instance()
+        self.MockJobRepository.assert_called_once_with(self.mock_db)
+
+
+class TestExecute(ListJobItemsTestCase):
+    """Tests for execute()."""
+
+    def test_execute_success_returns_items(self) -> None:
+        """
+        When: The job has processed documents
+        Then: Should return them with pagination metadata
+        """
+        items = [
+            self.make_item(document_id=1),
+            self.make_item(document_id=2, action="skipped"),
+            self.make_item(document_id=3, status="failed", error="not_found"),
+        ]
+        self.mock_repo_instance.list_items.return_value = (items, 3)
+
+        result = self.get_instance().execute(self.test_uuid)
+
+        self.assertEqual(result.job_id, self.test_uuid)
+        self.assertEqual([i.document_id for i in result.items], [1, 2, 3])
+        self.assertEqual(result.items[1].action, "skipped")
+        self.assertEqual(result.items[2].error, "not_found")
+        self.assertEqual(result.total, 3)
+        self.assertEqual(result.total_pages, 1)
+
+    def test_execute_success_pagination_params(self) -> None:
+        """
+        When: Page 3 with page_size 20
+        Then: Should pass skip=40 and limit=20
+        """
+        self.mock_repo_instance.list_items.return_value = ([], 45)
+
+        result = self.get_instance().execute(self.test_uuid, page=3, page_size=20)
+
+        self.mock_repo_instance.list_items.assert_called_once_with(self.test_uuid, skip=40, limit=20)
+        self.assertEqual(result.total_pages, 3)
+
+    def test_execute_error_job_not_found(self) -> None:
+        """
+        When: Job doesn't exist
+        Then: Should raise JobNotFoundException without listing items
+        """
+        self.mock_repo_instance.exists.return_value = False
+
+        with self.assertRaises(JobNotFoundException):
+            self.get_instance().execute(self.test_uuid)
+
+        self.mock_repo_instance.list_items.assert_not_called()
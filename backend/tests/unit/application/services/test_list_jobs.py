@@ -1,9 +1,13 @@
 """Tests for app.application.services.list_jobs.ListJobs."""
 
 import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from uuid import uuid4
 
 from tests.common import BaseTestCase
+from app.application.dtos.job_dtos import JobListView, JobSummaryListResponse
 from app.application.services.list_jobs import ListJobs
 from app.domain.entities.job.job import Job
 from app.domain.entities.job.status import JobStatus
@@ -168,3 +172,30 @@ class TestExecute(ListJobsTestCase):
 
         with self.assertRaises(Exception):
             service.execute()
+
+    def test_execute_success_summary_view(self) -> None:
+        """
+        When: view is summary
+        Then: Should use the projected repository query and return summaries
+        """
+        row = SimpleNamespace(
+            job_id=uuid4(),
+            status="completed",
+            created_at=datetime.now(timezone.utc),
+            completed_at=datetime.now(timezone.utc),
+            error_message=None,
+            document_count=4,
+            processed=3,
+            failed=1,
+        )
+        self.mock_repo_instance.list_summaries.return_value = ([row], 1)
+
+        service = self.get_instance()
+        result = service.execute(page=1, page_size=10, view=JobListView.SUMMARY)
+
+        self.mock_repo_instance.list_all.assert_not_called()
+        self.mock_repo_instance.list_summaries.assert_called_once_with(status=None, skip=0, limit=10)
+        self.assertIsInstance(result, JobSummaryListResponse)
+        self.assertEqual(result.items[0].document_count, 4)
+        self.assertEqual(result.items[0].processed, 3)
+        self.assertEqual(result.items[0].failed, 1)
@@ -95,7 +95,7 @@ class TestExecute(ProcessBatchTestCase):
         Then: Should create job and return response
         """
         doc_id = self.fake.random_int(min=1, max=99_999)
-        self.mock_doc_repo.get_by_id.return_value = self.make_document(id=doc_id)
+        self.mock_doc_repo.existing_ids.return_value = {doc_id}
         created_job = self.make_job(document_ids=[doc_id])
         self.mock_job_repo.create.return_value = created_job
 
@@ -112,7 +112,7 @@ class TestExecute(ProcessBatchTestCase):
         Then: Should dispatch Celery task
         """
         doc_ids = [self.fake.random_int(min=1, max=999) for _ in range(2)]
-        self.mock_doc_repo.get_by_id.return_value = self.make_document(id=doc_ids[0])
+        self.mock_doc_repo.existing_ids.return_value = set(doc_ids)
         created_job = self.make_job(document_ids=doc_ids)
         self.mock_job_repo.create.return_value = created_job
 
@@ -122,28 +122,46 @@ class TestExecute(ProcessBatchTestCase):
 
         self.mock_celery_task.delay.assert_called_once()
 
+    def test_execute_success_profile_sets_message_header(self) -> None:
+        """
+        When: A profile of the run is requested
+        Then: Should dispatch the Celery task with the profile header
+        """
+        doc_ids = [self.fake.random_int(min=1, max=999)]
+        self.mock_doc_repo.existing_ids.return_value = set(doc_ids)
+        created_job = self.make_job(document_ids=doc_ids)
+        self.mock_job_repo.create.return_value = created_job
+
+        service = self.get_instance()
+        service.execute(ProcessBatchRequest(document_ids=doc_ids), profile=True)
+
+        self.mock_celery_task.delay.assert_not_called()
+        _, kwargs = self.mock_celery_task.apply_async.call_args
+        self.assertEqual(kwargs["headers"], {"profile": True})
+
     def test_execute_success_multiple_documents(self) -> None:
         """
         When: Multiple valid document IDs
         Then: Should validate all and create job
         """
         doc_ids = [self.fake.random_int(min=1, max=999) for _ in range(3)]
-        self.mock_doc_repo.get_by_id.return_value = self.make_document()
+        self.mock_doc_repo.existing_ids.return_value = set(doc_ids)
         created_job = self.make_job(document_ids=doc_ids)
         self.mock_job_repo.create.return_value = created_job
 
         request = ProcessBatchRequest(document_ids=doc_ids)
         service = self.get_instance()
-        result = service.execute(request)
+        service.execute(request)
 
-        self.assertEqual(self.mock_doc_repo.get_by_id.call_count, 3)
+        self.mock_doc_repo.existing_ids.assert_called_once_with(doc_ids)
+        self.mock_doc_repo.get_by_id.assert_not_called()
 
     def test_execute_success_returns_job_response(self) -> None:
         """
         When: Job is created
         Then: Should return response with all fields
         """
-        self.mock_doc_repo.get_by_id.return_value = self.make_document()
+        self.mock_doc_repo.existing_ids.return_value = {1}
         created_job = self.make_job()
         self.mock_job_repo.create.return_value = created_job
 
@@ -160,10 +178,7 @@ class TestExecute(ProcessBatchTestCase):
         When: One of the document IDs doesn't exist
         Then: Should raise DocumentNotFoundException
         """
-        self.mock_doc_repo.get_by_id.side_effect = [
-            self.make_document(id=1),
-            None,
-        ]
+        self.mock_doc_repo.existing_ids.return_value = {1}
 
         request = ProcessBatchRequest(document_ids=[1, 999])
         service = self.get_instance()
@@ -176,7 +191,7 @@ class TestExecute(ProcessBatchTestCase):
         When: First document ID doesn't exist
         Then: Should raise DocumentNotFoundException immediately
         """
-        self.mock_doc_repo.get_by_id.return_value = None
+        self.mock_doc_repo.existing_ids.return_value = set()
 
         request = ProcessBatchRequest(document_ids=[999])
         service = self.get_instance()
@@ -191,7 +206,7 @@ class TestExecute(ProcessBatchTestCase):
         When: Document validation fails
         Then: Should not dispatch Celery task
         """
-        self.mock_doc_repo.get_by_id.return_value = None
+        self.mock_doc_repo.existing_ids.return_value = set()
 
         request = ProcessBatchRequest(document_ids=[999])
         service = self.get_instance()
@@ -78,7 +78,7 @@ class TestExecute(SearchDocumentsTestCase):
         Then: Should return PaginatedDocumentsResponse
         """
         docs = [self.make_document(id=i) for i in range(1, 4)]
-        self.mock_repo_instance.search.return_value = (docs, 3)
+        self.mock_repo_instance.search_rows.return_value = (docs, 3)
 
         request = SearchDocumentsRequest()
         service = self.get_instance()
@@ -93,7 +93,7 @@ class TestExecute(SearchDocumentsTestCase):
         When: Search returns no documents
         Then: Should return empty items with total=0
         """
-        self.mock_repo_instance.search.return_value = ([], 0)
+        self.mock_repo_instance.search_rows.return_value = ([], 0)
 
         request = SearchDocumentsRequest()
         service = self.get_instance()
@@ -108,13 +108,13 @@ class TestExecute(SearchDocumentsTestCase):
         When: Filtering by type
         Then: Should pass type filter to repository
         """
-        self.mock_repo_instance.search.return_value = ([], 0)
+        self.mock_repo_instance.search_rows.return_value = ([], 0)
 
         request = SearchDocumentsRequest(type="invoice")
         service = self.get_instance()
         service.execute(request)
 
-        call_kwargs = self.mock_repo_instance.search.call_args
+        call_kwargs = self.mock_repo_instance.search_rows.call_args
         filters = call_kwargs.kwargs.get("filters") or call_kwargs[1].get("filters", call_kwargs[0][0])
         self.assertIn("type", filters)
         self.assertEqual(filters["type"], "invoice")
@@ -124,13 +124,13 @@ class TestExecute(SearchDocumentsTestCase):
         When: Filtering by status
         Then: Should pass status filter to repository
         """
-        self.mock_repo_instance.search.return_value = ([], 0)
+        self.mock_repo_instance.search_rows.return_value = ([], 0)
 
         request = SearchDocumentsRequest(status="pending")
         service = self.get_instance()
         service.execute(request)
 
-        call_kwargs = self.mock_repo_instance.search.call_args
+        call_kwargs = self.mock_repo_instance.search_rows.call_args
         filters = call_kwargs.kwargs.get("filters") or call_kwargs[1].get("filters", call_kwargs[0][0])
         self.assertIn("status", filters)
 
@@ -140,7 +140,7 @@ class TestExecute(SearchDocumentsTestCase):
         Then: Should calculate total_pages correctly
         """
         docs = [self.make_document(id=1)]
-        self.mock_repo_instance.search.return_value = (docs, 25)
+        self.mock_repo_instance.search_rows.return_value = (docs, 25)
 
         request = SearchDocumentsRequest(page=1, page_size=10)
         service = self.get_instance()
@@ -154,13 +154,13 @@ class TestExecute(SearchDocumentsTestCase):
         When: Requesting page 3 with page_size 10
         Then: Should pass skip=20 to repository
         """
-        self.mock_repo_instance.search.return_value = ([], 0)
+        self.mock_repo_instance.search_rows.return_value = ([], 0)
 
         request = SearchDocumentsRequest(page=3, page_size=10)
         service = self.get_instance()
         service.execute(request)
 
-        call_kwargs = self.mock_repo_instance.search.call_args
+        call_kwargs = self.mock_repo_instance.search_rows.call_args
         skip = call_kwargs.kwargs.get("skip") or call_kwargs[1].get("skip", call_kwargs[0][1] if len(call_kwargs[0]) > 1 else None)
         self.assertEqual(skip, 20)
 
@@ -169,14 +169,14 @@ class TestExecute(SearchDocumentsTestCase):
         When: No filters are provided
         Then: Should pass filters dict with all None values
         """
-        self.mock_repo_instance.search.return_value = ([], 0)
+        self.mock_repo_instance.search_rows.return_value = ([], 0)
 
         request = SearchDocumentsRequest()
         service = self.get_instance()
         service.execute(request)
 
-        self.mock_repo_instance.search.assert_called_once()
-        call_args = self.mock_repo_instance.search.call_args
+        self.mock_repo_instance.search_rows.assert_called_once()
+        call_args = self.mock_repo_instance.search_rows.call_args
         if call_args.kwargs.get("filters") is not None:
             filters = call_args.kwargs["filters"]
         else:
@@ -189,10 +189,28 @@ class TestExecute(SearchDocumentsTestCase):
         When: Repository raises exception
         Then: Should propagate
         """
-        self.mock_repo_instance.search.side_effect = Exception("DB error")
+        self.mock_repo_instance.search_rows.side_effect = Exception("DB error")
 
         request = SearchDocumentsRequest()
         service = self.get_instance()
 
         with self.assertRaises(Exception):
             service.execute(request)
+
+    def test_execute_success_sparse_fields(self) -> None:
+        """
+        When: request.fields is given
+        Then: Should use the projected search and return sparse items
+        """
+        self.mock_repo_instance.search_fields.return_value = ([{"id": 1, "status": "draft"}], 1)
+
+        request = SearchDocumentsRequest(status="draft", fields="status")
+        service = self.get_instance()
+        result = service.execute(request)
+
+        self.mock_repo_instance.search_rows.assert_not_called()
+        self.mock_repo_instance.search_fields.assert_called_once_with(
+            filters={"status": "draft"}, fields=["id", "status"], skip=0, limit=50
+        )
+        self.assertEqual(result.items[0].model_dump(exclude_unset=True), {"id": 1, "status": DocumentStatus.DRAFT})
+        self.assertEqual(result.total_pages, 1)
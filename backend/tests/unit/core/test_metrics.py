@@ -0,0 +1,51 @@
+"""Tests for app.core.metrics."""
+
+import tempfile
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY, CONTENT_TYPE_LATEST
+
+from tests.common import BaseTestCase
+
+from app.core import metrics
+
+
+class TestMetricsRegistry(BaseTestCase):
+    """Tests for metrics_registry() and render_metrics()."""
+
+    def test_metrics_registry_success_single_process(self) -> None:
+        with patch.dict("os.environ", {"PROMETHEUS_MULTIPROC_DIR": ""}):
+            self.assertIs(metrics.metrics_registry(), REGISTRY)
+
+    def test_metrics_registry_success_multiprocess(self) -> None:
+        with tempfile.TemporaryDirectory() as directory, patch.dict(
+            "os.environ", {"PROMETHEUS_MULTIPROC_DIR": directory}
+        ):
+            self.assertIsNot(metrics.metrics_registry(), REGISTRY)
+
+    def test_render_metrics_success_text_format(self) -> None:
+        metrics.NOTIFICATION_DELIVERIES.labels(channel="test", outcome="succeeded").inc()
+
+        body, content_type = metrics.render_metrics()
+
+        self.assertEqual(content_type, CONTENT_TYPE_LATEST)
+        self.assertIn(b"notification_deliveries_total", body)
+        self.assertIn(b"http_request_duration_seconds", body)
+
+
+class TestMarkProcessDead(BaseTestCase):
+    """Tests for mark_process_dead()."""
+
+    def test_mark_process_dead_success_noop_single_process(self) -> None:
+        with patch.dict("os.environ", {"PROMETHEUS_MULTIPROC_DIR": ""}), patch(
+            "app.core.metrics.multiprocess.mark_process_dead"
+        ) as mock_mark:
+            metrics.mark_process_dead(123)
+        mock_mark.assert_not_called()
+
+    def test_mark_process_dead_success_multiprocess(self) -> None:
+        with patch.dict("os.environ", {"PROMETHEUS_MULTIPROC_DIR": "/tmp/metrics"}), patch(
+            "app.core.metrics.multiprocess.mark_process_dead"
+        ) as mock_mark:
+            metrics.mark_process_dead(123)
+        mock_mark.assert_called_once_with(123)
@@ -0,0 +1,76 @@
+"""Tests for app.core.profiling."""
+
+import threading
+import time
+
+from tests.common import BaseTestCase
+
+from app.core import profiling
+from app.core.profiling import ProfilerBusy, SamplingProfiler
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(100))
+
+
+class TestSamplingProfiler(BaseTestCase):
+    """Tests for SamplingProfiler."""
+
+    def test_collapsed_success_samples_busy_thread(self) -> None:
+        stop = threading.Event()
+        worker = threading.Thread(target=_spin, args=(stop,))
+        worker.start()
+        try:
+            with SamplingProfiler(interval=0.001, thread_ids={worker.ident}) as profiler:
+                time.sleep(0.1)
+        finally:
+            stop.set()
+            worker.join()
+
+        self.assertGreater(profiler.samples, 0)
+        self.assertGreater(profiler.duration, 0)
+        first_line = profiler.collapsed().splitlines()[0]
+        stack, count = first_line.rsplit(" ", 1)
+        self.assertIn("_spin (test_profiling.py:", stack)
+        self.assertGreater(int(count), 0)
+
+    def test_collapsed_success_skips_idle_threads(self) -> None:
+        stop = threading.Event()
+        waiter = threading.Thread(target=stop.wait)
+        waiter.start()
+        try:
+            with SamplingProfiler(interval=0.001, thread_ids={waiter.ident}) as profiler:
+                time.sleep(0.05)
+        finally:
+            stop.set()
+            waiter.join()
+
+        self.assertGreater(profiler.samples, 0)
+        self.assertEqual(profiler.collapsed(), "")
+
+    def test_start_error_busy(self) -> None:
+        with SamplingProfiler(interval=0.01):
+            self.assertTrue(profiling.is_profiling())
+            with self.assertRaises(ProfilerBusy):
+                SamplingProfiler().start()
+
+        self.assertFalse(profiling.is_profiling())
+
+    def test_stop_success_not_started(self) -> None:
+        profiler = SamplingProfiler().stop()
+
+        self.assertEqual(profiler.samples, 0)
+        self.assertFalse(profiling.is_profiling())
+
+    def test_max_seconds_success_frees_slot_before_stop(self) -> None:
+        profiler = SamplingProfiler(interval=0.001, max_seconds=0.05).start()
+        time.sleep(0.3)
+
+        self.assertFalse(profiling.is_profiling())
+        with SamplingProfiler(interval=0.01):
+            self.assertTrue(profiling.is_profiling())
+        profiler.stop()
+
+        self.assertTrue(profiler.capped)
+        self.assertLess(profiler.duration, 0.25)
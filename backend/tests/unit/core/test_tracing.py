@@ -0,0 +1,173 @@
+"""Tests for app.core.tracing."""
+
+import asyncio
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from tests.common import BaseTestCase
+
+from app.core import tracing
+
+
+class TracingTestCase(BaseTestCase):
+    """Base class: collects spans in memory."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exporter = tracing.InMemoryExporter()
+        tracing.set_exporter(self.exporter)
+
+    def tearDown(self) -> None:
+        tracing.set_exporter(None)
+        super().tearDown()
+
+    def names(self) -> list:
+        return [span.name for span in self.exporter.spans()]
+
+
+class TestSpanContext(BaseTestCase):
+    """Tests for SpanContext traceparent round trip."""
+
+    def test_from_traceparent_success_round_trip(self) -> None:
+        context = tracing.SpanContext("a" * 32, "b" * 16)
+        parsed = tracing.SpanContext.from_traceparent(context.to_traceparent())
+
+        self.assertEqual((parsed.trace_id, parsed.span_id), ("a" * 32, "b" * 16))
+
+    def test_from_traceparent_error_malformed(self) -> None:
+        self.assertIsNone(tracing.SpanContext.from_traceparent(None))
+        self.assertIsNone(tracing.SpanContext.from_traceparent("00-xyz-abc-01"))
+        self.assertIsNone(tracing.SpanContext.from_traceparent(f"00-{'z' * 32}-{'b' * 16}-01"))
+
+
+class TestStartSpan(TracingTestCase):
+    """Tests for start_span() and the current span context."""
+
+    def test_start_span_success_nested_spans_share_trace(self) -> None:
+        with tracing.start_span("parent") as parent, tracing.start_span("child") as child:
+            self.assertIs(tracing.current_span(), child)
+
+        self.assertEqual(self.names(), ["child", "parent"])
+        self.assertEqual(child.context.trace_id, parent.context.trace_id)
+        self.assertEqual(child.parent_id, parent.context.span_id)
+        self.assertIsNone(parent.parent_id)
+        self.assertIsNone(tracing.current_span())
+
+    def test_start_span_error_records_exception(self) -> None:
+        with self.assertRaises(ValueError), tracing.start_span("failing"):
+            raise ValueError("boom")
+
+        span = self.exporter.spans()[0]
+        self.assertEqual(span.status, "error")
+        self.assertEqual(span.status_message, "ValueError: boom")
+
+    def test_start_span_success_explicit_remote_parent(self) -> None:
+        remote = tracing.SpanContext("c" * 32, "d" * 16)
+
+        with tracing.start_span("server", parent=remote, kind=tracing.KIND_SERVER) as span:
+            pass
+
+        self.assertEqual(span.context.trace_id, "c" * 32)
+        self.assertEqual(span.parent_id, "d" * 16)
+        self.assertEqual(span.to_dict()["kind"], "server")
+
+    def test_start_span_success_disabled_is_noop(self) -> None:
+        tracing.set_exporter(None)
+
+        with tracing.start_span("ignored") as span:
+            span.set_attribute("key", "value")
+            self.assertIsNone(tracing.current_span())
+
+        self.assertIs(span, tracing.NOOP_SPAN)
+        self.assertEqual(self.exporter.spans(), [])
+
+    def test_set_span_attributes_success_active_span(self) -> None:
+        with tracing.start_span("work") as span:
+            tracing.set_span_attributes({"job.id": "abc"})
+
+        tracing.set_span_attributes({"ignored": True})
+        self.assertEqual(span.attributes, {"job.id": "abc"})
+
+
+class TestPropagation(TracingTestCase):
+    """Tests for inject() and extract()."""
+
+    def test_inject_extract_success_continues_trace(self) -> None:
+        headers: dict = {}
+        with tracing.start_span("producer") as span:
+            tracing.inject(headers)
+
+        context = tracing.extract(headers)
+        self.assertEqual(context.trace_id, span.context.trace_id)
+        self.assertEqual(context.span_id, span.context.span_id)
+
+    def test_inject_success_without_span(self) -> None:
+        headers: dict = {}
+        tracing.inject(headers)
+        self.assertEqual(headers, {})
+        self.assertIsNone(tracing.extract(None))
+
+
+class TestTraced(TracingTestCase):
+    """Tests for traced() and traced_methods()."""
+
+    def test_traced_success_sync_function(self) -> None:
+        @tracing.traced()
+        def compute(x: int) -> int:
+            return x * 2
+
+        self.assertEqual(compute(21), 42)
+        self.assertEqual(self.names(), [compute.__wrapped__.__qualname__])
+
+    def test_traced_success_coroutine_function(self) -> None:
+        @tracing.traced("async work")
+        async def work() -> str:
+            return "done"
+
+        self.assertEqual(asyncio.run(work()), "done")
+        self.assertEqual(self.names(), ["async work"])
+
+    def test_traced_methods_success_public_methods_only(self) -> None:
+        @tracing.traced_methods
+        class Repository:
+            def find(self) -> str:
+                return self._helper()
+
+            def _helper(self) -> str:
+                return "row"
+
+        self.assertEqual(Repository().find(), "row")
+        self.assertEqual(self.names(), ["Repository.find"])
+
+
+class TestExporters(BaseTestCase):
+    """Tests for get_exporter() and FileExporter."""
+
+    def tearDown(self) -> None:
+        tracing.set_exporter(None)
+        super().tearDown()
+
+    def test_file_exporter_success_writes_json_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces.jsonl")
+            tracing.set_exporter(tracing.FileExporter(path))
+
+            with tracing.start_span("parent"), tracing.start_span("child", attributes={"n": 1}):
+                pass
+
+            with open(path) as file:
+                spans = [json.loads(line) for line in file]
+
+        self.assertEqual([span["name"] for span in spans], ["child", "parent"])
+        self.assertEqual(spans[0]["parentSpanId"], spans[1]["spanId"])
+        self.assertEqual(spans[0]["attributes"], {"n": 1})
+        self.assertEqual(spans[1]["status"]["code"], "ok")
+
+    def test_get_exporter_success_from_settings(self) -> None:
+        with patch.object(tracing, "_exporter_configured", False), patch.object(tracing, "_exporter", None), patch(
+            "app.core.tracing.settings"
+        ) as mock_settings:
+            mock_settings.TRACING_EXPORTER = "memory"
+            self.assertIsInstance(tracing.get_exporter(), tracing.InMemoryExporter)
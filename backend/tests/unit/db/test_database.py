@@ -23,3 +23,83 @@ class TestInfraGetDb(BaseTestCase):
         except StopIteration:
             pass
         mock_session.close.assert_called_once()
+
+
+class TestCreateDbEngine(BaseTestCase):
+    """Tests for app.infrastructure.database.session.create_db_engine()."""
+
+    def _create(self, **overrides) -> MagicMock:  # noqa: ANN003
+        from app.infrastructure.database.session import create_db_engine
+
+        with patch("app.infrastructure.database.session.settings") as mock_settings, patch(
+            "app.infrastructure.database.session.create_engine"
+        ) as mock_create, patch("app.infrastructure.database.session.instrument_engine"), patch(
+            "app.infrastructure.database.session.enable_slow_query_log"
+        ):
+            mock_settings.DB_PGBOUNCER = False
+            mock_settings.DB_POOL_TIMEOUT_SECONDS = 5.0
+            mock_settings.DB_POOL_RECYCLE_SECONDS = 600
+            mock_settings.DB_POOL_PRE_PING = False
+            mock_settings.DB_POOL_USE_LIFO = True
+            for key, value in overrides.items():
+                setattr(mock_settings, key, value)
+            create_db_engine(pool_size=7, max_overflow=3)
+        return mock_create
+
+    def test_create_db_engine_success_queue_pool_settings(self) -> None:
+        from app.infrastructure.database.instrumentation import InstrumentedQueuePool
+
+        kwargs = self._create().call_args.kwargs
+
+        self.assertIs(kwargs["poolclass"], InstrumentedQueuePool)
+        self.assertEqual(kwargs["pool_size"], 7)
+        self.assertEqual(kwargs["max_overflow"], 3)
+        self.assertEqual(kwargs["pool_timeout"], 5.0)
+        self.assertEqual(kwargs["pool_recycle"], 600)
+        self.assertFalse(kwargs["pool_pre_ping"])
+        self.assertTrue(kwargs["pool_use_lifo"])
+
+    def test_create_db_engine_success_pgbouncer_uses_null_pool(self) -> None:
+        from sqlalchemy.pool import NullPool
+
+        kwargs = self._create(DB_PGBOUNCER=True).call_args.kwargs
+
+        self.assertIs(kwargs["poolclass"], NullPool)
+        self.assertNotIn("pool_size", kwargs)
+        self.assertNotIn("pool_pre_ping", kwargs)
+
+    def test_engines_success_api_and_worker_pools_are_separate(self) -> None:
+        from app.infrastructure.database.session import engine, worker_engine
+
+        self.assertIsNot(engine.pool, worker_engine.pool)
+
+
+class TestSkipAudit(BaseTestCase):
+    """Tests for app.infrastructure.database.session.skip_audit()."""
+
+    def test_skip_audit_success_once_per_transaction(self) -> None:
+        from app.infrastructure.database.session import skip_audit
+
+        db = MagicMock()
+        db.info = {}
+        first, second = MagicMock(), MagicMock()
+        db.get_transaction.return_value = first
+
+        skip_audit(db)
+        skip_audit(db)
+        db.get_transaction.return_value = second
+        skip_audit(db)
+
+        self.assertEqual(db.execute.call_count, 2)
+        self.assertIn("SET LOCAL app.skip_audit", str(db.execute.call_args[0][0]))
+
+    def test_skip_audit_success_outside_transaction(self) -> None:
+        from app.infrastructure.database.session import skip_audit
+
+        db = MagicMock()
+        db.info = {}
+        db.get_transaction.return_value = None
+
+        skip_audit(db)
+
+        db.execute.assert_called_once()
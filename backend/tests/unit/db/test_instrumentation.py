@@ -0,0 +1,149 @@
+"""Tests for app.infrastructure.database.instrumentation."""
+
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.database.instrumentation import (
+    InstrumentedQueuePool,
+    QueryStats,
+    StatementBudgetExceeded,
+    check_statement_budget,
+    current_query_stats,
+    instrument_engine,
+    start_query_tracking,
+    statement_budget,
+    statement_operation,
+    stop_query_tracking,
+    track_queries,
+)
+
+
+def _sample(name: str, labels: dict | None = None) -> float:
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+class TestStatementOperation(BaseTestCase):
+    """Tests for statement_operation()."""
+
+    def test_statement_operation_success_known_keywords(self) -> None:
+        self.assertEqual(statement_operation("SELECT 1"), "SELECT")
+        self.assertEqual(statement_operation("\n  update finance.documents SET x = 1"), "UPDATE")
+        self.assertEqual(statement_operation("WITH a AS (SELECT 1) SELECT * FROM a"), "WITH")
+
+    def test_statement_operation_success_other(self) -> None:
+        self.assertEqual(statement_operation("VACUUM"), "OTHER")
+        self.assertEqual(statement_operation("   "), "OTHER")
+
+
+class TestInstrumentEngine(BaseTestCase):
+    """Tests for instrument_engine() and InstrumentedQueuePool."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = instrument_engine(create_engine("sqlite://", poolclass=InstrumentedQueuePool))
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        super().tearDown()
+
+    def test_instrument_engine_success_times_statements(self) -> None:
+        before = _sample("db_statement_duration_seconds_count", {"operation": "SELECT"})
+
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        self.assertEqual(_sample("db_statement_duration_seconds_count", {"operation": "SELECT"}) - before, 2)
+
+    def test_instrument_engine_error_failed_statement_leaves_no_start_time(self) -> None:
+        with self.engine.connect() as conn:
+            for _ in range(3):
+                with self.assertRaises(OperationalError):
+                    conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+
+            self.assertNotIn("query_start_time", conn.connection.info)
+
+    def test_instrument_engine_success_tracks_checkouts(self) -> None:
+        waits_before = _sample("db_pool_checkout_wait_seconds_count")
+        in_use_before = _sample("db_pool_connections_in_use")
+
+        with self.engine.connect() as conn:
+            self.assertEqual(_sample("db_pool_connections_in_use") - in_use_before, 1)
+            conn.execute(text("SELECT 1"))
+
+        self.assertEqual(_sample("db_pool_connections_in_use"), in_use_before)
+        self.assertEqual(_sample("db_pool_checkout_wait_seconds_count") - waits_before, 1)
+
+
+class TestTrackQueries(BaseTestCase):
+    """Tests for track_queries() and the tracking helpers."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = instrument_engine(create_engine("sqlite://", poolclass=InstrumentedQueuePool))
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        super().tearDown()
+
+    def test_track_queries_success_counts_statements(self) -> None:
+        with track_queries() as stats, self.engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text(f"SELECT {i}"))
+
+        self.assertEqual(stats.statements, 3)
+        self.assertGreater(stats.duration_ms, 0)
+        self.assertIsNone(current_query_stats())
+
+    def test_track_queries_success_nested_scopes(self) -> None:
+        with track_queries() as outer, self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with track_queries() as inner:
+                conn.execute(text("SELECT 2"))
+            self.assertIs(current_query_stats(), outer)
+
+        self.assertEqual(outer.statements, 1)
+        self.assertEqual(inner.statements, 1)
+
+    def test_stop_query_tracking_success_returns_stats(self) -> None:
+        token = start_query_tracking()
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        self.assertEqual(stop_query_tracking(token).statements, 1)
+        self.assertIsNone(current_query_stats())
+
+
+class TestStatementBudget(BaseTestCase):
+    """Tests for statement_budget() and check_statement_budget()."""
+
+    def test_statement_budget_success_override(self) -> None:
+        with patch("app.infrastructure.database.instrumentation.settings") as mock_settings:
+            mock_settings.DB_STATEMENT_BUDGETS = {"GET /api/v1/jobs": 3}
+            self.assertEqual(statement_budget("GET /api/v1/jobs", 20), 3)
+            self.assertEqual(statement_budget("GET /api/v1/documents", 20), 20)
+            self.assertEqual(statement_budget("process_documents_batch"), 0)
+
+    def test_check_statement_budget_success_within_budget(self) -> None:
+        check_statement_budget("GET /x", QueryStats(statements=3), 3)
+        check_statement_budget("GET /x", QueryStats(statements=300), 0)
+
+    def test_check_statement_budget_error_strict_raises(self) -> None:
+        with patch("app.infrastructure.database.instrumentation.settings") as mock_settings:
+            mock_settings.DB_STATEMENT_BUDGET_STRICT = True
+            with self.assertRaises(StatementBudgetExceeded):
+                check_statement_budget("GET /x", QueryStats(statements=4), 3)
+
+    def test_check_statement_budget_error_logs_warning(self) -> None:
+        with patch("app.infrastructure.database.instrumentation.settings") as mock_settings:
+            mock_settings.DB_STATEMENT_BUDGET_STRICT = False
+            with self.assertLogs("app.infrastructure.database.instrumentation", level="WARNING") as logs:
+                check_statement_budget("GET /x", QueryStats(statements=4), 3)
+
+        self.assertIn("GET /x ran 4 SQL statements (budget 3", logs.output[0])
@@ -0,0 +1,197 @@
+"""Tests for app.infrastructure.database.slow_queries."""
+
+import os
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.database import slow_queries
+from app.infrastructure.database.slow_queries import (
+    SlowQuery,
+    SlowQueryLog,
+    caller_location,
+    enable_slow_query_log,
+    explain,
+    explain_sql,
+    parameter_shapes,
+)
+
+
+class TestParameterShapes(BaseTestCase):
+    """Tests for parameter_shapes()."""
+
+    def test_parameter_shapes_success_hides_values(self) -> None:
+        shapes = parameter_shapes({"email": self.fake.email(), "ids": [1, 2, 3], "at": datetime.now()})
+        self.assertEqual(shapes, {"email": "str", "ids": "list[3]", "at": "datetime"})
+
+    def test_parameter_shapes_success_positional(self) -> None:
+        self.assertEqual(parameter_shapes((1, "a", None)), ["int", "str", "NoneType"])
+
+    def test_parameter_shapes_success_executemany(self) -> None:
+        shapes = parameter_shapes([{"id": 1}, {"id": 2}], executemany=True)
+        self.assertEqual(shapes, {"rows": 2, "row": {"id": "int"}})
+
+
+class TestCallerLocation(BaseTestCase):
+    """Tests for caller_location()."""
+
+    def test_caller_location_success_application_frame(self) -> None:
+        namespace: dict = {"caller_location": caller_location}
+        filename = os.path.join(slow_queries._APP_DIR, "repositories", "docs.py")
+        code = compile("def search_rows():\n    return caller_location()\n", filename, "exec")
+        exec(code, namespace)  # noqa: S102
+
+        self.assertEqual(namespace["search_rows"](), "app/repositories/docs.py:2 in search_rows")
+
+    def test_caller_location_success_ignores_other_app_directories(self) -> None:
+        namespace: dict = {"caller_location": caller_location}
+        code = compile("def run():\n    return caller_location()\n", "/srv/other/app/tasks.py", "exec")
+        exec(code, namespace)  # noqa: S102
+
+        self.assertEqual(namespace["run"](), "unknown")
+
+    def test_caller_location_success_unknown_outside_app(self) -> None:
+        self.assertEqual(caller_location(), "unknown")
+
+
+class TestSlowQueryLog(BaseTestCase):
+    """Tests for SlowQueryLog."""
+
+    def test_entries_success_slowest_first_and_bounded(self) -> None:
+        log = SlowQueryLog(max_entries=2)
+        for duration in (300.0, 500.0, 400.0):
+            log.add(SlowQuery("SELECT 1", [], duration, "unknown"))
+
+        self.assertEqual([entry.duration_ms for entry in log.entries()], [500.0, 400.0])
+        log.clear()
+        self.assertEqual(log.entries(), [])
+
+
+class TestSlowQueryHook(BaseTestCase):
+    """Tests for the engine listeners."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        slow_queries.slow_query_log.clear()
+        self.engine = enable_slow_query_log(create_engine("sqlite://"))
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        slow_queries.slow_query_log.clear()
+        super().tearDown()
+
+    def test_hook_success_records_statement_over_threshold(self) -> None:
+        with patch("app.infrastructure.database.slow_queries.settings") as mock_settings:
+            mock_settings.SLOW_QUERY_THRESHOLD_MS = 1e-9
+            mock_settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE = 1.0
+            with self.assertLogs("app.infrastructure.database.slow_queries", level="WARNING"), self.engine.connect() as conn:
+                conn.execute(text("SELECT :value"), {"value": "secret"})
+
+        (entry,) = slow_queries.slow_query_log.entries()
+        self.assertIn("SELECT", entry.statement)
+        self.assertNotIn("secret", str(entry.parameters))
+        self.assertIsNone(entry.plan)
+
+    def test_hook_success_ignores_fast_statements(self) -> None:
+        with patch("app.infrastructure.database.slow_queries.settings") as mock_settings:
+            mock_settings.SLOW_QUERY_THRESHOLD_MS = 60_000
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        self.assertEqual(slow_queries.slow_query_log.entries(), [])
+
+    def test_hook_error_failed_statement_leaves_no_start_time(self) -> None:
+        with patch("app.infrastructure.database.slow_queries.settings") as mock_settings:
+            mock_settings.SLOW_QUERY_THRESHOLD_MS = 60_000
+            with self.engine.connect() as conn:
+                for _ in range(3):
+                    with self.assertRaises(OperationalError):
+                        conn.execute(text("SELECT * FROM missing_table"))
+                conn.execute(text("SELECT 1"))
+
+                self.assertNotIn(slow_queries._START_KEY, conn.connection.info)
+
+    def test_hook_success_samples_postgres_selects_for_explain(self) -> None:
+        conn = MagicMock()
+        conn.info = {slow_queries._START_KEY: 0.0}
+        conn.engine.dialect.name = "postgresql"
+
+        with patch("app.infrastructure.database.slow_queries.settings") as mock_settings, patch(
+            "app.infrastructure.database.slow_queries._submit_explain"
+        ) as mock_submit:
+            mock_settings.SLOW_QUERY_THRESHOLD_MS = 1.0
+            mock_settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE = 1.0
+            slow_queries._after_cursor_execute(conn, None, "SELECT * FROM t WHERE id = %(id)s", {"id": 1}, None, False)
+            conn.info[slow_queries._START_KEY] = 0.0
+            slow_queries._after_cursor_execute(conn, None, "UPDATE t SET x = 1", {}, None, False)
+            conn.info[slow_queries._START_KEY] = 0.0
+            slow_queries._after_cursor_execute(conn, None, "SELECT * FROM t FOR UPDATE", {}, None, False)
+
+        self.assertEqual(mock_submit.call_count, 3)
+        self.assertEqual(len(slow_queries.slow_query_log.entries()), 3)
+
+    def test_hook_success_skips_non_explainable_statements(self) -> None:
+        conn = MagicMock()
+        conn.info = {slow_queries._START_KEY: 0.0}
+        conn.engine.dialect.name = "postgresql"
+
+        with patch("app.infrastructure.database.slow_queries.settings") as mock_settings, patch(
+            "app.infrastructure.database.slow_queries._submit_explain"
+        ) as mock_submit:
+            mock_settings.SLOW_QUERY_THRESHOLD_MS = 1.0
+            mock_settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE = 1.0
+            slow_queries._after_cursor_execute(conn, None, "VACUUM ANALYZE finance.documents", {}, None, False)
+
+        mock_submit.assert_not_called()
+
+
+class TestExplainSql(BaseTestCase):
+    """Tests for explain_sql()."""
+
+    def test_explain_sql_success_analyzes_plain_select(self) -> None:
+        sql = explain_sql("SELECT * FROM finance.documents WHERE updated_at > now()")
+        self.assertTrue(sql.startswith("EXPLAIN (ANALYZE, BUFFERS) SELECT"))
+
+    def test_explain_sql_success_plain_explain_for_writes_locks_and_ctes(self) -> None:
+        for statement in (
+            "WITH moved AS (UPDATE finance.documents SET status = 'pending' RETURNING id) SELECT * FROM moved",
+            "WITH recent AS (SELECT id FROM finance.documents) SELECT * FROM recent",
+            "SELECT * FROM finance.documents FOR UPDATE SKIP LOCKED",
+            "SELECT * FROM finance.documents FOR KEY SHARE",
+            "INSERT INTO finance.outbox (payload) VALUES ('{}')",
+            "select * from t where id in (delete from u returning id)",
+        ):
+            with self.subTest(statement=statement):
+                self.assertEqual(explain_sql(statement), f"EXPLAIN {statement}")
+
+
+class TestExplain(BaseTestCase):
+    """Tests for explain()."""
+
+    def test_explain_success_attaches_plan_and_rolls_back(self) -> None:
+        engine = MagicMock()
+        conn = engine.connect.return_value.__enter__.return_value
+        conn.info = {}
+        conn.exec_driver_sql.return_value = [("Index Scan using documents_pkey",), ("Execution Time: 0.1 ms",)]
+        entry = SlowQuery("SELECT 1", [], 500.0, "unknown")
+
+        explain(engine, entry, "SELECT * FROM finance.documents WHERE id = %(id)s", {"id": 1})
+
+        self.assertEqual(entry.plan, "Index Scan using documents_pkey\nExecution Time: 0.1 ms")
+        self.assertTrue(conn.exec_driver_sql.call_args.args[0].startswith("EXPLAIN (ANALYZE, BUFFERS) SELECT"))
+        conn.rollback.assert_called_once()
+        self.assertNotIn(slow_queries._EXPLAIN_KEY, conn.info)
+
+    def test_explain_error_logged_and_ignored(self) -> None:
+        engine = create_engine("sqlite://")
+        entry = SlowQuery("SELECT 1", [], 500.0, "unknown")
+
+        with self.assertLogs("app.infrastructure.database.slow_queries", level="WARNING"):
+            explain(engine, entry, "SELECT 1", ())
+
+        self.assertIsNone(entry.plan)
+        engine.dispose()
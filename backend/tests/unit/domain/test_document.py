@@ -84,6 +84,17 @@ class TestUnderScoreUnderScoreInit(DocumentTestCase):
         with self.assertRaises(InvalidAmountException):
             Document(type="invoice", amount=Decimal("-100"))
 
+    def test_init_success_slotted(self) -> None:
+        """
+        When: Document is created
+        Then: Should have no per-instance __dict__ and reject unknown attributes
+        """
+        doc = self.get_instance()
+
+        self.assertFalse(hasattr(doc, "__dict__"))
+        with self.assertRaises(AttributeError):
+            doc.unknown = self.fake.word()
+
 
 class TestChangeStatus(DocumentTestCase):
     """Tests for change_status()."""
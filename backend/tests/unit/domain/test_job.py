@@ -81,6 +81,14 @@ class TestUnderScoreUnderScoreInit(JobTestCase):
         job = self.get_instance(document_ids=[single_id])
         self.assertEqual(job.document_ids, [single_id])
 
+    def test_init_success_slotted(self) -> None:
+        """
+        When: Job is created
+        Then: Should have no per-instance __dict__
+        """
+        job = self.get_instance()
+        self.assertFalse(hasattr(job, "__dict__"))
+
 
 class TestStartProcessing(JobTestCase):
     """Tests for start_processing()."""
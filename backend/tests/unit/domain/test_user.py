@@ -220,3 +220,12 @@ class TestUserAttributes(UserTestCase):
         """
         user = self.get_instance(role=None)
         self.assertIsNone(user.role)
+
+    def test_user_attributes_slotted(self) -> None:
+        """
+        When: User is created
+        Then: Should have no per-instance __dict__ and keep dataclass equality
+        """
+        user = self.get_instance()
+        self.assertFalse(hasattr(user, "__dict__"))
+        self.assertEqual(user, self.get_instance())
@@ -81,3 +81,18 @@ class TestCheckRateLimit(RedisClientTestCase):
         allowed, _, retry = self.client.check_rate_limit("key1")
         self.assertFalse(allowed)
         self.assertEqual(retry, 1)
+
+
+class TestCommandMetrics(RedisClientTestCase):
+    """Tests for Redis command latency metrics."""
+
+    def test_command_success_observes_latency(self) -> None:
+        from prometheus_client import REGISTRY
+
+        labels = {"command": "exists"}
+        before = REGISTRY.get_sample_value("redis_command_duration_seconds_count", labels) or 0.0
+        self.mock_redis.exists.return_value = 1
+
+        self.client.is_key_cached_valid(self.fake.sha256())
+
+        self.assertEqual(REGISTRY.get_sample_value("redis_command_duration_seconds_count", labels) - before, 1)
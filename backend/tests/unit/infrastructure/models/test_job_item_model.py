@@ -0,0 +1,29 @@
+"""Tests for app.infrastructure.database.models.job_item.JobItemModel.to_dict."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from tests.common import BaseTestCase
+
+
+class TestJobItemModelToDict(BaseTestCase):
+    """Tests for JobItemModel.to_dict()."""
+
+    def _make_model(self) -> MagicMock:
+        model = MagicMock()
+        model.id = self.fake.random_int()
+        model.job_id = uuid4()
+        model.document_id = self.fake.random_int(min=1, max=999)
+        model.status = "failed"
+        model.action = None
+        model.error = "not_found"
+        return model
+
+    def test_to_dict_success_returns_detail_keys(self) -> None:
+        from app.infrastructure.database.models.job_item import JobItemModel
+
+        model = self._make_model()
+        result = JobItemModel.to_dict(model)
+        self.assertEqual(set(result.keys()), {"document_id", "status", "action", "error"})
+        self.assertEqual(result["document_id"], model.document_id)
+        self.assertEqual(result["error"], "not_found")
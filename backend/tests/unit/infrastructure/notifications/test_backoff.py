@@ -0,0 +1,24 @@
+"""Tests for app.infrastructure.notifications.backoff."""
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.notifications.backoff import backoff_delay
+
+
+class TestBackoffDelay(BaseTestCase):
+    """Tests for backoff_delay()."""
+
+    def test_backoff_delay_success_exponential_with_jitter(self) -> None:
+        for attempt, full in enumerate([2, 4, 8]):
+            delay = backoff_delay(2, attempt)
+            self.assertGreaterEqual(delay, full / 2)
+            self.assertLessEqual(delay, full)
+
+    def test_backoff_delay_success_capped(self) -> None:
+        delay = backoff_delay(30, 10, cap=600)
+        self.assertGreaterEqual(delay, 300)
+        self.assertLessEqual(delay, 600)
+
+    def test_backoff_delay_success_jittered(self) -> None:
+        delays = {backoff_delay(10, 3) for _ in range(20)}
+        self.assertGreater(len(delays), 1)
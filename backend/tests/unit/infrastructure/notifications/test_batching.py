@@ -0,0 +1,72 @@
+"""Tests for app.infrastructure.notifications.channels.batching.PayloadBatcher."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.notifications.channels.batching import PayloadBatcher
+
+
+class TestPayloadBatcher(BaseTestCase):
+    """Tests for PayloadBatcher.submit()."""
+
+    def test_submit_success_flushes_on_max_size(self) -> None:
+        flush = AsyncMock()
+        batcher = PayloadBatcher(flush, max_size=2, linger_seconds=60)
+
+        async def run() -> None:
+            await asyncio.wait_for(asyncio.gather(batcher.submit({"n": 1}), batcher.submit({"n": 2})), timeout=1)
+
+        asyncio.run(run())
+
+        flush.assert_awaited_once_with([{"n": 1}, {"n": 2}])
+
+    def test_submit_success_flushes_after_linger(self) -> None:
+        flush = AsyncMock()
+        batcher = PayloadBatcher(flush, max_size=100, linger_seconds=0.05)
+
+        async def run() -> float:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(batcher.submit({"n": 1}), batcher.submit({"n": 2}))
+            return loop.time() - start
+
+        elapsed = asyncio.run(run())
+
+        flush.assert_awaited_once_with([{"n": 1}, {"n": 2}])
+        self.assertGreaterEqual(elapsed, 0.04)
+
+    def test_submit_success_splits_into_batches(self) -> None:
+        flush = AsyncMock()
+        batcher = PayloadBatcher(flush, max_size=2, linger_seconds=0.05)
+
+        async def run() -> None:
+            await asyncio.gather(*(batcher.submit({"n": n}) for n in range(5)))
+
+        asyncio.run(run())
+
+        self.assertEqual(
+            [c.args[0] for c in flush.await_args_list],
+            [[{"n": 0}, {"n": 1}], [{"n": 2}, {"n": 3}], [{"n": 4}]],
+        )
+
+    def test_submit_error_propagates_flush_failure(self) -> None:
+        flush = AsyncMock(side_effect=ConnectionError("down"))
+        batcher = PayloadBatcher(flush, max_size=2, linger_seconds=60)
+
+        async def run() -> list:
+            return await asyncio.gather(batcher.submit({"n": 1}), batcher.submit({"n": 2}), return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+
+    def test_submit_success_new_event_loop_starts_fresh(self) -> None:
+        flush = AsyncMock()
+        batcher = PayloadBatcher(flush, max_size=1, linger_seconds=60)
+
+        asyncio.run(batcher.submit({"n": 1}))
+        asyncio.run(batcher.submit({"n": 2}))
+
+        self.assertEqual([c.args[0] for c in flush.await_args_list], [[{"n": 1}], [{"n": 2}]])
@@ -0,0 +1,78 @@
+"""Tests for app.infrastructure.notifications.clients.body_encoder.BodyEncoder."""
+
+import gzip
+import hashlib
+import hmac
+import json
+from unittest.mock import patch
+
+import zstandard
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.notifications.clients.body_encoder import SIGNATURE_HEADER, BodyEncoder
+
+
+class TestBodyEncoderInit(BaseTestCase):
+    """Tests for BodyEncoder.__init__."""
+
+    def test_init_error_unknown_compression(self) -> None:
+        with self.assertRaises(ValueError):
+            BodyEncoder(compression="brotli")
+
+    def test_init_success_zstd_falls_back_to_gzip_when_unavailable(self) -> None:
+        with patch("app.infrastructure.notifications.clients.body_encoder.ZSTD_AVAILABLE", False):
+            encoder = BodyEncoder(compression="zstd")
+        self.assertEqual(encoder.compression, "gzip")
+
+
+class TestBodyEncoderEncode(BaseTestCase):
+    """Tests for BodyEncoder.encode()."""
+
+    def setUp(self) -> None:
+        self.payload = {"job_id": self.fake.uuid4(), "document_ids": list(range(500))}
+
+    def test_encode_success_plain_json(self) -> None:
+        body, headers = BodyEncoder().encode(self.payload)
+
+        self.assertEqual(json.loads(body), self.payload)
+        self.assertEqual(headers, {"Content-Type": "application/json"})
+
+    def test_encode_success_batch_array(self) -> None:
+        body, _ = BodyEncoder().encode([self.payload, self.payload])
+        self.assertEqual(json.loads(body), [self.payload, self.payload])
+
+    def test_encode_success_below_threshold_not_compressed(self) -> None:
+        body, headers = BodyEncoder(compression="gzip", compress_min_bytes=10_000).encode(self.payload)
+
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertEqual(json.loads(body), self.payload)
+
+    def test_encode_success_gzip(self) -> None:
+        body, headers = BodyEncoder(compression="gzip", compress_min_bytes=0).encode(self.payload)
+
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(body)), self.payload)
+
+    def test_encode_success_gzip_deterministic(self) -> None:
+        encoder = BodyEncoder(compression="gzip", compress_min_bytes=0)
+        self.assertEqual(encoder.encode(self.payload)[0], encoder.encode(self.payload)[0])
+
+    def test_encode_success_zstd(self) -> None:
+        body, headers = BodyEncoder(compression="zstd", compress_min_bytes=0).encode(self.payload)
+
+        self.assertEqual(headers["Content-Encoding"], "zstd")
+        self.assertEqual(json.loads(zstandard.ZstdDecompressor().decompress(body)), self.payload)
+
+    def test_encode_success_signature_over_sent_bytes(self) -> None:
+        secret = self.fake.password()
+        body, headers = BodyEncoder(compression="gzip", compress_min_bytes=0, signing_secret=secret).encode(
+            self.payload
+        )
+
+        expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+        self.assertEqual(headers[SIGNATURE_HEADER], f"sha256={expected}")
+
+    def test_encode_success_unsigned_without_secret(self) -> None:
+        _, headers = BodyEncoder().encode(self.payload)
+        self.assertNotIn(SIGNATURE_HEADER, headers)
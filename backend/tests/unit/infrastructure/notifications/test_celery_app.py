@@ -14,3 +14,280 @@ class TestConfigureLogging(BaseTestCase):
 
             configure_logging()
             mock_setup.assert_called_once()
+
+
+class TestTaskRoutes(BaseTestCase):
+    """Tests for celery_app task routing."""
+
+    def test_task_routes_success_notifications_queue(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import celery_app
+
+        self.assertEqual(celery_app.conf.task_routes["relay_outbox"], {"queue": "notifications"})
+
+    def test_beat_schedule_success_relays_outbox(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import celery_app
+
+        self.assertEqual(celery_app.conf.beat_schedule["relay-outbox"]["task"], "relay_outbox")
+
+
+class TestCloseNotificationPool(BaseTestCase):
+    """Tests for the close_notification_pool shutdown signal handler."""
+
+    def test_close_notification_pool_success_closes_event_loop(self) -> None:
+        with patch("app.infrastructure.notifications.tasks.event_loop.close_event_loop") as mock_close:
+            from app.infrastructure.notifications.tasks.celery_app import close_notification_pool
+
+            close_notification_pool()
+            mock_close.assert_called_once()
+
+
+class TestStartMetricsServer(BaseTestCase):
+    """Tests for the start_metrics_server worker_init signal handler."""
+
+    def test_start_metrics_server_success_listens_on_port(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import start_metrics_server
+
+        with patch("app.infrastructure.notifications.tasks.celery_app.settings") as mock_settings, patch(
+            "prometheus_client.start_http_server"
+        ) as mock_start:
+            mock_settings.CELERY_METRICS_PORT = 9808
+            start_metrics_server()
+
+        mock_start.assert_called_once()
+        self.assertEqual(mock_start.call_args[0][0], 9808)
+
+    def test_start_metrics_server_success_disabled(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import start_metrics_server
+
+        with patch("app.infrastructure.notifications.tasks.celery_app.settings") as mock_settings, patch(
+            "prometheus_client.start_http_server"
+        ) as mock_start:
+            mock_settings.CELERY_METRICS_PORT = 0
+            start_metrics_server()
+
+        mock_start.assert_not_called()
+
+
+class TestResetWorkerEngine(BaseTestCase):
+    """Tests for the reset_worker_engine worker_process_init signal handler."""
+
+    def test_reset_worker_engine_success_disposes_without_closing(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import reset_worker_engine
+
+        with patch("app.infrastructure.database.session.worker_engine") as mock_engine:
+            reset_worker_engine()
+
+        mock_engine.dispose.assert_called_once_with(close=False)
+
+
+class TestWorkerHeartbeat(BaseTestCase):
+    """Tests for the start_worker_heartbeat / stop_worker_heartbeat signal handlers."""
+
+    def test_worker_heartbeat_success_starts_and_stops(self) -> None:
+        import fakeredis
+
+        from app.infrastructure.health import HEARTBEAT_KEY
+        from app.infrastructure.notifications.tasks.celery_app import start_worker_heartbeat, stop_worker_heartbeat
+
+        client = fakeredis.FakeRedis(decode_responses=True)
+        worker = type("Consumer", (), {"hostname": "celery@worker-1"})()
+        with patch("redis.from_url", return_value=client):
+            start_worker_heartbeat(sender=worker)
+        self.assertIn("celery@worker-1", client.hgetall(HEARTBEAT_KEY))
+
+        stop_worker_heartbeat()
+        stop_worker_heartbeat()
+
+        self.assertEqual(client.hgetall(HEARTBEAT_KEY), {})
+
+
+class TestMarkMetricsProcessDead(BaseTestCase):
+    """Tests for the mark_metrics_process_dead shutdown signal handler."""
+
+    def test_mark_metrics_process_dead_success_uses_pid(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import mark_metrics_process_dead
+
+        with patch("app.core.metrics.mark_process_dead") as mock_mark:
+            mark_metrics_process_dead(pid=4321)
+
+        mock_mark.assert_called_once_with(4321)
+
+
+class TestTaskQueryTracking(BaseTestCase):
+    """Tests for the task_prerun/task_postrun statement tracking handlers."""
+
+    def test_task_query_tracking_success_logs_statements(self) -> None:
+        from unittest.mock import MagicMock
+
+        from app.infrastructure.database.instrumentation import current_query_stats
+        from app.infrastructure.notifications.tasks.celery_app import (
+            finish_task_query_tracking,
+            start_task_query_tracking,
+        )
+
+        task_id = self.fake.uuid4()
+        task = MagicMock()
+        task.name = "process_documents_batch"
+
+        start_task_query_tracking(task_id=task_id, task=task)
+        current_query_stats().statements = 4
+        with self.assertLogs("app.infrastructure.notifications.tasks.celery_app", level="INFO") as logs:
+            finish_task_query_tracking(task_id=task_id, task=task)
+
+        self.assertIn("4 SQL statements", logs.output[0])
+        self.assertIsNone(current_query_stats())
+
+    def test_finish_task_query_tracking_success_unknown_task(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import finish_task_query_tracking
+
+        finish_task_query_tracking(task_id=self.fake.uuid4())
+
+
+class TestTaskProfile(BaseTestCase):
+    """Tests for the task_prerun/task_postrun profile handlers."""
+
+    def test_task_profile_success_writes_collapsed_stacks(self) -> None:
+        import os
+        import tempfile
+        import time
+        from unittest.mock import MagicMock
+
+        from app.core.config import settings
+        from app.core.profiling import is_profiling
+        from app.infrastructure.notifications.tasks.celery_app import finish_task_profile, start_task_profile
+
+        task_id = self.fake.uuid4()
+        task = MagicMock()
+        task.name = "process_documents_batch"
+        task.request.profile = True
+
+        with tempfile.TemporaryDirectory() as output_dir, patch.object(settings, "PROFILING_OUTPUT_DIR", output_dir):
+            start_task_profile(task_id=task_id, task=task)
+            self.assertTrue(is_profiling())
+            time.sleep(0.05)
+            finish_task_profile(task_id=task_id, task=task)
+
+            path = os.path.join(output_dir, f"process_documents_batch-{task_id}.folded")
+            with open(path) as file:
+                self.assertIn("test_task_profile_success_writes_collapsed_stacks", file.read())
+        self.assertFalse(is_profiling())
+
+    def test_task_profile_success_capped_at_max_seconds(self) -> None:
+        import tempfile
+        import time
+        from unittest.mock import MagicMock
+
+        from app.core.config import settings
+        from app.core.profiling import is_profiling
+        from app.infrastructure.notifications.tasks.celery_app import finish_task_profile, start_task_profile
+
+        task_id = self.fake.uuid4()
+        task = MagicMock()
+        task.name = "process_documents_batch"
+        task.request.profile = True
+
+        with (
+            tempfile.TemporaryDirectory() as output_dir,
+            patch.object(settings, "PROFILING_OUTPUT_DIR", output_dir),
+            patch.object(settings, "PROFILING_MAX_SECONDS", 0.05),
+        ):
+            start_task_profile(task_id=task_id, task=task)
+            time.sleep(0.3)
+            self.assertFalse(is_profiling())
+            with self.assertLogs("app.infrastructure.notifications.tasks.celery_app", level="INFO") as logs:
+                finish_task_profile(task_id=task_id, task=task)
+
+        self.assertIn("capped at 0.05s", logs.output[0])
+
+    def test_start_task_profile_success_not_requested(self) -> None:
+        from unittest.mock import MagicMock
+
+        from app.core.profiling import is_profiling
+        from app.infrastructure.notifications.tasks.celery_app import finish_task_profile, start_task_profile
+
+        task_id = self.fake.uuid4()
+        task = MagicMock()
+        task.request.profile = None
+
+        start_task_profile(task_id=task_id, task=task)
+        self.assertFalse(is_profiling())
+        finish_task_profile(task_id=task_id, task=task)
+
+
+class TestTaskTracing(BaseTestCase):
+    """Tests for the publish and task lifecycle tracing handlers."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        from app.core import tracing
+
+        self.tracing = tracing
+        self.exporter = tracing.InMemoryExporter()
+        tracing.set_exporter(self.exporter)
+
+    def tearDown(self) -> None:
+        self.tracing.set_exporter(None)
+        super().tearDown()
+
+    def test_task_tracing_success_links_publish_queue_and_run(self) -> None:
+        from unittest.mock import MagicMock
+
+        from app.infrastructure.notifications.tasks.celery_app import (
+            finish_publish_span,
+            finish_task_span,
+            start_publish_span,
+            start_task_span,
+        )
+
+        task_id = self.fake.uuid4()
+        headers = {"id": task_id}
+        with self.tracing.start_span("ProcessBatch.execute") as root:
+            start_publish_span(sender="process_documents_batch", headers=headers)
+            finish_publish_span(headers=headers)
+
+        task = MagicMock()
+        task.name = "process_documents_batch"
+        task.request.traceparent = headers["traceparent"]
+        task.request.published_at_ns = headers["published_at_ns"]
+        task.request.retries = 0
+        start_task_span(task_id=task_id, task=task)
+        finish_task_span(task_id=task_id, state="SUCCESS")
+
+        spans = {span.name: span for span in self.exporter.spans()}
+        publish = spans["publish process_documents_batch"]
+        self.assertEqual(publish.parent_id, root.context.span_id)
+        self.assertEqual(spans["queue process_documents_batch"].parent_id, publish.context.span_id)
+        run = spans["run process_documents_batch"]
+        self.assertEqual(run.parent_id, publish.context.span_id)
+        self.assertEqual(run.context.trace_id, root.context.trace_id)
+        self.assertEqual(run.attributes["task.state"], "SUCCESS")
+
+    def test_record_task_span_error_success_marks_failure(self) -> None:
+        from unittest.mock import MagicMock
+
+        from app.infrastructure.notifications.tasks.celery_app import (
+            finish_task_span,
+            record_task_span_error,
+            start_task_span,
+        )
+
+        task_id = self.fake.uuid4()
+        task = MagicMock()
+        task.name = "relay_outbox"
+        task.request.traceparent = None
+        start_task_span(task_id=task_id, task=task)
+        record_task_span_error(task_id=task_id, exception=RuntimeError("down"))
+        finish_task_span(task_id=task_id, state="FAILURE")
+
+        (span,) = self.exporter.spans()
+        self.assertEqual(span.status, "error")
+        self.assertIsNone(span.parent_id)
+
+    def test_start_publish_span_success_disabled(self) -> None:
+        from app.infrastructure.notifications.tasks.celery_app import start_publish_span
+
+        self.tracing.set_exporter(None)
+        headers = {"id": self.fake.uuid4()}
+        start_publish_span(sender="relay_outbox", headers=headers)
+
+        self.assertNotIn("traceparent", headers)
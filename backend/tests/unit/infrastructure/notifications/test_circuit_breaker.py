@@ -0,0 +1,149 @@
+"""Tests for app.infrastructure.notifications.circuit_breaker.CircuitBreaker."""
+
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import redis
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.notifications.circuit_breaker import CircuitBreaker, CircuitState, get_circuit_breaker
+
+
+class CircuitBreakerTestCase(BaseTestCase):
+    """Base class for CircuitBreaker tests, backed by fakeredis."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        self.breaker = CircuitBreaker(
+            self.redis, failure_threshold=3, window_seconds=60, open_seconds=30, max_open_seconds=600
+        )
+        self.name = self.fake.word()
+
+    def _trip(self) -> None:
+        for _ in range(3):
+            self.breaker.record_failure(self.name)
+
+    def _end_open_period(self) -> None:
+        self.redis.delete(f"cb:{self.name}:open")
+
+
+class TestClosed(CircuitBreakerTestCase):
+    """Tests for the closed state."""
+
+    def test_allow_success_closed_by_default(self) -> None:
+        self.assertEqual(self.breaker.state(self.name), CircuitState.CLOSED)
+        self.assertTrue(self.breaker.allow(self.name))
+
+    def test_record_failure_success_below_threshold_stays_closed(self) -> None:
+        self.breaker.record_failure(self.name)
+        self.breaker.record_failure(self.name)
+
+        self.assertEqual(self.breaker.state(self.name), CircuitState.CLOSED)
+        self.assertEqual(self.redis.ttl(f"cb:{self.name}:failures"), 60)
+
+    def test_record_failure_success_restores_missing_window(self) -> None:
+        self.redis.set(f"cb:{self.name}:failures", 1)
+
+        self.breaker.record_failure(self.name)
+
+        self.assertEqual(self.redis.get(f"cb:{self.name}:failures"), "2")
+        self.assertEqual(self.redis.ttl(f"cb:{self.name}:failures"), 60)
+
+    def test_record_success_success_resets_failures(self) -> None:
+        self.breaker.record_failure(self.name)
+        self.breaker.record_failure(self.name)
+        self.breaker.record_success(self.name)
+        self.breaker.record_failure(self.name)
+
+        self.assertEqual(self.breaker.state(self.name), CircuitState.CLOSED)
+
+
+class TestOpen(CircuitBreakerTestCase):
+    """Tests for the open state."""
+
+    def test_record_failure_success_threshold_opens_circuit(self) -> None:
+        self._trip()
+
+        self.assertEqual(self.breaker.state(self.name), CircuitState.OPEN)
+        self.assertFalse(self.breaker.allow(self.name))
+        self.assertTrue(15 <= self.redis.ttl(f"cb:{self.name}:open") <= 30)
+
+    def test_circuits_are_per_channel(self) -> None:
+        self._trip()
+        self.assertTrue(self.breaker.allow("other"))
+
+
+class TestHalfOpen(CircuitBreakerTestCase):
+    """Tests for the half-open state."""
+
+    def test_allow_success_single_probe(self) -> None:
+        self._trip()
+        self._end_open_period()
+
+        self.assertEqual(self.breaker.state(self.name), CircuitState.HALF_OPEN)
+        self.assertTrue(self.breaker.allow(self.name))
+        self.assertFalse(self.breaker.allow(self.name))
+
+    def test_record_success_success_probe_closes_circuit(self) -> None:
+        self._trip()
+        self._end_open_period()
+        self.breaker.allow(self.name)
+
+        self.breaker.record_success(self.name)
+
+        self.assertEqual(self.breaker.state(self.name), CircuitState.CLOSED)
+        self.assertTrue(self.breaker.allow(self.name))
+
+    def test_record_failure_error_probe_reopens_with_longer_period(self) -> None:
+        self._trip()
+        self._end_open_period()
+        self.breaker.allow(self.name)
+
+        self.breaker.record_failure(self.name)
+
+        self.assertEqual(self.breaker.state(self.name), CircuitState.OPEN)
+        self.assertEqual(self.redis.get(f"cb:{self.name}:trips"), "2")
+        self.assertTrue(30 <= self.redis.ttl(f"cb:{self.name}:open") <= 60)
+
+
+class TestRedisUnavailable(BaseTestCase):
+    """Tests for fail-open behaviour when Redis errors."""
+
+    def test_allow_success_fails_open(self) -> None:
+        client = MagicMock()
+        client.exists.side_effect = redis.ConnectionError("down")
+        client.pipeline.return_value.__enter__.return_value.execute.side_effect = redis.ConnectionError("down")
+        client.delete.side_effect = redis.ConnectionError("down")
+        breaker = CircuitBreaker(client)
+
+        self.assertTrue(breaker.allow("ch"))
+        breaker.record_failure("ch")
+        breaker.record_success("ch")
+
+
+class TestFromConfig(BaseTestCase):
+    """Tests for CircuitBreaker.from_config() and get_circuit_breaker()."""
+
+    def test_from_config_success_reads_settings(self) -> None:
+        with (
+            patch("app.core.config.settings") as mock_settings,
+            patch("app.infrastructure.notifications.circuit_breaker.redis.from_url") as mock_from_url,
+        ):
+            mock_settings.NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD = 7
+            mock_settings.NOTIFICATION_CIRCUIT_WINDOW_SECONDS = 90
+            mock_settings.NOTIFICATION_CIRCUIT_OPEN_SECONDS = 10.0
+            mock_settings.NOTIFICATION_CIRCUIT_MAX_OPEN_SECONDS = 100.0
+            mock_settings.NOTIFICATION_CIRCUIT_REDIS_TIMEOUT_SECONDS = 0.5
+            breaker = CircuitBreaker.from_config()
+
+        mock_from_url.assert_called_once_with(
+            mock_settings.REDIS_URL, decode_responses=True, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+        self.assertEqual(breaker._failure_threshold, 7)
+        self.assertEqual(breaker.open_seconds, 10.0)
+
+    def test_get_circuit_breaker_success_singleton(self) -> None:
+        with patch("app.infrastructure.notifications.circuit_breaker.redis.from_url"):
+            self.assertIs(get_circuit_breaker(), get_circuit_breaker())
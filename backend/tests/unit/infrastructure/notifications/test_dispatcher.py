@@ -1,6 +1,7 @@
 """Tests for app.infrastructure.notifications.dispatcher."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from tests.common import BaseTestCase
@@ -33,6 +34,16 @@ class TestDispatchResult(BaseTestCase):
         self.assertTrue(r.all_succeeded)
         self.assertEqual(r.succeeded, [])
         self.assertEqual(r.failed, [])
+        self.assertEqual(r.timed_out, [])
+
+    def test_dispatch_result_success_str_includes_timed_out(self) -> None:
+        r = DispatchResult(failed=["slow"], timed_out=["slow"])
+        self.assertIn("timed_out=['slow']", str(r))
+
+    def test_dispatch_result_success_str_includes_short_circuited(self) -> None:
+        r = DispatchResult(failed=["down"], short_circuited=["down"])
+        self.assertIn("short_circuited=['down']", str(r))
+        self.assertFalse(r.all_succeeded)
 
 
 class TestNotificationDispatcherInit(BaseTestCase):
@@ -42,16 +53,67 @@ class TestNotificationDispatcherInit(BaseTestCase):
         channels = [MagicMock(), MagicMock()]
         dispatcher = NotificationDispatcher(channels)
         self.assertEqual(len(dispatcher._channels), 2)
+        self.assertIsNone(dispatcher._channel_timeout)
+        self.assertIsNone(dispatcher._total_timeout)
+        self.assertIsNone(dispatcher._breaker)
 
 
 class TestNotificationDispatcherFromConfig(BaseTestCase):
     """Tests for NotificationDispatcher.from_config()."""
 
     def test_from_config_success_returns_dispatcher(self) -> None:
-        with patch("app.infrastructure.notifications.channels.factory.build_channels", return_value=[]):
+        with patch("app.infrastructure.notifications.channels.factory.get_configured_channels", return_value={}):
             dispatcher = NotificationDispatcher.from_config()
         self.assertIsInstance(dispatcher, NotificationDispatcher)
 
+    def test_from_config_success_reads_timeouts(self) -> None:
+        with (
+            patch("app.infrastructure.notifications.channels.factory.get_configured_channels", return_value={}),
+            patch("app.core.config.settings") as mock_settings,
+        ):
+            mock_settings.NOTIFICATION_CHANNEL_TIMEOUT_SECONDS = 5.0
+            mock_settings.NOTIFICATION_DISPATCH_TIMEOUT_SECONDS = 8.0
+            dispatcher = NotificationDispatcher.from_config()
+        self.assertEqual(dispatcher._channel_timeout, 5.0)
+        self.assertEqual(dispatcher._total_timeout, 8.0)
+
+    def test_from_config_success_breaker_disabled(self) -> None:
+        with (
+            patch("app.infrastructure.notifications.channels.factory.get_configured_channels", return_value={}),
+            patch("app.core.config.settings") as mock_settings,
+        ):
+            mock_settings.NOTIFICATION_CIRCUIT_BREAKER_ENABLED = False
+            dispatcher = NotificationDispatcher.from_config()
+        self.assertIsNone(dispatcher._breaker)
+
+    def test_from_config_success_uses_shared_breaker(self) -> None:
+        breaker = MagicMock()
+        with (
+            patch("app.infrastructure.notifications.channels.factory.get_configured_channels", return_value={}),
+            patch("app.infrastructure.notifications.circuit_breaker.get_circuit_breaker", return_value=breaker),
+            patch("app.core.config.settings") as mock_settings,
+        ):
+            mock_settings.NOTIFICATION_CIRCUIT_BREAKER_ENABLED = True
+            dispatcher = NotificationDispatcher.from_config()
+        self.assertIs(dispatcher._breaker, breaker)
+
+    def test_from_config_success_filters_channel_names(self) -> None:
+        channels = {"a": MagicMock(), "b": MagicMock()}
+        with patch(
+            "app.infrastructure.notifications.channels.factory.get_configured_channels", return_value=channels
+        ):
+            dispatcher = NotificationDispatcher.from_config(["b"])
+        self.assertEqual(dispatcher._channels, [channels["b"]])
+
+    def test_from_config_success_reuses_channel_instances(self) -> None:
+        channels = {"a": MagicMock()}
+        with patch(
+            "app.infrastructure.notifications.channels.factory.get_configured_channels", return_value=channels
+        ):
+            first = NotificationDispatcher.from_config()
+            second = NotificationDispatcher.from_config()
+        self.assertIs(first._channels[0], second._channels[0])
+
 
 class TestNotificationDispatcherDispatch(BaseTestCase):
     """Tests for NotificationDispatcher.dispatch()."""
@@ -86,6 +148,38 @@ class TestNotificationDispatcherDispatch(BaseTestCase):
         self.assertIn("ok", result.succeeded)
         self.assertIn("fail", result.failed)
 
+    def test_dispatch_success_counts_deliveries(self) -> None:
+        from prometheus_client import REGISTRY
+
+        labels = {"channel": "metered", "outcome": "succeeded"}
+        before = REGISTRY.get_sample_value("notification_deliveries_total", labels) or 0.0
+        channel = MagicMock()
+        channel._name = "metered"
+        channel.send = AsyncMock()
+
+        asyncio.run(NotificationDispatcher([channel]).dispatch({"event": "test"}))
+
+        self.assertEqual(REGISTRY.get_sample_value("notification_deliveries_total", labels) - before, 1)
+
+    def test_dispatch_success_traces_each_channel(self) -> None:
+        from app.core import tracing
+
+        exporter = tracing.InMemoryExporter()
+        tracing.set_exporter(exporter)
+        channel = MagicMock()
+        channel._name = "traced"
+        channel.send = AsyncMock(side_effect=Exception("boom"))
+        try:
+            asyncio.run(NotificationDispatcher([channel]).dispatch({"event": "test"}))
+        finally:
+            tracing.set_exporter(None)
+
+        notify, dispatch = exporter.spans()
+        self.assertEqual(notify.name, "notify traced")
+        self.assertEqual(notify.attributes["notification.outcome"], "failed")
+        self.assertEqual(dispatch.name, "NotificationDispatcher.dispatch")
+        self.assertEqual(notify.parent_id, dispatch.context.span_id)
+
     def test_dispatch_success_no_channels(self) -> None:
         dispatcher = NotificationDispatcher([])
         result = asyncio.run(dispatcher.dispatch({"event": "test"}))
@@ -99,3 +193,141 @@ class TestNotificationDispatcherDispatch(BaseTestCase):
         dispatcher = NotificationDispatcher([ch])
         result = asyncio.run(dispatcher.dispatch({"event": "test"}))
         self.assertTrue(result.all_succeeded)
+
+    def test_dispatch_success_channels_run_concurrently(self) -> None:
+        started = []
+
+        def make_channel(name: str) -> MagicMock:
+            async def send(payload: dict) -> None:
+                started.append(name)
+                await asyncio.sleep(0.2)
+
+            ch = MagicMock()
+            ch._name = name
+            ch.send = send
+            return ch
+
+        dispatcher = NotificationDispatcher([make_channel("a"), make_channel("b"), make_channel("c")])
+
+        async def run() -> tuple:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            result = await dispatcher.dispatch({"event": "test"})
+            return result, loop.time() - start
+
+        result, elapsed = asyncio.run(run())
+
+        self.assertEqual(result.succeeded, ["a", "b", "c"])
+        self.assertCountEqual(started, ["a", "b", "c"])
+        self.assertLess(elapsed, 0.5)
+
+    def test_dispatch_error_channel_timeout(self) -> None:
+        async def slow_send(payload: dict) -> None:
+            await asyncio.sleep(5)
+
+        ch_slow = MagicMock()
+        ch_slow._name = "slow"
+        ch_slow.send = slow_send
+        ch_ok = MagicMock()
+        ch_ok._name = "ok"
+        ch_ok.send = AsyncMock()
+
+        dispatcher = NotificationDispatcher([ch_slow, ch_ok], channel_timeout=0.05)
+        result = asyncio.run(dispatcher.dispatch({"event": "test"}))
+
+        self.assertEqual(result.succeeded, ["ok"])
+        self.assertEqual(result.failed, ["slow"])
+        self.assertEqual(result.timed_out, ["slow"])
+        self.assertFalse(result.all_succeeded)
+
+    def test_dispatch_error_total_timeout_cancels_pending(self) -> None:
+        cancelled = []
+
+        async def slow_send(payload: dict) -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+
+        ch_slow = MagicMock()
+        ch_slow._name = "slow"
+        ch_slow.send = slow_send
+        ch_fail = MagicMock()
+        ch_fail._name = "fail"
+        ch_fail.send = AsyncMock(side_effect=Exception("boom"))
+
+        dispatcher = NotificationDispatcher([ch_slow, ch_fail], channel_timeout=10, total_timeout=0.05)
+        result = asyncio.run(dispatcher.dispatch({"event": "test"}))
+
+        self.assertEqual(result.succeeded, [])
+        self.assertEqual(result.failed, ["slow", "fail"])
+        self.assertEqual(result.timed_out, ["slow"])
+        self.assertEqual(cancelled, ["slow"])
+
+    def test_dispatch_success_open_circuit_short_circuits(self) -> None:
+        ch_ok = MagicMock()
+        ch_ok._name = "ok"
+        ch_ok.send = AsyncMock()
+        ch_down = MagicMock()
+        ch_down._name = "down"
+        ch_down.send = AsyncMock()
+
+        breaker = MagicMock()
+        breaker.allow.side_effect = lambda name: name != "down"
+
+        dispatcher = NotificationDispatcher([ch_ok, ch_down], breaker=breaker)
+        result = asyncio.run(dispatcher.dispatch({"event": "test"}))
+
+        self.assertEqual(result.succeeded, ["ok"])
+        self.assertEqual(result.failed, ["down"])
+        self.assertEqual(result.short_circuited, ["down"])
+        ch_down.send.assert_not_called()
+        breaker.record_success.assert_called_once_with("ok")
+        breaker.record_failure.assert_not_called()
+
+    def test_dispatch_error_failure_and_timeout_recorded_in_breaker(self) -> None:
+        async def slow_send(payload: dict) -> None:
+            await asyncio.sleep(5)
+
+        ch_fail = MagicMock()
+        ch_fail._name = "fail"
+        ch_fail.send = AsyncMock(side_effect=Exception("boom"))
+        ch_slow = MagicMock()
+        ch_slow._name = "slow"
+        ch_slow.send = slow_send
+
+        breaker = MagicMock()
+        breaker.allow.return_value = True
+
+        dispatcher = NotificationDispatcher([ch_fail, ch_slow], channel_timeout=0.05, breaker=breaker)
+        asyncio.run(dispatcher.dispatch({"event": "test"}))
+
+        self.assertCountEqual([c.args[0] for c in breaker.record_failure.call_args_list], ["fail", "slow"])
+
+    def test_dispatch_success_slow_breaker_does_not_block_event_loop(self) -> None:
+        ch = MagicMock()
+        ch._name = "ok"
+        ch.send = AsyncMock()
+
+        breaker = MagicMock()
+        breaker.allow.side_effect = lambda name: time.sleep(0.2) or True
+
+        dispatcher = NotificationDispatcher([ch], breaker=breaker)
+
+        async def dispatch_while_ticking() -> int:
+            ticks = 0
+
+            async def tick() -> None:
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.create_task(tick())
+            await dispatcher.dispatch({"event": "test"})
+            ticker.cancel()
+            return ticks
+
+        self.assertGreaterEqual(asyncio.run(dispatch_while_ticking()), 5)
+        breaker.record_success.assert_called_once_with("ok")
@@ -136,11 +136,34 @@ class BuildHandlersTest(BaseTestCase):
         self.assertIn(DocumentStatus.PENDING.value, handlers)
 
 
+class RecordBatchMetricsTest(BaseTestCase):
+    """Tests for _record_batch_metrics()."""
+
+    def test_record_batch_metrics_success_counts_documents(self) -> None:
+        from prometheus_client import REGISTRY
+
+        from app.infrastructure.notifications.tasks.document_tasks import _record_batch_metrics
+
+        def sample(name: str, labels: dict) -> float:
+            return REGISTRY.get_sample_value(name, labels) or 0.0
+
+        processed_before = sample("batch_documents_total", {"outcome": "processed"})
+        failed_before = sample("batch_documents_total", {"outcome": "failed"})
+        runs_before = sample("batch_job_duration_seconds_count", {"status": "completed"})
+
+        _record_batch_metrics("completed", 0.0, 8, 2)
+
+        self.assertEqual(sample("batch_documents_total", {"outcome": "processed"}) - processed_before, 8)
+        self.assertEqual(sample("batch_documents_total", {"outcome": "failed"}) - failed_before, 2)
+        self.assertEqual(sample("batch_job_duration_seconds_count", {"status": "completed"}) - runs_before, 1)
+        self.assertGreater(sample("batch_job_documents_per_second", {}), 0)
+
+
 class ProcessDocumentsBatchTest(BaseTestCase):
     """Tests for process_documents_batch() Celery task."""
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks._notify_completion")
-    @patch("app.infrastructure.notifications.tasks.document_tasks.SessionLocal")
+    @patch("app.infrastructure.notifications.tasks.document_tasks._wake_outbox_relay")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.WorkerSessionLocal")
     @patch("app.infrastructure.notifications.tasks.document_tasks.time.sleep")
     @patch("app.infrastructure.notifications.tasks.document_tasks.secrets.randbelow", return_value=0)
     def test_process_batch_success_all_documents(self, _rand, _sleep, mock_session_cls, _notify) -> None:
@@ -162,8 +185,37 @@ class ProcessDocumentsBatchTest(BaseTestCase):
 
         self.assertEqual(result["total"], 1)
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks._notify_completion")
-    @patch("app.infrastructure.notifications.tasks.document_tasks.SessionLocal")
+    @patch("app.infrastructure.notifications.tasks.document_tasks._wake_outbox_relay")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.WorkerSessionLocal")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.time.sleep")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.secrets.randbelow", return_value=0)
+    def test_process_batch_success_details_stored_as_job_items(self, _rand, _sleep, mock_session_cls, mock_notify) -> None:
+        from app.infrastructure.notifications.tasks.document_tasks import process_documents_batch
+
+        mock_session_cls.return_value = self.make_mock_db_session()
+
+        doc = self.make_document(status=DocumentStatus.APPROVED.value)
+        mock_job_repo = MagicMock()
+        mock_doc_repo = MagicMock()
+        mock_doc_repo.get_by_id.return_value = doc
+
+        with patch("app.infrastructure.repositories.job_repository.JobRepository", return_value=mock_job_repo), \
+             patch("app.infrastructure.repositories.document_repository.DocumentRepository", return_value=mock_doc_repo), \
+             patch("app.infrastructure.repositories.audit_repository.AuditRepository", return_value=MagicMock()):
+            result = process_documents_batch(str(self.fake.uuid4()), [doc.id])
+
+        self.assertNotIn("details", result)
+        _, status = mock_job_repo.update_status.call_args.args
+        kwargs = mock_job_repo.update_status.call_args.kwargs
+        self.assertEqual(status, "completed")
+        self.assertEqual(kwargs["result"], {"total": 1, "processed": 1, "failed": 0})
+        self.assertEqual(kwargs["items"], [{"document_id": doc.id, "status": "success", "action": "skipped"}])
+        self.assertEqual(kwargs["outbox_event"]["result"], {"total": 1, "processed": 1, "failed": 0})
+        self.assertEqual(kwargs["outbox_event"]["status"], "completed")
+        mock_notify.assert_called_once()
+
+    @patch("app.infrastructure.notifications.tasks.document_tasks._wake_outbox_relay")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.WorkerSessionLocal")
     @patch("app.infrastructure.notifications.tasks.document_tasks.time.sleep")
     @patch("app.infrastructure.notifications.tasks.document_tasks.secrets.randbelow", return_value=0)
     def test_process_batch_success_document_not_found(self, _rand, _sleep, mock_session_cls, _notify) -> None:
@@ -182,8 +234,8 @@ class ProcessDocumentsBatchTest(BaseTestCase):
 
         self.assertEqual(result["failed"], 1)
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks._notify_completion")
-    @patch("app.infrastructure.notifications.tasks.document_tasks.SessionLocal")
+    @patch("app.infrastructure.notifications.tasks.document_tasks._wake_outbox_relay")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.WorkerSessionLocal")
     @patch("app.infrastructure.notifications.tasks.document_tasks.time.sleep")
     @patch("app.infrastructure.notifications.tasks.document_tasks.secrets.randbelow", return_value=0)
     def test_process_batch_error_document_exception(self, _rand, _sleep, mock_session_cls, _notify) -> None:
@@ -202,9 +254,9 @@ class ProcessDocumentsBatchTest(BaseTestCase):
 
         self.assertEqual(result["failed"], 1)
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks._notify_completion")
-    @patch("app.infrastructure.notifications.tasks.document_tasks.SessionLocal")
-    def test_process_batch_error_critical_failure(self, mock_session_cls, _notify) -> None:
+    @patch("app.infrastructure.notifications.tasks.document_tasks._wake_outbox_relay")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.WorkerSessionLocal")
+    def test_process_batch_error_critical_failure(self, mock_session_cls, mock_wake) -> None:
         from app.infrastructure.notifications.tasks.document_tasks import process_documents_batch
 
         mock_db = self.make_mock_db_session()
@@ -219,8 +271,14 @@ class ProcessDocumentsBatchTest(BaseTestCase):
             with self.assertRaises(Exception):
                 process_documents_batch(str(self.fake.uuid4()), [1])
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks._notify_completion")
-    @patch("app.infrastructure.notifications.tasks.document_tasks.SessionLocal")
+        kwargs = mock_job_repo.update_status.call_args.kwargs
+        self.assertEqual(kwargs["error_message"], "fatal")
+        self.assertEqual(kwargs["outbox_event"]["status"], "failed")
+        self.assertEqual(kwargs["outbox_event"]["error_message"], "fatal")
+        self.assertNotIn("details", kwargs["outbox_event"]["result"])
+
+    @patch("app.infrastructure.notifications.tasks.document_tasks._wake_outbox_relay")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.WorkerSessionLocal")
     def test_process_batch_error_critical_failure_update_also_fails(self, mock_session_cls, _notify) -> None:
         from app.infrastructure.notifications.tasks.document_tasks import process_documents_batch
 
@@ -237,8 +295,8 @@ class ProcessDocumentsBatchTest(BaseTestCase):
                 process_documents_batch(str(self.fake.uuid4()), [1])
 
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks._notify_completion")
-    @patch("app.infrastructure.notifications.tasks.document_tasks.SessionLocal")
+    @patch("app.infrastructure.notifications.tasks.document_tasks._wake_outbox_relay")
+    @patch("app.infrastructure.notifications.tasks.document_tasks.WorkerSessionLocal")
     @patch("app.infrastructure.notifications.tasks.document_tasks.time.sleep")
     @patch("app.infrastructure.notifications.tasks.document_tasks.secrets.randbelow", return_value=0)
     def test_process_batch_success_handler_returns_false(self, _rand, _sleep, mock_session_cls, _notify) -> None:
@@ -260,53 +318,47 @@ class ProcessDocumentsBatchTest(BaseTestCase):
         self.assertEqual(result["failed"], 1)
 
 
-class NotifyCompletionTest(BaseTestCase):
-    """Tests for _notify_completion()."""
+class CompletionEventTest(BaseTestCase):
+    """Tests for _completion_event()."""
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks.NotificationDispatcher")
-    def test_notify_completion_success(self, mock_dispatcher_cls) -> None:
-        from app.infrastructure.notifications.tasks.document_tasks import _notify_completion
+    def test_completion_event_success(self) -> None:
+        from app.infrastructure.notifications.tasks.document_tasks import _completion_event
 
-        mock_result = MagicMock()
-        mock_result.all_succeeded = True
-        mock_dispatcher = MagicMock()
-        mock_dispatcher.dispatch = MagicMock(return_value=mock_result)
-        mock_dispatcher_cls.from_config.return_value = mock_dispatcher
+        job_id = str(self.fake.uuid4())
+        result = {"total": 2, "processed": 2, "failed": 0}
+        payload = _completion_event(job_id=job_id, status="completed", document_ids=[1, 2], result=result)
 
-        with patch("app.infrastructure.notifications.tasks.document_tasks.asyncio.run", return_value=mock_result):
-            _notify_completion(
-                job_id=str(self.fake.uuid4()),
-                status="completed",
-                document_ids=[1, 2],
-                result={"total": 2, "processed": 2, "failed": 0, "details": []},
-            )
+        self.assertEqual(payload, {"job_id": job_id, "status": "completed", "document_ids": [1, 2], "result": result})
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks.asyncio.run", side_effect=Exception("dispatch failed"))
-    @patch("app.infrastructure.notifications.tasks.document_tasks.NotificationDispatcher")
-    def test_notify_completion_error_exception_caught(self, _disp, _run) -> None:
-        from app.infrastructure.notifications.tasks.document_tasks import _notify_completion
+    def test_completion_event_success_includes_error_message(self) -> None:
+        from app.infrastructure.notifications.tasks.document_tasks import _completion_event
 
-        _notify_completion(
+        payload = _completion_event(
             job_id=str(self.fake.uuid4()),
             status="failed",
             document_ids=[1],
-            result={"total": 1, "processed": 0, "failed": 1, "details": []},
+            result={"total": 1, "processed": 0, "failed": 1},
             error_message="critical error",
         )
 
-    @patch("app.infrastructure.notifications.tasks.document_tasks.NotificationDispatcher")
-    def test_notify_completion_success_partial_failure(self, mock_dispatcher_cls) -> None:
-        from app.infrastructure.notifications.tasks.document_tasks import _notify_completion
-
-        mock_result = MagicMock()
-        mock_result.all_succeeded = False
-        mock_result.succeeded = ["ch1"]
-        mock_result.failed = ["ch2"]
-
-        with patch("app.infrastructure.notifications.tasks.document_tasks.asyncio.run", return_value=mock_result):
-            _notify_completion(
-                job_id=str(self.fake.uuid4()),
-                status="completed",
-                document_ids=[1],
-                result={"total": 1, "processed": 1, "failed": 0, "details": []},
-            )
+        self.assertEqual(payload["error_message"], "critical error")
+
+
+class WakeOutboxRelayTest(BaseTestCase):
+    """Tests for _wake_outbox_relay()."""
+
+    @patch("app.infrastructure.notifications.tasks.document_tasks.relay_outbox")
+    def test_wake_outbox_relay_success_enqueues_relay(self, mock_relay) -> None:
+        from app.infrastructure.notifications.tasks.document_tasks import _wake_outbox_relay
+
+        _wake_outbox_relay(str(self.fake.uuid4()))
+
+        mock_relay.delay.assert_called_once_with()
+
+    @patch("app.infrastructure.notifications.tasks.document_tasks.relay_outbox")
+    def test_wake_outbox_relay_error_broker_failure_caught(self, mock_relay) -> None:
+        from app.infrastructure.notifications.tasks.document_tasks import _wake_outbox_relay
+
+        mock_relay.delay.side_effect = ConnectionError("broker down")
+
+        _wake_outbox_relay(str(self.fake.uuid4()))
@@ -0,0 +1,57 @@
+"""Tests for app.infrastructure.notifications.tasks.event_loop."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.notifications.tasks import event_loop
+from app.infrastructure.notifications.tasks.event_loop import close_event_loop, run_async
+
+
+class TestRunAsync(BaseTestCase):
+    """Tests for run_async() and close_event_loop()."""
+
+    def tearDown(self) -> None:
+        close_event_loop()
+
+    def test_run_async_success_reuses_loop(self) -> None:
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = run_async(current_loop())
+        second = run_async(current_loop())
+
+        self.assertIs(first, second)
+        self.assertFalse(first.is_closed())
+
+    def test_run_async_success_uses_caller_context(self) -> None:
+        from app.core import tracing
+
+        async def active_span() -> object:
+            return tracing.current_span()
+
+        tracing.set_exporter(tracing.InMemoryExporter())
+        try:
+            run_async(active_span())
+            with tracing.start_span("relay") as span:
+                self.assertIs(run_async(active_span()), span)
+        finally:
+            tracing.set_exporter(None)
+
+    def test_close_event_loop_success_closes_pool_and_loop(self) -> None:
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        loop = run_async(current_loop())
+        with patch("app.infrastructure.notifications.tasks.event_loop.get_http_pool") as mock_get_pool:
+            mock_get_pool.return_value.aclose = AsyncMock()
+            close_event_loop()
+
+        mock_get_pool.return_value.aclose.assert_awaited_once()
+        self.assertTrue(loop.is_closed())
+        self.assertIsNone(event_loop._runner)
+
+    def test_close_event_loop_success_noop_without_loop(self) -> None:
+        close_event_loop()
+        self.assertIsNone(event_loop._runner)
@@ -1,8 +1,11 @@
-"""Tests for app.infrastructure.notifications.channels.factory.build_channels."""
+"""Tests for app.infrastructure.notifications.channels.factory."""
+
+from unittest.mock import patch
 
 from tests.common import BaseTestCase
 
-from app.infrastructure.notifications.channels.factory import build_channels
+from app.infrastructure.notifications.channels import factory
+from app.infrastructure.notifications.channels.factory import build_channels, get_configured_channels
 
 
 class TestBuildChannels(BaseTestCase):
@@ -49,3 +52,26 @@ class TestBuildChannels(BaseTestCase):
         ]
         channels = build_channels(config)
         self.assertEqual(len(channels), 1)
+
+
+class TestGetConfiguredChannels(BaseTestCase):
+    """Tests for get_configured_channels()."""
+
+    def setUp(self) -> None:
+        factory._configured_channels = None
+        self.addCleanup(setattr, factory, "_configured_channels", None)
+
+    def test_get_configured_channels_success_built_once_by_name(self) -> None:
+        config = [
+            {"type": "http", "name": "a", "url": "http://a.example.com"},
+            {"type": "http", "name": "b", "url": "http://b.example.com", "batch_size": 10},
+        ]
+        with patch("app.core.config.settings") as mock_settings:
+            mock_settings.NOTIFICATION_CHANNELS = config
+            first = get_configured_channels()
+            mock_settings.NOTIFICATION_CHANNELS = []
+            second = get_configured_channels()
+
+        self.assertEqual(list(first), ["a", "b"])
+        self.assertIs(first, second)
+        self.assertIsNotNone(first["b"]._batcher)
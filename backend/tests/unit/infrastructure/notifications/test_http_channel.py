@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from tests.common import BaseTestCase
 
+from app.infrastructure.notifications.channels.base import NotificationDeliveryError
 from app.infrastructure.notifications.channels.http import HttpNotificationChannel
 
 
@@ -20,9 +21,23 @@ class TestHttpNotificationChannelInit(BaseTestCase):
         self.assertEqual(channel._url, url)
         self.assertEqual(channel._headers, headers)
 
+    def test_init_success_encoder_settings(self) -> None:
+        channel = HttpNotificationChannel(
+            name=self.fake.word(),
+            url=self.fake.url(),
+            compression="gzip",
+            compress_min_bytes=10,
+            signing_secret=self.fake.password(),
+        )
+        encoder = channel._client._encoder
+        self.assertEqual(encoder.compression, "gzip")
+        self.assertEqual(encoder.compress_min_bytes, 10)
+        self.assertIsNotNone(encoder._signing_key)
+
     def test_init_success_default_headers(self) -> None:
         channel = HttpNotificationChannel(name="ch", url="http://example.com")
         self.assertEqual(channel._headers, {})
+        self.assertEqual(channel._max_attempts, 1)
 
 
 class TestHttpNotificationChannelSend(BaseTestCase):
@@ -39,8 +54,9 @@ class TestHttpNotificationChannelSend(BaseTestCase):
         payload = {"event": self.fake.word()}
         asyncio.run(channel.send(payload))
         channel._client.post.assert_called_once()
+        self.assertEqual(channel._client.post.call_args.kwargs["max_retries"], 1)
 
-    def test_send_error_logs_failure(self) -> None:
+    def test_send_error_logs_and_raises_failure(self) -> None:
         channel = HttpNotificationChannel(
             name="test_channel",
             url="http://example.com/webhook",
@@ -49,5 +65,47 @@ class TestHttpNotificationChannelSend(BaseTestCase):
         channel._client.post = AsyncMock(return_value=False)
 
         with patch("app.infrastructure.notifications.channels.http.logger") as mock_logger:
-            asyncio.run(channel.send({"data": "test"}))
+            with self.assertRaises(NotificationDeliveryError):
+                asyncio.run(channel.send({"data": "test"}))
             mock_logger.error.assert_called_once()
+
+
+class TestHttpNotificationChannelBatching(BaseTestCase):
+    """Tests for HttpNotificationChannel batching mode."""
+
+    def _channel(self, batch_size: int, linger_seconds: float = 5.0) -> HttpNotificationChannel:
+        channel = HttpNotificationChannel(
+            name="batched", url=self.fake.url(), batch_size=batch_size, linger_seconds=linger_seconds
+        )
+        channel._client = MagicMock()
+        channel._client.post = AsyncMock(return_value=True)
+        return channel
+
+    def test_init_success_batching_disabled_by_default(self) -> None:
+        channel = HttpNotificationChannel(name="ch", url="http://example.com")
+        self.assertIsNone(channel._batcher)
+
+    def test_send_success_full_batch_posted_as_array(self) -> None:
+        channel = self._channel(batch_size=3)
+        payloads = [{"event_id": i} for i in range(3)]
+
+        async def run() -> None:
+            await asyncio.gather(*(channel.send(p) for p in payloads))
+
+        asyncio.run(run())
+
+        channel._client.post.assert_called_once()
+        self.assertEqual(channel._client.post.call_args.args[1], payloads)
+
+    def test_send_error_batch_failure_raises_for_every_payload(self) -> None:
+        channel = self._channel(batch_size=2)
+        channel._client.post = AsyncMock(return_value=False)
+
+        async def run() -> list:
+            return await asyncio.gather(
+                channel.send({"event_id": 1}), channel.send({"event_id": 2}), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        self.assertTrue(all(isinstance(r, NotificationDeliveryError) for r in results))
@@ -17,6 +17,11 @@ class TestHttpClientInit(BaseTestCase):
         client = HttpClient()
         self.assertEqual(client.timeout, 10)
 
+    def test_init_success_uses_shared_pool(self) -> None:
+        from app.infrastructure.notifications.clients.http_pool import get_http_pool
+
+        self.assertIs(HttpClient()._pool, get_http_pool())
+
     def test_init_success_custom_timeout(self) -> None:
         client = HttpClient(timeout=30)
         self.assertEqual(client.timeout, 30)
@@ -25,72 +30,76 @@ class TestHttpClientInit(BaseTestCase):
 class TestHttpClientPost(BaseTestCase):
     """Tests for HttpClient.post()."""
 
-    def test_post_success_first_attempt(self) -> None:
-        client = HttpClient(timeout=5)
+    def setUp(self) -> None:
+        self.mock_async_client = AsyncMock()
+        self.mock_pool = MagicMock()
+        self.mock_pool.client.return_value = self.mock_async_client
+        self.client = HttpClient(timeout=5, pool=self.mock_pool)
+
+    def _ok_response(self) -> MagicMock:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.raise_for_status = MagicMock()
+        return mock_response
 
-        mock_async_client = AsyncMock()
-        mock_async_client.post.return_value = mock_response
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=False)
+    def test_post_success_first_attempt(self) -> None:
+        self.mock_async_client.post.return_value = self._ok_response()
 
-        with patch("app.infrastructure.notifications.clients.http_client.httpx.AsyncClient", return_value=mock_async_client):
-            result = asyncio.run(client.post(self.fake.url(), {"key": "value"}))
+        result = asyncio.run(self.client.post(self.fake.url(), {"key": "value"}))
 
         self.assertTrue(result)
+        self.assertEqual(self.mock_async_client.post.call_args.kwargs["timeout"], 5)
 
     def test_post_success_with_headers(self) -> None:
-        client = HttpClient(timeout=5)
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-
-        mock_async_client = AsyncMock()
-        mock_async_client.post.return_value = mock_response
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=False)
+        self.mock_async_client.post.return_value = self._ok_response()
 
         headers = {"X-Custom": self.fake.word()}
-        with patch("app.infrastructure.notifications.clients.http_client.httpx.AsyncClient", return_value=mock_async_client):
-            result = asyncio.run(client.post(self.fake.url(), {"key": "val"}, headers=headers))
+        result = asyncio.run(self.client.post(self.fake.url(), {"key": "val"}, headers=headers))
 
         self.assertTrue(result)
+        sent = self.mock_async_client.post.call_args.kwargs["headers"]
+        self.assertEqual(sent["X-Custom"], headers["X-Custom"])
+        self.assertEqual(sent["Content-Type"], "application/json")
 
-    def test_post_error_all_retries_fail(self) -> None:
-        client = HttpClient(timeout=5)
+    def test_post_success_sends_encoded_body(self) -> None:
+        self.mock_async_client.post.return_value = self._ok_response()
+        encoder = MagicMock()
+        encoder.encode.return_value = (b"compressed", {"Content-Encoding": "gzip"})
+        client = HttpClient(pool=self.mock_pool, encoder=encoder)
 
-        mock_async_client = AsyncMock()
-        mock_async_client.post.side_effect = httpx.HTTPError("connection error")
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=False)
+        asyncio.run(client.post(self.fake.url(), {"key": "val"}))
 
-        with patch("app.infrastructure.notifications.clients.http_client.httpx.AsyncClient", return_value=mock_async_client):
-            with patch("app.infrastructure.notifications.clients.http_client.asyncio.sleep", new_callable=AsyncMock):
-                result = asyncio.run(client.post(self.fake.url(), {"key": "val"}, max_retries=3))
+        encoder.encode.assert_called_once_with({"key": "val"})
+        kwargs = self.mock_async_client.post.call_args.kwargs
+        self.assertEqual(kwargs["content"], b"compressed")
+        self.assertEqual(kwargs["headers"], {"Content-Encoding": "gzip"})
 
-        self.assertFalse(result)
-        self.assertEqual(mock_async_client.post.call_count, 3)
+    def test_post_success_reuses_pooled_client(self) -> None:
+        self.mock_async_client.post.return_value = self._ok_response()
 
-    def test_post_success_after_retry(self) -> None:
-        client = HttpClient(timeout=5)
+        asyncio.run(self.client.post(self.fake.url(), {"key": "val"}))
+        asyncio.run(self.client.post(self.fake.url(), {"key": "val"}))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
+        self.assertEqual(self.mock_pool.client.call_count, 2)
+        self.mock_async_client.aclose.assert_not_called()
+
+    def test_post_error_all_retries_fail(self) -> None:
+        self.mock_async_client.post.side_effect = httpx.HTTPError("connection error")
+
+        with patch("app.infrastructure.notifications.clients.http_client.asyncio.sleep", new_callable=AsyncMock):
+            result = asyncio.run(self.client.post(self.fake.url(), {"key": "val"}, max_retries=3))
 
-        mock_async_client = AsyncMock()
-        mock_async_client.post.side_effect = [
+        self.assertFalse(result)
+        self.assertEqual(self.mock_async_client.post.call_count, 3)
+
+    def test_post_success_after_retry(self) -> None:
+        self.mock_async_client.post.side_effect = [
             httpx.HTTPError("fail"),
-            mock_response,
+            self._ok_response(),
         ]
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("app.infrastructure.notifications.clients.http_client.httpx.AsyncClient", return_value=mock_async_client):
-            with patch("app.infrastructure.notifications.clients.http_client.asyncio.sleep", new_callable=AsyncMock):
-                result = asyncio.run(client.post(self.fake.url(), {"key": "val"}, max_retries=3))
+        with patch("app.infrastructure.notifications.clients.http_client.asyncio.sleep", new_callable=AsyncMock):
+            result = asyncio.run(self.client.post(self.fake.url(), {"key": "val"}, max_retries=3))
 
         self.assertTrue(result)
-        self.assertEqual(mock_async_client.post.call_count, 2)
+        self.assertEqual(self.mock_async_client.post.call_count, 2)
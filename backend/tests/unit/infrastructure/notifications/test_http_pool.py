@@ -0,0 +1,78 @@
+"""Tests for app.infrastructure.notifications.clients.http_pool."""
+
+import asyncio
+from unittest.mock import patch
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.notifications.clients import http_pool
+from app.infrastructure.notifications.clients.http_pool import HttpClientPool, get_http_pool
+
+
+class TestHttpClientPool(BaseTestCase):
+    """Tests for HttpClientPool."""
+
+    def test_client_success_created_lazily_and_reused(self) -> None:
+        pool = HttpClientPool(max_connections=5, max_keepalive_connections=2, keepalive_expiry=10)
+        self.assertIsNone(pool._client)
+
+        async def run() -> tuple:
+            first, second = pool.client(), pool.client()
+            await pool.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        self.assertIs(first, second)
+        self.assertEqual(pool._limits.max_connections, 5)
+        self.assertEqual(pool._limits.max_keepalive_connections, 2)
+        self.assertEqual(pool._limits.keepalive_expiry, 10)
+
+    def test_client_success_recreated_after_close(self) -> None:
+        pool = HttpClientPool()
+
+        async def run() -> tuple:
+            first = pool.client()
+            await pool.aclose()
+            second = pool.client()
+            await pool.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertIsNone(pool._client)
+
+    def test_aclose_success_without_client_is_noop(self) -> None:
+        pool = HttpClientPool()
+        asyncio.run(pool.aclose())
+        self.assertIsNone(pool._client)
+
+    def test_init_success_http2_disabled_without_h2(self) -> None:
+        with patch.object(http_pool, "HTTP2_AVAILABLE", False):
+            pool = HttpClientPool(http2=True)
+        self.assertFalse(pool._http2)
+
+    def test_init_success_http2_disabled_by_config(self) -> None:
+        self.assertFalse(HttpClientPool(http2=False)._http2)
+
+    def test_from_config_success_reads_settings(self) -> None:
+        with patch("app.core.config.settings") as mock_settings:
+            mock_settings.NOTIFICATION_HTTP_MAX_CONNECTIONS = 7
+            mock_settings.NOTIFICATION_HTTP_MAX_KEEPALIVE_CONNECTIONS = 3
+            mock_settings.NOTIFICATION_HTTP_KEEPALIVE_EXPIRY_SECONDS = 12.0
+            mock_settings.NOTIFICATION_HTTP2 = False
+            pool = HttpClientPool.from_config()
+
+        self.assertEqual(pool._limits.max_connections, 7)
+        self.assertEqual(pool._limits.max_keepalive_connections, 3)
+        self.assertEqual(pool._limits.keepalive_expiry, 12.0)
+        self.assertFalse(pool._http2)
+
+
+class TestGetHttpPool(BaseTestCase):
+    """Tests for get_http_pool()."""
+
+    def test_get_http_pool_success_singleton(self) -> None:
+        self.assertIs(get_http_pool(), get_http_pool())
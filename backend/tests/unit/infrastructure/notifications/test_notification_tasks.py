@@ -0,0 +1,141 @@
+"""Tests for app.infrastructure.notifications.tasks.notification_tasks."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.notifications.dispatcher import DispatchResult
+from app.infrastructure.notifications.tasks.event_loop import close_event_loop
+from app.infrastructure.notifications.tasks.notification_tasks import relay_outbox
+
+
+class RelayOutboxTest(BaseTestCase):
+    """Tests for the relay_outbox task."""
+
+    def setUp(self) -> None:
+        self.mock_db = self.make_mock_db_session()
+        self.mock_repo = MagicMock()
+
+        session_patcher = patch(
+            "app.infrastructure.notifications.tasks.notification_tasks.WorkerSessionLocal", return_value=self.mock_db
+        )
+        repo_patcher = patch(
+            "app.infrastructure.repositories.outbox_repository.OutboxRepository", return_value=self.mock_repo
+        )
+        self.mock_dispatcher_cls = patch(
+            "app.infrastructure.notifications.tasks.notification_tasks.NotificationDispatcher"
+        ).start()
+        session_patcher.start()
+        repo_patcher.start()
+        self.addCleanup(patch.stopall)
+        self.addCleanup(close_event_loop)
+
+    def _event(self, attempts: int = 0, channels: list | None = None) -> MagicMock:
+        event = MagicMock()
+        event.id = self.fake.random_int(min=1, max=10_000)
+        event.payload = {"job_id": str(self.fake.uuid4()), "status": "completed"}
+        event.attempts = attempts
+        event.channels = channels
+        return event
+
+    def _dispatch_results(self, *results: DispatchResult) -> MagicMock:
+        dispatcher = MagicMock()
+        dispatcher.dispatch = AsyncMock(side_effect=list(results))
+        self.mock_dispatcher_cls.from_config.return_value = dispatcher
+        return dispatcher
+
+    def test_relay_outbox_success_no_pending_events(self) -> None:
+        """
+        When: The outbox has no due events
+        Then: Nothing is dispatched and the transaction is rolled back
+        """
+        self.mock_repo.claim_pending.return_value = []
+
+        result = relay_outbox()
+
+        self.assertEqual(result, {"sent": 0, "retried": 0, "deferred": 0, "failed": 0})
+        self.mock_dispatcher_cls.from_config.assert_not_called()
+        self.mock_db.rollback.assert_called_once()
+        self.mock_db.close.assert_called_once()
+
+    def test_relay_outbox_success_marks_events_sent(self) -> None:
+        """
+        When: Every claimed event is delivered
+        Then: Each is marked sent with the event id in the payload, and the batch is committed once
+        """
+        events = [self._event(), self._event(channels=["b"])]
+        self.mock_repo.claim_pending.return_value = events
+        dispatcher = self._dispatch_results(DispatchResult(succeeded=["a", "b"]), DispatchResult(succeeded=["b"]))
+
+        result = relay_outbox()
+
+        self.assertEqual(result, {"sent": 2, "retried": 0, "deferred": 0, "failed": 0})
+        self.assertEqual(
+            [c.args for c in self.mock_dispatcher_cls.from_config.call_args_list], [(None,), (["b"],)]
+        )
+        self.assertEqual(dispatcher.dispatch.await_args_list[0].args[0]["event_id"], events[0].id)
+        self.assertEqual([c.args[0] for c in self.mock_repo.mark_sent.call_args_list], events)
+        self.mock_db.commit.assert_called_once()
+
+    def test_relay_outbox_error_reschedules_failed_channels(self) -> None:
+        """
+        When: A channel fails and retries remain
+        Then: The event is rescheduled with exponential backoff for the failed channels only
+        """
+        event = self._event(attempts=1)
+        self.mock_repo.claim_pending.return_value = [event]
+        self._dispatch_results(DispatchResult(succeeded=["a"], failed=["b"]))
+
+        with patch(
+            "app.infrastructure.notifications.tasks.notification_tasks.backoff_delay", return_value=4
+        ) as mock_backoff:
+            result = relay_outbox()
+
+        self.assertEqual(result, {"sent": 0, "retried": 1, "deferred": 0, "failed": 0})
+        self.mock_repo.mark_failed.assert_called_once_with(event, ["b"], "failed channels: ['b']", retry_in=4)
+        mock_backoff.assert_called_once_with(2, 1)
+        self.mock_db.commit.assert_called_once()
+
+    def test_relay_outbox_success_defers_short_circuited_without_attempt(self) -> None:
+        """
+        When: Every failed channel was short-circuited by an open circuit
+        Then: The event is deferred without spending a retry attempt
+        """
+        event = self._event(attempts=3)
+        self.mock_repo.claim_pending.return_value = [event]
+        self._dispatch_results(DispatchResult(succeeded=["a"], failed=["b"], short_circuited=["b"]))
+
+        result = relay_outbox()
+
+        self.assertEqual(result, {"sent": 0, "retried": 0, "deferred": 1, "failed": 0})
+        kwargs = self.mock_repo.mark_failed.call_args.kwargs
+        self.assertFalse(kwargs["count_attempt"])
+        self.assertGreaterEqual(kwargs["retry_in"], 15)
+
+    def test_relay_outbox_error_gives_up_after_max_retries(self) -> None:
+        """
+        When: A channel fails and the event has used all its retries
+        Then: The event is marked failed without a retry
+        """
+        event = self._event(attempts=3)
+        self.mock_repo.claim_pending.return_value = [event]
+        self._dispatch_results(DispatchResult(failed=["b"]))
+
+        result = relay_outbox()
+
+        self.assertEqual(result, {"sent": 0, "retried": 0, "deferred": 0, "failed": 1})
+        self.mock_repo.mark_failed.assert_called_once_with(event, ["b"], "failed channels: ['b']")
+
+    def test_relay_outbox_error_rolls_back_on_exception(self) -> None:
+        """
+        When: Claiming the batch raises
+        Then: The transaction is rolled back, the session closed and the error propagated
+        """
+        self.mock_repo.claim_pending.side_effect = Exception("db down")
+
+        with self.assertRaises(Exception):
+            relay_outbox()
+
+        self.mock_db.rollback.assert_called_once()
+        self.mock_db.commit.assert_not_called()
+        self.mock_db.close.assert_called_once()
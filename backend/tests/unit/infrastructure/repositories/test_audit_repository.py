@@ -31,6 +31,32 @@ class TestLog(AuditRepositoryTestCase):
         self.mock_db.commit.assert_called_once()
 
 
+class TestLogMany(AuditRepositoryTestCase):
+    """Tests for log_many()."""
+
+    def test_log_many_success_single_insert(self) -> None:
+        entries = [
+            {"table_name": "documents", "record_id": 1, "action": "state_change", "old_value": "draft"},
+            {"table_name": "documents", "record_id": 2, "action": "state_change", "new_value": "pending"},
+        ]
+        self.repo.log_many(entries)
+
+        self.mock_db.execute.assert_called_once()
+        rows = self.mock_db.execute.call_args.args[1]
+        self.assertEqual([r["record_id"] for r in rows], ["1", "2"])
+        self.assertIsNone(rows[0]["new_value"])
+        self.mock_db.commit.assert_called_once()
+
+    def test_log_many_success_without_commit(self) -> None:
+        self.repo.log_many([{"table_name": "jobs", "record_id": "x", "action": "created"}], commit=False)
+        self.mock_db.execute.assert_called_once()
+        self.mock_db.commit.assert_not_called()
+
+    def test_log_many_success_empty_is_noop(self) -> None:
+        self.repo.log_many([])
+        self.mock_db.execute.assert_not_called()
+
+
 class TestLogCreated(AuditRepositoryTestCase):
     """Tests for log_created()."""
 
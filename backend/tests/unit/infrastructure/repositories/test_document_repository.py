@@ -14,10 +14,9 @@ class DocumentRepositoryTestCase(BaseTestCase):
     def setUp(self) -> None:
         super().setUp()
         self.mock_db = self.make_mock_db_session()
-        with patch("app.infrastructure.repositories.document_repository._SKIP_AUDIT_SQL"):
-            from app.infrastructure.repositories.document_repository import DocumentRepository
+        from app.infrastructure.repositories.document_repository import DocumentRepository
 
-            self.repo = DocumentRepository(self.mock_db)
+        self.repo = DocumentRepository(self.mock_db)
 
     def _make_db_model(self, **overrides):
         model = MagicMock()
@@ -63,6 +62,78 @@ class TestGetById(DocumentRepositoryTestCase):
         self.assertIsNone(result)
 
 
+class TestGetMany(DocumentRepositoryTestCase):
+    """Tests for get_many(), existing_ids() and get_many_fields()."""
+
+    def test_get_many_success_binds_ids_as_array(self) -> None:
+        self.mock_db.query.return_value.filter.return_value.all.return_value = [
+            self._make_db_model(id=2), self._make_db_model(id=1)
+        ]
+
+        docs = self.repo.get_many([1, 2])
+
+        self.assertEqual([d.id for d in docs], [2, 1])
+        condition = self.mock_db.query.return_value.filter.call_args.args[0]
+        self.assertEqual(condition.right.element.value, [1, 2])
+
+    def test_existing_ids_success_single_query(self) -> None:
+        self.mock_db.query.return_value.filter.return_value.all.return_value = [MagicMock(id=3)]
+
+        self.assertEqual(self.repo.existing_ids([3, 4]), {3})
+        self.mock_db.query.assert_called_once()
+
+    def test_get_many_fields_success(self) -> None:
+        self.mock_db.query.return_value.filter.return_value.all.return_value = [(5, "approved")]
+
+        rows = self.repo.get_many_fields([5, 6], ["id", "status"])
+
+        self.assertEqual(rows, [{"id": 5, "status": "approved"}])
+
+
+class TestBulkUpdateStatus(DocumentRepositoryTestCase):
+    """Tests for bulk_update_status()."""
+
+    def _row(self, document_id, new_status, old_status, updated):
+        row = MagicMock()
+        row.document_id = document_id
+        row.new_status = new_status
+        row.old_status = old_status
+        row.updated = updated
+        return row
+
+    def test_bulk_update_status_success_one_statement_and_audit(self) -> None:
+        rows = [
+            self._row(1, "approved", "pending", True),
+            self._row(2, "approved", "draft", False),
+            self._row(3, "rejected", None, False),
+        ]
+        self.mock_db.execute.return_value.all.return_value = rows
+        self.repo._audit = MagicMock()
+
+        result = self.repo.bulk_update_status(
+            [
+                {"document_id": 1, "new_status": "approved"},
+                {"document_id": 2, "new_status": "approved"},
+                {"document_id": 3, "new_status": "rejected", "comment": "bad"},
+            ],
+            user_email="approver@test.com",
+        )
+
+        self.assertEqual(result, rows)
+        params = self.mock_db.execute.call_args.args[1]
+        self.assertIn('"idx": 2', params["entries"])
+        self.assertIn('"comment": "bad"', params["entries"])
+        self.assertIn('"from_status": "pending"', params["transitions"])
+        self.assertEqual(params["user_email"], "approver@test.com")
+
+        audit_entries = self.repo._audit.log_many.call_args.args[0]
+        self.assertEqual(len(audit_entries), 1)
+        self.assertEqual(audit_entries[0]["record_id"], 1)
+        self.assertEqual(audit_entries[0]["old_value"], "pending")
+        self.assertFalse(self.repo._audit.log_many.call_args.kwargs["commit"])
+        self.mock_db.commit.assert_called_once()
+
+
 class TestUpdate(DocumentRepositoryTestCase):
     """Tests for update()."""
 
@@ -182,3 +253,82 @@ class TestSearch(DocumentRepositoryTestCase):
             "created_to": datetime(2024, 12, 31),
         })
         self.assertEqual(total, 0)
+
+
+class TestSparseFields(DocumentRepositoryTestCase):
+    """Tests for get_fields() and search_fields()."""
+
+    def test_get_fields_success_selects_only_requested_columns(self) -> None:
+        self.mock_db.query.return_value.filter.return_value.first.return_value = (7, "invoice", "ACME")
+
+        data = self.repo.get_fields(7, ["id", "type", "metadata.client"])
+
+        self.assertEqual(data, {"id": 7, "type": "invoice", "metadata": {"client": "ACME"}})
+        self.assertEqual(len(self.mock_db.query.call_args.args), 3)
+
+    def test_get_fields_success_not_found(self) -> None:
+        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.assertIsNone(self.repo.get_fields(1, ["id"]))
+
+    def test_get_fields_success_missing_metadata_key_omitted(self) -> None:
+        self.mock_db.query.return_value.filter.return_value.first.return_value = (7, None)
+        self.assertEqual(self.repo.get_fields(7, ["id", "metadata.client"]), {"id": 7, "metadata": {}})
+
+    def test_search_fields_success_with_filter(self) -> None:
+        mock_query = MagicMock()
+        mock_filtered = MagicMock()
+        mock_query.filter.return_value = mock_filtered
+        mock_filtered.count.return_value = 1
+        mock_filtered.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [
+            (3, Decimal("10.00"), "draft")
+        ]
+        self.mock_db.query.return_value = mock_query
+
+        rows, total = self.repo.search_fields({"status": "draft"}, ["id", "amount", "status"])
+
+        self.assertEqual(total, 1)
+        self.assertEqual(rows, [{"id": 3, "amount": Decimal("10.00"), "status": "draft"}])
+
+
+class TestReadRows(DocumentRepositoryTestCase):
+    """Tests for get_row(), get_many_rows() and search_rows()."""
+
+    def _labels(self) -> list:
+        return [column.name for column in self.mock_db.query.call_args.args]
+
+    def test_get_row_success_selects_labeled_columns(self) -> None:
+        row = MagicMock()
+        self.mock_db.query.return_value.filter.return_value.first.return_value = row
+
+        self.assertIs(self.repo.get_row(7), row)
+        self.assertEqual(
+            self._labels(),
+            ["id", "type", "amount", "status", "created_at", "updated_at", "metadata", "created_by"],
+        )
+
+    def test_get_row_success_not_found(self) -> None:
+        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        self.assertIsNone(self.repo.get_row(999))
+
+    def test_get_many_rows_success_binds_ids_as_array(self) -> None:
+        rows = [MagicMock(), MagicMock()]
+        self.mock_db.query.return_value.filter.return_value.all.return_value = rows
+
+        self.assertEqual(self.repo.get_many_rows([1, 2]), rows)
+        condition = self.mock_db.query.return_value.filter.call_args.args[0]
+        self.assertEqual(condition.right.element.value, [1, 2])
+
+    def test_search_rows_success_with_filter(self) -> None:
+        mock_query = MagicMock()
+        mock_filtered = MagicMock()
+        mock_query.filter.return_value = mock_filtered
+        mock_filtered.count.return_value = 1
+        rows = [MagicMock()]
+        mock_filtered.order_by.return_value.offset.return_value.limit.return_value.all.return_value = rows
+        self.mock_db.query.return_value = mock_query
+
+        result, total = self.repo.search_rows({"status": "draft"}, skip=10, limit=5)
+
+        self.assertEqual((result, total), (rows, 1))
+        mock_filtered.order_by.return_value.offset.assert_called_once_with(10)
+        self.assertIn("metadata", self._labels())
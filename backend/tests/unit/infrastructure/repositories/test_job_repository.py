@@ -15,10 +15,9 @@ class JobRepositoryTestCase(BaseTestCase):
     def setUp(self) -> None:
         super().setUp()
         self.mock_db = self.make_mock_db_session()
-        with patch("app.infrastructure.repositories.job_repository._SKIP_AUDIT_SQL"):
-            from app.infrastructure.repositories.job_repository import JobRepository
+        from app.infrastructure.repositories.job_repository import JobRepository
 
-            self.repo = JobRepository(self.mock_db)
+        self.repo = JobRepository(self.mock_db)
 
     def _make_db_model(self, **overrides):
         model = MagicMock()
@@ -81,6 +80,35 @@ class TestListAll(JobRepositoryTestCase):
         self.assertEqual(total, 1)
 
 
+class TestListSummaries(JobRepositoryTestCase):
+    """Tests for list_summaries()."""
+
+    def test_list_summaries_success_projects_columns(self) -> None:
+        mock_query = MagicMock()
+        mock_query.count.return_value = 1
+        row = MagicMock()
+        mock_query.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [row]
+        self.mock_db.query.return_value = mock_query
+        rows, total = self.repo.list_summaries(skip=0, limit=10)
+        self.assertEqual(total, 1)
+        self.assertEqual(rows, [row])
+        columns = [str(getattr(c, "name", c)) for c in self.mock_db.query.call_args.args]
+        self.assertIn("document_count", columns)
+        self.assertNotIn("document_ids", columns)
+        self.assertNotIn("result", columns)
+
+    def test_list_summaries_success_with_status_filter(self) -> None:
+        mock_query = MagicMock()
+        mock_filtered = MagicMock()
+        mock_query.filter.return_value = mock_filtered
+        mock_filtered.count.return_value = 0
+        mock_filtered.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
+        self.mock_db.query.return_value = mock_query
+        rows, total = self.repo.list_summaries(status="failed")
+        mock_query.filter.assert_called_once()
+        self.assertEqual((rows, total), ([], 0))
+
+
 class TestUpdateStatus(JobRepositoryTestCase):
     """Tests for update_status()."""
 
@@ -106,3 +134,73 @@ class TestUpdateStatus(JobRepositoryTestCase):
         self.mock_db.query.return_value.filter.return_value.first.return_value = None
         with self.assertRaises(JobNotFoundException):
             self.repo.update_status(uuid4(), "completed")
+
+    def test_update_status_success_bulk_inserts_items(self) -> None:
+        db_model = self._make_db_model()
+        self.mock_db.query.return_value.filter.return_value.first.return_value = db_model
+        items = [
+            {"document_id": 1, "status": "success"},
+            {"document_id": 2, "status": "success", "action": "skipped"},
+            {"document_id": 3, "status": "failed", "error": "not_found"},
+        ]
+        self.repo.update_status(db_model.id, "completed", result={"total": 3}, items=items)
+
+        _, rows = self.mock_db.execute.call_args.args
+        self.assertEqual([r["document_id"] for r in rows], [1, 2, 3])
+        self.assertEqual(rows[1]["action"], "skipped")
+        self.assertEqual(rows[2]["error"], "not_found")
+        self.assertTrue(all(r["job_id"] == db_model.id for r in rows))
+        self.mock_db.commit.assert_called_once()
+
+    def test_update_status_success_without_items_skips_insert(self) -> None:
+        db_model = self._make_db_model()
+        self.mock_db.query.return_value.filter.return_value.first.return_value = db_model
+        self.repo.update_status(db_model.id, "processing")
+        self.assertEqual(self.mock_db.execute.call_count, 1)
+
+    def test_update_status_success_writes_outbox_event(self) -> None:
+        db_model = self._make_db_model()
+        self.mock_db.query.return_value.filter.return_value.first.return_value = db_model
+        payload = {"job_id": str(db_model.id), "status": "completed"}
+
+        self.repo.update_status(db_model.id, "completed", outbox_event=payload)
+
+        event = self.mock_db.add.call_args.args[0]
+        self.assertEqual(event.event_type, "job.completed")
+        self.assertEqual(event.payload, payload)
+        self.mock_db.commit.assert_called_once()
+
+    def test_update_status_success_without_outbox_event_adds_nothing(self) -> None:
+        db_model = self._make_db_model()
+        self.mock_db.query.return_value.filter.return_value.first.return_value = db_model
+        self.repo.update_status(db_model.id, "processing")
+        self.mock_db.add.assert_not_called()
+
+
+class TestExists(JobRepositoryTestCase):
+    """Tests for exists()."""
+
+    def test_exists_success_true(self) -> None:
+        self.mock_db.query.return_value.scalar.return_value = True
+        self.assertTrue(self.repo.exists(uuid4()))
+
+    def test_exists_success_false(self) -> None:
+        self.mock_db.query.return_value.scalar.return_value = False
+        self.assertFalse(self.repo.exists(uuid4()))
+
+
+class TestListItems(JobRepositoryTestCase):
+    """Tests for list_items()."""
+
+    def test_list_items_success_paginates(self) -> None:
+        mock_query = MagicMock()
+        mock_query.count.return_value = 120
+        mock_query.order_by.return_value.offset.return_value.limit.return_value.all.return_value = [MagicMock()]
+        self.mock_db.query.return_value.filter.return_value = mock_query
+
+        items, total = self.repo.list_items(uuid4(), skip=50, limit=50)
+
+        self.assertEqual(total, 120)
+        self.assertEqual(len(items), 1)
+        mock_query.order_by.return_value.offset.assert_called_once_with(50)
+        mock_query.order_by.return_value.offset.return_value.limit.assert_called_once_with(50)
@@ -0,0 +1,107 @@
+"""Tests for app.infrastructure.repositories.outbox_repository.OutboxRepository."""
+
+from unittest.mock import MagicMock
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.database.models import OutboxModel
+from app.infrastructure.repositories.outbox_repository import OutboxRepository
+
+
+class OutboxRepositoryTestCase(BaseTestCase):
+    """Base class for OutboxRepository tests."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_db = self.make_mock_db_session()
+        self.repo = OutboxRepository(self.mock_db)
+
+    def _event(self, attempts: int = 0) -> OutboxModel:
+        return OutboxModel(event_type="job.completed", payload={"job_id": "x"}, status="pending", attempts=attempts)
+
+
+class TestAdd(OutboxRepositoryTestCase):
+    """Tests for add()."""
+
+    def test_add_success_creates_pending_event(self) -> None:
+        payload = {"job_id": str(self.fake.uuid4())}
+        event = self.repo.add("job.completed", payload)
+
+        self.mock_db.add.assert_called_once_with(event)
+        self.assertEqual(event.event_type, "job.completed")
+        self.assertEqual(event.payload, payload)
+        self.assertEqual(event.status, "pending")
+        self.mock_db.commit.assert_called_once()
+
+    def test_add_success_without_commit(self) -> None:
+        self.repo.add("job.failed", {"job_id": "x"}, commit=False)
+        self.mock_db.add.assert_called_once()
+        self.mock_db.commit.assert_not_called()
+
+
+class TestMarkSent(OutboxRepositoryTestCase):
+    """Tests for mark_sent()."""
+
+    def test_mark_sent_success(self) -> None:
+        event = self._event(attempts=1)
+        event.channels = ["b"]
+        event.last_error = "boom"
+
+        self.repo.mark_sent(event)
+
+        self.assertEqual(event.status, "sent")
+        self.assertEqual(event.attempts, 2)
+        self.assertIsNone(event.channels)
+        self.assertIsNone(event.last_error)
+        self.assertIsNotNone(event.processed_at)
+        self.mock_db.commit.assert_not_called()
+
+
+class TestMarkFailed(OutboxRepositoryTestCase):
+    """Tests for mark_failed()."""
+
+    def test_mark_failed_success_reschedules(self) -> None:
+        event = self._event()
+
+        self.repo.mark_failed(event, ["b"], "boom", retry_in=4)
+
+        self.assertEqual(event.status, "pending")
+        self.assertEqual(event.attempts, 1)
+        self.assertEqual(event.channels, ["b"])
+        self.assertEqual(event.last_error, "boom")
+        self.assertIsNotNone(event.next_attempt_at)
+        self.assertIsNone(event.processed_at)
+
+    def test_mark_failed_success_without_counting_attempt(self) -> None:
+        event = self._event(attempts=2)
+
+        self.repo.mark_failed(event, ["b"], "open circuit", retry_in=30, count_attempt=False)
+
+        self.assertEqual(event.attempts, 2)
+        self.assertEqual(event.status, "pending")
+
+    def test_mark_failed_success_gives_up(self) -> None:
+        event = self._event(attempts=3)
+
+        self.repo.mark_failed(event, ["b"], "boom")
+
+        self.assertEqual(event.status, "failed")
+        self.assertEqual(event.attempts, 4)
+        self.assertIsNotNone(event.processed_at)
+
+
+class TestClaimPending(OutboxRepositoryTestCase):
+    """Tests for claim_pending()."""
+
+    def test_claim_pending_success_skip_locked(self) -> None:
+        events = [self._event()]
+        query = self.mock_db.query.return_value
+        query.filter.return_value.order_by.return_value.limit.return_value.with_for_update.return_value.all.return_value = events
+
+        result = self.repo.claim_pending(10)
+
+        self.assertEqual(result, events)
+        query.filter.return_value.order_by.return_value.limit.assert_called_once_with(10)
+        query.filter.return_value.order_by.return_value.limit.return_value.with_for_update.assert_called_once_with(
+            skip_locked=True
+        )
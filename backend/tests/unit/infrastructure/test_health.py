@@ -0,0 +1,276 @@
+"""Tests for app.infrastructure.health – ReadinessProbe and WorkerHeartbeat."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import redis
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
+
+from tests.common import BaseTestCase
+
+from app.infrastructure.health import (
+    HEARTBEAT_KEY,
+    ReadinessProbe,
+    WorkerHeartbeat,
+    create_probe_engine,
+    get_readiness_probe,
+    pool_stats,
+)
+
+
+class ReadinessProbeTestCase(BaseTestCase):
+    """Base class for ReadinessProbe tests: SQLite engine and fakeredis."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        self.redis.hset(HEARTBEAT_KEY, "celery@worker-1", time.time())
+        self.probe = self._probe()
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        super().tearDown()
+
+    def _probe(self, **kwargs) -> ReadinessProbe:  # noqa: ANN003
+        kwargs.setdefault("timeout_seconds", 2.0)
+        return ReadinessProbe(self.engine, self.redis, queues=["celery", "notifications"], **kwargs)
+
+
+class TestReport(ReadinessProbeTestCase):
+    """Tests for ReadinessProbe.report."""
+
+    def test_report_success_all_checks_ok(self) -> None:
+        report = self.probe.report()
+
+        self.assertEqual(report["status"], "ready")
+        self.assertTrue(report["ready"])
+        self.assertFalse(report["cached"])
+        self.assertEqual(set(report["checks"]), {"database", "redis", "queues", "workers"})
+        self.assertEqual(report["checks"]["queues"]["details"], {"depth": {"celery": 0, "notifications": 0}})
+
+    def test_report_success_cached_within_period(self) -> None:
+        self.probe.report()
+        with patch.object(self.probe, "check_redis") as mock_check:
+            report = self.probe.report()
+
+        self.assertTrue(report["cached"])
+        mock_check.assert_not_called()
+
+    def test_report_success_non_critical_failure_is_degraded(self) -> None:
+        self.redis.delete(HEARTBEAT_KEY)
+
+        report = self.probe.report()
+
+        self.assertEqual(report["status"], "degraded")
+        self.assertTrue(report["ready"])
+        self.assertEqual(report["checks"]["workers"]["error"], "no worker heartbeat")
+
+    def test_report_success_critical_check_degraded_stays_ready(self) -> None:
+        report = self._probe(db_latency_degraded_ms=-1).report()
+
+        self.assertEqual(report["status"], "degraded")
+        self.assertTrue(report["ready"])
+        self.assertEqual(report["checks"]["database"]["status"], "degraded")
+
+    def test_report_failure_critical_check_down(self) -> None:
+        self.probe._redis = MagicMock()
+        self.probe._redis.ping.side_effect = redis.ConnectionError("connection refused")
+
+        report = self.probe.report()
+
+        self.assertEqual(report["status"], "unavailable")
+        self.assertFalse(report["ready"])
+        self.assertEqual(report["checks"]["redis"]["status"], "down")
+        self.assertEqual(report["checks"]["redis"]["error"], "connection refused")
+
+    def test_report_failure_check_times_out(self) -> None:
+        release = threading.Event()
+        probe = self._probe(timeout_seconds=0.05, cache_seconds=0)
+        probe._checks["database"] = lambda: release.wait(5)
+
+        first = probe.report()
+        second = probe.report()
+        release.set()
+
+        self.assertEqual(first["checks"]["database"]["error"], "timed out after 0.05s")
+        self.assertEqual(second["checks"]["database"]["error"], "previous probe still running")
+        self.assertFalse(first["ready"])
+
+    def test_report_failure_check_raises(self) -> None:
+        probe = self._probe(critical_checks=["redis"])
+        probe._checks["queues"] = MagicMock(side_effect=RuntimeError("boom"))
+
+        report = probe.report()
+
+        self.assertEqual(report["status"], "degraded")
+        self.assertEqual(report["checks"]["queues"]["error"], "boom")
+
+
+class TestChecks(ReadinessProbeTestCase):
+    """Tests for the individual checks."""
+
+    def test_check_database_success_degraded_when_slow(self) -> None:
+        result = self._probe(db_latency_degraded_ms=-1).check_database()
+
+        self.assertEqual(result.status, "degraded")
+        self.assertEqual(result.details, {"class": "StaticPool"})
+
+    def test_check_database_failure_connection_error(self) -> None:
+        self.probe._probe_engine = create_engine("sqlite:////nonexistent/dir/db.sqlite")
+
+        result = self.probe.check_database()
+
+        self.assertEqual(result.status, "down")
+        self.assertIsNotNone(result.error)
+
+    def test_check_database_success_uses_probe_engine(self) -> None:
+        probe_engine = create_engine("sqlite:////nonexistent/dir/db.sqlite")
+
+        result = self._probe(probe_engine=probe_engine).check_database()
+        probe_engine.dispose()
+
+        self.assertEqual(result.status, "down")
+        self.assertEqual(result.details, {"class": "StaticPool"})
+
+    def test_check_redis_success_degraded_when_slow(self) -> None:
+        result = self._probe(redis_latency_degraded_ms=-1).check_redis()
+
+        self.assertEqual(result.status, "degraded")
+
+    def test_check_queues_success_degraded_when_backed_up(self) -> None:
+        self.redis.rpush("celery", *range(11))
+
+        result = self._probe(queue_depth_degraded=10).check_queues()
+
+        self.assertEqual(result.status, "degraded")
+        self.assertEqual(result.details["depth"]["celery"], 11)
+
+    def test_check_queues_failure_redis_error(self) -> None:
+        self.probe._redis = MagicMock()
+        self.probe._redis.pipeline.side_effect = redis.ConnectionError("down")
+
+        self.assertEqual(self.probe.check_queues().status, "down")
+
+    def test_check_workers_success_prunes_expired(self) -> None:
+        self.redis.hset(HEARTBEAT_KEY, "celery@gone", time.time() - 3600)
+
+        result = self.probe.check_workers()
+
+        self.assertEqual(result.status, "ok")
+        self.assertEqual(result.details["alive"], ["celery@worker-1"])
+        self.assertNotIn("celery@gone", self.redis.hgetall(HEARTBEAT_KEY))
+
+    def test_check_workers_failure_stale_heartbeat(self) -> None:
+        self.redis.hset(HEARTBEAT_KEY, "celery@worker-1", time.time() - 60)
+
+        result = self.probe.check_workers()
+
+        self.assertEqual(result.status, "down")
+        self.assertEqual(result.details["alive"], [])
+        self.assertGreaterEqual(result.details["newest_age_seconds"], 60)
+
+    def test_check_workers_failure_redis_error(self) -> None:
+        self.probe._redis = MagicMock()
+        self.probe._redis.hgetall.side_effect = redis.ConnectionError("down")
+
+        self.assertEqual(self.probe.check_workers().status, "down")
+
+
+class TestPoolStats(BaseTestCase):
+    """Tests for pool_stats."""
+
+    def test_pool_stats_success_queue_pool(self) -> None:
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=3, max_overflow=2)
+        with engine.connect():
+            stats = pool_stats(engine, max_overflow=2)
+        engine.dispose()
+
+        self.assertEqual(stats, {"class": "QueuePool", "size": 3, "checked_out": 1, "overflow": 0, "capacity": 5})
+
+    def test_pool_stats_success_null_pool(self) -> None:
+        engine = create_engine("sqlite://", poolclass=NullPool)
+
+        self.assertEqual(pool_stats(engine, max_overflow=10), {"class": "NullPool"})
+
+    def test_check_database_success_degraded_when_pool_saturated(self) -> None:
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=0, pool_timeout=5)
+        probe = ReadinessProbe(engine, fakeredis.FakeRedis(), queues=[], db_max_overflow=0, db_pool_saturation=0.5)
+
+        with engine.connect():
+            result = probe.check_database()
+        engine.dispose()
+
+        self.assertEqual(result.status, "degraded")
+        self.assertEqual(result.details["checked_out"], 1)
+        self.assertEqual(result.error, "connection pool saturated")
+
+    def test_check_database_success_exhausted_pool_does_not_wait(self) -> None:
+        engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=5)
+        probe_engine = MagicMock()
+        probe = ReadinessProbe(engine, fakeredis.FakeRedis(), queues=[], db_max_overflow=0, probe_engine=probe_engine)
+
+        start = time.monotonic()
+        with engine.connect():
+            result = probe.check_database()
+        engine.dispose()
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(result.status, "degraded")
+        probe_engine.connect.assert_not_called()
+
+    def test_create_probe_engine_success_single_connection(self) -> None:
+        probe_engine = create_probe_engine("sqlite://", timeout_seconds=0.5)
+
+        self.assertIsInstance(probe_engine.pool, QueuePool)
+        self.assertEqual(probe_engine.pool.size(), 1)
+        self.assertEqual(pool_stats(probe_engine, max_overflow=0)["capacity"], 1)
+        self.assertEqual(probe_engine.pool._timeout, 0.5)
+
+
+class TestGetReadinessProbe(BaseTestCase):
+    """Tests for get_readiness_probe."""
+
+    def test_get_readiness_probe_success_singleton(self) -> None:
+        with patch("app.infrastructure.health._probe", None):
+            first = get_readiness_probe()
+            self.assertIs(get_readiness_probe(), first)
+
+
+class TestWorkerHeartbeat(BaseTestCase):
+    """Tests for WorkerHeartbeat."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+
+    def test_worker_heartbeat_success_beats_until_stopped(self) -> None:
+        heartbeat = WorkerHeartbeat(self.redis, "celery@worker-1", interval_seconds=0.01).start()
+        first = float(self.redis.hget(HEARTBEAT_KEY, "celery@worker-1"))
+        time.sleep(0.05)
+        latest = float(self.redis.hget(HEARTBEAT_KEY, "celery@worker-1"))
+        heartbeat.stop()
+
+        self.assertGreater(latest, first)
+        self.assertIsNone(self.redis.hget(HEARTBEAT_KEY, "celery@worker-1"))
+
+    def test_worker_heartbeat_success_defaults_to_hostname(self) -> None:
+        with patch("app.infrastructure.health.socket.gethostname", return_value="host-a"):
+            heartbeat = WorkerHeartbeat(self.redis)
+
+        self.assertEqual(heartbeat.hostname, "host-a")
+
+    def test_worker_heartbeat_failure_redis_errors_are_logged(self) -> None:
+        client = MagicMock()
+        client.hset.side_effect = redis.ConnectionError("down")
+        client.hdel.side_effect = redis.ConnectionError("down")
+        heartbeat = WorkerHeartbeat(client, "celery@worker-1")
+
+        with self.assertLogs("app.infrastructure.health", level="WARNING") as logs:
+            heartbeat.beat()
+            heartbeat.stop()
+
+        self.assertEqual(len(logs.output), 2)
@@ -1,5 +1,7 @@
 """Tests for app.main – FastAPI app and health endpoints."""
 
+from unittest.mock import MagicMock, patch
+
 from fastapi.testclient import TestClient
 
 from tests.common import BaseTestCase
@@ -30,6 +32,27 @@ class TestHealthEndpoint(BaseTestCase):
         self.assertEqual(resp.json()["status"], "healthy")
 
 
+class TestReadinessEndpoint(BaseTestCase):
+    """Tests for GET /ready."""
+
+    def _get(self, report: dict) -> object:
+        probe = MagicMock()
+        probe.report.return_value = report
+        with patch("app.main.get_readiness_probe", return_value=probe):
+            return TestClient(app).get("/ready")
+
+    def test_ready_success_returns_report(self) -> None:
+        resp = self._get({"status": "degraded", "ready": True, "checks": {}})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["status"], "degraded")
+
+    def test_ready_failure_unavailable_returns_503(self) -> None:
+        resp = self._get({"status": "unavailable", "ready": False, "checks": {}})
+
+        self.assertEqual(resp.status_code, 503)
+
+
 class TestAppConfiguration(BaseTestCase):
     """Tests for app configuration."""
 
@@ -43,3 +66,16 @@ class TestAppConfiguration(BaseTestCase):
         route_paths = [r.path for r in app.routes]
         self.assertIn("/", route_paths)
         self.assertIn("/health", route_paths)
+        self.assertIn("/ready", route_paths)
+
+
+class TestMetricsEndpoint(BaseTestCase):
+    """Tests for GET /metrics."""
+
+    def test_metrics_success_prometheus_text(self) -> None:
+        client = TestClient(app)
+        client.get("/health")
+        resp = client.get("/metrics")
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/plain"))
+        self.assertIn('route="/health"', resp.text)
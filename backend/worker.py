@@ -3,12 +3,17 @@
 Run with:
     celery -A worker.celery_app worker --loglevel=info
     celery -A worker.celery_app worker --loglevel=info --concurrency=4
+
+Notifications are relayed from the outbox on their own queue; run a dedicated
+worker for it with an embedded beat scheduler (periodic relay_outbox):
+    celery -A worker.celery_app worker -Q notifications -B --loglevel=info --concurrency=8
 """
 
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.infrastructure.notifications.tasks.celery_app import celery_app
 from app.infrastructure.notifications.tasks.document_tasks import process_documents_batch  # noqa: F401
+from app.infrastructure.notifications.tasks.notification_tasks import relay_outbox  # noqa: F401
 
 setup_logging(settings.LOG_LEVEL)
 
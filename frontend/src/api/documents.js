@@ -5,6 +5,9 @@ export const documentsApi = {
 
   get: (id) => client.get(`/documents/${id}`),
 
+  batchGet: (ids, fields = null) =>
+    client.post('/documents/batch-get', { ids, ...(fields ? { fields } : {}) }),
+
   create: (data) => client.post('/documents', data),
 
   update: (id, data) => client.put(`/documents/${id}`, data),
@@ -15,6 +18,8 @@ export const documentsApi = {
       ...(comment ? { comment } : {}),
     }),
 
+  bulkChangeStatus: (entries) => client.patch('/documents/status', { entries }),
+
   processBatch: (documentIds) =>
     client.post('/documents/batch/process', { document_ids: documentIds }),
 }
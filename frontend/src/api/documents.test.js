@@ -129,4 +129,40 @@ describe('documentsApi', () => {
       })
     })
   })
+
+  describe('batchGet', () => {
+    it('should call POST /documents/batch-get with ids', async () => {
+      const ids = [
+        faker.number.int({ min: 1, max: 999 }),
+        faker.number.int({ min: 1, max: 999 }),
+      ]
+      client.post.mockResolvedValue({ data: { items: [], missing: [] } })
+
+      await documentsApi.batchGet(ids)
+
+      expect(client.post).toHaveBeenCalledWith('/documents/batch-get', { ids })
+    })
+
+    it('should include fields when provided', async () => {
+      client.post.mockResolvedValue({ data: { items: [], missing: [] } })
+
+      await documentsApi.batchGet([1, 2], 'type,amount')
+
+      expect(client.post).toHaveBeenCalledWith('/documents/batch-get', { ids: [1, 2], fields: 'type,amount' })
+    })
+  })
+
+  describe('bulkChangeStatus', () => {
+    it('should call PATCH /documents/status with entries', async () => {
+      const entries = [
+        { document_id: faker.number.int({ min: 1, max: 999 }), new_status: 'approved' },
+        { document_id: faker.number.int({ min: 1000, max: 1999 }), new_status: 'rejected', comment: faker.lorem.sentence() },
+      ]
+      client.patch.mockResolvedValue({ data: { results: [], updated: 0, failed: 0 } })
+
+      await documentsApi.bulkChangeStatus(entries)
+
+      expect(client.patch).toHaveBeenCalledWith('/documents/status', { entries })
+    })
+  })
 })
@@ -3,4 +3,5 @@ import client from './client'
 export const jobsApi = {
   list: (params = {}) => client.get('/jobs', { params }),
   get: (jobId) => client.get(`/jobs/${jobId}`),
+  items: (jobId, params = {}) => client.get(`/jobs/${jobId}/items`, { params }),
 }
@@ -47,4 +47,16 @@ describe('jobsApi', () => {
       expect(result.data).toEqual(job)
     })
   })
+
+  describe('items', () => {
+    it('should call GET /jobs/:jobId/items with pagination params', async () => {
+      const job = makeJob()
+      const params = { page: 2, page_size: 100 }
+      client.get.mockResolvedValue({ data: { items: [], total: 0 } })
+
+      await jobsApi.items(job.job_id, params)
+
+      expect(client.get).toHaveBeenCalledWith(`/jobs/${job.job_id}/items`, { params })
+    })
+  })
 })
@@ -0,0 +1,37 @@
+import { useState, useEffect, useCallback } from 'react'
+import { jobsApi } from '../api/jobs'
+
+const PAGE_SIZE = 100
+
+export default function useJobItems(jobId, enabled = true) {
+  const [items, setItems]     = useState([])
+  const [total, setTotal]     = useState(0)
+  const [page, setPage]       = useState(1)
+  const [loading, setLoading] = useState(false)
+  const [error, setError]     = useState(null)
+
+  const fetchPage = useCallback(async (pageToLoad) => {
+    setLoading(true)
+    setError(null)
+    try {
+      const { data } = await jobsApi.items(jobId, { page: pageToLoad, page_size: PAGE_SIZE })
+      setItems((prev) => (pageToLoad === 1 ? data.items : [...prev, ...data.items]))
+      setTotal(data.total)
+      setPage(pageToLoad)
+    } catch (err) {
+      setError(err.response?.data?.detail || 'Error al cargar el resultado por documento')
+    } finally {
+      setLoading(false)
+    }
+  }, [jobId])
+
+  useEffect(() => {
+    if (!jobId || !enabled) return
+    fetchPage(1)
+  }, [jobId, enabled, fetchPage])
+
+  const hasMore  = items.length < total
+  const loadMore = () => fetchPage(page + 1)
+
+  return { items, total, loading, error, hasMore, loadMore }
+}
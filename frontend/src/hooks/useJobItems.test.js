@@ -0,0 +1,84 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { renderHook, act, waitFor } from '@testing-library/react'
+import { faker } from '../test/helpers'
+
+const mockItems = vi.fn()
+
+vi.mock('../api/jobs', () => ({
+  jobsApi: {
+    items: (...args) => mockItems(...args),
+  },
+}))
+
+import useJobItems from './useJobItems'
+
+function makeItem(overrides = {}) {
+  return {
+    document_id: faker.number.int({ min: 1, max: 999 }),
+    status: 'success',
+    action: null,
+    error: null,
+    ...overrides,
+  }
+}
+
+beforeEach(() => {
+  vi.clearAllMocks()
+})
+
+describe('useJobItems', () => {
+  it('should load the first page on mount', async () => {
+    const jobId = faker.string.uuid()
+    const items = [makeItem(), makeItem()]
+    mockItems.mockResolvedValue({ data: { items, total: 2 } })
+
+    const { result } = renderHook(() => useJobItems(jobId))
+
+    await waitFor(() => {
+      expect(result.current.items).toEqual(items)
+    })
+
+    expect(mockItems).toHaveBeenCalledWith(jobId, { page: 1, page_size: 100 })
+    expect(result.current.total).toBe(2)
+    expect(result.current.hasMore).toBe(false)
+  })
+
+  it('should not fetch when disabled', () => {
+    renderHook(() => useJobItems(faker.string.uuid(), false))
+    expect(mockItems).not.toHaveBeenCalled()
+  })
+
+  it('should append the next page on loadMore', async () => {
+    const jobId = faker.string.uuid()
+    const first = [makeItem()]
+    const second = [makeItem()]
+    mockItems
+      .mockResolvedValueOnce({ data: { items: first, total: 2 } })
+      .mockResolvedValueOnce({ data: { items: second, total: 2 } })
+
+    const { result } = renderHook(() => useJobItems(jobId))
+
+    await waitFor(() => {
+      expect(result.current.hasMore).toBe(true)
+    })
+
+    await act(async () => {
+      await result.current.loadMore()
+    })
+
+    expect(mockItems).toHaveBeenLastCalledWith(jobId, { page: 2, page_size: 100 })
+    expect(result.current.items).toEqual([...first, ...second])
+    expect(result.current.hasMore).toBe(false)
+  })
+
+  it('should set error from API response detail', async () => {
+    const detail = faker.lorem.sentence()
+    mockItems.mockRejectedValue({ response: { data: { detail } } })
+
+    const { result } = renderHook(() => useJobItems(faker.string.uuid()))
+
+    await waitFor(() => {
+      expect(result.current.error).toBe(detail)
+    })
+  })
+})
@@ -7,13 +7,16 @@ import Pagination from '../components/common/Pagination'
 import LoadingSpinner from '../components/common/LoadingSpinner'
 import BatchModal from '../components/batch/BatchModal'
 
+// Columnas que muestra DocumentTable: evita traer la metadata completa en el listado
+const LIST_FIELDS = 'type,amount,status,created_by,created_at'
+
 export default function DocumentsPage() {
   const [searchParams] = useSearchParams()
   const [selected, setSelected] = useState([])
   const [showBatch, setShowBatch] = useState(false)
 
   const { documents, total, totalPages, loading, error, filters, updateFilter, refresh } =
-    useDocuments({ status: searchParams.get('status') || '' })
+    useDocuments({ status: searchParams.get('status') || '', fields: LIST_FIELDS })
 
   useEffect(() => { setSelected([]) }, [filters])
 
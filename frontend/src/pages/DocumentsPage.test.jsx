@@ -245,6 +245,14 @@ describe('DocumentsPage', () => {
       expect(useDocuments).toHaveBeenCalledWith(expect.objectContaining({ status: 'draft' }))
     })
 
+    it('requests only the fields shown in the table', () => {
+      useDocuments.mockReturnValue(buildUseDocuments())
+      renderPage('/documents')
+      expect(useDocuments).toHaveBeenCalledWith(
+        expect.objectContaining({ fields: 'type,amount,status,created_by,created_at' }),
+      )
+    })
+
     it('passes empty status when not in search params', () => {
       useDocuments.mockReturnValue(buildUseDocuments())
       renderPage('/documents')
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react'
 import { useParams, Link } from 'react-router-dom'
 import useJobPolling from '../hooks/useJobPolling'
+import useJobItems from '../hooks/useJobItems'
 import { formatDate } from '../utils/formatters'
 
 const JOB_STATUS_COLORS = {
@@ -119,6 +120,7 @@ function ResultsView({ job }) {
   const failed   = result?.failed    ?? 0
   const pct      = total > 0 ? Math.round((processed / total) * 100) : 0
   const isOk     = job.status === 'completed'
+  const { items, hasMore, loading: itemsLoading, loadMore } = useJobItems(job.job_id, Boolean(result))
 
   return (
     <>
@@ -163,13 +165,13 @@ function ResultsView({ job }) {
       )}
 
       {/* Document results */}
-      {result?.details && result.details.length > 0 && (
+      {items.length > 0 && (
         <div className="bg-white rounded-2xl shadow-sm border border-gray-100 overflow-hidden">
           <div className="px-6 py-4 border-b border-gray-100">
             <h2 className="font-semibold text-brand-900">Resultado por documento</h2>
           </div>
           <div className="divide-y divide-gray-50">
-            {result.details.map((d) => (
+            {items.map((d) => (
               <div key={d.document_id} className="flex items-center justify-between px-6 py-3.5">
                 <Link
                   to={`/documents/${d.document_id}`}
@@ -201,6 +203,18 @@ function ResultsView({ job }) {
               </div>
             ))}
           </div>
+          {hasMore && (
+            <div className="px-6 py-3 border-t border-gray-100 text-center">
+              <button
+                type="button"
+                onClick={loadMore}
+                disabled={itemsLoading}
+                className="text-sm font-medium text-brand-700 hover:underline disabled:opacity-50"
+              >
+                {itemsLoading ? 'Cargando...' : 'Ver más'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </>
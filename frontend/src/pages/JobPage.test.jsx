@@ -1,5 +1,5 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
-import { render, screen, act } from '@testing-library/react'
+import { render, screen, act, fireEvent } from '@testing-library/react'
 import { MemoryRouter } from 'react-router-dom'
 import { faker, makeJob } from '../test/helpers'
 
@@ -12,9 +12,14 @@ vi.mock('../hooks/useJobPolling', () => ({
   default: vi.fn(),
 }))
 
+vi.mock('../hooks/useJobItems', () => ({
+  default: vi.fn(),
+}))
+
 import JobPage from './JobPage'
 import { useParams } from 'react-router-dom'
 import useJobPolling from '../hooks/useJobPolling'
+import useJobItems from '../hooks/useJobItems'
 
 function renderPage() {
   return render(
@@ -30,6 +35,7 @@ describe('JobPage', () => {
   beforeEach(() => {
     vi.clearAllMocks()
     useParams.mockReturnValue({ jobId })
+    useJobItems.mockReturnValue({ items: [], hasMore: false, loading: false, loadMore: vi.fn() })
     vi.useFakeTimers({ shouldAdvanceTime: true })
   })
 
@@ -188,14 +194,15 @@ describe('JobPage', () => {
     const job = makeJob({
       job_id: jobId,
       status: 'completed',
-      result: {
-        total: 1,
-        processed: 1,
-        failed: 0,
-        details: [{ document_id: docId, status: 'success' }],
-      },
+      result: { total: 1, processed: 1, failed: 0 },
     })
     useJobPolling.mockReturnValue({ job, loading: false, error: null })
+    useJobItems.mockReturnValue({
+      items: [{ document_id: docId, status: 'success' }],
+      hasMore: false,
+      loading: false,
+      loadMore: vi.fn(),
+    })
 
     renderPage()
     expect(screen.getByText('Resultado por documento')).toBeInTheDocument()
@@ -210,14 +217,15 @@ describe('JobPage', () => {
     const job = makeJob({
       job_id: jobId,
       status: 'completed',
-      result: {
-        total: 1,
-        processed: 0,
-        failed: 1,
-        details: [{ document_id: docId, status: 'failed', error: errText }],
-      },
+      result: { total: 1, processed: 0, failed: 1 },
     })
     useJobPolling.mockReturnValue({ job, loading: false, error: null })
+    useJobItems.mockReturnValue({
+      items: [{ document_id: docId, status: 'failed', error: errText }],
+      hasMore: false,
+      loading: false,
+      loadMore: vi.fn(),
+    })
 
     renderPage()
     expect(screen.getByText(`#${docId}`)).toBeInTheDocument()
@@ -225,11 +233,11 @@ describe('JobPage', () => {
     expect(screen.getByText(errText)).toBeInTheDocument()
   })
 
-  it('does not render details section when details is empty', () => {
+  it('does not render details section when the job has no items', () => {
     const job = makeJob({
       job_id: jobId,
       status: 'completed',
-      result: { total: 1, processed: 1, failed: 0, details: [] },
+      result: { total: 1, processed: 1, failed: 0 },
     })
     useJobPolling.mockReturnValue({ job, loading: false, error: null })
 
@@ -237,16 +245,32 @@ describe('JobPage', () => {
     expect(screen.queryByText('Resultado por documento')).not.toBeInTheDocument()
   })
 
-  it('does not render details section when details is absent', () => {
+  it('requests job items only when the job has a result', () => {
+    const job = makeJob({ job_id: jobId, status: 'completed', result: null })
+    useJobPolling.mockReturnValue({ job, loading: false, error: null })
+
+    renderPage()
+    expect(useJobItems).toHaveBeenCalledWith(jobId, false)
+  })
+
+  it('shows a load more button when more items are available', () => {
+    const loadMore = vi.fn()
     const job = makeJob({
       job_id: jobId,
       status: 'completed',
-      result: { total: 1, processed: 1, failed: 0 },
+      result: { total: 2, processed: 2, failed: 0 },
     })
     useJobPolling.mockReturnValue({ job, loading: false, error: null })
+    useJobItems.mockReturnValue({
+      items: [{ document_id: 1, status: 'success' }],
+      hasMore: true,
+      loading: false,
+      loadMore,
+    })
 
     renderPage()
-    expect(screen.queryByText('Resultado por documento')).not.toBeInTheDocument()
+    fireEvent.click(screen.getByText('Ver más'))
+    expect(loadMore).toHaveBeenCalled()
   })
 
   it('renders back link to documents', () => {
@@ -28,7 +28,7 @@ const JOB_STATUS_DOTS = {
 const STATUSES = ['', 'pending', 'processing', 'completed', 'failed']
 
 export default function JobsPage() {
-  const { jobs, total, totalPages, loading, error, filters, updateFilter } = useJobs()
+  const { jobs, total, totalPages, loading, error, filters, updateFilter } = useJobs({ view: 'summary' })
 
   return (
     <div className="p-8">
@@ -83,8 +83,8 @@ export default function JobsPage() {
 
             <div className="divide-y divide-gray-50">
               {jobs.map((job) => {
-                const total_docs = job.result?.total ?? '—'
-                const processed  = job.result?.processed ?? '—'
+                const total_docs = job.document_count ?? '—'
+                const processed  = job.processed ?? '—'
 
                 return (
                   <Link
@@ -1,7 +1,7 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest'
 import { render, screen, fireEvent } from '@testing-library/react'
 import { MemoryRouter } from 'react-router-dom'
-import { faker, makeJob } from '../test/helpers'
+import { faker, makeJobSummary } from '../test/helpers'
 
 vi.mock('../hooks/useJobs', () => ({
   default: vi.fn(),
@@ -51,6 +51,12 @@ describe('JobsPage', () => {
     vi.clearAllMocks()
   })
 
+  it('requests the summary projection', () => {
+    mockHook()
+    renderPage()
+    expect(useJobs).toHaveBeenCalledWith({ view: 'summary' })
+  })
+
   it('shows loading spinner while loading', () => {
     mockHook({ loading: true })
     renderPage()
@@ -80,8 +86,8 @@ describe('JobsPage', () => {
 
   it('renders job rows with job_id, status badge', () => {
     const jobs = [
-      makeJob({ status: 'completed', result: { total: 5, processed: 3 } }),
-      makeJob({ status: 'pending' }),
+      makeJobSummary({ status: 'completed', document_count: 5, processed: 3 }),
+      makeJobSummary({ status: 'pending' }),
     ]
     mockHook({ jobs, total: 2, totalPages: 1 })
 
@@ -120,13 +126,13 @@ describe('JobsPage', () => {
   })
 
   it('renders pagination when totalPages > 1', () => {
-    mockHook({ jobs: [makeJob()], total: 20, totalPages: 2 })
+    mockHook({ jobs: [makeJobSummary()], total: 20, totalPages: 2 })
     renderPage()
     expect(screen.getByTestId('pagination')).toBeInTheDocument()
   })
 
   it('pagination calls updateFilter with page', () => {
-    const { updateFilter } = mockHook({ jobs: [makeJob()], total: 20, totalPages: 2 })
+    const { updateFilter } = mockHook({ jobs: [makeJobSummary()], total: 20, totalPages: 2 })
     renderPage()
     fireEvent.click(screen.getByText('next'))
     expect(updateFilter).toHaveBeenCalledWith('page', 2)
@@ -134,7 +140,7 @@ describe('JobsPage', () => {
 
   it('renders completed_at date when present', () => {
     const completedAt = '2025-08-01T14:30:00Z'
-    const job = makeJob({ status: 'completed', completed_at: completedAt })
+    const job = makeJobSummary({ status: 'completed', completed_at: completedAt })
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
@@ -143,7 +149,7 @@ describe('JobsPage', () => {
   })
 
   it('hides completed_at when absent', () => {
-    const job = makeJob({ status: 'pending', completed_at: null })
+    const job = makeJobSummary({ status: 'pending', completed_at: null })
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
@@ -152,7 +158,7 @@ describe('JobsPage', () => {
   })
 
   it('renders result stats (processed/total) when available', () => {
-    const job = makeJob({ status: 'completed', result: { total: 10, processed: 7 } })
+    const job = makeJobSummary({ status: 'completed', document_count: 10, processed: 7 })
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
@@ -160,8 +166,8 @@ describe('JobsPage', () => {
     expect(screen.getByText('7')).toBeInTheDocument()
   })
 
-  it('renders "—" for total and processed when result is null', () => {
-    const job = makeJob({ status: 'pending', result: null })
+  it('renders "—" for total and processed when counts are missing', () => {
+    const job = makeJobSummary({ status: 'pending', document_count: null, processed: null })
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
@@ -170,7 +176,7 @@ describe('JobsPage', () => {
   })
 
   it('links job rows to /jobs/:jobId', () => {
-    const job = makeJob()
+    const job = makeJobSummary()
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
@@ -178,7 +184,7 @@ describe('JobsPage', () => {
   })
 
   it('falls back to job.status when JOB_STATUS_LABELS has no entry', () => {
-    const job = makeJob({ status: 'custom_unknown' })
+    const job = makeJobSummary({ status: 'custom_unknown' })
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
@@ -186,7 +192,7 @@ describe('JobsPage', () => {
   })
 
   it('applies green color for processed > 0', () => {
-    const job = makeJob({ status: 'completed', result: { total: 3, processed: 2 } })
+    const job = makeJobSummary({ status: 'completed', document_count: 3, processed: 2 })
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
@@ -195,7 +201,7 @@ describe('JobsPage', () => {
   })
 
   it('applies gray color for processed = 0 (number)', () => {
-    const job = makeJob({ status: 'completed', result: { total: 3, processed: 0 } })
+    const job = makeJobSummary({ status: 'completed', document_count: 3, processed: 0 })
     mockHook({ jobs: [job], total: 1, totalPages: 1 })
 
     renderPage()
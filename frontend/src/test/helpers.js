@@ -46,6 +46,20 @@ export function makeJob(overrides = {}) {
   }
 }
 
+export function makeJobSummary(overrides = {}) {
+  return {
+    job_id: faker.string.uuid(),
+    status: 'pending',
+    created_at: faker.date.recent().toISOString(),
+    completed_at: null,
+    error_message: null,
+    document_count: 2,
+    processed: null,
+    failed: null,
+    ...overrides,
+  }
+}
+
 /**
  * Build a fake JWT string from a payload object.
  * No real signature — only the base64-encoded payload matters for client-side decoding.